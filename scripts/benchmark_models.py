@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""Micro-benchmark building Jira issue models from search results.
+
+Builds ``JiraIssue`` objects from synthetic API payloads (with a realistic
+number of custom fields) and reports time and memory per issue::
+
+    uv run python scripts/benchmark_models.py
+    uv run python scripts/benchmark_models.py --issues 5000 --custom-fields 150
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from mcp_atlassian.models.jira.issue import JiraIssue  # noqa: E402
+from mcp_atlassian.models.jira.search import JiraSearchResult  # noqa: E402
+
+# A typical explicit field list: standard fields plus custom fields by ID,
+# ``cf_`` short form and display name.
+REQUESTED_FIELDS = [
+    "summary",
+    "status",
+    "assignee",
+    "priority",
+    "created",
+    "updated",
+    "labels",
+    "customfield_10101",
+    "cf_10150",
+    "Custom Field 7",
+]
+
+
+def _issue_payload(index: int, custom_fields: int) -> dict[str, Any]:
+    fields: dict[str, Any] = {
+        "summary": f"Issue summary {index}",
+        "description": f"Description of issue {index}",
+        "created": "2024-01-01T10:00:00.000+0000",
+        "updated": "2024-01-02T15:30:00.000+0000",
+        "status": {
+            "name": "In Progress",
+            "id": "3",
+            "statusCategory": {"key": "indeterminate", "name": "In Progress"},
+        },
+        "issuetype": {"id": "10001", "name": "Task", "subtask": False},
+        "priority": {"id": "3", "name": "Medium"},
+        "assignee": {"accountId": "123", "displayName": "Test User", "active": True},
+        "reporter": {"accountId": "456", "displayName": "Reporter", "active": True},
+        "labels": ["backend", "perf"],
+        "components": [{"name": "Backend"}],
+        "fixVersions": [{"name": "v1.0"}],
+        "project": {"id": "10000", "key": "PROJ", "name": "Project"},
+        "issuelinks": [
+            {
+                "id": str(index),
+                "type": {"name": "Blocks", "inward": "is blocked by"},
+                "outwardIssue": {"key": f"PROJ-{index + 1}", "fields": {}},
+            }
+        ],
+    }
+    for number in range(custom_fields):
+        value: Any
+        if number % 3 == 0:
+            value = None
+        elif number % 3 == 1:
+            value = {"value": f"Option {number}", "id": str(number)}
+        else:
+            value = f"text {number}"
+        fields[f"customfield_{10100 + number}"] = value
+    return {
+        "id": str(10000 + index),
+        "key": f"PROJ-{index}",
+        "self": f"https://example.atlassian.net/rest/api/2/issue/{10000 + index}",
+        "fields": fields,
+    }
+
+
+def _build(payloads: list[dict[str, Any]]) -> list[JiraIssue]:
+    return [
+        JiraIssue.from_api_response(
+            payload,
+            base_url="https://example.atlassian.net",
+            requested_fields="*all",
+        )
+        for payload in payloads
+    ]
+
+
+def _search_result(
+    payloads: list[dict[str, Any]], custom_fields: int
+) -> JiraSearchResult:
+    names = {
+        f"customfield_{10100 + n}": f"Custom Field {n}" for n in range(custom_fields)
+    }
+    return JiraSearchResult.from_api_response(
+        {"total": len(payloads), "issues": payloads, "names": names},
+        base_url="https://example.atlassian.net",
+        requested_fields=REQUESTED_FIELDS,
+    )
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--issues", type=int, default=1000, help="Issues per run (default: 1000)."
+    )
+    parser.add_argument(
+        "--custom-fields",
+        type=int,
+        default=80,
+        help="Custom fields per issue (default: 80).",
+    )
+    parser.add_argument(
+        "-n",
+        "--repeat",
+        type=int,
+        default=5,
+        help="Timing repetitions; the best one is reported (default: 5).",
+    )
+    return parser
+
+
+def main() -> int:
+    """Print time and memory per issue for construction and serialization."""
+    args = _parser().parse_args()
+    payloads = [_issue_payload(i, args.custom_fields) for i in range(args.issues)]
+    issues = _build(payloads)
+    search_result = _search_result(payloads, args.custom_fields)
+
+    cases = {
+        "from_api_response": lambda: _build(payloads),
+        "to_simplified_dict": lambda: [issue.to_simplified_dict() for issue in issues],
+        "search_result": search_result.to_simplified_dict,
+    }
+    for name, run in cases.items():
+        best = min(timeit.repeat(run, number=1, repeat=args.repeat))
+        tracemalloc.start()
+        result = run()
+        retained, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del result
+        print(
+            f"{name:<20} {best / args.issues * 1e6:>9.1f} us/issue "
+            f"{retained / args.issues / 1024:>8.1f} KiB retained/issue "
+            f"{peak / args.issues / 1024:>8.1f} KiB peak/issue"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
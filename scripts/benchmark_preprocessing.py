@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""Micro-benchmark the text preprocessing hot paths.
+
+Runs each converter over synthetic documents of increasing size and prints the
+best-of-N wall time. Use it to compare a change against ``main``::
+
+    uv run python scripts/benchmark_preprocessing.py
+    uv run python scripts/benchmark_preprocessing.py --case jira_to_markdown -n 20
+
+The ``process_html_content`` cases run on synthetic Confluence storage pages
+(about 0.9 KiB per section, so ``--sizes 1200,6000`` covers 1-5 MB), or on real
+pages exported as storage-format files with ``--corpus DIR``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import timeit
+from collections.abc import Callable
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from mcp_atlassian.models.jira.adf import markdown_to_adf  # noqa: E402
+from mcp_atlassian.preprocessing.confluence import ConfluencePreprocessor  # noqa: E402
+from mcp_atlassian.preprocessing.jira import JiraPreprocessor  # noqa: E402
+
+JIRA_WIKI_SECTION = """\
+h2. Summary {n}
+
+The *deployment* of _service {n}_ failed on +staging+ with x^2^ and H~2~O, see \
+??the runbook?? and [the dashboard|https://grafana.example.com/d/{n}].
+
+* first item with {{{{inline_code()}}}}
+** nested item {n}
+# numbered one
+## numbered nested
+
+bq. Quoted remark number {n}
+
+{{code:python}}
+def handler_{n}(event):
+    return {{"status": "*ok*", "id": {n}}}
+{{code}}
+
+{{panel:title=Notes {n}}}
+Panel body with !screenshot-{n}.png|alt=Screenshot {n}! and !icon.png!
+{{panel}}
+
+{{color:red}}Important {n}{{color}}
+
+||Key||Value||
+|alpha|{n}|
+|beta|-{n}-|
+
+{{noformat}}
+raw *text* {n}
+{{noformat}}
+"""
+
+
+def _jira_wiki_document(sections: int) -> str:
+    return "\n".join(JIRA_WIKI_SECTION.format(n=i) for i in range(sections))
+
+
+MARKDOWN_SECTION = """\
+## Release {n}
+
+Setext title {n}
+----------------
+
+The **deployment** of _service {n}_ uses `snake_case_{n}` and customfield_10{n}, \
+see [the dashboard](https://grafana.example.com/d/{n}?a=b_c) or <https://x.y/{n}>.
+Also ~~removed~~ text, <sup>2</sup>, <ins>added</ins> and \
+<span style="color:#ff0000">red {n}</span>.
+
+- first item
+  - nested item with ![](image-{n}.png)
+    + deeper ![Alt {n}](shot.png)
+1. numbered one
+  2. numbered nested
+
+```python
+def handler_{n}(event):
+    return {{"status": "**ok**"}}
+```
+
+| Key | Value |
+|-----|-------|
+| alpha | {n} |
+| beta  | *{n}* |
+"""
+
+
+def _markdown_document(sections: int) -> str:
+    return "\n".join(MARKDOWN_SECTION.format(n=i) for i in range(sections))
+
+
+def _table_and_list_document(sections: int) -> str:
+    """A table with ten rows and two ten-item lists per section."""
+    lines = ["| Key | Status | Owner | Notes |", "|-----|:------:|-------|-------|"]
+    for n in range(sections):
+        for row in range(10):
+            lines.append(
+                f"| PROJ-{n * 10 + row} | **done** | @[Ann](accountid:a{row}) "
+                f"| see `cfg_{row}` and [docs](https://x.y/{n}) |"
+            )
+    for n in range(sections):
+        lines.extend(f"- item {n}.{i} with *emphasis*" for i in range(10))
+        lines.append("")
+        lines.extend(f"{i}. step {n}.{i} for OPS-{i}" for i in range(1, 11))
+        lines.append("")
+    return "\n".join(lines)
+
+
+STORAGE_SECTION = (
+    '<h2><ac:emoticon ac:name="blue-star" />&nbsp;Section {n}</h2>'
+    '<p>Owner: <ac:link><ri:user ri:account-id="user{n}" /></ac:link>, due '
+    '<time datetime="2024-01-{day:02d}" />. See <a href="https://example.com/{n}">'
+    "the spec</a> &amp; <strong>notes</strong> with <em>emphasis</em>.</p>"
+    '<ac:structured-macro ac:name="code"><ac:parameter ac:name="language">python'
+    "</ac:parameter><ac:plain-text-body><![CDATA[def f_{n}(x):\n    return x < {n}\n]]>"
+    "</ac:plain-text-body></ac:structured-macro>"
+    "<table><tbody><tr><th><p>Key</p></th><th><p>Value</p></th></tr>"
+    "<tr><td><p>alpha</p></td><td><p>{n}</p></td></tr>"
+    '<tr><td><p>status</p></td><td><ac:structured-macro ac:name="status">'
+    '<ac:parameter ac:name="title">DONE</ac:parameter></ac:structured-macro></td></tr>'
+    "</tbody></table>"
+    '<ac:image ac:width="300"><ri:attachment ri:filename="diagram-{n}.png" />'
+    "</ac:image>"
+    "<ul><li><p>first</p></li><li><p>second <code>inline_{n}</code></p></li></ul>"
+)
+
+
+def _storage_page(sections: int) -> str:
+    return "".join(STORAGE_SECTION.format(n=i, day=i % 28 + 1) for i in range(sections))
+
+
+def _cases() -> dict[str, tuple[Callable[[str], object], Callable[[int], str]]]:
+    jira = JiraPreprocessor(base_url="https://example.atlassian.net")
+    confluence = ConfluencePreprocessor(base_url="https://example.atlassian.net/wiki")
+    confluence_lxml = ConfluencePreprocessor(
+        base_url="https://example.atlassian.net/wiki", html_parser="lxml"
+    )
+    return {
+        "jira_to_markdown": (jira.jira_to_markdown, _jira_wiki_document),
+        "markdown_to_jira": (jira.markdown_to_jira, _markdown_document),
+        "markdown_to_confluence_storage": (
+            confluence.markdown_to_confluence_storage,
+            _markdown_document,
+        ),
+        "markdown_to_adf": (
+            lambda text: markdown_to_adf(text, "https://example.atlassian.net"),
+            _markdown_document,
+        ),
+        "markdown_to_adf[tables]": (
+            lambda text: markdown_to_adf(text, "https://example.atlassian.net"),
+            _table_and_list_document,
+        ),
+        "process_html_content": (
+            lambda html: confluence.process_html_content(html, content_id="1"),
+            _storage_page,
+        ),
+        "process_html_content[lxml]": (
+            lambda html: confluence_lxml.process_html_content(html, content_id="1"),
+            _storage_page,
+        ),
+    }
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--case",
+        action="append",
+        help="Benchmark only this case (repeatable). Default: all cases.",
+    )
+    parser.add_argument(
+        "--sizes",
+        default="1,20,200",
+        help="Comma-separated document sizes in sections (default: 1,20,200).",
+    )
+    parser.add_argument(
+        "--corpus",
+        type=Path,
+        help=(
+            "Directory of Confluence storage-format files (*.html, *.xml) to use "
+            "instead of synthetic pages for the process_html_content cases."
+        ),
+    )
+    parser.add_argument(
+        "-n",
+        "--repeat",
+        type=int,
+        default=5,
+        help="Timing repetitions; the best one is reported (default: 5).",
+    )
+    return parser
+
+
+def main() -> int:
+    """Run the selected benchmarks and print one line per case and size."""
+    args = _parser().parse_args()
+    cases = _cases()
+    selected = args.case or list(cases)
+    unknown = sorted(set(selected) - set(cases))
+    if unknown:
+        print(f"Unknown case(s): {', '.join(unknown)}", file=sys.stderr)
+        return 2
+
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    corpus: list[str] = []
+    if args.corpus is not None:
+        corpus = [
+            path.read_text(encoding="utf-8")
+            for path in sorted(args.corpus.iterdir())
+            if path.suffix in (".html", ".xml")
+        ]
+        if not corpus:
+            print(f"No *.html or *.xml files in {args.corpus}", file=sys.stderr)
+            return 2
+
+    for name in selected:
+        convert, build_input = cases[name]
+        if corpus and name.startswith("process_html_content"):
+            inputs = [(text, 1) for text in corpus]
+        else:
+            inputs = [(build_input(size), max(1, 200 // size)) for size in sizes]
+        for text, number in inputs:
+            best = min(
+                timeit.repeat(
+                    lambda convert=convert, text=text: convert(text),
+                    number=number,
+                    repeat=args.repeat,
+                )
+            )
+            per_call_ms = best / number * 1000
+            print(
+                f"{name:<32} {len(text) / 1024:>9.1f} KiB {per_call_ms:>10.3f} ms/call"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
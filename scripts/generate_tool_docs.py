@@ -45,6 +45,10 @@ CATEGORY_TOOLS: dict[str, list[str]] = {
     ],
     "jira-search-fields": [
         "jira_search",
+        "jira_count_issues",
+        "jira_multi_search",
+        "jira_batch_get_issues",
+        "jira_local_search",
         "jira_search_fields",
         "jira_get_field_options",
         "jira_get_project_issue_types",
@@ -126,6 +130,7 @@ CATEGORY_TOOLS: dict[str, list[str]] = {
     ],
     "confluence-search": [
         "confluence_search",
+        "confluence_local_search",
         "confluence_search_user",
     ],
     "confluence-attachments": [
@@ -789,6 +794,17 @@ COUNT_RULES = (
         ),
         "core_toolsets",
     ),
+    CountRule(
+        "src/mcp_atlassian/utils/toolsets.py",
+        re.compile(r"Groups (\d+) tools into (\d+) named toolsets", re.IGNORECASE),
+        "total_tools",
+    ),
+    CountRule(
+        "src/mcp_atlassian/utils/toolsets.py",
+        re.compile(r"Groups (\d+) tools into (\d+) named toolsets", re.IGNORECASE),
+        "total_toolsets",
+        group=2,
+    ),
 )
 
 COUNT_FILES = tuple(dict.fromkeys(rule.relative_path for rule in COUNT_RULES))
@@ -9,6 +9,7 @@ from .client import ConfluenceClient
 from .comments import CommentsMixin
 from .config import ConfluenceConfig
 from .labels import LabelsMixin
+from .local_index import LocalIndexMixin
 from .pages import PagesMixin
 from .permissions import PermissionsMixin
 from .restrictions import RestrictionsMixin
@@ -21,6 +22,7 @@ from .users import UsersMixin
 class ConfluenceFetcher(
     SearchMixin,
     SpacesMixin,
+    LocalIndexMixin,
     PagesMixin,
     CommentsMixin,
     LabelsMixin,
@@ -39,6 +41,7 @@ class ConfluenceFetcher(
     Available mixins:
     - SearchMixin: CQL search operations
     - SpacesMixin: Space operations
+    - LocalIndexMixin: Local full-text page index
     - PagesMixin: Page operations
     - CommentsMixin: Comment operations
     - LabelsMixin: Label operations
@@ -7,6 +7,13 @@ from pathlib import Path
 from typing import Any
 
 from ..models.confluence import ConfluenceAttachment
+from ..utils.cache import (
+    CONFLUENCE_PAGE,
+    WILDCARD,
+    config_cache_scope,
+    invalidates,
+    publish_invalidation,
+)
 from ..utils.io import validate_safe_path
 from ..utils.urls import resolve_relative_url
 from .client import ConfluenceClient
@@ -29,7 +36,9 @@ class AttachmentsMixin(ConfluenceClient, AttachmentsOperationsProto):
         """
         if self.config.auth_type == "oauth" and self.config.is_cloud:
             return ConfluenceV2Adapter(
-                session=self.confluence._session, base_url=self.confluence.url
+                session=self.confluence._session,
+                base_url=self.confluence.url,
+                cache_scope=config_cache_scope(self.config),
             )
         return None
 
@@ -118,6 +127,7 @@ class AttachmentsMixin(ConfluenceClient, AttachmentsOperationsProto):
             v1_url = f"{v1_url}?{urllib.parse.urlencode({'version': version})}"
         return v1_url
 
+    @invalidates(CONFLUENCE_PAGE, "content_id")
     def upload_attachment(
         self,
         content_id: str,
@@ -194,6 +204,7 @@ class AttachmentsMixin(ConfluenceClient, AttachmentsOperationsProto):
             logger.error(f"Error uploading attachment: {error_msg}")
             return {"success": False, "error": error_msg}
 
+    @invalidates(CONFLUENCE_PAGE, "content_id")
     def upload_attachments(
         self,
         content_id: str,
@@ -254,6 +265,7 @@ class AttachmentsMixin(ConfluenceClient, AttachmentsOperationsProto):
             "failed": failed,
         }
 
+    @invalidates(CONFLUENCE_PAGE, "content_id")
     def upload_attachment_from_content(
         self,
         content_id: str,
@@ -805,6 +817,9 @@ class AttachmentsMixin(ConfluenceClient, AttachmentsOperationsProto):
                 response.raise_for_status()
 
             logger.info(f"Successfully deleted attachment {attachment_id}")
+            # The attachment ID does not name its page; page renders embed
+            # attachment metadata, so drop every cached page.
+            publish_invalidation(CONFLUENCE_PAGE, WILDCARD)
 
             return {
                 "success": True,
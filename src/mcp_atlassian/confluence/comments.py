@@ -8,6 +8,7 @@ from typing import Any
 import requests
 
 from ..models.confluence import ConfluenceComment
+from ..utils.cache import CONFLUENCE_PAGE, config_cache_scope, invalidates
 from .client import ConfluenceClient
 from .v2_adapter import ConfluenceV2Adapter
 
@@ -26,7 +27,9 @@ class CommentsMixin(ConfluenceClient):
         """
         if self.config.is_cloud and self.config.auth_type in ("oauth", "pat"):
             return ConfluenceV2Adapter(
-                session=self.confluence._session, base_url=self.confluence.url
+                session=self.confluence._session,
+                base_url=self.confluence.url,
+                cache_scope=config_cache_scope(self.config),
             )
         return None
 
@@ -43,7 +46,9 @@ class CommentsMixin(ConfluenceClient):
         """
         if self.config.is_cloud:
             return ConfluenceV2Adapter(
-                session=self.confluence._session, base_url=self.confluence.url
+                session=self.confluence._session,
+                base_url=self.confluence.url,
+                cache_scope=config_cache_scope(self.config),
             )
         return None
 
@@ -126,6 +131,7 @@ class CommentsMixin(ConfluenceClient):
             logger.debug("Full exception details for comments:", exc_info=True)
             return []
 
+    @invalidates(CONFLUENCE_PAGE, "page_id")
     def add_comment(self, page_id: str, content: str) -> ConfluenceComment | None:
         """
         Add a comment to a Confluence page.
@@ -354,6 +360,7 @@ class CommentsMixin(ConfluenceClient):
             logger.debug("Full exception details for inline comments:", exc_info=True)
             return []
 
+    @invalidates(CONFLUENCE_PAGE, "page_id")
     def add_inline_comment(
         self,
         page_id: str,
@@ -3,6 +3,7 @@
 import logging
 
 from ..models.confluence import ConfluenceLabel
+from ..utils.cache import CONFLUENCE_PAGE, invalidates
 from .client import ConfluenceClient
 
 logger = logging.getLogger("mcp-atlassian")
@@ -47,6 +48,7 @@ class LabelsMixin(ConfluenceClient):
                 f"Failed fetching labels from page {page_id}: {str(e)}"
             ) from e
 
+    @invalidates(CONFLUENCE_PAGE, "page_id")
     def add_page_label(self, page_id: str, name: str) -> list[ConfluenceLabel]:
         """
         Add a label to a Confluence page.
@@ -0,0 +1,447 @@
+"""Opt-in local full-text index of selected Confluence spaces.
+
+Set ``CONFLUENCE_LOCAL_INDEX_SPACES`` to a comma-separated list of space keys
+to keep their pages, as markdown, in a SQLite file
+(``CONFLUENCE_LOCAL_INDEX_PATH``, default
+``~/.mcp-atlassian/confluence-index.sqlite3``) with an FTS5 index over title
+and body. ``local_search`` then answers text queries from that file, so its
+cost depends on the index rather than on the load of the CQL search endpoint.
+
+A sync lists the space with version metadata only (no bodies) and compares
+each page's version with the indexed one. Only new or modified pages are
+fetched again: one at a time through ``get_page_content`` when few changed,
+or by walking the space in body batches when that takes fewer requests (the
+first sync of a space). Bulk batches are filtered by id before any page is
+converted to markdown. Pages missing from the listing are dropped, so
+deletions and moves out of the space are picked up by every sync. Rows are
+scoped to the credential that fetched them.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+from ..exceptions import MCPAtlassianAuthenticationError
+from ..models.confluence import ConfluencePage
+from ..utils.cache import config_cache_scope
+from ..utils.decorators import handle_auth_errors
+from ..utils.env import get_int_env
+from ..utils.fts import (
+    SyncClaims,
+    connect_fts_database,
+    fts_match_query,
+    iso_timestamp,
+)
+from .pages import PagesMixin
+
+logger = logging.getLogger("mcp-atlassian")
+
+LOCAL_INDEX_SPACES_ENV = "CONFLUENCE_LOCAL_INDEX_SPACES"
+LOCAL_INDEX_PATH_ENV = "CONFLUENCE_LOCAL_INDEX_PATH"
+LOCAL_INDEX_SYNC_INTERVAL_ENV = "CONFLUENCE_LOCAL_INDEX_SYNC_INTERVAL"
+DEFAULT_LOCAL_INDEX_SYNC_INTERVAL = 300
+# Above this many changed pages, bodies are re-read in bulk space batches
+# instead of one request per page, if walking the space takes fewer requests.
+BULK_REFRESH_THRESHOLD = 25
+_BODY_BATCH_SIZE = 25
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS index_pages (
+    id INTEGER PRIMARY KEY,
+    scope TEXT NOT NULL,
+    page_id TEXT NOT NULL,
+    space TEXT NOT NULL,
+    title TEXT NOT NULL,
+    body TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    last_modified TEXT,
+    url TEXT,
+    indexed_at REAL NOT NULL,
+    UNIQUE (scope, page_id)
+);
+CREATE INDEX IF NOT EXISTS index_pages_space ON index_pages (scope, space);
+CREATE VIRTUAL TABLE IF NOT EXISTS index_pages_fts USING fts5(
+    title, body, content='index_pages', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS index_pages_ai AFTER INSERT ON index_pages BEGIN
+    INSERT INTO index_pages_fts (rowid, title, body)
+    VALUES (new.id, new.title, new.body);
+END;
+CREATE TRIGGER IF NOT EXISTS index_pages_ad AFTER DELETE ON index_pages BEGIN
+    INSERT INTO index_pages_fts (index_pages_fts, rowid, title, body)
+    VALUES ('delete', old.id, old.title, old.body);
+END;
+CREATE TRIGGER IF NOT EXISTS index_pages_au AFTER UPDATE ON index_pages BEGIN
+    INSERT INTO index_pages_fts (index_pages_fts, rowid, title, body)
+    VALUES ('delete', old.id, old.title, old.body);
+    INSERT INTO index_pages_fts (rowid, title, body)
+    VALUES (new.id, new.title, new.body);
+END;
+CREATE TABLE IF NOT EXISTS index_spaces (
+    scope TEXT NOT NULL,
+    space TEXT NOT NULL,
+    synced_at REAL NOT NULL,
+    PRIMARY KEY (scope, space)
+);
+"""
+_UPSERT = (
+    "INSERT INTO index_pages (scope, page_id, space, title, body, version, "
+    "last_modified, url, indexed_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT (scope, page_id) DO UPDATE SET space = excluded.space, "
+    "title = excluded.title, body = excluded.body, version = excluded.version, "
+    "last_modified = excluded.last_modified, url = excluded.url, "
+    "indexed_at = excluded.indexed_at"
+)
+
+
+def get_local_index_spaces() -> list[str]:
+    """Return the space keys configured for indexing (empty = disabled)."""
+    raw = os.getenv(LOCAL_INDEX_SPACES_ENV, "")
+    return [key.strip() for key in raw.split(",") if key.strip()]
+
+
+class PageIndex:
+    """SQLite store behind the local Confluence index.
+
+    One connection is shared by worker threads and guarded by a lock. Syncs
+    are claimed per credential and space, so concurrent tool calls do not
+    fetch the same pages twice and never wait on each other's scans.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path).expanduser()
+        self._conn = connect_fts_database(self.path)
+        self._lock = threading.Lock()
+        self.syncs = SyncClaims()
+        with self._lock:
+            self._conn.executescript(_SCHEMA)
+
+    def synced_at(self, scope: str, space: str) -> float | None:
+        """Return when *space* was last synced, if ever."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT synced_at FROM index_spaces WHERE scope = ? AND space = ?",
+                (scope, space),
+            ).fetchone()
+        return row[0] if row else None
+
+    def versions(self, scope: str, space: str) -> dict[str, int]:
+        """Return the indexed version of every page of *space*."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT page_id, version FROM index_pages "
+                "WHERE scope = ? AND space = ?",
+                (scope, space),
+            ).fetchall()
+        return dict(rows)
+
+    def upsert(
+        self,
+        scope: str,
+        space: str,
+        page: ConfluencePage,
+        version: int,
+        last_modified: str | None,
+        now: float,
+    ) -> None:
+        """Store or refresh one page's markdown body."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                _UPSERT,
+                (
+                    scope,
+                    page.id,
+                    space,
+                    page.title,
+                    page.content,
+                    version,
+                    last_modified,
+                    page.url,
+                    now,
+                ),
+            )
+
+    def delete(self, scope: str, page_ids: Sequence[str]) -> None:
+        """Drop pages that are no longer in their space."""
+        if not page_ids:
+            return
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "DELETE FROM index_pages WHERE scope = ? AND page_id = ?",
+                [(scope, page_id) for page_id in page_ids],
+            )
+
+    def finish_sync(self, scope: str, space: str, started: float) -> None:
+        """Record a completed sync of *space*."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO index_spaces VALUES (?, ?, ?) "
+                "ON CONFLICT (scope, space) DO UPDATE SET synced_at = excluded.synced_at",
+                (scope, space, started),
+            )
+
+    def search(
+        self, scope: str, query: str, spaces: Sequence[str], limit: int = 10
+    ) -> list[dict[str, Any]]:
+        """Return indexed pages matching every word of *query*.
+
+        Results are ranked by relevance, with title matches weighing most,
+        and carry a snippet of the matching text.
+        """
+        match = fts_match_query(query)
+        if not match:
+            return []
+        placeholders = ",".join("?" for _ in spaces)
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT p.page_id, p.space, p.title, p.url, p.version, "  # noqa: S608
+                "p.last_modified, p.indexed_at, s.synced_at, "
+                "snippet(index_pages_fts, -1, '[', ']', '...', 24) "
+                "FROM index_pages_fts "
+                "JOIN index_pages p ON p.id = index_pages_fts.rowid "
+                "JOIN index_spaces s ON s.scope = p.scope AND s.space = p.space "
+                f"WHERE index_pages_fts MATCH ? AND p.scope = ? "
+                f"AND p.space IN ({placeholders}) "
+                "ORDER BY bm25(index_pages_fts, 10.0, 1.0) LIMIT ?",
+                (match, scope, *spaces, limit),
+            ).fetchall()
+        now = time.time()
+        return [
+            {
+                "id": page_id,
+                "space": space,
+                "title": title,
+                "url": url,
+                "version": version,
+                "last_modified": last_modified,
+                "snippet": snippet,
+                "freshness": {
+                    "indexed_at": iso_timestamp(indexed_at),
+                    "synced_at": iso_timestamp(synced_at),
+                    "age_seconds": max(int(now - synced_at), 0),
+                },
+            }
+            for (
+                page_id,
+                space,
+                title,
+                url,
+                version,
+                last_modified,
+                indexed_at,
+                synced_at,
+                snippet,
+            ) in rows
+        ]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def _default_index_path() -> Path:
+    return Path.home() / ".mcp-atlassian" / "confluence-index.sqlite3"
+
+
+_page_index: PageIndex | None = None
+_page_index_lock = threading.Lock()
+
+
+def get_page_index() -> PageIndex:
+    """Return the process-wide page index, opening it on first use."""
+    global _page_index
+    with _page_index_lock:
+        if _page_index is None:
+            path = os.getenv(LOCAL_INDEX_PATH_ENV, "").strip()
+            _page_index = PageIndex(path or _default_index_path())
+            logger.info("Using local Confluence index at %s.", _page_index.path)
+        return _page_index
+
+
+def _reset_page_index_for_tests() -> None:
+    global _page_index
+    with _page_index_lock:
+        if _page_index is not None:
+            _page_index.close()
+        _page_index = None
+
+
+class LocalIndexMixin(PagesMixin):
+    """Mixin for the local full-text Confluence index."""
+
+    def _index_spaces(self, spaces: Sequence[str] | None) -> list[str]:
+        configured = get_local_index_spaces()
+        if not configured:
+            raise ValueError(
+                f"The local Confluence index is disabled. Set {LOCAL_INDEX_SPACES_ENV} "
+                "to the space keys to index."
+            )
+        if not spaces:
+            return configured
+        requested = [key.strip() for key in spaces if key.strip()]
+        unknown = [key for key in requested if key not in configured]
+        if unknown:
+            raise ValueError(
+                f"Spaces not indexed: {', '.join(unknown)}. "
+                f"Indexed spaces: {', '.join(configured)}."
+            )
+        return requested
+
+    def _changed_pages(
+        self,
+        space: str,
+        changed: dict[str, tuple[int, str | None]],
+        space_size: int,
+    ) -> list[ConfluencePage]:
+        """Fetch the markdown bodies of the *changed* pages of *space*."""
+        pages: list[ConfluencePage] = []
+        bulk_requests = math.ceil(space_size / _BODY_BATCH_SIZE)
+        if len(changed) > BULK_REFRESH_THRESHOLD and bulk_requests < len(changed):
+            start = 0
+            while batch := self.confluence.get_all_pages_from_space(
+                space=space, start=start, limit=_BODY_BATCH_SIZE, expand="body.storage"
+            ):
+                pages.extend(
+                    self._space_page_model(page, space)
+                    for page in batch
+                    if str(page.get("id")) in changed
+                )
+                start += len(batch)
+            return pages
+        for page_id in changed:
+            try:
+                pages.append(self.get_page_content(page_id))
+            except MCPAtlassianAuthenticationError:
+                raise
+            except Exception as e:  # noqa: BLE001 - retried by the next sync
+                logger.warning("Could not index Confluence page %s: %s", page_id, e)
+        return pages
+
+    @handle_auth_errors("Confluence API")
+    def sync_local_index(
+        self,
+        spaces: Sequence[str] | None = None,
+        max_age_seconds: float = 0,
+    ) -> dict[str, dict[str, Any]]:
+        """Bring indexed spaces up to date with Confluence.
+
+        Args:
+            spaces: Space keys to sync (default: every indexed space).
+            max_age_seconds: Skip spaces synced more recently than this.
+
+        Returns:
+            Per space: whether it was ``skipped`` (with ``in_progress`` set
+            when another call is syncing it) and how many pages were
+            ``indexed`` and ``removed``.
+
+        Raises:
+            ValueError: If the index is disabled or a space is not indexed.
+        """
+        index = get_page_index()
+        scope = config_cache_scope(self.config)
+        report: dict[str, dict[str, Any]] = {}
+        for space in self._index_spaces(spaces):
+            with index.syncs.claim(scope, space) as claimed:
+                if not claimed:
+                    # Another call is already syncing this space; searching
+                    # the pages indexed so far beats waiting for its scan.
+                    report[space] = {
+                        "skipped": True,
+                        "in_progress": True,
+                        "indexed": 0,
+                        "removed": 0,
+                    }
+                    continue
+                report[space] = self._sync_index_space(
+                    index, scope, space, max_age_seconds
+                )
+        return report
+
+    def _sync_index_space(
+        self,
+        index: PageIndex,
+        scope: str,
+        space: str,
+        max_age_seconds: float,
+    ) -> dict[str, Any]:
+        started = time.time()
+        synced_at = index.synced_at(scope, space)
+        if synced_at is not None and started - synced_at < max_age_seconds:
+            return {"skipped": True, "indexed": 0, "removed": 0}
+        listed = {
+            str(page["id"]): (
+                page.get("version", {}).get("number", 0),
+                page.get("version", {}).get("when"),
+            )
+            for page in self.iter_space_pages(space, expand="version")
+        }
+        indexed = index.versions(scope, space)
+        removed = [page_id for page_id in indexed if page_id not in listed]
+        index.delete(scope, removed)
+        changed = {
+            page_id: meta
+            for page_id, meta in listed.items()
+            if indexed.get(page_id) != meta[0]
+        }
+        written = 0
+        for page in self._changed_pages(space, changed, len(listed)):
+            version, last_modified = changed[page.id]
+            index.upsert(scope, space, page, version, last_modified, time.time())
+            written += 1
+        index.finish_sync(scope, space, started)
+        result = {"skipped": False, "indexed": written, "removed": len(removed)}
+        logger.debug("Local index sync of %s: %s", space, result)
+        return result
+
+    def local_search(
+        self,
+        query: str,
+        spaces: Sequence[str] | None = None,
+        limit: int = 10,
+        refresh: bool = True,
+    ) -> dict[str, Any]:
+        """Search the local Confluence index.
+
+        Args:
+            query: Words to find in page titles and bodies; a trailing ``*``
+                matches a prefix.
+            spaces: Indexed space keys to search (default: all).
+            limit: Maximum results.
+            refresh: First sync spaces older than
+                ``CONFLUENCE_LOCAL_INDEX_SYNC_INTERVAL`` seconds. A failed
+                sync is reported and the existing index is searched anyway.
+
+        Returns:
+            ``results`` with snippets and per-result ``freshness``, plus
+            ``sync`` details when a refresh ran.
+
+        Raises:
+            ValueError: If the index is disabled or a space is not indexed.
+        """
+        selected = self._index_spaces(spaces)
+        result: dict[str, Any] = {}
+        if refresh:
+            interval = get_int_env(
+                LOCAL_INDEX_SYNC_INTERVAL_ENV, DEFAULT_LOCAL_INDEX_SYNC_INTERVAL
+            )
+            try:
+                result["sync"] = self.sync_local_index(
+                    selected, max_age_seconds=interval
+                )
+            except (MCPAtlassianAuthenticationError, sqlite3.Error, ValueError):
+                raise
+            except Exception as e:  # noqa: BLE001 - fall back to indexed data
+                logger.warning("Local index sync failed: %s", e)
+                result["sync_error"] = str(e)
+        results = get_page_index().search(
+            config_cache_scope(self.config), query, selected, limit=limit
+        )
+        return {"query": query, "spaces": selected, "results": results, **result}
@@ -2,6 +2,9 @@
 
 import difflib
 import logging
+import sys
+import time
+from collections.abc import Iterator
 from typing import Any
 from urllib.parse import parse_qs, urlparse
 
@@ -11,14 +14,59 @@ from bs4 import BeautifulSoup, Tag
 from requests.exceptions import HTTPError
 
 from ..models.confluence import ConfluencePage
+from ..utils.cache import (
+    CONFLUENCE_PAGE,
+    CONFLUENCE_SPACE,
+    ResponseCache,
+    config_cache_scope,
+    entity_key,
+    invalidates,
+)
 from ..utils.decorators import handle_auth_errors
+from ..utils.env import get_int_env
 from ..utils.pagination import clamp_limit
+from ..utils.progress import PageProgress
 from .client import ConfluenceClient
 from .utils import emoji_to_hex_id, extract_emoji_from_property
 from .v2_adapter import ConfluenceV2Adapter
 
 logger = logging.getLogger("mcp-atlassian")
 
+PAGE_NOT_FOUND_CACHE_TTL_ENV = "MCP_ATLASSIAN_PAGE_NOT_FOUND_CACHE_TTL"
+DEFAULT_PAGE_NOT_FOUND_CACHE_TTL = 30
+# Pages requested per batch when walking a space.
+SPACE_PAGES_BATCH_SIZE = 200
+
+# Rendered page content per (page id, format). Each entry remembers the page
+# version it was rendered from and is only served after a body-less version
+# lookup confirms the page has not changed.
+_page_content_cache = ResponseCache("confluence.page_content")
+
+
+def _page_not_found_cache_ttl() -> int:
+    return get_int_env(PAGE_NOT_FOUND_CACHE_TTL_ENV, DEFAULT_PAGE_NOT_FOUND_CACHE_TTL)
+
+
+# Page ids that returned 404, remembered briefly so agents retrying a dead
+# link do not hit the API each time.
+_page_not_found_cache = ResponseCache(
+    "confluence.page_not_found", max_ttl=_page_not_found_cache_ttl
+)
+
+
+def _is_not_found_error(error: BaseException) -> bool:
+    """Whether ``error`` (or what it wraps) is an HTTP 404."""
+    seen: set[int] = set()
+    current: BaseException | None = error
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        response = getattr(current, "response", None)
+        if getattr(response, "status_code", None) == 404:
+            return True
+        reason = getattr(current, "reason", None)
+        current = reason if isinstance(reason, BaseException) else current.__cause__
+    return False
+
 
 class PagesMixin(ConfluenceClient):
     """Mixin for Confluence page operations."""
@@ -32,7 +80,9 @@ class PagesMixin(ConfluenceClient):
         """
         if self.config.auth_type == "oauth" and self.config.is_cloud:
             return ConfluenceV2Adapter(
-                session=self.confluence._session, base_url=self.confluence.url
+                session=self.confluence._session,
+                base_url=self.confluence.url,
+                cache_scope=config_cache_scope(self.config),
             )
         return None
 
@@ -48,8 +98,26 @@ class PagesMixin(ConfluenceClient):
         return ConfluenceV2Adapter(
             session=self.confluence._session,
             base_url=base_url,
+            cache_scope=config_cache_scope(self.config),
         )
 
+    def get_space_id(self, space_key: str) -> str | None:
+        """Resolve the v2 space ID for a space key.
+
+        Args:
+            space_key: The space key to look up
+
+        Returns:
+            The space ID on Cloud, or None on Server/Data Center (no v2 API).
+
+        Raises:
+            ValueError: If the space is not found or the lookup fails
+        """
+        adapter = self._cloud_v2_adapter()
+        if adapter is None:
+            return None
+        return adapter._get_space_id(space_key)
+
     @property
     def _page_children_v2_adapter(self) -> ConfluenceV2Adapter | None:
         """Get v2 API adapter for Cloud page-children lookups.
@@ -59,7 +127,9 @@ class PagesMixin(ConfluenceClient):
         """
         if self.config.is_cloud:
             return ConfluenceV2Adapter(
-                session=self.confluence._session, base_url=self.confluence.url
+                session=self.confluence._session,
+                base_url=self.confluence.url,
+                cache_scope=config_cache_scope(self.config),
             )
         return None
 
@@ -200,7 +270,22 @@ class PagesMixin(ConfluenceClient):
                 with the Confluence API (401/403)
             Exception: If there is an error retrieving the page
         """
+        scope = config_cache_scope(self.config)
+        entities = (entity_key(CONFLUENCE_PAGE, page_id),)
+        loaded_at = time.time()
         try:
+            not_found = _page_not_found_cache.get((scope, page_id))
+            if not_found is not None:
+                raise Exception(not_found)
+
+            cache_key = (scope, page_id, convert_to_markdown)
+            cached = _page_content_cache.get(cache_key)
+            if (
+                cached is not None
+                and self._get_page_version_number(page_id) == cached["version"]
+            ):
+                return self._page_from_cached_content(cached, convert_to_markdown)
+
             # Use v2 API for OAuth, v1 API for token/basic auth
             v2_adapter = self._v2_adapter
             if v2_adapter:
@@ -253,6 +338,21 @@ class PagesMixin(ConfluenceClient):
             emoji = self._get_page_emoji(page_id)
             page_width = self._get_page_width(page_id)
 
+            version = (page.get("version") or {}).get("number")
+            if isinstance(version, int):
+                _page_content_cache.put(
+                    cache_key,
+                    {
+                        "version": version,
+                        "page": {k: v for k, v in page.items() if k != "body"},
+                        "content": page_content,
+                        "emoji": emoji,
+                        "page_width": page_width,
+                    },
+                    loaded_at=loaded_at,
+                    entities=entities,
+                )
+
             return ConfluencePage.from_api_response(
                 page,
                 base_url=self.config.url,
@@ -266,11 +366,48 @@ class PagesMixin(ConfluenceClient):
         except HTTPError:
             raise  # let decorator handle auth errors
         except Exception as e:
+            if _is_not_found_error(e):
+                _page_not_found_cache.put(
+                    (scope, page_id), str(e), loaded_at=loaded_at, entities=entities
+                )
             logger.error(
                 f"Error retrieving page content for page ID {page_id}: {str(e)}"
             )
             raise Exception(f"Error retrieving page content: {str(e)}") from e
 
+    def _get_page_version_number(self, page_id: str) -> int | None:
+        """Look up a page's current version without downloading its body.
+
+        Returns None when the lookup fails, which callers treat as "changed".
+        """
+        try:
+            v2_adapter = self._v2_adapter
+            if v2_adapter:
+                return v2_adapter.get_page_version(page_id)
+            page = self.confluence.get_page_by_id(page_id=page_id, expand="version")
+        except Exception as e:  # noqa: BLE001 - fall back to a full fetch
+            logger.debug(f"Version check for page {page_id} failed: {e}")
+            return None
+        if not isinstance(page, dict):
+            return None
+        number = (page.get("version") or {}).get("number")
+        return number if isinstance(number, int) else None
+
+    def _page_from_cached_content(
+        self, cached: dict[str, Any], convert_to_markdown: bool
+    ) -> ConfluencePage:
+        """Rebuild the page model from a ``_page_content_cache`` entry."""
+        return ConfluencePage.from_api_response(
+            cached["page"],
+            base_url=self.config.url,
+            include_body=True,
+            content_override=cached["content"],
+            content_format=("storage" if not convert_to_markdown else "markdown"),
+            is_cloud=self.config.is_cloud,
+            emoji=cached["emoji"],
+            page_width=cached["page_width"],
+        )
+
     @handle_auth_errors("Confluence API")
     def get_page_ancestors(self, page_id: str) -> list[ConfluencePage]:
         """
@@ -653,47 +790,58 @@ class PagesMixin(ConfluenceClient):
             space=space_key, start=start, limit=limit, expand="body.storage"
         )
 
-        page_models = []
-        for page in pages:
-            try:
-                content = page["body"]["storage"]["value"]
-            except (KeyError, TypeError) as e:
-                logger.warning(
-                    f"Page {page.get('id', 'unknown')} missing body.storage.value: {e}"
-                )
-                content = ""
-            processed_html, processed_markdown = self.preprocessor.process_html_content(
-                content,
-                space_key=space_key,
-                confluence_client=self.confluence,
-                content_id=str(page.get("id", "")),
+        return [
+            self._space_page_model(
+                page, space_key, convert_to_markdown=convert_to_markdown
             )
+            for page in pages
+        ]
 
-            # Use the appropriate content format based on the convert_to_markdown flag
-            page_content = processed_markdown if convert_to_markdown else processed_html
-
-            # Ensure space information is included
-            if "space" not in page:
-                page["space"] = {
-                    "key": space_key,
-                    "name": space_key,  # Use space_key as name if not available
-                }
-
-            # Create the ConfluencePage model
-            page_model = ConfluencePage.from_api_response(
-                page,
-                base_url=self.config.url,
-                include_body=True,
-                # Override content with our processed version
-                content_override=page_content,
-                content_format="storage" if not convert_to_markdown else "markdown",
-                is_cloud=self.config.is_cloud,
+    def _space_page_model(
+        self,
+        page: dict[str, Any],
+        space_key: str,
+        *,
+        convert_to_markdown: bool = True,
+    ) -> ConfluencePage:
+        """Convert a raw space page with ``body.storage`` to a ConfluencePage."""
+        try:
+            content = page["body"]["storage"]["value"]
+        except (KeyError, TypeError) as e:
+            logger.warning(
+                f"Page {page.get('id', 'unknown')} missing body.storage.value: {e}"
             )
+            content = ""
+        processed_html, processed_markdown = self.preprocessor.process_html_content(
+            content,
+            space_key=space_key,
+            confluence_client=self.confluence,
+            content_id=str(page.get("id", "")),
+        )
 
-            page_models.append(page_model)
+        # Use the appropriate content format based on the convert_to_markdown flag
+        page_content = processed_markdown if convert_to_markdown else processed_html
 
-        return page_models
+        # Ensure space information is included
+        if "space" not in page:
+            page["space"] = {
+                "key": space_key,
+                "name": space_key,  # Use space_key as name if not available
+            }
 
+        # Create the ConfluencePage model
+        return ConfluencePage.from_api_response(
+            page,
+            base_url=self.config.url,
+            include_body=True,
+            # Override content with our processed version
+            content_override=page_content,
+            content_format="storage" if not convert_to_markdown else "markdown",
+            is_cloud=self.config.is_cloud,
+        )
+
+    @invalidates(CONFLUENCE_SPACE, "space_key")
+    @invalidates(CONFLUENCE_PAGE, "parent_id")
     def create_page(
         self,
         space_key: str,
@@ -815,6 +963,7 @@ class PagesMixin(ConfluenceClient):
                 f"Failed to create page '{title}' in space {space_key}: {str(e)}"
             ) from e
 
+    @invalidates(CONFLUENCE_PAGE, "page_id", "parent_id")
     def update_page(
         self,
         page_id: str,
@@ -933,6 +1082,7 @@ class PagesMixin(ConfluenceClient):
             logger.error(f"Error updating page {page_id}: {str(e)}")
             raise Exception(f"Failed to update page {page_id}: {str(e)}") from e
 
+    @invalidates(CONFLUENCE_PAGE, "page_id")
     def update_page_section(
         self,
         page_id: str,
@@ -1199,11 +1349,110 @@ class PagesMixin(ConfluenceClient):
             logger.debug("Full exception details:", exc_info=True)
             raise
 
+    def _iter_space_page_batches(
+        self,
+        space_key: str,
+        limit: int,
+        start: int = 0,
+        expand: str | None = None,
+        page_size: int = SPACE_PAGES_BATCH_SIZE,
+    ) -> Iterator[tuple[list[dict[str, Any]], str | None]]:
+        """Yield each batch of raw space pages with its ``_links.next``.
+
+        Paginates using the raw API to access _links.next for reliable
+        truncation detection. The higher-level get_all_pages_from_space()
+        has a broken termination condition when limit > server-side cap.
+        """
+        fetched = 0
+        while fetched < limit:
+            response = self.confluence.get_all_pages_from_space_raw(
+                space=space_key,
+                start=start + fetched,
+                limit=min(page_size, limit - fetched),
+                expand=expand,
+            )
+            batch = response.get("results", [])
+            next_link = response.get("_links", {}).get("next")
+            yield batch, next_link
+            if not batch or not next_link:
+                return
+            fetched += len(batch)
+
+    @handle_auth_errors("Confluence API")
+    def iter_space_pages(
+        self,
+        space_key: str,
+        limit: int | None = None,
+        start: int = 0,
+        expand: str | None = "ancestors",
+        page_size: int = SPACE_PAGES_BATCH_SIZE,
+    ) -> Iterator[dict[str, Any]]:
+        """Stream the pages of a space as raw v1 content dicts.
+
+        Batches are fetched lazily as the caller consumes them, so walking a
+        large space holds one batch at a time.
+
+        Args:
+            space_key: The key of the space
+            limit: Maximum number of pages to yield (default: all)
+            start: Offset of the first page
+            expand: Fields to expand on each page (default: ``ancestors``)
+            page_size: Pages per request
+
+        Yields:
+            Page dicts in the order the API returns them
+        """
+        if limit is None:
+            limit = sys.maxsize
+        for batch, _ in self._iter_space_page_batches(
+            space_key, limit, start=start, expand=expand, page_size=page_size
+        ):
+            yield from batch
+
+    @staticmethod
+    def _page_tree_entry(page: dict[str, Any]) -> dict[str, Any]:
+        """Reduce a raw page to its ``get_space_page_tree`` entry."""
+        title = page.get("title", "Untitled")
+
+        # Position is auto-included via extensions in the v1 API.
+        # Confluence DC/Server can return position as the string
+        # "none" (or other non-numeric strings) instead of int/null.
+        # Normalize to int | None so sorting never mixes types.
+        raw_position = page.get("extensions", {}).get("position")
+        if raw_position is None:
+            position = None
+        elif isinstance(raw_position, int):
+            position = raw_position
+        else:
+            try:
+                position = int(str(raw_position))
+            except (TypeError, ValueError):
+                position = None
+
+        # Determine parent and depth from ancestors
+        ancestors = page.get("ancestors", [])
+        if ancestors:
+            parent_id = ancestors[-1].get("id")
+            depth = len(ancestors)
+        else:
+            parent_id = None
+            depth = 0
+
+        return {
+            "id": page.get("id"),
+            "title": title,
+            "parent_id": parent_id,
+            "position": position,
+            "depth": depth,
+        }
+
     @handle_auth_errors("Confluence API")
     def get_space_page_tree(
         self,
         space_key: str,
         limit: int = 500,
+        start: int = 0,
+        progress: PageProgress | None = None,
     ) -> dict:
         """Get hierarchical page tree for a space.
 
@@ -1211,19 +1460,23 @@ class PagesMixin(ConfluenceClient):
         allowing the AI to build custom views or filter as needed. This is
         more token-efficient than ASCII art and easier to process.
 
-        Uses manual pagination via get_all_pages_from_space_raw() to reliably
-        fetch all pages and detect truncation via _links.next, matching the
-        pagination pattern in search.py.
+        Pages are streamed in batches from get_all_pages_from_space_raw(),
+        which exposes _links.next for reliable truncation detection, matching
+        the pagination pattern in search.py.
 
         Args:
             space_key: The key of the space
             limit: Maximum number of pages to fetch (default: 500)
+            start: Offset of the first page, to continue from ``next_start``
+            progress: Optional per-batch progress sink and deadline; once the
+                deadline passes the tree built so far is returned
 
         Returns:
             Dictionary with:
             - space_key: The space key
             - total_pages: Total number of pages in the response
-            - has_more: Whether more pages exist beyond the limit
+            - has_more: Whether more pages exist beyond the limit (or the
+              deadline); ``next_start`` then gives the offset to continue at
             - pages: List of dicts with id, title, parent_id, position, depth
             - Note: parent_id is None for root pages
 
@@ -1233,33 +1486,32 @@ class PagesMixin(ConfluenceClient):
         try:
             limit = clamp_limit(limit, context="confluence.get_space_page_tree")
 
-            # Paginate using the raw API to access _links.next for reliable
-            # truncation detection. The higher-level get_all_pages_from_space()
-            # has a broken termination condition when limit > server-side cap.
-            page_size = 200
-            start = 0
-            all_pages: list[dict[str, Any]] = []
+            # Reduce each batch as it arrives; raw pages (with their
+            # ancestor chains) are not kept for the whole space.
+            result_pages = []
             next_link: str | None = None
-
-            while len(all_pages) < limit:
-                fetch_limit = min(page_size, limit - len(all_pages))
-                response = self.confluence.get_all_pages_from_space_raw(
-                    space=space_key,
-                    start=start,
-                    limit=fetch_limit,
-                    expand="ancestors",
+            batches = self._iter_space_page_batches(
+                space_key, limit, start=start, expand="ancestors"
+            )
+            for batch, next_link in batches:
+                result_pages.extend(self._page_tree_entry(page) for page in batch)
+                if progress is None:
+                    continue
+                fetched = len(result_pages)
+                progress.page_done(
+                    fetched, limit, f"Fetched {fetched} of up to {limit} pages"
                 )
-                batch = response.get("results", [])
-                all_pages.extend(batch)
-
-                next_link = response.get("_links", {}).get("next")
-                if not batch or not next_link:
+                more = bool(batch) and bool(next_link) and fetched < limit
+                if progress.should_stop(start + fetched if more else None):
+                    batches.close()
                     break
-                start += len(batch)
 
-            has_more = len(all_pages) >= limit and bool(next_link)
+            has_more = bool(next_link) and (
+                len(result_pages) >= limit
+                or (progress is not None and progress.deadline_reached)
+            )
 
-            if not all_pages:
+            if not result_pages:
                 return {
                     "space_key": space_key,
                     "total_pages": 0,
@@ -1267,49 +1519,8 @@ class PagesMixin(ConfluenceClient):
                     "pages": [],
                 }
 
-            # Build flat list with parent_id and depth
-            result_pages = []
-
-            for page in all_pages:
-                page_id = page.get("id")
-                title = page.get("title", "Untitled")
-
-                # Position is auto-included via extensions in the v1 API.
-                # Confluence DC/Server can return position as the string
-                # "none" (or other non-numeric strings) instead of int/null.
-                # Normalize to int | None so sorting never mixes types.
-                raw_position = page.get("extensions", {}).get("position")
-                if raw_position is None:
-                    position = None
-                elif isinstance(raw_position, int):
-                    position = raw_position
-                else:
-                    try:
-                        position = int(str(raw_position))
-                    except (TypeError, ValueError):
-                        position = None
-
-                # Determine parent and depth from ancestors
-                ancestors = page.get("ancestors", [])
-                if ancestors:
-                    parent_id = ancestors[-1].get("id")
-                    depth = len(ancestors)
-                else:
-                    parent_id = None
-                    depth = 0
-
-                result_pages.append(
-                    {
-                        "id": page_id,
-                        "title": title,
-                        "parent_id": parent_id,
-                        "position": position,
-                        "depth": depth,
-                    }
-                )
-
             # Sort by depth first (breadth-first), then by position.
-            # Position is now always int | None after normalization above.
+            # Position is always int | None after _page_tree_entry.
             result_pages.sort(
                 key=lambda p: (
                     p["depth"],
@@ -1325,7 +1536,7 @@ class PagesMixin(ConfluenceClient):
                 "pages": result_pages,
             }
             if has_more:
-                result["next_start"] = start
+                result["next_start"] = start + len(result_pages)
             return result
 
         except HTTPError:
@@ -1334,6 +1545,7 @@ class PagesMixin(ConfluenceClient):
             logger.error(f"Error fetching page tree for space '{space_key}': {e}")
             raise Exception(f"Failed to fetch page tree: {e}") from e
 
+    @invalidates(CONFLUENCE_PAGE, "page_id")
     def delete_page(self, page_id: str) -> bool:
         """
         Delete a Confluence page by its ID.
@@ -1480,6 +1692,8 @@ class PagesMixin(ConfluenceClient):
             raise Exception(f"Error getting page history: {str(e)}") from e
 
     @handle_auth_errors("Confluence API")
+    @invalidates(CONFLUENCE_SPACE, "target_space_key")
+    @invalidates(CONFLUENCE_PAGE, "page_id", "target_parent_id")
     def move_page(
         self,
         page_id: str,
@@ -1593,6 +1807,8 @@ class PagesMixin(ConfluenceClient):
         }
 
     @handle_auth_errors("Confluence API")
+    @invalidates(CONFLUENCE_SPACE, "destination_space_key")
+    @invalidates(CONFLUENCE_PAGE, "destination_parent_id")
     def copy_page(
         self,
         source_page_id: str,
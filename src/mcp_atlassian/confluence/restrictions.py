@@ -5,6 +5,7 @@ from typing import Any
 
 from requests.exceptions import HTTPError
 
+from ..utils.cache import CONFLUENCE_PAGE, invalidates
 from ..utils.decorators import handle_auth_errors
 from .client import ConfluenceClient
 
@@ -83,6 +84,7 @@ class RestrictionsMixin(ConfluenceClient):
             ) from e
 
     @handle_auth_errors("Confluence API")
+    @invalidates(CONFLUENCE_PAGE, "page_id")
     def set_page_restrictions(
         self,
         page_id: str,
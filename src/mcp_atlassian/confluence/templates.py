@@ -3,6 +3,7 @@
 from typing import Any, cast
 from urllib.parse import quote
 
+from ..utils.cache import CONFLUENCE_PAGE, CONFLUENCE_SPACE, invalidates
 from ..utils.decorators import handle_auth_errors
 from .client import ConfluenceClient
 from .pages import PagesMixin
@@ -122,6 +123,8 @@ class TemplatesMixin(ConfluenceClient):
         )
 
     @handle_auth_errors("Confluence API")
+    @invalidates(CONFLUENCE_SPACE, "space_key")
+    @invalidates(CONFLUENCE_PAGE, "parent_id")
     def create_page_from_template(
         self,
         space_key: str,
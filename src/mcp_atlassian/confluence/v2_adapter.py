@@ -10,23 +10,37 @@ from typing import Any
 import requests
 from requests.exceptions import HTTPError
 
+from ..utils.cache import CONFLUENCE_SPACE, ResponseCache, entity_key
 from .utils import emoji_to_hex_id, extract_emoji_from_property
 
 logger = logging.getLogger("mcp-atlassian")
 
+# Space IDs never change for a key on a given site, but whether a space is
+# visible depends on the caller, so entries are scoped to the credential.
+# Failed lookups are not cached.
+_space_id_cache = ResponseCache("confluence.space_ids")
+
 
 class ConfluenceV2Adapter:
     """Adapter for Confluence REST API v2 operations."""
 
-    def __init__(self, session: requests.Session, base_url: str) -> None:
+    def __init__(
+        self,
+        session: requests.Session,
+        base_url: str,
+        cache_scope: str | None = None,
+    ) -> None:
         """Initialize the v2 adapter.
 
         Args:
             session: Authenticated requests session (OAuth configured)
             base_url: Base URL for the Confluence instance
+            cache_scope: Credential scope from ``config_cache_scope``; space ID
+                lookups are only cached when it is given
         """
         self.session = session
         self.base_url = base_url
+        self.cache_scope = cache_scope
 
     @staticmethod
     def _user_ref_from_account_id(account_id: str | None) -> dict[str, str] | None:
@@ -47,6 +61,15 @@ class ConfluenceV2Adapter:
         Raises:
             ValueError: If space not found or API error
         """
+        if self.cache_scope is None:
+            return self._fetch_space_id(space_key)
+        return _space_id_cache.get_or_load(
+            (self.cache_scope, space_key),
+            lambda: self._fetch_space_id(space_key),
+            entities=(entity_key(CONFLUENCE_SPACE, space_key),),
+        )
+
+    def _fetch_space_id(self, space_key: str) -> str:
         try:
             # Use v2 spaces endpoint to get space ID
             url = f"{self.base_url}/api/v2/spaces"
@@ -365,6 +388,24 @@ class ConfluenceV2Adapter:
                 logger.error(f"Error getting page '{page_id}': {e}")
             raise ValueError(f"Failed to get page '{page_id}': {e}") from e
 
+    def get_page_version(self, page_id: str) -> int | None:
+        """Get the current version number of a page without its body.
+
+        Args:
+            page_id: The ID of the page
+
+        Returns:
+            The version number, or None if the response has none
+
+        Raises:
+            HTTPError: If the request fails
+        """
+        url = f"{self.base_url}/api/v2/pages/{page_id}"
+        response = self.session.get(url)
+        response.raise_for_status()
+        number = (response.json().get("version") or {}).get("number")
+        return number if isinstance(number, int) else None
+
     def get_page_direct_children(
         self,
         page_id: str,
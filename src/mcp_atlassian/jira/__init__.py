@@ -22,6 +22,7 @@ from .forms_api import FormsApiMixin  # Forms REST API
 from .formatting import FormattingMixin
 from .issues import IssuesMixin
 from .links import LinksMixin
+from .local_mirror import LocalMirrorMixin
 from .metrics import MetricsMixin
 from .project_analysis import ProjectAnalysisMixin
 from .projects import ProjectsMixin
@@ -59,6 +60,7 @@ class JiraFetcher(
     SLAMixin,
     DevelopmentMixin,
     ProjectAnalysisMixin,
+    LocalMirrorMixin,
 ):
     """
     The main Jira client class providing access to all Jira operations.
@@ -82,6 +84,7 @@ class JiraFetcher(
     - MetricsMixin: Issue metrics and date operations
     - QueuesMixin: Service Desk queue read operations (Server/DC)
     - SLAMixin: SLA calculations
+    - LocalMirrorMixin: Local full-text issue mirror
 
     The class structure is designed to maintain backward compatibility while
     improving code organization and maintainability.
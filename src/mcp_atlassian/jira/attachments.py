@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import Any
 
 from ..models.jira import JiraAttachment
+from ..utils.cache import JIRA_ISSUE, invalidates
 from ..utils.io import validate_safe_path
 from ..utils.media import ATTACHMENT_MAX_BYTES
 from .client import JiraClient
@@ -361,6 +362,7 @@ class AttachmentsMixin(JiraClient, AttachmentsOperationsProto):
             "failed": failed,
         }
 
+    @invalidates(JIRA_ISSUE, "issue_key")
     def upload_attachment(self, issue_key: str, file_path: str) -> dict[str, Any]:
         """
         Upload a single attachment to a Jira issue.
@@ -426,6 +428,7 @@ class AttachmentsMixin(JiraClient, AttachmentsOperationsProto):
             logger.error(f"Error uploading attachment: {error_msg}")
             return {"success": False, "error": error_msg}
 
+    @invalidates(JIRA_ISSUE, "issue_key")
     def upload_attachments(
         self, issue_key: str, file_paths: list[str]
     ) -> dict[str, Any]:
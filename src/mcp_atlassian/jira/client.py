@@ -11,6 +11,12 @@ from requests.exceptions import ConnectionError as RequestsConnectionError
 
 from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
 from mcp_atlassian.preprocessing import JiraPreprocessor
+from mcp_atlassian.utils.cache import (
+    JIRA_PROJECT,
+    WILDCARD,
+    invalidates,
+    publish_invalidation,
+)
 from mcp_atlassian.utils.http import (
     configure_circuit_breaker,
     configure_concurrency,
@@ -23,6 +29,7 @@ from mcp_atlassian.utils.logging import (
     mask_sensitive,
 )
 from mcp_atlassian.utils.oauth import configure_oauth_session
+from mcp_atlassian.utils.progress import PageProgress
 from mcp_atlassian.utils.proxy import apply_proxy_configuration
 from mcp_atlassian.utils.ssl import configure_ssl_verification
 from mcp_atlassian.utils.ssrf_adapter import mount_ssrf_pinning
@@ -402,6 +409,7 @@ class JiraClient:
         params_or_json: dict | None = None,
         *,
         absolute: bool = False,
+        progress: PageProgress | None = None,
     ) -> list[dict]:
         """
         Repeatly fetch paged data from Jira API using `nextPageToken` to paginate.
@@ -411,6 +419,9 @@ class JiraClient:
             url: The URL to retrieve data from
             params_or_json: Optional query parameters or JSON data to send
             absolute: Whether to use absolute URL
+            progress: Optional per-page progress sink and deadline; once the
+                deadline passes, paging stops and ``progress.cursor`` holds
+                the next page's token
 
         Returns:
             List of requested json data
@@ -445,15 +456,25 @@ class JiraClient:
             # Extract values from response
             all_results.append(api_result)
 
+            if progress is not None:
+                progress.page_done(
+                    len(all_results), None, f"Fetched {len(all_results)} pages"
+                )
+
             # Check if this is the last page
             if "nextPageToken" not in api_result:
                 break
+            if progress is not None and progress.should_stop(
+                api_result["nextPageToken"]
+            ):
+                break
 
             # Update for next iteration
             current_data["nextPageToken"] = api_result["nextPageToken"]
 
         return all_results
 
+    @invalidates(JIRA_PROJECT, "project")
     def create_version(
         self,
         project: str,
@@ -534,6 +555,8 @@ class JiraClient:
             raise ValueError("update_version requires at least one field to update")
         logger.info(f"Updating Jira version {version_id}: {payload}")
         result = self.jira.put(f"/rest/api/2/version/{version_id}", data=payload)
+        # The version ID does not name its project; drop all project metadata.
+        publish_invalidation(JIRA_PROJECT, WILDCARD)
         if not isinstance(result, dict):
             error_message = f"Unexpected response from Jira API: {result}"
             raise ValueError(error_message)
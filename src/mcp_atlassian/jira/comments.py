@@ -28,6 +28,7 @@ from requests.exceptions import HTTPError
 
 from ..models.jira.adf import adf_to_text
 from ..utils import parse_date
+from ..utils.cache import JIRA_ISSUE, invalidates
 from .client import JiraClient
 from .config import normalize_project_key
 
@@ -332,6 +333,7 @@ class CommentsMixin(JiraClient):
                 "add information."
             )
 
+    @invalidates(JIRA_ISSUE, "issue_key")
     def add_comment(
         self,
         issue_key: str,
@@ -528,6 +530,7 @@ class CommentsMixin(JiraClient):
                 f"{error_msg or type(e).__name__}"
             ) from e
 
+    @invalidates(JIRA_ISSUE, "issue_key")
     def edit_comment(
         self,
         issue_key: str,
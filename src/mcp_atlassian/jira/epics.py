@@ -4,6 +4,7 @@ import logging
 from typing import Any
 
 from ..models.jira import JiraIssue
+from ..utils.cache import JIRA_ISSUE, invalidates
 from .client import JiraClient
 from .protocols import (
     FieldsOperationsProto,
@@ -290,6 +291,7 @@ class EpicsMixin(
         logger.debug("Could not determine Epic Color field ID")
         return None
 
+    @invalidates(JIRA_ISSUE, "issue_key", "epic_key")
     def link_issue_to_epic(self, issue_key: str, epic_key: str) -> JiraIssue:
         """
         Link an existing issue to an epic.
@@ -850,6 +852,7 @@ class EpicsMixin(
             logger.warning(f"No issues found for epic {epic_key} with query: {jql}")
         return search_result.issues
 
+    @invalidates(JIRA_ISSUE, "issue_key")
     def update_epic_fields(self, issue_key: str, kwargs: dict[str, Any]) -> JiraIssue:
         """
         Update Epic-specific fields after Epic creation.
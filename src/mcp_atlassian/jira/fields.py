@@ -6,11 +6,16 @@ from typing import Any
 from thefuzz import fuzz
 
 from ..utils import parse_date
+from ..utils.cache import ResponseCache, config_cache_scope
 from .client import JiraClient
 from .protocols import EpicOperationsProto, UsersOperationsProto
 
 logger = logging.getLogger("mcp-jira")
 
+# Field definitions change rarely and are identical for every fetcher built
+# from the same credentials, so replicas sharing a cache backend can share them.
+_fields_cache = ResponseCache("jira.fields")
+
 
 class FieldsMixin(JiraClient, EpicOperationsProto, UsersOperationsProto):
     """Mixin for Jira field operations.
@@ -42,8 +47,12 @@ class FieldsMixin(JiraClient, EpicOperationsProto, UsersOperationsProto):
                     None  # Clear name map cache if refreshing fields
                 )
 
-            # Fetch fields from Jira API
-            fields = self.jira.get_all_fields()
+            # Fetch fields from Jira API (or the shared response cache)
+            fields = _fields_cache.get_or_load(
+                (config_cache_scope(self.config),),
+                self.jira.get_all_fields,
+                refresh=refresh,
+            )
             if not isinstance(fields, list):
                 msg = f"Unexpected return value type from `jira.get_all_fields`: {type(fields)}"
                 logger.error(msg)
@@ -19,6 +19,7 @@ from requests.auth import HTTPBasicAuth
 from requests.exceptions import HTTPError
 
 from ..models.jira import ProFormaForm
+from ..utils.cache import JIRA_ISSUE, invalidates
 from .client import JiraClient
 from .forms_common import handle_forms_http_error
 
@@ -245,6 +246,7 @@ class FormsApiMixin(JiraClient):
             )
             raise
 
+    @invalidates(JIRA_ISSUE, "issue_key")
     def update_form_answers(
         self, issue_key: str, form_id: str, answers: list[dict[str, Any]]
     ) -> dict[str, Any]:
@@ -327,6 +329,7 @@ class FormsApiMixin(JiraClient):
             logger.error(f"Error updating form {form_id} for {issue_key}: {str(e)}")
             raise
 
+    @invalidates(JIRA_ISSUE, "issue_key")
     def add_form_template(self, issue_key: str, template_id: str) -> dict[str, Any]:
         """Add a form template to an issue.
 
@@ -354,6 +357,7 @@ class FormsApiMixin(JiraClient):
             logger.error(f"Error adding form template to {issue_key}: {str(e)}")
             raise
 
+    @invalidates(JIRA_ISSUE, "issue_key")
     def delete_form(self, issue_key: str, form_id: str) -> None:
         """Delete a form from an issue.
 
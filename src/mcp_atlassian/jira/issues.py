@@ -14,6 +14,8 @@ from ..models.jira import JiraIssue
 from ..models.jira.adf import merge_adf_with_preserved_media
 from ..models.jira.common import JiraChangelog
 from ..utils import parse_date
+from ..utils.cache import JIRA_ISSUE, JIRA_PROJECT, invalidates, publish_invalidation
+from ..utils.progress import PageProgress
 from .client import JiraClient
 from .constants import DEFAULT_READ_JIRA_FIELDS
 from .protocols import (
@@ -594,6 +596,7 @@ class IssuesMixin(
 
         return metadata
 
+    @invalidates(JIRA_PROJECT, "project_key")
     def create_issue(
         self,
         project_key: str,
@@ -1142,6 +1145,7 @@ class IssuesMixin(
             return ",".join(return_fields)
         return return_fields
 
+    @invalidates(JIRA_ISSUE, "issue_key")
     def update_issue(
         self,
         issue_key: str,
@@ -1330,6 +1334,7 @@ class IssuesMixin(
             logger.error(f"Error updating issue {issue_key}: {error_msg}")
             raise ValueError(f"Failed to update issue {issue_key}: {error_msg}") from e
 
+    @invalidates(JIRA_ISSUE, "issue_key")
     def assign_issue(
         self,
         issue_key: str,
@@ -1538,6 +1543,7 @@ class IssuesMixin(
             issue_data, requested_fields=return_fields_param
         )
 
+    @invalidates(JIRA_ISSUE, "issue_key")
     def delete_issue(self, issue_key: str) -> bool:
         """
         Delete a Jira issue.
@@ -1559,6 +1565,8 @@ class IssuesMixin(
             logger.error(msg)
             raise Exception(msg) from e
 
+    @invalidates(JIRA_ISSUE, "issue_key")
+    @invalidates(JIRA_PROJECT, "target_project_key")
     def move_issue(self, issue_key: str, target_project_key: str) -> JiraIssue:
         """
         Move a Jira issue to a different project.
@@ -1822,6 +1830,7 @@ class IssuesMixin(
                 f"Error getting transitions for issue {issue_key}: {str(e)}"
             ) from e
 
+    @invalidates(JIRA_ISSUE, "issue_key")
     def transition_issue(self, issue_key: str, transition_id: str) -> JiraIssue:
         """
         Transition an issue to a new status.
@@ -1875,6 +1884,8 @@ class IssuesMixin(
 
         # Prepare issues for bulk creation
         issue_updates = []
+        # Batches often reuse one description template; convert each text once.
+        converted_descriptions: dict[str, str | dict[str, Any]] = {}
         for issue_data in issues:
             try:
                 # Extract and validate required fields
@@ -1900,7 +1911,14 @@ class IssuesMixin(
 
                 # Add optional fields
                 if description:
-                    fields["description"] = self._markdown_to_jira(description)
+                    if isinstance(description, str):
+                        if description not in converted_descriptions:
+                            converted_descriptions[description] = (
+                                self._markdown_to_jira(description)
+                            )
+                        fields["description"] = converted_descriptions[description]
+                    else:
+                        fields["description"] = self._markdown_to_jira(description)
 
                 # Add assignee if provided
                 if assignee:
@@ -1999,9 +2017,17 @@ class IssuesMixin(
         except Exception as e:
             logger.error(f"Error in bulk issue creation: {str(e)}")
             raise
+        finally:
+            publish_invalidation(
+                JIRA_PROJECT, *(issue.get("project_key") for issue in issues)
+            )
 
     def batch_get_changelogs(
-        self, issue_ids_or_keys: list[str], fields: list[str] | None = None
+        self,
+        issue_ids_or_keys: list[str],
+        fields: list[str] | None = None,
+        page_token: str | None = None,
+        progress: PageProgress | None = None,
     ) -> list[JiraIssue]:
         """
         Get changelogs for multiple issues in a batch. Repeatly fetch data if necessary.
@@ -2012,6 +2038,10 @@ class IssuesMixin(
         Args:
             issue_ids_or_keys: List of issue IDs or keys
             fields: Filter the changelogs by fields, e.g. ['status', 'assignee']. Default to None for all fields.
+            page_token: Token to continue a bulk fetch cut short by a deadline.
+            progress: Optional per-page progress sink and deadline. When the
+                deadline stops the fetch, ``progress.cursor`` is the token to
+                pass as page_token to continue.
 
         Returns:
             List of JiraIssue objects that only contain changelogs and id
@@ -2022,14 +2052,19 @@ class IssuesMixin(
             logger.error(error_msg)
             raise NotImplementedError(error_msg)
 
+        request_json: dict[str, Any] = {
+            "fieldIds": fields,
+            "issueIdsOrKeys": issue_ids_or_keys,
+        }
+        if page_token:
+            request_json["nextPageToken"] = page_token
+
         # Get paged api results
         paged_api_results = self.get_paged(
             method="post",
             url=self.jira.resource_url("changelog/bulkfetch"),
-            params_or_json={
-                "fieldIds": fields,
-                "issueIdsOrKeys": issue_ids_or_keys,
-            },
+            params_or_json=request_json,
+            progress=progress,
         )
 
         # Save (issue_id, changelogs)
@@ -6,11 +6,22 @@ from typing import Any
 from requests.exceptions import HTTPError
 
 from ..models.jira import JiraIssueLinkType
+from ..utils.cache import (
+    JIRA_ISSUE,
+    WILDCARD,
+    ResponseCache,
+    config_cache_scope,
+    invalidates,
+    publish_invalidation,
+)
 from ..utils.decorators import handle_auth_errors
 from .client import JiraClient
 
 logger = logging.getLogger("mcp-jira")
 
+# Link types are instance configuration; nothing this server does changes them.
+_link_types_cache = ResponseCache("jira.link_types")
+
 
 class LinksMixin(JiraClient):
     """Mixin for Jira issue link operations."""
@@ -29,7 +40,10 @@ class LinksMixin(JiraClient):
             Exception: If there is an error retrieving issue link types
         """
         try:
-            link_types_response = self.jira.get("rest/api/2/issueLinkType")
+            link_types_response = _link_types_cache.get_or_load(
+                (config_cache_scope(self.config),),
+                lambda: self.jira.get("rest/api/2/issueLinkType"),
+            )
             if not isinstance(link_types_response, dict):
                 msg = (
                     "Unexpected return value type from "
@@ -132,13 +146,13 @@ class LinksMixin(JiraClient):
                 data["inwardIssue"]["key"], data["outwardIssue"]["key"]
             )
 
+        inward = data["inwardIssue"]["key"]
+        outward = data["outwardIssue"]["key"]
         try:
             # Create the issue link
             self.jira.create_issue_link(data)
 
             # Return a response with the link information
-            inward = data["inwardIssue"]["key"]
-            outward = data["outwardIssue"]["key"]
             return {
                 "success": True,
                 "message": (f"Link created between {inward} and {outward}"),
@@ -155,8 +169,11 @@ class LinksMixin(JiraClient):
                 exc_info=True,
             )
             raise Exception(f"Error creating issue link: {error_msg}") from e
+        finally:
+            publish_invalidation(JIRA_ISSUE, inward, outward)
 
     @handle_auth_errors("Jira API")
+    @invalidates(JIRA_ISSUE, "issue_key")
     def create_remote_issue_link(
         self, issue_key: str, link_data: dict[str, Any]
     ) -> dict[str, Any]:
@@ -282,6 +299,8 @@ class LinksMixin(JiraClient):
 
         try:
             self.jira.remove_issue_link(link_id)
+            # The link ID does not name the issues it joined; drop them all.
+            publish_invalidation(JIRA_ISSUE, WILDCARD)
 
             return {
                 "success": True,
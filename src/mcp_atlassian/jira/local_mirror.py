@@ -0,0 +1,460 @@
+"""Opt-in local full-text mirror of selected Jira projects.
+
+Set ``JIRA_LOCAL_MIRROR_PROJECTS`` to a comma-separated list of project keys
+to keep a copy of their issues in a SQLite file
+(``JIRA_LOCAL_MIRROR_PATH``, default ``~/.mcp-atlassian/jira-mirror.sqlite3``)
+with an FTS5 index over summary, description and comments. ``local_search``
+then answers text queries and simple filters without calling Jira.
+
+The mirror is kept current through ``search_issues``: the first sync of a
+project loads all of its issues, later syncs ask only for issues whose
+``updated`` is newer than the previous sync. Deleted and moved issues do not
+show up in those deltas, so each project is reloaded in full once a day and
+rows not seen again are dropped. Rows are scoped to the credential that
+fetched them, so users never see issues mirrored with someone else's
+permissions.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import Any
+
+from ..exceptions import MCPAtlassianAuthenticationError
+from ..models.jira import JiraIssue
+from ..utils.cache import config_cache_scope
+from ..utils.decorators import handle_auth_errors
+from ..utils.env import get_int_env
+from ..utils.fts import (
+    SyncClaims,
+    connect_fts_database,
+    fts_match_query,
+    iso_timestamp,
+)
+from .client import JiraClient
+from .protocols import SearchOperationsProto
+
+logger = logging.getLogger("mcp-jira")
+
+LOCAL_MIRROR_PROJECTS_ENV = "JIRA_LOCAL_MIRROR_PROJECTS"
+LOCAL_MIRROR_PATH_ENV = "JIRA_LOCAL_MIRROR_PATH"
+LOCAL_MIRROR_SYNC_INTERVAL_ENV = "JIRA_LOCAL_MIRROR_SYNC_INTERVAL"
+DEFAULT_LOCAL_MIRROR_SYNC_INTERVAL = 300
+# Deltas cannot see deletions or moves; a daily full reload drops them.
+FULL_RESYNC_SECONDS = 24 * 60 * 60
+
+_MIRROR_FIELDS = (
+    "summary,description,comment,status,issuetype,priority,assignee,updated"
+)
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS mirror_issues (
+    id INTEGER PRIMARY KEY,
+    scope TEXT NOT NULL,
+    key TEXT NOT NULL,
+    project TEXT NOT NULL,
+    summary TEXT NOT NULL,
+    description TEXT NOT NULL,
+    comments TEXT NOT NULL,
+    status TEXT,
+    issue_type TEXT,
+    priority TEXT,
+    assignee TEXT,
+    updated TEXT,
+    mirrored_at REAL NOT NULL,
+    UNIQUE (scope, key)
+);
+CREATE INDEX IF NOT EXISTS mirror_issues_project ON mirror_issues (scope, project);
+CREATE VIRTUAL TABLE IF NOT EXISTS mirror_issues_fts USING fts5(
+    summary, description, comments, content='mirror_issues', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS mirror_issues_ai AFTER INSERT ON mirror_issues BEGIN
+    INSERT INTO mirror_issues_fts (rowid, summary, description, comments)
+    VALUES (new.id, new.summary, new.description, new.comments);
+END;
+CREATE TRIGGER IF NOT EXISTS mirror_issues_ad AFTER DELETE ON mirror_issues BEGIN
+    INSERT INTO mirror_issues_fts
+        (mirror_issues_fts, rowid, summary, description, comments)
+    VALUES ('delete', old.id, old.summary, old.description, old.comments);
+END;
+CREATE TRIGGER IF NOT EXISTS mirror_issues_au AFTER UPDATE ON mirror_issues BEGIN
+    INSERT INTO mirror_issues_fts
+        (mirror_issues_fts, rowid, summary, description, comments)
+    VALUES ('delete', old.id, old.summary, old.description, old.comments);
+    INSERT INTO mirror_issues_fts (rowid, summary, description, comments)
+    VALUES (new.id, new.summary, new.description, new.comments);
+END;
+CREATE TABLE IF NOT EXISTS mirror_projects (
+    scope TEXT NOT NULL,
+    project TEXT NOT NULL,
+    synced_at REAL NOT NULL,
+    full_synced_at REAL NOT NULL,
+    PRIMARY KEY (scope, project)
+);
+"""
+_UPSERT = (
+    "INSERT INTO mirror_issues (scope, key, project, summary, description, "
+    "comments, status, issue_type, priority, assignee, updated, mirrored_at) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT (scope, key) DO UPDATE SET project = excluded.project, "
+    "summary = excluded.summary, description = excluded.description, "
+    "comments = excluded.comments, status = excluded.status, "
+    "issue_type = excluded.issue_type, priority = excluded.priority, "
+    "assignee = excluded.assignee, updated = excluded.updated, "
+    "mirrored_at = excluded.mirrored_at"
+)
+_RESULT_COLUMNS = (
+    "i.key, i.project, i.summary, i.status, i.issue_type, i.priority, "
+    "i.assignee, i.updated, i.mirrored_at, p.synced_at"
+)
+
+
+def get_local_mirror_projects() -> list[str]:
+    """Return the project keys configured for mirroring (empty = disabled)."""
+    raw = os.getenv(LOCAL_MIRROR_PROJECTS_ENV, "")
+    return [key.strip().upper() for key in raw.split(",") if key.strip()]
+
+
+def _issue_row(issue: JiraIssue) -> tuple[Any, ...]:
+    return (
+        issue.summary,
+        issue.description or "",
+        "\n\n".join(comment.body for comment in issue.comments if comment.body),
+        issue.status.name if issue.status else None,
+        issue.issue_type.name if issue.issue_type else None,
+        issue.priority.name if issue.priority else None,
+        issue.assignee.display_name if issue.assignee else None,
+        issue.updated or None,
+    )
+
+
+class IssueMirror:
+    """SQLite store behind the local issue mirror.
+
+    One connection is shared by worker threads and guarded by a lock. Syncs
+    are claimed per credential and project, so concurrent tool calls do not
+    load the same project twice and never wait on each other's scans.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path).expanduser()
+        self._conn = connect_fts_database(self.path)
+        self._lock = threading.Lock()
+        self.syncs = SyncClaims()
+        with self._lock:
+            self._conn.executescript(_SCHEMA)
+
+    def sync_state(self, scope: str, project: str) -> tuple[float, float] | None:
+        """Return ``(synced_at, full_synced_at)`` for a project, if synced."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT synced_at, full_synced_at FROM mirror_projects "
+                "WHERE scope = ? AND project = ?",
+                (scope, project),
+            ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def upsert(
+        self, scope: str, project: str, issues: Iterable[JiraIssue], now: float
+    ) -> int:
+        """Store or refresh issues of *project*; returns how many were written."""
+        rows = [
+            (scope, issue.key, project, *_issue_row(issue), now) for issue in issues
+        ]
+        if rows:
+            with self._lock, self._conn:
+                self._conn.executemany(_UPSERT, rows)
+        return len(rows)
+
+    def finish_sync(self, scope: str, project: str, started: float, full: bool) -> int:
+        """Record a completed sync; a full one drops rows it did not see.
+
+        Returns the number of rows removed.
+        """
+        with self._lock, self._conn:
+            removed = 0
+            if full:
+                removed = self._conn.execute(
+                    "DELETE FROM mirror_issues "
+                    "WHERE scope = ? AND project = ? AND mirrored_at < ?",
+                    (scope, project, started),
+                ).rowcount
+            self._conn.execute(
+                "INSERT INTO mirror_projects VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (scope, project) DO UPDATE SET "
+                "synced_at = excluded.synced_at, full_synced_at = CASE WHEN ? "
+                "THEN excluded.full_synced_at ELSE full_synced_at END",
+                (scope, project, started, started, full),
+            )
+        return removed
+
+    def search(
+        self,
+        scope: str,
+        query: str,
+        projects: Sequence[str],
+        status: str | None = None,
+        assignee: str | None = None,
+        issue_type: str | None = None,
+        limit: int = 20,
+    ) -> list[dict[str, Any]]:
+        """Return mirrored issues matching *query* and the filters.
+
+        With a query, results are ranked by relevance (summary matches
+        weigh most) and carry a snippet; without one they are filtered only
+        and ordered by most recently updated.
+        """
+        match = fts_match_query(query)
+        conditions = ["i.scope = ?"]
+        params: list[Any] = [scope]
+        if projects:
+            conditions.append(f"i.project IN ({','.join('?' for _ in projects)})")
+            params.extend(projects)
+        for column, value in (
+            ("status", status),
+            ("assignee", assignee),
+            ("issue_type", issue_type),
+        ):
+            if value:
+                conditions.append(f"i.{column} = ? COLLATE NOCASE")
+                params.append(value)
+        join = "JOIN mirror_projects p ON p.scope = i.scope AND p.project = i.project"
+        if match:
+            sql = (
+                f"SELECT {_RESULT_COLUMNS}, snippet(mirror_issues_fts, -1, "  # noqa: S608
+                "'[', ']', '...', 16) FROM mirror_issues_fts "
+                f"JOIN mirror_issues i ON i.id = mirror_issues_fts.rowid {join} "
+                f"WHERE mirror_issues_fts MATCH ? AND {' AND '.join(conditions)} "
+                "ORDER BY bm25(mirror_issues_fts, 10.0, 2.0, 1.0) LIMIT ?"
+            )
+            params = [match, *params, limit]
+        else:
+            sql = (
+                f"SELECT {_RESULT_COLUMNS}, NULL FROM mirror_issues i {join} "  # noqa: S608
+                f"WHERE {' AND '.join(conditions)} "
+                "ORDER BY i.updated DESC, i.key LIMIT ?"
+            )
+            params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        now = time.time()
+        results = []
+        for (
+            key,
+            project,
+            summary,
+            row_status,
+            row_type,
+            priority,
+            row_assignee,
+            updated,
+            mirrored_at,
+            synced_at,
+            snippet,
+        ) in rows:
+            result: dict[str, Any] = {
+                "key": key,
+                "project": project,
+                "summary": summary,
+                "status": row_status,
+                "issue_type": row_type,
+                "priority": priority,
+                "assignee": row_assignee,
+                "updated": updated,
+            }
+            if snippet is not None:
+                result["snippet"] = snippet
+            result["freshness"] = {
+                "mirrored_at": iso_timestamp(mirrored_at),
+                "synced_at": iso_timestamp(synced_at),
+                "age_seconds": max(int(now - synced_at), 0),
+            }
+            results.append(result)
+        return results
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def _default_mirror_path() -> Path:
+    return Path.home() / ".mcp-atlassian" / "jira-mirror.sqlite3"
+
+
+_issue_mirror: IssueMirror | None = None
+_issue_mirror_lock = threading.Lock()
+
+
+def get_issue_mirror() -> IssueMirror:
+    """Return the process-wide issue mirror, opening it on first use."""
+    global _issue_mirror
+    with _issue_mirror_lock:
+        if _issue_mirror is None:
+            path = os.getenv(LOCAL_MIRROR_PATH_ENV, "").strip()
+            _issue_mirror = IssueMirror(path or _default_mirror_path())
+            logger.info("Using local Jira mirror at %s.", _issue_mirror.path)
+        return _issue_mirror
+
+
+def _reset_issue_mirror_for_tests() -> None:
+    global _issue_mirror
+    with _issue_mirror_lock:
+        if _issue_mirror is not None:
+            _issue_mirror.close()
+        _issue_mirror = None
+
+
+class LocalMirrorMixin(JiraClient, SearchOperationsProto):
+    """Mixin for the local full-text issue mirror."""
+
+    def _mirror_projects(self, projects: Sequence[str] | None) -> list[str]:
+        configured = get_local_mirror_projects()
+        if not configured:
+            raise ValueError(
+                f"The local issue mirror is disabled. Set {LOCAL_MIRROR_PROJECTS_ENV} "
+                "to the project keys to mirror."
+            )
+        if not projects:
+            return configured
+        requested = [key.strip().upper() for key in projects if key.strip()]
+        unknown = [key for key in requested if key not in configured]
+        if unknown:
+            raise ValueError(
+                f"Projects not mirrored: {', '.join(unknown)}. "
+                f"Mirrored projects: {', '.join(configured)}."
+            )
+        return requested
+
+    @handle_auth_errors("Jira API")
+    def sync_local_mirror(
+        self,
+        projects: Sequence[str] | None = None,
+        max_age_seconds: float = 0,
+    ) -> dict[str, dict[str, Any]]:
+        """Bring mirrored projects up to date with Jira.
+
+        Args:
+            projects: Project keys to sync (default: every mirrored project).
+            max_age_seconds: Skip projects synced more recently than this.
+
+        Returns:
+            Per project: the sync ``mode`` (``full``, ``delta``, ``skipped``,
+            or ``in_progress`` when another call is syncing it) and how many
+            issues were ``written`` and ``removed``.
+
+        Raises:
+            ValueError: If the mirror is disabled or a project is not mirrored.
+        """
+        mirror = get_issue_mirror()
+        scope = config_cache_scope(self.config)
+        report: dict[str, dict[str, Any]] = {}
+        for project in self._mirror_projects(projects):
+            with mirror.syncs.claim(scope, project) as claimed:
+                if not claimed:
+                    # Another call is already syncing this project; searching
+                    # the rows stored so far beats waiting for its scan.
+                    report[project] = {
+                        "mode": "in_progress",
+                        "written": 0,
+                        "removed": 0,
+                    }
+                    continue
+                report[project] = self._sync_mirror_project(
+                    mirror, scope, project, max_age_seconds
+                )
+        return report
+
+    def _sync_mirror_project(
+        self,
+        mirror: IssueMirror,
+        scope: str,
+        project: str,
+        max_age_seconds: float,
+    ) -> dict[str, Any]:
+        started = time.time()
+        state = mirror.sync_state(scope, project)
+        if state is not None and started - state[0] < max_age_seconds:
+            return {"mode": "skipped", "written": 0, "removed": 0}
+        full = state is None or started - state[1] >= FULL_RESYNC_SECONDS
+        jql = f'project = "{project}"'
+        if state is not None and not full:
+            # Relative minutes sidestep the Jira user's timezone; the extra
+            # minute covers clock skew between us and Jira.
+            minutes = math.ceil((started - state[0]) / 60) + 1
+            jql += f" AND updated >= -{minutes}m"
+        written = 0
+        for page in self.iter_search_pages(
+            f"{jql} ORDER BY key ASC", fields=_MIRROR_FIELDS
+        ):
+            written += mirror.upsert(scope, project, page.issues, time.time())
+        removed = mirror.finish_sync(scope, project, started, full)
+        result = {
+            "mode": "full" if full else "delta",
+            "written": written,
+            "removed": removed,
+        }
+        logger.debug("Local mirror sync of %s: %s", project, result)
+        return result
+
+    def local_search(
+        self,
+        query: str = "",
+        projects: Sequence[str] | None = None,
+        status: str | None = None,
+        assignee: str | None = None,
+        issue_type: str | None = None,
+        limit: int = 20,
+        refresh: bool = True,
+    ) -> dict[str, Any]:
+        """Search the local issue mirror.
+
+        Args:
+            query: Words to find in summary, description or comments; a
+                trailing ``*`` matches a prefix. Empty lists by filters only.
+            projects: Mirrored project keys to search (default: all).
+            status: Exact status name (case-insensitive).
+            assignee: Exact assignee display name (case-insensitive).
+            issue_type: Exact issue type name (case-insensitive).
+            limit: Maximum results.
+            refresh: First sync projects older than
+                ``JIRA_LOCAL_MIRROR_SYNC_INTERVAL`` seconds. A failed sync is
+                reported and the existing mirror is searched anyway.
+
+        Returns:
+            ``issues`` with per-result ``freshness``, plus ``sync`` details
+            when a refresh ran.
+
+        Raises:
+            ValueError: If the mirror is disabled or a project is not mirrored.
+        """
+        selected = self._mirror_projects(projects)
+        result: dict[str, Any] = {}
+        if refresh:
+            interval = get_int_env(
+                LOCAL_MIRROR_SYNC_INTERVAL_ENV, DEFAULT_LOCAL_MIRROR_SYNC_INTERVAL
+            )
+            try:
+                result["sync"] = self.sync_local_mirror(
+                    selected, max_age_seconds=interval
+                )
+            except (MCPAtlassianAuthenticationError, sqlite3.Error, ValueError):
+                raise
+            except Exception as e:  # noqa: BLE001 - fall back to mirrored data
+                logger.warning("Local mirror sync failed: %s", e)
+                result["sync_error"] = str(e)
+        issues = get_issue_mirror().search(
+            config_cache_scope(self.config),
+            query,
+            selected,
+            status=status,
+            assignee=assignee,
+            issue_type=issue_type,
+            limit=limit,
+        )
+        return {"query": query, "projects": selected, "issues": issues, **result}
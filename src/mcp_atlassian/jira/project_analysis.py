@@ -1,10 +1,13 @@
 """Module for Jira project-level analysis operations."""
 
+import contextlib
 from collections import defaultdict
+from collections.abc import Iterator
 from typing import Any
 
-from ..models.jira import JiraSearchResult
+from ..models.jira.issue import IssueFieldProjection
 from ..utils.decorators import handle_auth_errors
+from ..utils.progress import PageProgress
 from .client import JiraClient
 from .constants import CHILD_OF_PHRASES
 
@@ -17,6 +20,7 @@ _LINK_FIELDS = [
     "issuelinks",
     "parent",
 ]
+_LINK_PROJECTION = IssueFieldProjection(_LINK_FIELDS)
 
 
 def _project_key_from_issue_key(issue_key: str) -> str:
@@ -31,47 +35,75 @@ class ProjectAnalysisMixin(JiraClient):
     # Shared helper
     # ------------------------------------------------------------------
 
-    def _fetch_project_issues_with_links(
+    def _iter_project_issues_with_links(
         self,
         jql: str,
         max_issues: int,
-    ) -> list[dict[str, Any]]:
-        """Fetch issues matching *jql* with link data, handling pagination.
+        cursor: str | None = None,
+        progress: PageProgress | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Stream issues matching *jql* with link data.
+
+        Pages are fetched lazily through ``iter_search_pages``, so callers
+        can reduce each issue as it arrives instead of holding the whole
+        scan. With *progress*, each page is reported and the scan stops at a
+        page boundary once the deadline passes, leaving ``progress.cursor``
+        set to where it can resume.
 
         Args:
             jql: JQL query to execute.
             max_issues: Upper bound on the number of issues.
+            cursor: Resume point from an earlier deadline-cut scan: a
+                nextPageToken on Cloud, a start offset on Server/DC.
+            progress: Optional per-page progress sink and deadline.
 
-        Returns:
-            List of simplified issue dicts (via ``to_simplified_dict``).
+        Yields:
+            Simplified issue dicts (via ``to_simplified_dict``).
+
+        Raises:
+            ValueError: If a Server/DC *cursor* is not an offset.
         """
-        result: JiraSearchResult = self.search_issues(  # type: ignore[attr-defined]
-            jql=jql,
-            fields=_LINK_FIELDS,
-            limit=max_issues,
-        )
-        all_issues: list[dict[str, Any]] = [
-            issue.to_simplified_dict() for issue in result.issues
-        ]
-
-        # Cloud paginates internally via nextPageToken — only page
-        # manually on Server/DC where each response caps at 50.
-        if not self.config.is_cloud:
-            while (
-                len(all_issues) < max_issues
-                and len(result.issues) >= _SERVER_DC_PAGE_SIZE
-            ):
-                result = self.search_issues(  # type: ignore[attr-defined]
-                    jql=jql,
-                    fields=_LINK_FIELDS,
-                    start=len(all_issues),
-                    limit=max_issues - len(all_issues),
+        is_cloud = self.config.is_cloud
+        if is_cloud:
+            pages = self.iter_search_pages(  # type: ignore[attr-defined]
+                jql, fields=_LINK_FIELDS, limit=max_issues, page_token=cursor
+            )
+        else:
+            try:
+                start = int(cursor) if cursor else 0
+            except ValueError:
+                raise ValueError(
+                    f"Invalid cursor {cursor!r}: expected a start offset"
+                ) from None
+            pages = self.iter_search_pages(  # type: ignore[attr-defined]
+                jql, fields=_LINK_FIELDS, limit=max_issues, start=start
+            )
+
+        seen: set[str] = set()
+        scanned = 0
+        with contextlib.closing(pages):
+            for page in pages:
+                for issue in page.issues:
+                    if issue.key in seen:
+                        continue
+                    seen.add(issue.key)
+                    yield issue.to_simplified_dict(_LINK_PROJECTION)
+                scanned += len(page.issues)
+                if progress is None:
+                    continue
+                progress.page_done(
+                    scanned, max_issues, f"Scanned {scanned} of up to {max_issues}"
                 )
-                if not result.issues:
+                if not page.issues or scanned >= max_issues:
+                    break
+                if is_cloud:
+                    next_cursor: str | int | None = page.next_page_token
+                else:
+                    next_offset = page.start_at + len(page.issues)
+                    more = page.total < 0 or next_offset < page.total
+                    next_cursor = next_offset if more else None
+                if progress.should_stop(next_cursor):
                     break
-                all_issues.extend(issue.to_simplified_dict() for issue in result.issues)
-
-        return all_issues[:max_issues]
 
     # ------------------------------------------------------------------
     # Public methods
@@ -103,32 +135,25 @@ class ProjectAnalysisMixin(JiraClient):
             Exception: On API or query errors.
         """
         jql = f'project = "{project_key}" AND issuetype = Epic ORDER BY updated DESC'
-        epic_dicts = self._fetch_project_issues_with_links(jql, max_epics)
-
         parent_keys: set[str] = set()
-        epic_to_parent: dict[str, str | None] = {}
+        groups: dict[str | None, list[dict[str, Any]]] = defaultdict(list)
+        total_epics = 0
 
-        for epic in epic_dicts:
+        for epic in self._iter_project_issues_with_links(jql, max_epics):
+            total_epics += 1
             parent_key = self._detect_parent_key(epic, project_key)
-            key = epic.get("key", "")
-            epic_to_parent[key] = parent_key
             if parent_key:
                 parent_keys.add(parent_key)
-
-        parent_info = self._batch_fetch_summaries(parent_keys)
-
-        groups: dict[str | None, list[dict[str, Any]]] = defaultdict(list)
-        for epic in epic_dicts:
-            key = epic.get("key", "")
-            parent_key = epic_to_parent.get(key)
             groups[parent_key].append(
                 {
-                    "key": key,
+                    "key": epic.get("key", ""),
                     "summary": epic.get("summary", ""),
                     "status": self._extract_status_name(epic),
                 }
             )
 
+        parent_info = self._batch_fetch_summaries(parent_keys)
+
         result_groups: list[dict[str, Any]] = []
         for pk in sorted(groups, key=lambda k: (k is None, k or "")):
             if pk is None:
@@ -154,7 +179,7 @@ class ProjectAnalysisMixin(JiraClient):
 
         return {
             "project_key": project_key,
-            "total_epics": len(epic_dicts),
+            "total_epics": total_epics,
             "groups": result_groups,
         }
 
@@ -163,6 +188,8 @@ class ProjectAnalysisMixin(JiraClient):
         self,
         project_key: str,
         max_issues: int = 200,
+        cursor: str | None = None,
+        progress: PageProgress | None = None,
     ) -> dict[str, Any]:
         """Find all cross-project issue links for a project.
 
@@ -172,26 +199,33 @@ class ProjectAnalysisMixin(JiraClient):
 
         Args:
             project_key: Jira project key (e.g. ``PROJ``).
-            max_issues: Maximum issues to scan.
+            max_issues: Maximum issues to scan in this call.
+            cursor: ``next_cursor`` from an earlier partial result, to
+                continue that scan.
+            progress: Optional per-page progress sink and deadline.
 
         Returns:
             Dict with ``project_key``, ``total_issues_scanned``,
             ``total_cross_project_links``, and ``by_project`` grouped
-            results.
+            results. When the deadline cut the scan short it also holds
+            ``next_cursor``.
 
         Raises:
             MCPAtlassianAuthenticationError: If authentication fails.
             Exception: On API or query errors.
         """
         jql = f'project = "{project_key}" ORDER BY updated DESC'
-        issues = self._fetch_project_issues_with_links(jql, max_issues)
-
         by_project: dict[str, dict[str, list[dict[str, str]]]] = defaultdict(
             lambda: defaultdict(list)
         )
         total_links = 0
+        total_scanned = 0
 
+        issues = self._iter_project_issues_with_links(
+            jql, max_issues, cursor=cursor, progress=progress
+        )
         for issue in issues:
+            total_scanned += 1
             issue_key = issue.get("key", "")
             for link_info in self._extract_cross_project_links(issue, project_key):
                 target_proj = _project_key_from_issue_key(link_info["target_key"])
@@ -212,12 +246,15 @@ class ProjectAnalysisMixin(JiraClient):
                 "by_link_type": dict(link_types),
             }
 
-        return {
+        result: dict[str, Any] = {
             "project_key": project_key,
-            "total_issues_scanned": len(issues),
+            "total_issues_scanned": total_scanned,
             "total_cross_project_links": total_links,
             "by_project": by_project_output,
         }
+        if progress is not None and progress.deadline_reached:
+            result["next_cursor"] = progress.cursor
+        return result
 
     # ------------------------------------------------------------------
     # Private helpers
@@ -6,11 +6,21 @@ from typing import Any
 from ..models import JiraProject
 from ..models.jira.search import JiraSearchResult
 from ..models.jira.version import JiraVersion
+from ..utils.cache import (
+    JIRA_PROJECT,
+    ResponseCache,
+    config_cache_scope,
+    entity_key,
+)
 from .client import JiraClient
 from .protocols import SearchOperationsProto
 
 logger = logging.getLogger("mcp-jira")
 
+# Project metadata shared across fetchers; version writes made through this
+# server invalidate it via the project entity.
+_project_metadata_cache = ResponseCache("jira.project_metadata")
+
 
 class ProjectsMixin(JiraClient, SearchOperationsProto):
     """Mixin for Jira project operations.
@@ -177,7 +187,11 @@ class ProjectsMixin(JiraClient, SearchOperationsProto):
             List of component data dictionaries
         """
         try:
-            components = self.jira.get_project_components(key=project_key)
+            components = _project_metadata_cache.get_or_load(
+                (config_cache_scope(self.config), "components", project_key),
+                lambda: self.jira.get_project_components(key=project_key),
+                entities=(entity_key(JIRA_PROJECT, project_key),),
+            )
             return components if isinstance(components, list) else []
 
         except Exception as e:
@@ -197,7 +211,11 @@ class ProjectsMixin(JiraClient, SearchOperationsProto):
             List of version data dictionaries
         """
         try:
-            raw_versions = self.jira.get_project_versions(key=project_key)
+            raw_versions = _project_metadata_cache.get_or_load(
+                (config_cache_scope(self.config), "versions", project_key),
+                lambda: self.jira.get_project_versions(key=project_key),
+                entities=(entity_key(JIRA_PROJECT, project_key),),
+            )
             if not isinstance(raw_versions, list):
                 return []
             versions: list[dict[str, Any]] = []
@@ -520,23 +538,12 @@ class ProjectsMixin(JiraClient, SearchOperationsProto):
             project_key: The project key
 
         Returns:
-            Count of issues in the project
+            Count of issues in the project (approximate on Cloud)
         """
         try:
-            # Use JQL to count issues in the project
             jql = f'project = "{project_key}"'
-            result = self.jira.jql(jql=jql, fields="key", limit=1)
-            if not isinstance(result, dict):
-                msg = f"Unexpected return value type from `jira.jql`: {type(result)}"
-                logger.error(msg)
-                raise TypeError(msg)
-
-            # Extract total from the response
-            total = 0
-            if isinstance(result, dict) and "total" in result:
-                total = result.get("total", 0)
-
-            return total
+            # Like the search this replaced, not narrowed by JIRA_PROJECTS_FILTER.
+            return self._count_jql(jql)  # type: ignore[attr-defined]
 
         except Exception as e:
             logger.error(
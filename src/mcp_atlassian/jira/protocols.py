@@ -1,6 +1,7 @@
 """Module for Jira protocol definitions."""
 
 from abc import abstractmethod
+from collections.abc import Iterator
 from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 
 from ..models.jira import JiraIssue, ProFormaForm
@@ -97,6 +98,20 @@ class SearchOperationsProto(Protocol):
     ) -> JiraSearchResult:
         """Search for issues using JQL."""
 
+    @abstractmethod
+    def iter_search_pages(
+        self,
+        jql: str,
+        fields: list[str] | tuple[str, ...] | set[str] | str | None = None,
+        limit: int | None = None,
+        page_size: int | None = None,
+        expand: str | None = None,
+        projects_filter: str | None = None,
+        start: int = 0,
+        page_token: str | None = None,
+    ) -> Iterator[JiraSearchResult]:
+        """Search with JQL, yielding one result per page."""
+
 
 class EpicOperationsProto(Protocol):
     """Protocol defining epic operations interface."""
@@ -1,15 +1,37 @@
 """Module for Jira search operations."""
 
+import contextlib
+import itertools
 import logging
+import math
+import queue
 import re
-from typing import Any
+import sys
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, TypeVar
 
 import requests
 from requests.exceptions import HTTPError
 
-from ..models.jira import JiraSearchResult
+from ..exceptions import MCPAtlassianAuthenticationError
+from ..models.jira import JiraIssue, JiraSearchResult
+from ..utils.cache import (
+    JIRA_ISSUE,
+    JIRA_PROJECT,
+    WILDCARD,
+    ResponseCache,
+    config_cache_scope,
+    entity_key,
+    invalidation_bus,
+)
 from ..utils.decorators import handle_auth_errors
+from ..utils.env import get_int_env
 from ..utils.pagination import clamp_limit
+from ..utils.progress import PageProgress
 from .client import JiraClient
 from .constants import DEFAULT_READ_JIRA_FIELDS
 from .protocols import IssueOperationsProto
@@ -17,6 +39,228 @@ from .utils import quote_jql_identifier_if_needed, sanitize_jql_reserved_words
 
 logger = logging.getLogger("mcp-jira")
 
+# Server/DC returns at most this many issues per search request.
+SERVER_DC_PAGE_SIZE = 50
+# Largest maxResults the Cloud v3 search endpoint accepts.
+CLOUD_PAGE_SIZE = 100
+SEARCH_MAX_WORKERS_ENV = "JIRA_SEARCH_MAX_WORKERS"
+DEFAULT_SEARCH_MAX_WORKERS = 4
+MAX_MULTI_SEARCH_QUERIES = 10
+MAX_BATCH_GET_ISSUES = 500
+ISSUE_COUNT_CACHE_TTL_ENV = "MCP_ATLASSIAN_ISSUE_COUNT_CACHE_TTL"
+DEFAULT_ISSUE_COUNT_CACHE_TTL = 30
+
+# Match counts per (credential, JQL). Any query may match any issue, so the
+# entries hang off the issue wildcard and every issue or project write made
+# through this server marks all of them stale.
+_ALL_ISSUES = entity_key(JIRA_ISSUE, WILDCARD)
+
+
+def _issue_count_cache_ttl() -> int:
+    return get_int_env(ISSUE_COUNT_CACHE_TTL_ENV, DEFAULT_ISSUE_COUNT_CACHE_TTL)
+
+
+_issue_count_cache = ResponseCache("jira.issue_count", max_ttl=_issue_count_cache_ttl)
+
+
+def _invalidate_issue_counts(entity: str) -> None:
+    if entity.partition(":")[0] in (JIRA_ISSUE, JIRA_PROJECT):
+        _issue_count_cache.invalidate(_ALL_ISSUES)
+
+
+invalidation_bus.subscribe(_invalidate_issue_counts)
+
+JQL_RESULT_CACHE_TTL_ENV = "MCP_ATLASSIAN_JQL_RESULT_CACHE_TTL"
+
+
+def _jql_result_cache_ttl() -> int:
+    return get_int_env(JQL_RESULT_CACHE_TTL_ENV, 0)
+
+
+# Issue bodies from recent searches per (credential, JQL filter, fields,
+# expand). Every use is revalidated against Jira (a key-only search plus an
+# updated-since delta), so entries need no write invalidation and the cache
+# has its own opt-in TTL rather than the response cache's.
+_jql_result_cache = ResponseCache("jira.jql_results", ttl=_jql_result_cache_ttl)
+
+_ISSUE_KEY = re.compile(r"^[A-Z][A-Z0-9_]*-\d+$")
+_ORDER_BY = re.compile(r"\bORDER\s+BY\b", re.IGNORECASE)
+
+
+def _strip_order_by(jql: str) -> str:
+    """Return *jql* without its top-level ORDER BY clause.
+
+    ``ORDER BY`` inside quoted text or parentheses is part of the query, so
+    the clause is searched for outside both.
+    """
+    depth = 0
+    quote: str | None = None
+    escaped = False
+    for index, char in enumerate(jql):
+        if quote:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == quote:
+                quote = None
+        elif char in "\"'":
+            quote = char
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth = max(depth - 1, 0)
+        elif depth == 0 and _ORDER_BY.match(jql, index):
+            return jql[:index].rstrip()
+    return jql.strip()
+
+
+def _jql_cache_filter(jql: str) -> str:
+    """Return *jql* without ORDER BY and with whitespace collapsed.
+
+    Only used to group cached issue bodies: which issues a page holds always
+    comes from Jira, so queries that normalise alike may share an entry.
+    """
+    return " ".join(_strip_order_by(jql).split())
+
+
+def _fields_param(
+    fields: list[str] | tuple[str, ...] | set[str] | str | None,
+) -> str:
+    """Return the comma-separated ``fields`` parameter sent to Jira."""
+    if fields is None:  # Use default if None
+        return ",".join(DEFAULT_READ_JIRA_FIELDS)
+    # Convert fields to proper format if it's a list/tuple/set
+    if isinstance(fields, list | tuple | set):
+        return ",".join(fields)
+    return fields
+
+
+def _is_key_only(fields_param: str) -> bool:
+    return {field.strip() for field in fields_param.split(",")} <= {"id", "key"}
+
+
+def _rejected_keys(error: HTTPError, keys: Sequence[str]) -> dict[str, str]:
+    """Map each of ``keys`` that a JQL error message names to that message."""
+    messages: list[str] = []
+    response = error.response
+    if response is not None:
+        try:
+            data = response.json()
+        except ValueError:
+            data = None
+        if isinstance(data, dict) and isinstance(data.get("errorMessages"), list):
+            messages = [str(message) for message in data["errorMessages"]]
+        elif response.text.strip():
+            messages = [response.text.strip()]
+    if not messages:
+        messages = [str(error)]
+    rejected: dict[str, str] = {}
+    for key in keys:
+        pattern = re.compile(rf"(?<![\w-]){re.escape(key)}(?!\d)")
+        for message in messages:
+            if pattern.search(message):
+                rejected[key] = message
+                break
+    return rejected
+
+
+_Request = TypeVar("_Request")
+_Page = TypeVar("_Page")
+
+
+def _prefetch_pages(
+    fetch: Callable[[_Request], _Page],
+    following: Callable[[_Page], _Request | None],
+    request: _Request,
+) -> Iterator[_Page]:
+    """Yield pages of a chained pagination, fetching ahead of the caller.
+
+    The first page is fetched inline, so single-page searches start no
+    thread. After that a producer thread requests each following page as
+    soon as the previous one arrives and hands it over through a one-slot
+    queue: at most one page waits while the caller processes another.
+
+    Args:
+        fetch: Fetches the page for a request.
+        following: Returns the request for the page after the given one, or
+            None when the pagination is complete. Called in page order.
+        request: The first request.
+    """
+    page = fetch(request)
+    next_request = following(page)
+    if next_request is None:
+        yield page
+        return
+
+    handoff: queue.Queue[tuple[_Page | BaseException, bool]] = queue.Queue(maxsize=1)
+    stop = threading.Event()
+
+    def produce(page_request: _Request | None) -> None:
+        # Every put is followed by a stop check, so once the consumer has
+        # drained the slot this thread puts at most once more and exits.
+        try:
+            while page_request is not None and not stop.is_set():
+                fetched_page = fetch(page_request)
+                page_request = following(fetched_page)
+                handoff.put((fetched_page, page_request is None))
+        except BaseException as exc:  # noqa: BLE001 - re-raised by the consumer
+            handoff.put((exc, True))
+
+    producer = threading.Thread(
+        target=produce,
+        args=(next_request,),
+        name="jira-search-prefetch",
+        daemon=True,
+    )
+    producer.start()
+    try:
+        yield page
+        while True:
+            item, last = handoff.get()
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+            if last:
+                return
+    finally:
+        stop.set()
+        with contextlib.suppress(queue.Empty):
+            handoff.get_nowait()
+
+
+def _map_in_order(
+    fetch: Callable[[_Request], _Page],
+    page_requests: Sequence[_Request],
+    max_workers: int,
+) -> Iterator[_Page]:
+    """Yield ``fetch(request)`` for each request, in order, fetched concurrently.
+
+    At most ``max_workers`` requests are in flight or waiting to be consumed,
+    so a long scan holds a bounded number of pages.
+    """
+    if max_workers <= 1 or len(page_requests) <= 1:
+        for request in page_requests:
+            yield fetch(request)
+        return
+
+    pool = ThreadPoolExecutor(
+        max_workers=min(max_workers, len(page_requests)),
+        thread_name_prefix="jira-search",
+    )
+    pending: deque[Future[_Page]] = deque()
+    remaining = iter(page_requests)
+    try:
+        for request in itertools.islice(remaining, max_workers):
+            pending.append(pool.submit(fetch, request))
+        while pending:
+            page = pending.popleft().result()
+            for request in itertools.islice(remaining, 1):
+                pending.append(pool.submit(fetch, request))
+            yield page
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
 
 class SearchMixin(JiraClient, IssueOperationsProto):
     """Mixin for Jira search operations."""
@@ -72,6 +316,313 @@ class SearchMixin(JiraClient, IssueOperationsProto):
         logger.info(f"Applied projects filter to query: {jql}")
         return jql
 
+    def _prepare_search(
+        self,
+        jql: str,
+        fields: list[str] | tuple[str, ...] | set[str] | str | None,
+        projects_filter: str | None,
+    ) -> tuple[str, str]:
+        """Return the JQL and ``fields`` parameter actually sent to Jira."""
+        # Sanitize JQL reserved words in project key values
+        jql = sanitize_jql_reserved_words(jql)
+
+        # Constrain to the allowed projects (JIRA_PROJECTS_FILTER)
+        jql = self._apply_projects_filter(jql, projects_filter)
+
+        return jql, _fields_param(fields)
+
+    def _iter_cloud_search_pages(
+        self,
+        jql: str,
+        fields_param: str,
+        limit: int,
+        expand: str | None,
+        page_token: str | None,
+        progress: PageProgress | None = None,
+    ) -> Iterator[JiraSearchResult]:
+        """Yield each page of a prepared Cloud search as it is parsed.
+
+        The next page is requested as soon as the previous one arrives, so
+        model building overlaps the following round trip and raw pages are
+        not all held at once. With *progress*, the scan stops at a page
+        boundary once its deadline passes.
+        """
+        # Cloud: Use v3 API endpoint POST /rest/api/3/search/jql
+        # The old v2 /rest/api/*/search endpoint is deprecated
+        # See: https://developer.atlassian.com/changelog/#CHANGE-2046
+        fields_list = fields_param.split(",") if fields_param else ["id", "key"]
+        request_body: dict[str, Any] = {"jql": jql, "fields": fields_list}
+        # Note: v3 API uses 'expand' as a comma-separated string, not an array
+        if expand:
+            request_body["expand"] = expand
+        fetched = 0
+
+        def fetch(token: str | None) -> dict[str, Any]:
+            # Only request the remaining count to avoid over-fetching.
+            # This ensures the returned nextPageToken aligns with
+            # the last issue we actually return to the caller.
+            body = {
+                **request_body,
+                "maxResults": min(limit - fetched, CLOUD_PAGE_SIZE),
+            }
+            if token:
+                body["nextPageToken"] = token
+            response = self.jira.post("rest/api/3/search/jql", json=body)
+            if not isinstance(response, dict):
+                msg = f"Unexpected response type from v3 search API: {type(response)}"
+                logger.error(msg)
+                raise TypeError(msg)
+            return response
+
+        def following(response: dict[str, Any]) -> str | None:
+            nonlocal fetched
+            fetched += len(response.get("issues") or [])
+            token = response.get("nextPageToken")
+            if not token or fetched >= limit:
+                return None
+            if progress is not None and progress.should_stop(token):
+                return None
+            return token
+
+        field_names: dict[str, Any] = {}
+        received = 0
+        for response in _prefetch_pages(fetch, following, page_token):
+            # 'fetched' may already count a prefetched page; report what
+            # has actually been handed over.
+            received += len(response.get("issues") or [])
+            if progress is not None:
+                progress.page_done(
+                    received, limit, f"Fetched {received} of up to {limit} issues"
+                )
+            # Later pages may omit 'names'; keep the map seen so far.
+            names = response.get("names")
+            if isinstance(names, dict):
+                field_names.update(names)
+            if field_names:
+                response = {**response, "names": field_names}
+            yield JiraSearchResult.from_api_response(
+                response, base_url=self.config.url, requested_fields=fields_param
+            )
+
+    @handle_auth_errors("Jira API")
+    def iter_search_pages(
+        self,
+        jql: str,
+        fields: list[str] | tuple[str, ...] | set[str] | str | None = None,
+        limit: int | None = None,
+        page_size: int | None = None,
+        expand: str | None = None,
+        projects_filter: str | None = None,
+        start: int = 0,
+        page_token: str | None = None,
+    ) -> Iterator[JiraSearchResult]:
+        """
+        Search with JQL, yielding one ``search_issues`` result per page.
+
+        Pages are fetched ahead of the caller but only a bounded number is
+        held at a time, so a scan of any size runs in constant memory. Cloud
+        follows nextPageToken with the next page prefetched. On Server/DC
+        the first page reports ``total``, so the remaining offsets are
+        fetched concurrently (``JIRA_SEARCH_MAX_WORKERS``, default 4) and
+        yielded in order; a full last page is followed serially in case
+        ``total`` was stale.
+
+        Args:
+            jql: JQL query string
+            fields: Fields to return, as for ``search_issues``
+            limit: Maximum issues to yield across all pages (default: all)
+            page_size: Issues per request (capped at 100 on Cloud and 50 on
+                Server/DC)
+            expand: Optional items to expand (comma-separated)
+            projects_filter: Optional project keys to narrow results within
+                the configured allowlist
+            start: Starting index (Server/DC only)
+            page_token: Pagination token to resume from (Cloud only)
+
+        Yields:
+            JiraSearchResult for each page, in JQL order. Each carries that
+            page's ``next_page_token`` (Cloud) or ``start_at`` and ``total``
+            (Server/DC), so a scan can be resumed from any page.
+        """
+        if limit is None:
+            limit = sys.maxsize
+        else:
+            limit = clamp_limit(limit, context="jira.iter_search_pages")
+        if limit <= 0:
+            return
+
+        if self.config.is_cloud:
+            size = min(page_size or CLOUD_PAGE_SIZE, CLOUD_PAGE_SIZE)
+            fetched = 0
+
+            def fetch_token(token: str | None) -> JiraSearchResult:
+                return self.search_issues(
+                    jql,
+                    fields=fields,
+                    limit=min(size, limit - fetched),
+                    expand=expand,
+                    projects_filter=projects_filter,
+                    page_token=token,
+                )
+
+            def following(page: JiraSearchResult) -> str | None:
+                nonlocal fetched
+                fetched += len(page.issues)
+                token = page.next_page_token
+                return token if token and page.issues and fetched < limit else None
+
+            yield from _prefetch_pages(fetch_token, following, page_token)
+            return
+
+        size = min(page_size or SERVER_DC_PAGE_SIZE, SERVER_DC_PAGE_SIZE)
+        end = start + limit
+
+        def fetch_offset(offset: int) -> JiraSearchResult:
+            return self.search_issues(
+                jql,
+                fields=fields,
+                start=offset,
+                limit=min(size, end - offset),
+                expand=expand,
+                projects_filter=projects_filter,
+            )
+
+        first = fetch_offset(start)
+        yield first
+        # The server may cap pages below what was asked for
+        # (jira.search.views.default.max); step by what it actually returns.
+        step = len(first.issues)
+        if not step:
+            return
+        known_end = min(end, first.total) if first.total >= 0 else start + step
+        offsets = range(start + step, known_end, step)
+        # A short first page is the server's cap unless it ended the results;
+        # later pages are full, and 'total' possibly stale, at that size.
+        page_cap = step if first.total < 0 or known_end > start + step else size
+        workers = max(
+            get_int_env(SEARCH_MAX_WORKERS_ENV, DEFAULT_SEARCH_MAX_WORKERS), 1
+        )
+        last_offset, last = start, first
+        for offset, page in zip(
+            offsets, _map_in_order(fetch_offset, offsets, workers), strict=True
+        ):
+            yield page
+            last_offset, last = offset, page
+
+        def following(offset_page: tuple[int, JiraSearchResult]) -> int | None:
+            offset, page = offset_page
+            next_offset = offset + len(page.issues)
+            full = len(page.issues) >= min(page_cap, end - offset)
+            return next_offset if page.issues and full and next_offset < end else None
+
+        # A full last page means 'total' may have been stale.
+        next_offset = following((last_offset, last))
+        if next_offset is not None:
+            pages = _prefetch_pages(
+                lambda offset: (offset, fetch_offset(offset)), following, next_offset
+            )
+            for _, page in pages:
+                yield page
+
+    def iter_issues(
+        self,
+        jql: str,
+        fields: list[str] | tuple[str, ...] | set[str] | str | None = None,
+        page_size: int | None = None,
+        limit: int | None = None,
+        expand: str | None = None,
+        projects_filter: str | None = None,
+    ) -> Iterator[JiraIssue]:
+        """
+        Stream the issues matching a JQL query.
+
+        Built on ``iter_search_pages``: pages are fetched lazily and ahead of
+        the caller, and only a bounded number are held at once. Issues
+        repeated across page boundaries (when issues are created or re-ranked
+        mid-scan) are yielded once.
+
+        Args:
+            jql: JQL query string
+            fields: Fields to return, as for ``search_issues``
+            page_size: Issues per request
+            limit: Maximum issues to yield (default: all)
+            expand: Optional items to expand (comma-separated)
+            projects_filter: Optional project keys to narrow results within
+                the configured allowlist
+
+        Yields:
+            JiraIssue objects in JQL order
+        """
+        seen: set[str] = set()
+        for page in self.iter_search_pages(
+            jql,
+            fields=fields,
+            limit=limit,
+            page_size=page_size,
+            expand=expand,
+            projects_filter=projects_filter,
+        ):
+            for issue in page.issues:
+                if issue.key not in seen:
+                    seen.add(issue.key)
+                    yield issue
+
+    @handle_auth_errors("Jira API")
+    def count_issues(self, jql: str, projects_filter: str | None = None) -> int:
+        """
+        Count the issues matching a JQL query without fetching any of them.
+
+        Cloud asks ``/rest/api/3/search/approximate-count``, whose figure can
+        trail very recent changes; Server/DC runs the search with
+        ``maxResults=0`` and reads the exact ``total``. With response caching
+        enabled, counts are cached per credential and query for at most
+        ``MCP_ATLASSIAN_ISSUE_COUNT_CACHE_TTL`` seconds (default 30) and
+        dropped as soon as this server writes an issue or project.
+
+        Args:
+            jql: JQL query string; any ORDER BY clause is ignored
+            projects_filter: Optional project keys to narrow the count within
+                the configured allowlist
+
+        Returns:
+            Number of matching issues
+
+        Raises:
+            TypeError: If Jira returns an unexpected response shape
+        """
+        jql, _ = self._prepare_search(jql, None, projects_filter)
+        return self._count_jql(jql)
+
+    def _count_jql(self, jql: str) -> int:
+        """Count the issues matching *jql* as given, without its ORDER BY.
+
+        Unlike ``count_issues`` this neither sanitises the query nor applies
+        the project allowlist.
+        """
+        jql = _strip_order_by(jql)
+        return _issue_count_cache.get_or_load(
+            (config_cache_scope(self.config), jql),
+            lambda: self._fetch_issue_count(jql),
+            entities=(_ALL_ISSUES,),
+        )
+
+    def _fetch_issue_count(self, jql: str) -> int:
+        if self.config.is_cloud:
+            response = self.jira.post(
+                "rest/api/3/search/approximate-count", json={"jql": jql}
+            )
+            count_key = "count"
+        else:
+            response = self.jira.jql(jql, fields="key", limit=0)
+            count_key = "total"
+        if not isinstance(response, dict) or not isinstance(
+            response.get(count_key), int
+        ):
+            msg = f"Unexpected issue count response: {response!r}"
+            logger.error(msg)
+            raise TypeError(msg)
+        return response[count_key]
+
     @handle_auth_errors("Jira API")
     def search_issues(
         self,
@@ -82,6 +633,7 @@ class SearchMixin(JiraClient, IssueOperationsProto):
         expand: str | None = None,
         projects_filter: str | None = None,
         page_token: str | None = None,
+        progress: PageProgress | None = None,
     ) -> JiraSearchResult:
         """
         Search for issues using JQL (Jira Query Language).
@@ -99,6 +651,10 @@ class SearchMixin(JiraClient, IssueOperationsProto):
                 replaces it)
             page_token: Optional pagination token from a previous search result.
                   Cloud only — Server/DC uses start for pagination.
+            progress: Optional per-page progress sink and deadline. When the
+                  deadline stops a multi-page Cloud search early, the result
+                  holds the pages fetched so far and ``next_page_token``
+                  resumes it.
 
         Returns:
             JiraSearchResult object containing issues and metadata (total, start_at, max_results)
@@ -109,116 +665,554 @@ class SearchMixin(JiraClient, IssueOperationsProto):
         """
         try:
             limit = clamp_limit(limit, context="jira.search_issues")
+            jql, fields_param = self._prepare_search(jql, fields, projects_filter)
 
-            # Sanitize JQL reserved words in project key values
-            jql = sanitize_jql_reserved_words(jql)
+            if _jql_result_cache.enabled and not _is_key_only(fields_param):
+                return self._search_with_result_cache(
+                    jql, fields_param, start, limit, expand, page_token, progress
+                )
+            return self._search_prepared(
+                jql, fields_param, start, limit, expand, page_token, progress
+            )
 
-            # Constrain to the allowed projects (JIRA_PROJECTS_FILTER)
-            jql = self._apply_projects_filter(jql, projects_filter)
+        except HTTPError:
+            raise  # let decorator handle auth errors
+        except Exception as e:
+            logger.error(f"Error searching issues with JQL '{jql}': {str(e)}")
+            raise Exception(f"Error searching issues: {str(e)}") from e
 
-            # Convert fields to proper format if it's a list/tuple/set
-            fields_param: str | None
-            if fields is None:  # Use default if None
-                fields_param = ",".join(DEFAULT_READ_JIRA_FIELDS)
-            elif isinstance(fields, list | tuple | set):
-                fields_param = ",".join(fields)
-            else:
-                fields_param = fields
+    def _search_prepared(
+        self,
+        jql: str,
+        fields_param: str,
+        start: int,
+        limit: int,
+        expand: str | None,
+        page_token: str | None,
+        progress: PageProgress | None,
+    ) -> JiraSearchResult:
+        """Run one ``search_issues`` call on an already prepared query."""
+        if self.config.is_cloud:
+            # Cloud pages by nextPageToken; each page is parsed while the
+            # next one is being fetched, so raw pages are not held at once.
+            issues: list[JiraIssue] = []
+            next_page_token: str | None = None
+            for page in self._iter_cloud_search_pages(
+                jql, fields_param, limit, expand, page_token, progress
+            ):
+                issues.extend(page.issues)
+                next_page_token = page.next_page_token
 
-            if self.config.is_cloud:
-                # Cloud: Use v3 API endpoint POST /rest/api/3/search/jql
-                # The old v2 /rest/api/*/search endpoint is deprecated
-                # See: https://developer.atlassian.com/changelog/#CHANGE-2046
+            # Note: v3 API doesn't provide total count, so we use -1
+            return JiraSearchResult(
+                total=-1,
+                start_at=0,
+                max_results=limit,
+                issues=issues[:limit],
+                next_page_token=next_page_token,
+            )
+        limit = min(limit, 50)
+        response = self.jira.jql(
+            jql, fields=fields_param, start=start, limit=limit, expand=expand
+        )
+        if not isinstance(response, dict):
+            msg = f"Unexpected return value type from `jira.jql`: {type(response)}"
+            logger.error(msg)
+            raise TypeError(msg)
+
+        # Convert the response to a search result model
+        search_result = JiraSearchResult.from_api_response(
+            response, base_url=self.config.url, requested_fields=fields_param
+        )
+
+        # Return the full search result object
+        return search_result
+
+    def _search_with_result_cache(
+        self,
+        jql: str,
+        fields_param: str,
+        start: int,
+        limit: int,
+        expand: str | None,
+        page_token: str | None,
+        progress: PageProgress | None,
+    ) -> JiraSearchResult:
+        """Run a search, reusing cached issue bodies that have not changed.
+
+        A key-only search with the same paging decides which issues the page
+        holds and in what order, so deleted issues and issues that stopped
+        matching drop out. Bodies are then fetched only for issues that are
+        new to the cache or were updated since it was last synced, and are
+        merged into the cached set.
+        """
+        synced_at = time.time()
+        key_page = self._search_prepared(
+            jql, "key", start, limit, None, page_token, progress
+        )
+        keys = list(dict.fromkeys(issue.key for issue in key_page.issues if issue.key))
+
+        cache_key = (
+            config_cache_scope(self.config),
+            _jql_cache_filter(jql),
+            fields_param,
+            expand or "",
+        )
+        entry = _jql_result_cache.get(cache_key) or {}
+        cached: dict[str, Any] = entry.get("issues", {})
+        names: dict[str, Any] = dict(entry.get("names", {}))
+        issues = {key: cached[key] for key in keys if key in cached}
+        missing = [key for key in keys if key not in cached]
+        if issues:
+            # Relative dates are evaluated by Jira in its own clock and time
+            # zone; round up to whole minutes and add one for slack.
+            minutes = math.ceil((synced_at - entry["synced_at"]) / 60) + 1
+            changed = self._fetch_issue_bodies(
+                list(issues), fields_param, expand, f"updated >= -{minutes}m"
+            )
+        else:
+            changed = {"issues": {}, "names": {}}
+        fetched = self._fetch_issue_bodies(missing, fields_param, expand)
+        for delta in (changed, fetched):
+            issues.update(delta["issues"])
+            names.update(delta["names"])
+        logger.debug(
+            "JQL result cache: %d cached, %d changed, %d fetched",
+            len(keys) - len(missing) - len(changed["issues"]),
+            len(changed["issues"]),
+            len(fetched["issues"]),
+        )
 
-                # Build request body for v3 API
-                fields_list = fields_param.split(",") if fields_param else ["id", "key"]
-                request_body: dict[str, Any] = {
+        response: dict[str, Any] = {
+            "issues": [issues[key] for key in keys if key in issues],
+            "total": key_page.total,
+            "startAt": key_page.start_at,
+            "maxResults": key_page.max_results,
+        }
+        if names:
+            response["names"] = names
+        if key_page.next_page_token:
+            response["nextPageToken"] = key_page.next_page_token
+        _jql_result_cache.put(
+            cache_key,
+            {"synced_at": synced_at, "issues": issues, "names": names},
+            loaded_at=synced_at,
+        )
+        return JiraSearchResult.from_api_response(
+            response, base_url=self.config.url, requested_fields=fields_param
+        )
+
+    def _fetch_issue_bodies(
+        self,
+        keys: list[str],
+        fields_param: str,
+        expand: str | None,
+        condition: str | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """Fetch raw issues for *keys* (optionally narrowed by *condition*).
+
+        Returns:
+            ``{"issues": {key: raw issue}, "names": {...}}``
+        """
+        found: dict[str, Any] = {}
+        names: dict[str, Any] = {}
+        for offset in range(0, len(keys), SERVER_DC_PAGE_SIZE):
+            chunk = keys[offset : offset + SERVER_DC_PAGE_SIZE]
+            key_list = ", ".join(f'"{key}"' for key in chunk)
+            jql = f"key in ({key_list})"
+            if condition:
+                jql = f"{jql} AND {condition}"
+            if self.config.is_cloud:
+                body: dict[str, Any] = {
                     "jql": jql,
-                    "fields": fields_list,
+                    "fields": fields_param.split(","),
+                    "maxResults": len(chunk),
                 }
-                # Note: v3 API uses 'expand' as a comma-separated string, not an array
                 if expand:
-                    request_body["expand"] = expand
+                    body["expand"] = expand
+                response = self.jira.post("rest/api/3/search/jql", json=body)
+            else:
+                response = self.jira.jql(
+                    jql, fields=fields_param, start=0, limit=len(chunk), expand=expand
+                )
+            if not isinstance(response, dict):
+                msg = f"Unexpected search response type: {type(response)}"
+                logger.error(msg)
+                raise TypeError(msg)
+            for issue in response.get("issues") or []:
+                if isinstance(issue, dict) and issue.get("key"):
+                    found[issue["key"]] = issue
+            if isinstance(response.get("names"), dict):
+                names.update(response["names"])
+        return {"issues": found, "names": names}
 
-                # Fetch issues using v3 API with nextPageToken pagination
-                all_issues: list[dict[str, Any]] = []
-                field_names: dict[str, Any] = {}
-                next_page_token: str | None = page_token
+    @handle_auth_errors("Jira API")
+    def search_all_issues(
+        self,
+        jql: str,
+        fields: list[str] | tuple[str, ...] | set[str] | str | None = None,
+        limit: int = 1000,
+        expand: str | None = None,
+        projects_filter: str | None = None,
+    ) -> JiraSearchResult:
+        """
+        Search with JQL across as many pages as needed for ``limit`` issues.
 
-                while len(all_issues) < limit:
-                    # Only request the remaining count to avoid over-fetching.
-                    # This ensures the returned nextPageToken aligns with
-                    # the last issue we actually return to the caller.
-                    remaining = limit - len(all_issues)
-                    request_body["maxResults"] = min(remaining, 100)
+        Cloud pages internally in ``search_issues``. On Server/DC, where each
+        request returns at most 50 issues, the pages come from
+        ``iter_search_pages``, which fetches the offsets after the first page
+        concurrently.
 
-                    if next_page_token:
-                        request_body["nextPageToken"] = next_page_token
+        Args:
+            jql: JQL query string
+            fields: Fields to return, as for ``search_issues``
+            limit: Maximum issues to return
+            expand: Optional items to expand (comma-separated)
+            projects_filter: Optional project keys to narrow results within
+                the configured allowlist
 
-                    response = self.jira.post(
-                        "rest/api/3/search/jql", json=request_body
-                    )
+        Returns:
+            JiraSearchResult with up to ``limit`` issues in JQL order
+        """
+        limit = clamp_limit(limit, context="jira.search_all_issues")
+        if self.config.is_cloud:
+            return self.search_issues(
+                jql,
+                fields=fields,
+                limit=limit,
+                expand=expand,
+                projects_filter=projects_filter,
+            )
 
-                    if not isinstance(response, dict):
-                        msg = f"Unexpected response type from v3 search API: {type(response)}"
-                        logger.error(msg)
-                        raise TypeError(msg)
-
-                    issues = response.get("issues", [])
-                    all_issues.extend(issues)
-
-                    names = response.get("names")
-                    if isinstance(names, dict):
-                        field_names.update(names)
-
-                    # Check for more pages
-                    next_page_token = response.get("nextPageToken")
-                    if not next_page_token:
-                        break
-
-                # Build response dict for model
-                # Note: v3 API doesn't provide total count, so we use -1
-                response_dict: dict[str, Any] = {
-                    "issues": all_issues[:limit],
-                    "total": -1,
-                    "startAt": 0,
-                    "maxResults": limit,
-                }
-                if next_page_token:
-                    response_dict["nextPageToken"] = next_page_token
-                if field_names:
-                    response_dict["names"] = field_names
-
-                search_result = JiraSearchResult.from_api_response(
-                    response_dict,
-                    base_url=self.config.url,
-                    requested_fields=fields_param,
-                )
+        pages = self.iter_search_pages(
+            jql,
+            fields=fields,
+            limit=limit,
+            expand=expand,
+            projects_filter=projects_filter,
+        )
+        total = -1
+        issues: list[JiraIssue] = []
+        seen: set[str] = set()
+        for index, page in enumerate(pages):
+            if index == 0:
+                total = page.total
+            # Issues created or re-ranked mid-scan can shift offsets and
+            # repeat an issue across pages.
+            for issue in page.issues:
+                if issue.key not in seen:
+                    seen.add(issue.key)
+                    issues.append(issue)
 
-                return search_result
-            else:
-                limit = min(limit, 50)
-                response = self.jira.jql(
-                    jql, fields=fields_param, start=start, limit=limit, expand=expand
+        return JiraSearchResult(
+            total=total,
+            start_at=0,
+            max_results=limit,
+            issues=issues[:limit],
+        )
+
+    @handle_auth_errors("Jira API")
+    def multi_search(
+        self,
+        queries: Sequence[str],
+        fields: list[str] | tuple[str, ...] | set[str] | str | None = None,
+        limit: int = 10,
+        projects_filter: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Run several JQL searches and return their issues once.
+
+        Each query first runs as a key-only search; the queries run
+        concurrently (``JIRA_SEARCH_MAX_WORKERS``). The union of the keys is
+        then fetched once with ``fields``, in concurrent chunks like
+        ``batch_get_issues``, so an issue matched by several queries is
+        transferred and returned a single time. An issue deleted in between
+        is reported under ``errors`` instead of failing the call.
+
+        Args:
+            queries: JQL query strings
+            fields: Fields to return for every issue, as for ``search_issues``
+            limit: Maximum issues per query
+            projects_filter: Optional project keys to narrow results within
+                the configured allowlist
+
+        Returns:
+            ``queries``: per query, in order, its ``jql``, ``total`` and
+            matching ``keys`` (or the ``error`` it failed with);
+            ``issues``: the simplified issues keyed by issue key;
+            ``errors`` (only when some were not returned): the ``key`` and
+            ``error`` of each issue whose fields could not be fetched.
+
+        Raises:
+            ValueError: If more than ``MAX_MULTI_SEARCH_QUERIES`` are given.
+        """
+        if len(queries) > MAX_MULTI_SEARCH_QUERIES:
+            msg = f"At most {MAX_MULTI_SEARCH_QUERIES} queries are allowed per call."
+            raise ValueError(msg)
+        limit = clamp_limit(limit, context="jira.multi_search")
+        fields_param = _fields_param(fields)
+
+        def key_search(jql: str) -> JiraSearchResult | Exception:
+            try:
+                return self.search_issues(
+                    jql, fields="key", limit=limit, projects_filter=projects_filter
                 )
-                if not isinstance(response, dict):
-                    msg = f"Unexpected return value type from `jira.jql`: {type(response)}"
-                    logger.error(msg)
-                    raise TypeError(msg)
-
-                # Convert the response to a search result model
-                search_result = JiraSearchResult.from_api_response(
-                    response, base_url=self.config.url, requested_fields=fields_param
+            except MCPAtlassianAuthenticationError:
+                raise
+            except Exception as e:  # noqa: BLE001 - reported per query
+                return e
+
+        workers = max(
+            get_int_env(SEARCH_MAX_WORKERS_ENV, DEFAULT_SEARCH_MAX_WORKERS), 1
+        )
+        results: list[dict[str, Any]] = []
+        key_issues: dict[str, dict[str, Any]] = {}
+        for jql, page in zip(
+            queries, _map_in_order(key_search, queries, workers), strict=True
+        ):
+            if isinstance(page, Exception):
+                results.append({"jql": jql, "error": str(page)})
+                continue
+            for issue in page.to_simplified_dict()["issues"]:
+                key_issues.setdefault(issue["key"], issue)
+            page_keys = [issue.key for issue in page.issues if issue.key]
+            result: dict[str, Any] = {
+                "jql": jql,
+                "total": page.total,
+                "keys": page_keys,
+            }
+            if page.next_page_token:
+                result["next_page_token"] = page.next_page_token
+            results.append(result)
+
+        errors: dict[str, str] = {}
+        if _is_key_only(fields_param):
+            issues = key_issues
+        else:
+            bodies = self._fetch_issues_by_key(
+                list(key_issues), fields_param, resolve_moved=False
+            )
+            errors = bodies["errors"]
+            response: dict[str, Any] = {
+                "issues": [
+                    bodies["issues"][k] for k in key_issues if k in bodies["issues"]
+                ]
+            }
+            if bodies["names"]:
+                response["names"] = bodies["names"]
+            table = JiraSearchResult.from_api_response(
+                response, base_url=self.config.url, requested_fields=fields_param
+            ).to_simplified_dict()["issues"]
+            issues = {issue["key"]: issue for issue in table}
+        logger.debug(
+            "multi_search: %d queries, %d issue keys, %d unique",
+            len(queries),
+            sum(len(result.get("keys", ())) for result in results),
+            len(key_issues),
+        )
+        output: dict[str, Any] = {"queries": results, "issues": issues}
+        if errors:
+            output["errors"] = [
+                {"key": key, "error": error} for key, error in errors.items()
+            ]
+        return output
+
+    @handle_auth_errors("Jira API")
+    def batch_get_issues(
+        self,
+        issue_keys: Sequence[str],
+        fields: list[str] | tuple[str, ...] | set[str] | str | None = None,
+        comment_limit: int = 0,
+        projects_filter: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Get many issues by key with chunked ``key in (...)`` searches.
+
+        The chunks run concurrently (``JIRA_SEARCH_MAX_WORKERS``). When Jira
+        rejects a chunk for a key it names (e.g. one that does not exist),
+        that key is reported and the rest of the chunk retried; any other
+        400 applies to the whole query and fails the call. Issues requested
+        by a previous key are returned under their current key.
+
+        Args:
+            issue_keys: Issue keys to fetch
+            fields: Fields to return, as for ``search_issues``
+            comment_limit: Newest comments to include per issue (0 for none)
+            projects_filter: Optional project keys to narrow results within
+                the configured allowlist
+
+        Returns:
+            ``issues``: the simplified issues in request order;
+            ``moved``: the ``requested_key`` and current ``key`` of each
+            moved or renamed issue;
+            ``errors``: the ``key`` and ``error`` of each key not returned.
+
+        Raises:
+            ValueError: If more than ``MAX_BATCH_GET_ISSUES`` keys are given.
+        """
+        keys = list(dict.fromkeys(key.strip().upper() for key in issue_keys))
+        keys = [key for key in keys if key]
+        if len(keys) > MAX_BATCH_GET_ISSUES:
+            msg = f"At most {MAX_BATCH_GET_ISSUES} issue keys are allowed per call."
+            raise ValueError(msg)
+        fields_param = _fields_param(fields)
+        if comment_limit > 0 and fields_param != "*all":
+            requested = {field.strip() for field in fields_param.split(",")}
+            if "comment" not in requested:
+                fields_param = f"{fields_param},comment"
+        condition = self._apply_projects_filter("", projects_filter) or None
+
+        errors: dict[str, str] = {
+            key: "Invalid issue key." for key in keys if not _ISSUE_KEY.match(key)
+        }
+        valid = [key for key in keys if key not in errors]
+
+        fetched = self._fetch_issues_by_key(valid, fields_param, condition)
+        found: dict[str, Any] = fetched["issues"]
+        names: dict[str, Any] = fetched["names"]
+        moved: dict[str, str] = fetched["moved"]
+        errors.update(fetched["errors"])
+
+        for key in valid:
+            if key not in found and key not in errors and key not in moved:
+                errors[key] = (
+                    f"Issue {key} not found. Verify the issue key and project access."
                 )
+        if comment_limit > 0:
+            for raw in found.values():
+                comment = (raw.get("fields") or {}).get("comment")
+                if isinstance(comment, dict) and isinstance(
+                    comment.get("comments"), list
+                ):
+                    # Jira returns comments oldest-first; keep the newest.
+                    comment["comments"] = comment["comments"][-comment_limit:]
 
-                # Return the full search result object
-                return search_result
+        # Issues requested by an old key come back under their current key.
+        current_keys = dict.fromkeys(moved.get(key, key) for key in keys)
+        response: dict[str, Any] = {
+            "issues": [found[key] for key in current_keys if key in found]
+        }
+        if names:
+            response["names"] = names
+        issues = JiraSearchResult.from_api_response(
+            response, base_url=self.config.url, requested_fields=fields_param
+        ).to_simplified_dict()["issues"]
+        logger.debug("batch_get_issues: %d keys, %d errors", len(keys), len(errors))
+        return {
+            "issues": issues,
+            "moved": [
+                {"requested_key": key, "key": moved[key]}
+                for key in keys
+                if key in moved
+            ],
+            "errors": [
+                {"key": key, "error": errors[key]} for key in keys if key in errors
+            ],
+        }
 
-        except HTTPError:
-            raise  # let decorator handle auth errors
-        except Exception as e:
-            logger.error(f"Error searching issues with JQL '{jql}': {str(e)}")
-            raise Exception(f"Error searching issues: {str(e)}") from e
+    def _fetch_issues_by_key(
+        self,
+        keys: list[str],
+        fields_param: str,
+        condition: str | None = None,
+        *,
+        resolve_moved: bool = True,
+    ) -> dict[str, dict[str, Any]]:
+        """Fetch raw issues for *keys* in concurrent ``key in (...)`` chunks.
+
+        When Jira rejects a chunk for a key it names (e.g. one deleted or
+        never created), that key is reported and the rest of the chunk
+        retried. Any other error fails only the keys of its chunk, except a
+        400/401/403 naming no key, which applies to the whole query and is
+        raised.
+
+        Returns:
+            ``issues`` and ``names`` as for ``_fetch_issue_bodies``,
+            ``errors`` by key, and ``moved``: requested key -> current key
+            (only with ``resolve_moved``).
+        """
+
+        def fetch_chunk(chunk: list[str]) -> dict[str, Any]:
+            result: dict[str, Any] = {
+                "issues": {},
+                "names": {},
+                "errors": {},
+                "moved": {},
+            }
+            pending = chunk
+            while pending:
+                try:
+                    bodies = self._fetch_issue_bodies(
+                        pending, fields_param, None, condition
+                    )
+                except HTTPError as e:
+                    status = e.response.status_code if e.response is not None else None
+                    rejected = _rejected_keys(e, pending) if status == 400 else {}
+                    if status in (400, 401, 403) and not rejected:
+                        # The error applies to the whole query, not a key.
+                        raise
+                    if not rejected:
+                        result["errors"].update(dict.fromkeys(pending, str(e)))
+                        return result
+                    # Jira names a key that does not exist; retry without it.
+                    result["errors"].update(rejected)
+                    pending = [key for key in pending if key not in rejected]
+                    continue
+                except MCPAtlassianAuthenticationError:
+                    raise
+                except Exception as e:  # noqa: BLE001 - reported per key
+                    result["errors"].update(dict.fromkeys(pending, str(e)))
+                    return result
+                result["issues"] = bodies["issues"]
+                result["names"] = bodies["names"]
+                if resolve_moved:
+                    result["moved"] = self._resolve_moved_keys(
+                        pending, bodies["issues"]
+                    )
+                return result
+            return result
+
+        chunks = [
+            keys[offset : offset + SERVER_DC_PAGE_SIZE]
+            for offset in range(0, len(keys), SERVER_DC_PAGE_SIZE)
+        ]
+        workers = max(
+            get_int_env(SEARCH_MAX_WORKERS_ENV, DEFAULT_SEARCH_MAX_WORKERS), 1
+        )
+        fetched: dict[str, dict[str, Any]] = {
+            "issues": {},
+            "names": {},
+            "errors": {},
+            "moved": {},
+        }
+        for result in _map_in_order(fetch_chunk, chunks, workers):
+            for part, values in result.items():
+                fetched[part].update(values)
+        return fetched
+
+    def _resolve_moved_keys(
+        self, requested: list[str], issues: dict[str, Any]
+    ) -> dict[str, str]:
+        """Map requested keys of moved or renamed issues to their current key.
+
+        ``key in (...)`` also matches an issue's previous keys but returns it
+        under its current key, so each requested key missing from ``issues``
+        is looked up once and kept if it resolves to a returned issue.
+        """
+        moved: dict[str, str] = {}
+        for key in requested:
+            if key in issues:
+                continue
+            try:
+                issue = self.jira.get_issue(key, fields="key", update_history=False)
+            except HTTPError as e:
+                if e.response is not None and e.response.status_code in (401, 403):
+                    raise
+                continue
+            current = issue.get("key") if isinstance(issue, dict) else None
+            if current in issues:
+                moved[key] = current
+        return moved
 
     def get_board_issues(
         self,
@@ -2,6 +2,7 @@
 
 import logging
 from datetime import datetime, time, timedelta
+from typing import Any
 from zoneinfo import ZoneInfo
 
 from ..models.jira.metrics import IssueDatesResponse
@@ -18,6 +19,7 @@ from ..models.jira.sla import (
     TimeInStatusMetric,
     WorkingHoursConfig,
 )
+from ..utils.cache import ResponseCache, config_cache_scope
 from .client import JiraClient
 from .config import SLAConfig
 from .metrics import MetricsMixin
@@ -25,6 +27,9 @@ from .protocols import MetricsOperationsProto
 
 logger = logging.getLogger("mcp-jira")
 
+# Workflow statuses and their categories, shared across fetchers.
+_statuses_cache = ResponseCache("jira.statuses")
+
 # Available SLA metrics
 AVAILABLE_METRICS = [
     "cycle_time",
@@ -463,6 +468,15 @@ class SLAMixin(JiraClient, MetricsOperationsProto):
                 ),
             )
 
+    def _get_all_statuses(self) -> list[dict[str, Any]]:
+        """Fetch every Jira status through the shared response cache.
+
+        Unlike :meth:`_get_status_category_map`, errors propagate.
+        """
+        return _statuses_cache.get_or_load(
+            (config_cache_scope(self.config),), self.jira.get_all_statuses
+        )
+
     def _get_status_category_map(self) -> dict[str, str]:
         """
         Get cached map of status name (lowercase) -> category key.
@@ -476,7 +490,7 @@ class SLAMixin(JiraClient, MetricsOperationsProto):
         if not hasattr(self, "_status_category_cache"):
             self._status_category_cache: dict[str, str] = {}
             try:
-                statuses = self.jira.get_all_statuses()
+                statuses = self._get_all_statuses()
                 for status in statuses:
                     name = status.get("name", "").lower()
                     category_key = status.get("statusCategory", {}).get("key", "")
@@ -8,6 +8,7 @@ import requests
 
 from ..models.jira import JiraSprint
 from ..utils import parse_date
+from ..utils.cache import JIRA_ISSUE, JIRA_SPRINT, invalidates
 from .client import JiraClient
 
 logger = logging.getLogger("mcp-jira")
@@ -71,6 +72,7 @@ class SprintsMixin(JiraClient):
         )
         return [JiraSprint.from_api_response(sprint) for sprint in sprints]
 
+    @invalidates(JIRA_SPRINT, "sprint_id")
     def update_sprint(
         self,
         sprint_id: str,
@@ -130,6 +132,7 @@ class SprintsMixin(JiraClient):
             logger.error(f"Error updating sprint: {str(e)}")
             return None
 
+    @invalidates(JIRA_ISSUE, "issue_keys")
     def add_issues_to_sprint(self, sprint_id: str, issue_keys: list[str]) -> bool:
         """Add issues to a sprint.
 
@@ -149,6 +152,7 @@ class SprintsMixin(JiraClient):
         )
         return True
 
+    @invalidates(JIRA_ISSUE, "issue_keys")
     def move_issues_to_backlog(self, issue_keys: list[str]) -> bool:
         """Move issues to the backlog (removes them from any sprint).
 
@@ -6,12 +6,23 @@ from typing import Any
 from requests.exceptions import HTTPError
 
 from ..models import JiraIssue, JiraTransition
+from ..utils.cache import (
+    JIRA_ISSUE,
+    ResponseCache,
+    config_cache_scope,
+    entity_key,
+    invalidates,
+)
 from ..utils.decorators import handle_auth_errors
 from .client import JiraClient
 from .protocols import IssueOperationsProto, UsersOperationsProto
 
 logger = logging.getLogger("mcp-jira")
 
+# Available transitions change only when the issue (or its workflow) changes,
+# so they are served from the shared response cache when it is enabled.
+_transitions_cache = ResponseCache("jira.transitions")
+
 
 class TransitionsMixin(JiraClient, IssueOperationsProto, UsersOperationsProto):
     """Mixin for Jira transition operations."""
@@ -34,7 +45,11 @@ class TransitionsMixin(JiraClient, IssueOperationsProto, UsersOperationsProto):
             Exception: If there is an error getting transitions
         """
         try:
-            transitions_data: object = self.jira.get_issue_transitions(issue_key)
+            transitions_data: object = _transitions_cache.get_or_load(
+                (config_cache_scope(self.config), "summary", issue_key),
+                lambda: self.jira.get_issue_transitions(issue_key),
+                entities=(entity_key(JIRA_ISSUE, issue_key),),
+            )
             if not isinstance(transitions_data, list):
                 return []
             result: list[dict[str, Any]] = []
@@ -90,7 +105,11 @@ class TransitionsMixin(JiraClient, IssueOperationsProto, UsersOperationsProto):
         Returns:
             Raw transitions data from the API with full 'to' status objects
         """
-        response = self.jira.get_issue_transitions_full(issue_key)
+        response = _transitions_cache.get_or_load(
+            (config_cache_scope(self.config), "full", issue_key),
+            lambda: self.jira.get_issue_transitions_full(issue_key),
+            entities=(entity_key(JIRA_ISSUE, issue_key),),
+        )
         if isinstance(response, dict):
             transitions = response.get("transitions", [])
             if isinstance(transitions, list):
@@ -117,6 +136,7 @@ class TransitionsMixin(JiraClient, IssueOperationsProto, UsersOperationsProto):
         return result
 
     @handle_auth_errors("Jira API")
+    @invalidates(JIRA_ISSUE, "issue_key")
     def transition_issue(
         self,
         issue_key: str,
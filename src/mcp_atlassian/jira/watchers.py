@@ -4,10 +4,19 @@ import logging
 from typing import Any
 
 from ..models.jira.common import JiraUser
+from ..utils.cache import (
+    JIRA_ISSUE,
+    ResponseCache,
+    config_cache_scope,
+    entity_key,
+    invalidates,
+)
 from .client import JiraClient
 
 logger = logging.getLogger("mcp-jira")
 
+_watchers_cache = ResponseCache("jira.watchers")
+
 
 class WatchersMixin(JiraClient):
     """Mixin for Jira issue watcher operations."""
@@ -22,7 +31,11 @@ class WatchersMixin(JiraClient):
             Dictionary with watcher count, is_watching flag,
             and list of watchers.
         """
-        result = self.jira.issue_get_watchers(issue_key)
+        result = _watchers_cache.get_or_load(
+            (config_cache_scope(self.config), issue_key),
+            lambda: self.jira.issue_get_watchers(issue_key),
+            entities=(entity_key(JIRA_ISSUE, issue_key),),
+        )
 
         if not isinstance(result, dict):
             logger.error(
@@ -48,6 +61,7 @@ class WatchersMixin(JiraClient):
             "watchers": watchers,
         }
 
+    @invalidates(JIRA_ISSUE, "issue_key")
     def add_watcher(self, issue_key: str, user_identifier: str) -> dict[str, Any]:
         """Add a user as a watcher to an issue.
 
@@ -66,6 +80,7 @@ class WatchersMixin(JiraClient):
             "user": user_identifier,
         }
 
+    @invalidates(JIRA_ISSUE, "issue_key")
     def remove_watcher(
         self,
         issue_key: str,
@@ -7,6 +7,7 @@ from typing import Any
 from ..models import JiraWorklog
 from ..models.jira.adf import adf_to_text
 from ..utils import parse_date
+from ..utils.cache import JIRA_ISSUE, invalidates
 from .client import JiraClient
 
 logger = logging.getLogger("mcp-jira")
@@ -62,6 +63,7 @@ class WorklogMixin(JiraClient):
 
         return total_seconds
 
+    @invalidates(JIRA_ISSUE, "issue_key")
     def add_worklog(
         self,
         issue_key: str,
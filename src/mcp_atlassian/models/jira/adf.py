@@ -2,12 +2,14 @@
 Atlassian Document Format (ADF) utilities.
 
 This module provides utilities for converting between ADF and other formats.
-Supports both ADF → plain text (for reading) and Markdown → ADF (for writing).
+Supports ADF → plain text or Markdown (for reading) and Markdown → ADF (for
+writing).
 """
 
 import copy
 import json
 import re
+from collections.abc import Callable
 from datetime import datetime, timezone
 from typing import Any
 
@@ -17,6 +19,31 @@ _JIRA_ISSUE_KEY_RE = re.compile(
     r"([A-Z][A-Z0-9_]+-\d+(?:-\d+)*)"
     r"(?![A-Za-z0-9_/-])"
 )
+# Inline Markdown. Pattern order matters: mention before link, bold before
+# italic, code before others.
+_INLINE_MARKDOWN_RE = re.compile(
+    r"\[~accountid:(?P<wiki_mention_id>[^\]]+)\]"
+    r"|@\[(?P<display_mention_text>[^\]]+)\]"
+    r"\(accountid:(?P<display_mention_id>[^)]+)\)"
+    r"|`(?P<code_inner>[^`]+)`"
+    r"|\*\*(?P<bold_inner>.+?)\*\*"
+    r"|~~(?P<strike_inner>.+?)~~"
+    r"|\[(?P<link_text>[^\]]+)\]\((?P<link_href>[^)]+)\)"
+    r"|(?<!\*)\*(?!\*)(?P<italic_inner>.+?)(?<!\*)\*(?!\*)"
+)
+# Every inline construct starts with one of these characters; text without
+# them is a single plain run.
+_INLINE_MARKDOWN_TRIGGER_RE = re.compile(r"[*`~\[@]")
+
+_MD_EXPAND_OPEN_RE = re.compile(r"^\{expand(?::(.+?))?\}\s*$")
+_MD_EXPAND_CLOSE_RE = re.compile(r"^\{expand\}\s*$")
+_MD_HEADING_RE = re.compile(r"^(#{1,6})\s+(.+)$")
+_MD_TASK_ITEM_RE = re.compile(r"^[-*]\s+\[([ xX])\]\s+")
+_MD_PANEL_RE = re.compile(r"^:::(\w+)\s*$")
+_MD_BULLET_ITEM_RE = re.compile(r"^[-*]\s+")
+_MD_ORDERED_ITEM_RE = re.compile(r"^\d+\.\s+")
+_MD_TABLE_SEPARATOR_CELL_RE = re.compile(r"^:?-+:?$")
+_MD_VALID_PANEL_TYPES = frozenset({"note", "info", "warning", "success", "error"})
 
 
 def _append_text_nodes(
@@ -30,7 +57,8 @@ def _append_text_nodes(
         return
 
     normalized_base_url = jira_base_url.rstrip("/")
-    if not normalized_base_url:
+    # Issue keys always contain a hyphen, so skip the scan when there is none.
+    if not normalized_base_url or "-" not in text:
         node: dict[str, Any] = {"type": "text", "text": text}
         if marks:
             node["marks"] = marks
@@ -92,34 +120,28 @@ def _parse_inline_formatting(
         return []
 
     nodes: list[dict[str, Any]] = []
-    # Pattern order matters: mention before link, bold before italic,
-    # code before others.
-    inline_re = re.compile(
-        r"\[~accountid:(?P<wiki_mention_id>[^\]]+)\]"
-        r"|@\[(?P<display_mention_text>[^\]]+)\]"
-        r"\(accountid:(?P<display_mention_id>[^)]+)\)"
-        r"|`(?P<code_inner>[^`]+)`"
-        r"|\*\*(?P<bold_inner>.+?)\*\*"
-        r"|~~(?P<strike_inner>.+?)~~"
-        r"|\[(?P<link_text>[^\]]+)\]\((?P<link_href>[^)]+)\)"
-        r"|(?<!\*)\*(?!\*)(?P<italic_inner>.+?)(?<!\*)\*(?!\*)"
-    )
+    if not _INLINE_MARKDOWN_TRIGGER_RE.search(text):
+        _append_text_nodes(nodes, text, jira_base_url)
+        return nodes
 
     pos = 0
-    for m in inline_re.finditer(text):
+    for m in _INLINE_MARKDOWN_RE.finditer(text):
         # Add any plain text before this match
         if m.start() > pos:
             plain = text[pos : m.start()]
             _append_text_nodes(nodes, plain, jira_base_url)
 
-        if m.group("wiki_mention_id") is not None:
+        # The alternatives are exclusive, so the last group that closed
+        # identifies which construct matched.
+        kind = m.lastgroup
+        if kind == "wiki_mention_id":
             nodes.append(
                 {
                     "type": "mention",
                     "attrs": {"id": m.group("wiki_mention_id")},
                 }
             )
-        elif m.group("display_mention_id") is not None:
+        elif kind == "display_mention_id":
             nodes.append(
                 {
                     "type": "mention",
@@ -129,7 +151,7 @@ def _parse_inline_formatting(
                     },
                 }
             )
-        elif m.group("code_inner") is not None:
+        elif kind == "code_inner":
             nodes.append(
                 {
                     "type": "text",
@@ -137,21 +159,21 @@ def _parse_inline_formatting(
                     "marks": [{"type": "code"}],
                 }
             )
-        elif m.group("bold_inner") is not None:
+        elif kind == "bold_inner":
             _append_text_nodes(
                 nodes,
                 m.group("bold_inner"),
                 jira_base_url,
                 [{"type": "strong"}],
             )
-        elif m.group("strike_inner") is not None:
+        elif kind == "strike_inner":
             _append_text_nodes(
                 nodes,
                 m.group("strike_inner"),
                 jira_base_url,
                 [{"type": "strike"}],
             )
-        elif m.group("link_text") is not None:
+        elif kind == "link_href":
             nodes.append(
                 {
                     "type": "text",
@@ -164,7 +186,7 @@ def _parse_inline_formatting(
                     ],
                 }
             )
-        elif m.group("italic_inner") is not None:
+        elif kind == "italic_inner":
             _append_text_nodes(
                 nodes,
                 m.group("italic_inner"),
@@ -241,12 +263,15 @@ def markdown_to_adf(markdown_text: str, jira_base_url: str = "") -> dict[str, An
         line = lines[i]
 
         # --- Expand/collapse block ({expand:Title}...{expand}) ---
-        expand_match = re.match(r"^\{expand(?::(.+?))?\}\s*$", line)
+        first = line[:1]
+        expand_match = (
+            _MD_EXPAND_OPEN_RE.match(line) if line.startswith("{expand") else None
+        )
         if expand_match:
             expand_title = expand_match.group(1) or ""
             expand_lines: list[str] = []
             i += 1
-            while i < len(lines) and not re.match(r"^\{expand\}\s*$", lines[i]):
+            while i < len(lines) and not _MD_EXPAND_CLOSE_RE.match(lines[i]):
                 expand_lines.append(lines[i])
                 i += 1
             # Skip closing {expand}
@@ -284,7 +309,7 @@ def markdown_to_adf(markdown_text: str, jira_base_url: str = "") -> dict[str, An
 
         # --- Horizontal rule ---
         stripped = line.strip()
-        if stripped in ("---", "***", "___") or (
+        if stripped[:1] in ("-", "*", "_") and (
             len(stripped) >= 3
             and all(c == stripped[0] for c in stripped)
             and stripped[0] in "-*_"
@@ -296,7 +321,7 @@ def markdown_to_adf(markdown_text: str, jira_base_url: str = "") -> dict[str, An
                 continue
 
         # --- Heading ---
-        heading_match = re.match(r"^(#{1,6})\s+(.+)$", line)
+        heading_match = _MD_HEADING_RE.match(line) if first == "#" else None
         if heading_match:
             level = len(heading_match.group(1))
             text = heading_match.group(2)
@@ -320,12 +345,13 @@ def markdown_to_adf(markdown_text: str, jira_base_url: str = "") -> dict[str, An
             continue
 
         # --- Task list (- [ ] / - [x]) ---
-        if re.match(r"^[-*]\s+\[[ xX]\]\s+", line):
+        task_match = _MD_TASK_ITEM_RE.match(line) if first in ("-", "*") else None
+        if task_match:
             task_items: list[dict[str, Any]] = []
             task_counter = 0
-            while i < len(lines) and re.match(r"^[-*]\s+\[[ xX]\]\s+", lines[i]):
-                checked = bool(re.match(r"^[-*]\s+\[[xX]\]\s+", lines[i]))
-                item_text = re.sub(r"^[-*]\s+\[[ xX]\]\s+", "", lines[i])
+            while task_match:
+                checked = task_match.group(1) != " "
+                item_text = lines[i][task_match.end() :]
                 task_counter += 1
                 task_items.append(
                     _make_task_item(
@@ -336,6 +362,9 @@ def markdown_to_adf(markdown_text: str, jira_base_url: str = "") -> dict[str, An
                     )
                 )
                 i += 1
+                task_match = (
+                    _MD_TASK_ITEM_RE.match(lines[i]) if i < len(lines) else None
+                )
             doc["content"].append(
                 {
                     "type": "taskList",
@@ -346,11 +375,10 @@ def markdown_to_adf(markdown_text: str, jira_base_url: str = "") -> dict[str, An
             continue
 
         # --- Panel block ---
-        panel_match = re.match(r"^:::(\w+)\s*$", line)
+        panel_match = _MD_PANEL_RE.match(line) if first == ":" else None
         if panel_match:
             panel_type = panel_match.group(1).lower()
-            valid_panel_types = {"note", "info", "warning", "success", "error"}
-            if panel_type in valid_panel_types:
+            if panel_type in _MD_VALID_PANEL_TYPES:
                 panel_lines: list[str] = []
                 i += 1
                 while i < len(lines) and lines[i].strip() != ":::":
@@ -370,27 +398,32 @@ def markdown_to_adf(markdown_text: str, jira_base_url: str = "") -> dict[str, An
                 continue
 
         # --- Unordered list ---
-        if re.match(r"^[-*]\s+", line):
+        bullet_match = _MD_BULLET_ITEM_RE.match(line) if first in ("-", "*") else None
+        if bullet_match:
             items: list[dict[str, Any]] = []
-            while i < len(lines) and re.match(r"^[-*]\s+", lines[i]):
-                item_text = re.sub(r"^[-*]\s+", "", lines[i])
+            while bullet_match:
+                item_text = lines[i][bullet_match.end() :]
                 items.append(_make_list_item(item_text, jira_base_url))
                 i += 1
+                bullet_match = (
+                    _MD_BULLET_ITEM_RE.match(lines[i]) if i < len(lines) else None
+                )
             doc["content"].append({"type": "bulletList", "content": items})
             continue
 
         # --- Ordered list ---
-        if re.match(r"^\d+\.\s+", line):
+        if first.isdigit() and _MD_ORDERED_ITEM_RE.match(line):
             items_ol: list[dict[str, Any]] = []
             while i < len(lines):
-                if re.match(r"^\d+\.\s+", lines[i]):
-                    item_text = re.sub(r"^\d+\.\s+", "", lines[i])
+                ordered_match = _MD_ORDERED_ITEM_RE.match(lines[i])
+                if ordered_match:
+                    item_text = lines[i][ordered_match.end() :]
                     items_ol.append(_make_list_item(item_text, jira_base_url))
                     i += 1
                 elif (
                     not lines[i].strip()
                     and i + 1 < len(lines)
-                    and re.match(r"^\d+\.\s+", lines[i + 1])
+                    and _MD_ORDERED_ITEM_RE.match(lines[i + 1])
                 ):
                     i += 1
                 else:
@@ -409,7 +442,7 @@ def markdown_to_adf(markdown_text: str, jira_base_url: str = "") -> dict[str, An
             data_rows: list[list[str]] = []
             for row_line in table_rows:
                 cells = [c.strip() for c in row_line.strip("|").split("|")]
-                if all(re.match(r"^:?-+:?$", c) for c in cells if c):
+                if all(_MD_TABLE_SEPARATOR_CELL_RE.match(c) for c in cells if c):
                     continue
                 data_rows.append(cells)
 
@@ -523,12 +556,300 @@ def merge_adf_with_preserved_media(
     return merged
 
 
+_NOT_A_LEAF = object()
+
+_MARKDOWN_MARK_ORDER = {"code": 0, "em": 1, "strong": 2, "strike": 3, "link": 4}
+_MARKDOWN_PANEL_ALERTS = {
+    "info": "NOTE",
+    "note": "NOTE",
+    "success": "TIP",
+    "warning": "WARNING",
+    "error": "CAUTION",
+}
+# Containers whose blocks are separated by a single newline instead of a blank
+# line, so that list items and table cells stay compact.
+_MARKDOWN_TIGHT_CONTAINERS = frozenset({"listItem", "tableCell", "tableHeader"})
+
+
+def _mention_text(node: dict[str, Any]) -> Any:
+    attrs = node.get("attrs", {})
+    return attrs.get("text") or f"@{attrs.get('id', 'unknown')}"
+
+
+def _emoji_text(node: dict[str, Any]) -> Any:
+    attrs = node.get("attrs", {})
+    return attrs.get("text") or attrs.get("shortName", "")
+
+
+def _date_text(node: dict[str, Any]) -> str:
+    timestamp = node.get("attrs", {}).get("timestamp")
+    if timestamp:
+        try:
+            dt = datetime.fromtimestamp(int(timestamp) / 1000, tz=timezone.utc)
+            return dt.strftime("%Y-%m-%d")
+        except (ValueError, OSError, TypeError, OverflowError):
+            return str(timestamp)
+    return ""
+
+
+def _inline_card_text(node: dict[str, Any]) -> Any:
+    attrs = node.get("attrs", {})
+    url = attrs.get("url")
+    if url:
+        return url
+    data = attrs.get("data", {})
+    return data.get("url") or data.get("name", "")
+
+
+# Inline nodes that render to text without looking at their children.
+_ADF_LEAF_RENDERERS: dict[str, Callable[[dict[str, Any]], Any]] = {
+    "text": lambda node: node.get("text", ""),
+    "hardBreak": lambda node: "\n",
+    "mention": _mention_text,
+    "emoji": _emoji_text,
+    "date": _date_text,
+    "status": lambda node: f"[{node.get('attrs', {}).get('text', '')}]",
+    "inlineCard": _inline_card_text,
+}
+
+
+def _adf_leaf_text(node: dict[str, Any]) -> Any:
+    """Return the text of an inline leaf node, or ``_NOT_A_LEAF``."""
+    render = _ADF_LEAF_RENDERERS.get(node.get("type"))  # type: ignore[arg-type]
+    return render(node) if render is not None else _NOT_A_LEAF
+
+
+def _render_adf_text(adf_content: Any) -> str | None:
+    """Render ADF as plain text with an explicit stack and a single buffer.
+
+    Non-empty siblings are separated by a newline and code blocks are fenced.
+    A separator is written optimistically before a container and removed again
+    if the container turns out to render nothing. Leaves are written while
+    scanning their parent's children, so only containers touch the stack.
+    """
+    out: list[str] = []
+    write = out.append
+    leaf_renderers = _ADF_LEAF_RENDERERS
+    # One level per open container:
+    # [children, emitted, buffer mark, wrote separator, closing suffix].
+    stack: list[list[Any]] = []
+    children = adf_content if isinstance(adf_content, list) else [adf_content]
+    level: list[Any] = [iter(children), False, 0, False, ""]
+    while True:
+        for child in level[0]:
+            if isinstance(child, str):
+                if child:
+                    if level[1]:
+                        write("\n")
+                    write(child)
+                    level[1] = True
+                continue
+            if isinstance(child, list):
+                content: Any = child
+                suffix = ""
+            elif isinstance(child, dict):
+                node_type = child.get("type")
+                render = leaf_renderers.get(node_type)  # type: ignore[arg-type]
+                if render is not None:
+                    text = render(child)
+                    if text:
+                        if level[1]:
+                            write("\n")
+                        write(text)
+                        level[1] = True
+                    continue
+                if node_type == "codeBlock":
+                    content = child.get("content", [])
+                    suffix = "\n```"
+                else:
+                    content = child.get("content")
+                    if not content:
+                        continue
+                    suffix = ""
+            else:
+                continue
+            mark = len(out)
+            if level[1]:
+                write("\n")
+            if suffix:
+                write("```\n")
+            if not isinstance(content, list):
+                content = [content] if content is not None else []
+            stack.append(level)
+            level = [iter(content), False, mark, level[1], suffix]
+            break
+        else:
+            if not stack:
+                break
+            _, emitted, mark, wrote_separator, suffix = level
+            level = stack.pop()
+            if suffix:
+                write(suffix)
+            elif not emitted:
+                del out[mark:]
+                continue
+            level[1] = True
+    return "".join(out) or None
+
+
+def _join_markdown_parts(parts: list[tuple[bool, str]], block_separator: str) -> str:
+    """Join rendered children; inline runs are concatenated, blocks separated."""
+    pieces: list[str] = []
+    previous_is_block = False
+    for index, (is_block, text) in enumerate(parts):
+        if index and (is_block or previous_is_block):
+            pieces.append(block_separator)
+        pieces.append(text)
+        previous_is_block = is_block
+    return "".join(pieces)
+
+
+def _indent_continuation(text: str, indent: str) -> str:
+    return text.replace("\n", "\n" + indent)
+
+
+def _markdown_inline_text(node: dict[str, Any]) -> str:
+    text = node.get("text") or ""
+    if not text:
+        return ""
+    marks = [mark for mark in node.get("marks") or [] if isinstance(mark, dict)]
+    for mark in sorted(
+        marks, key=lambda mark: _MARKDOWN_MARK_ORDER.get(mark.get("type"), 99)
+    ):
+        mark_type = mark.get("type")
+        if mark_type == "code":
+            text = f"`{text}`"
+        elif mark_type == "em":
+            text = f"*{text}*"
+        elif mark_type == "strong":
+            text = f"**{text}**"
+        elif mark_type == "strike":
+            text = f"~~{text}~~"
+        elif mark_type == "link":
+            href = (mark.get("attrs") or {}).get("href")
+            if href:
+                text = f"[{text}]({href})"
+    return text
+
+
+class _MarkdownFrame:
+    """Rendered children of one ADF container node."""
+
+    __slots__ = ("node", "parent", "parts")
+
+    def __init__(
+        self, node: dict[str, Any] | None, parent: "_MarkdownFrame | None"
+    ) -> None:
+        self.node = node
+        self.parent = parent
+        self.parts: list[tuple[bool, str]] = []
+
+
+def _finish_markdown_frame(frame: _MarkdownFrame) -> tuple[bool, str]:
+    """Render a closed container from its children's markdown."""
+    node = frame.node or {}
+    node_type = node.get("type")
+    attrs = node.get("attrs") or {}
+    parts = frame.parts
+    if node_type == "paragraph":
+        return True, _join_markdown_parts(parts, "\n\n")
+    if node_type == "heading":
+        level = attrs.get("level") if isinstance(attrs.get("level"), int) else 1
+        return True, "#" * min(max(level, 1), 6) + " " + _join_markdown_parts(
+            parts, " "
+        )
+    if node_type in ("bulletList", "orderedList", "taskList"):
+        start = attrs.get("order") if isinstance(attrs.get("order"), int) else 1
+        items = []
+        for index, (_, text) in enumerate(parts):
+            marker = f"{start + index}. " if node_type == "orderedList" else "- "
+            items.append(marker + _indent_continuation(text, " " * len(marker)))
+        return True, "\n".join(items)
+    if node_type == "taskItem":
+        checkbox = "[x] " if attrs.get("state") == "DONE" else "[ ] "
+        return True, checkbox + _join_markdown_parts(parts, "\n")
+    if node_type in ("blockquote", "panel"):
+        body = _join_markdown_parts(parts, "\n\n")
+        if node_type == "panel":
+            alert = _MARKDOWN_PANEL_ALERTS.get(attrs.get("panelType"), "NOTE")
+            body = f"[!{alert}]\n{body}"
+        return True, "\n".join(
+            f"> {line}" if line else ">" for line in body.split("\n")
+        )
+    if node_type in ("expand", "nestedExpand"):
+        body = _join_markdown_parts(parts, "\n\n")
+        title = attrs.get("title")
+        return True, f"**{title}**\n\n{body}" if title else body
+    if node_type in ("tableCell", "tableHeader"):
+        body = _join_markdown_parts(parts, "\n")
+        return False, body.replace("|", "\\|").replace("\n", "<br>")
+    if node_type == "tableRow":
+        return True, "| " + " | ".join(text for _, text in parts) + " |"
+    if node_type == "table":
+        rows = [text for _, text in parts]
+        if rows:
+            columns = rows[0].count(" | ") + 1
+            rows.insert(1, "|" + " --- |" * columns)
+        return True, "\n".join(rows)
+    separator = "\n" if node_type in _MARKDOWN_TIGHT_CONTAINERS else "\n\n"
+    return True, _join_markdown_parts(parts, separator)
+
+
+def _render_adf_markdown(adf_content: Any) -> str | None:
+    """Render ADF as markdown with an explicit stack.
+
+    Each container collects its rendered children and is turned into markdown
+    when it is closed, which is what list indentation, quotes and tables need.
+    """
+    root = _MarkdownFrame(None, None)
+    # Entries: (node, parent frame) to render a node, or a frame to close.
+    stack: list[Any] = [(adf_content, root)]
+    while stack:
+        entry = stack.pop()
+        if isinstance(entry, _MarkdownFrame):
+            is_block, text = _finish_markdown_frame(entry)
+            if text and entry.parent is not None:
+                entry.parent.parts.append((is_block, text))
+            continue
+        node, parent = entry
+        if isinstance(node, str):
+            if node:
+                parent.parts.append((False, node))
+        elif isinstance(node, list):
+            stack.extend((child, parent) for child in reversed(node))
+        elif isinstance(node, dict):
+            node_type = node.get("type")
+            if node_type == "text":
+                text = _markdown_inline_text(node)
+            else:
+                text = _adf_leaf_text(node)
+            if text is not _NOT_A_LEAF:
+                if text:
+                    parent.parts.append((False, str(text)))
+            elif node_type == "codeBlock":
+                language = (node.get("attrs") or {}).get("language") or ""
+                code = "".join(
+                    str(child.get("text") or "")
+                    for child in node.get("content") or []
+                    if isinstance(child, dict)
+                )
+                parent.parts.append((True, f"```{language}\n{code}\n```"))
+            elif node_type == "rule":
+                parent.parts.append((True, "---"))
+            elif node.get("content") or node_type in ("paragraph", "tableCell"):
+                frame = _MarkdownFrame(node, parent)
+                stack.append(frame)
+                stack.append((node.get("content") or [], frame))
+    return _join_markdown_parts(root.parts, "\n\n") or None
+
+
 def adf_to_text(adf_content: dict | list | str | None) -> str | None:
     """
     Convert Atlassian Document Format (ADF) content to plain text.
 
     ADF is Jira Cloud's rich text format returned for fields like description.
-    This function recursively extracts text content from the ADF structure.
+    Rendering walks the document with an explicit stack, so arbitrarily deep
+    documents do not hit the recursion limit.
 
     Args:
         adf_content: ADF document (dict), content list, string, or None
@@ -536,76 +857,41 @@ def adf_to_text(adf_content: dict | list | str | None) -> str | None:
     Returns:
         Plain text string or None if no content
     """
-    if adf_content is None:
-        return None
-
-    if isinstance(adf_content, str):
+    # A node whose content is a single node renders exactly as that node, so
+    # unwrap such chains and return top-level leaves (even empty ones) as is.
+    while isinstance(adf_content, dict):
+        text = _adf_leaf_text(adf_content)
+        if text is not _NOT_A_LEAF:
+            return text
+        content = adf_content.get("content")
+        if (
+            adf_content.get("type") == "codeBlock"
+            or not content
+            or isinstance(content, list)
+        ):
+            break
+        adf_content = content
+    if adf_content is None or isinstance(adf_content, str):
         return adf_content
+    return _render_adf_text(adf_content)
 
-    if isinstance(adf_content, list):
-        texts = []
-        for item in adf_content:
-            text = adf_to_text(item)
-            if text:
-                texts.append(text)
-        return "\n".join(texts) if texts else None
-
-    if isinstance(adf_content, dict):
-        # Check if this is a text node
-        if adf_content.get("type") == "text":
-            return adf_content.get("text", "")
-
-        # Check if this is a hardBreak node
-        if adf_content.get("type") == "hardBreak":
-            return "\n"
-
-        # Check if this is a mention node
-        if adf_content.get("type") == "mention":
-            attrs = adf_content.get("attrs", {})
-            return attrs.get("text") or f"@{attrs.get('id', 'unknown')}"
-
-        # Check if this is an emoji node
-        if adf_content.get("type") == "emoji":
-            attrs = adf_content.get("attrs", {})
-            return attrs.get("text") or attrs.get("shortName", "")
-
-        # Check if this is a date node
-        if adf_content.get("type") == "date":
-            attrs = adf_content.get("attrs", {})
-            timestamp = attrs.get("timestamp")
-            if timestamp:
-                try:
-                    dt = datetime.fromtimestamp(int(timestamp) / 1000, tz=timezone.utc)
-                    return dt.strftime("%Y-%m-%d")
-                except (ValueError, OSError, TypeError, OverflowError):
-                    return str(timestamp)
-            return ""
-
-        # Check if this is a status node
-        if adf_content.get("type") == "status":
-            attrs = adf_content.get("attrs", {})
-            return f"[{attrs.get('text', '')}]"
-
-        # Check if this is an inlineCard node
-        if adf_content.get("type") == "inlineCard":
-            attrs = adf_content.get("attrs", {})
-            url = attrs.get("url")
-            if url:
-                return url
-            data = attrs.get("data", {})
-            return data.get("url") or data.get("name", "")
-
-        # Check if this is a codeBlock node
-        if adf_content.get("type") == "codeBlock":
-            content = adf_content.get("content", [])
-            code_text = adf_to_text(content) or ""
-            return f"```\n{code_text}\n```"
-
-        # Recursively process content
-        content = adf_content.get("content")
-        if content:
-            return adf_to_text(content)
 
-        return None
+def adf_to_markdown(adf_content: dict | list | str | None) -> str | None:
+    """
+    Convert Atlassian Document Format (ADF) content to Markdown.
+
+    Keeps the structure that :func:`adf_to_text` flattens: headings, emphasis,
+    links, lists, task lists, quotes, panels, tables and fenced code blocks
+    with their language.
 
-    return None
+    Args:
+        adf_content: ADF document (dict), content list, string, or None
+
+    Returns:
+        Markdown string or None if no content
+    """
+    if adf_content is None:
+        return None
+    if isinstance(adf_content, str):
+        return adf_content
+    return _render_adf_markdown(adf_content)
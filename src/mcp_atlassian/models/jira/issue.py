@@ -6,7 +6,8 @@ This module provides Pydantic models for Jira issues.
 
 import logging
 import re
-from typing import Any, Literal
+from functools import lru_cache
+from typing import Any, Literal, NamedTuple
 
 from pydantic import Field
 
@@ -49,6 +50,65 @@ EPIC_LINK_PATTERNS = [
 ]
 
 
+_FIELD_NAME_SEPARATORS = re.compile(r"[_\-\s]")
+
+
+@lru_cache(maxsize=4096)
+def _normalize_field_name(name: str) -> str:
+    """Lower-case a field name and drop separators for fuzzy matching.
+
+    Field names repeat across every issue of a search page, so the result is
+    cached.
+    """
+    return _FIELD_NAME_SEPARATORS.sub("", name.lower())
+
+
+class _CustomFieldRequest(NamedTuple):
+    key: str
+    lower_key: str
+    is_field_id: bool
+    cf_field_id: str | None
+
+
+class IssueFieldProjection:
+    """The field selection ``JiraIssue.to_simplified_dict`` applies.
+
+    Compiled from a ``requested_fields`` value. Every issue of a search result
+    shares that value, so ``JiraSearchResult`` compiles it once and reuses it
+    for all of them.
+    """
+
+    __slots__ = (
+        "all_custom_fields",
+        "custom_field_requests",
+        "requested_fields",
+        "standard_fields",
+    )
+
+    def __init__(self, requested_fields: Literal["*all"] | list[str] | None) -> None:
+        self.requested_fields = requested_fields
+        self.all_custom_fields = requested_fields == "*all"
+        self.standard_fields: frozenset[str] | None = None
+        self.custom_field_requests: tuple[_CustomFieldRequest, ...] = ()
+        if isinstance(requested_fields, list):
+            self.standard_fields = frozenset(requested_fields)
+            self.custom_field_requests = tuple(
+                _CustomFieldRequest(
+                    key=key,
+                    lower_key=key.lower(),
+                    is_field_id=key.startswith("customfield_"),
+                    cf_field_id=(
+                        "customfield_" + key[3:] if key.startswith("cf_") else None
+                    ),
+                )
+                for key in requested_fields
+            )
+
+    def includes(self, field_name: str) -> bool:
+        """Return whether the standard field *field_name* is selected."""
+        return self.standard_fields is None or field_name in self.standard_fields
+
+
 class JiraIssue(ApiModel, TimestampMixin):
     """
     Model representing a Jira issue.
@@ -93,30 +153,27 @@ class JiraIssue(ApiModel, TimestampMixin):
     changelogs: list[JiraChangelog] = Field(default_factory=list)
     issuelinks: list[JiraIssueLink] = Field(default_factory=list)
 
-    def __getattribute__(self, name: str) -> Any:
+    def __getattr__(self, name: str) -> Any:
         """
         Custom attribute access to handle custom field access.
 
         This allows accessing custom fields by their name as if they were
-        regular attributes of the JiraIssue class.
+        regular attributes of the JiraIssue class. Python only calls this
+        after normal lookup fails, so regular fields pay nothing for it.
 
         Args:
             name: The attribute name to access
 
         Returns:
-            The attribute value or custom field value
+            The custom field value
         """
-        # First try to get the attribute normally
         try:
-            return super().__getattribute__(name)
+            return super().__getattr__(name)  # type: ignore[misc]
         except AttributeError:
             # If the attribute doesn't exist, check if it's a custom field
-            try:
-                custom_fields = super().__getattribute__("custom_fields")
-                if name in custom_fields:
-                    return custom_fields[name]
-            except AttributeError:
-                pass
+            custom_fields = self.__dict__.get("custom_fields")
+            if custom_fields and name in custom_fields:
+                return custom_fields[name]
             # Re-raise the original AttributeError
             raise
 
@@ -155,11 +212,7 @@ class JiraIssue(ApiModel, TimestampMixin):
             return None
 
         # Normalize all patterns for easier matching
-        normalized_patterns = []
-        for pattern in name_patterns:
-            norm_pattern = pattern.lower()
-            norm_pattern = re.sub(r"[_\-\s]", "", norm_pattern)
-            normalized_patterns.append(norm_pattern)
+        normalized_patterns = [_normalize_field_name(p) for p in name_patterns]
 
         custom_field_id = None
 
@@ -167,7 +220,7 @@ class JiraIssue(ApiModel, TimestampMixin):
         names_dict = fields.get("names", {})
         if isinstance(names_dict, dict):
             for field_id, field_name in names_dict.items():
-                field_name_norm = re.sub(r"[_\-\s]", "", field_name.lower())
+                field_name_norm = _normalize_field_name(field_name)
                 for norm_pattern in normalized_patterns:
                     if norm_pattern in field_name_norm:
                         custom_field_id = field_id
@@ -188,8 +241,7 @@ class JiraIssue(ApiModel, TimestampMixin):
                             continue
 
                         if isinstance(field_info, dict) and "name" in field_info:
-                            field_name = field_info["name"].lower()
-                            field_name_norm = re.sub(r"[_\-\s]", "", field_name)
+                            field_name_norm = _normalize_field_name(field_info["name"])
                             for norm_pattern in normalized_patterns:
                                 if norm_pattern in field_name_norm:
                                     custom_field_id = field_id
@@ -229,7 +281,7 @@ class JiraIssue(ApiModel, TimestampMixin):
                 if not field_name:
                     continue
 
-                field_name_norm = re.sub(r"[_\-\s]", "", field_name)
+                field_name_norm = _normalize_field_name(field_name)
                 for norm_pattern in normalized_patterns:
                     if norm_pattern in field_name_norm:
                         custom_field_id = field_id
@@ -519,21 +571,26 @@ class JiraIssue(ApiModel, TimestampMixin):
             issuelinks=cls._extract_issue_links(fields),
         )
 
-    def to_simplified_dict(self) -> dict[str, Any]:
-        """Convert to simplified dictionary for API response."""
+    def to_simplified_dict(
+        self, projection: IssueFieldProjection | None = None
+    ) -> dict[str, Any]:
+        """Convert to simplified dictionary for API response.
+
+        Args:
+            projection: A projection compiled from this issue's
+                ``requested_fields``. Callers serializing many issues that
+                share one ``requested_fields`` value pass it to avoid
+                recompiling it per issue.
+        """
+        if projection is None:
+            projection = IssueFieldProjection(self.requested_fields)
+        should_include_field = projection.includes
+
         result: dict[str, Any] = {
             "id": self.id,
             "key": self.key,
         }
 
-        # Helper method to check if a field should be included
-        def should_include_field(field_name: str) -> bool:
-            return (
-                self.requested_fields == "*all"
-                or not isinstance(self.requested_fields, list)
-                or field_name in self.requested_fields
-            )
-
         # Add summary if requested
         if should_include_field("summary"):
             result["summary"] = self.summary
@@ -664,64 +721,52 @@ class JiraIssue(ApiModel, TimestampMixin):
 
         # Process custom fields
         if self.custom_fields:
-            if self.requested_fields == "*all":
-                for internal_id, field_data_obj in self.custom_fields.items():
-                    processed_value = self._process_custom_field_value(
-                        field_data_obj.get("value")
-                    )
-                    output_value_obj = {"value": processed_value}
-                    if "name" in field_data_obj:
-                        output_value_obj["name"] = field_data_obj["name"]
-                    result[internal_id] = output_value_obj
-            elif isinstance(self.requested_fields, list):
-                for requested_key_or_name in self.requested_fields:
-                    found_by_id_or_name = False
-                    if (
-                        requested_key_or_name.startswith("customfield_")
-                        and requested_key_or_name in self.custom_fields
-                    ):
-                        field_data_obj = self.custom_fields[requested_key_or_name]
-                        output_value_obj = {
-                            "value": self._process_custom_field_value(
-                                field_data_obj.get("value")
-                            )
-                        }
-                        if "name" in field_data_obj:
-                            output_value_obj["name"] = field_data_obj["name"]
-                        result[requested_key_or_name] = output_value_obj
-                        found_by_id_or_name = True
-                    else:
-                        for internal_id, field_data_obj in self.custom_fields.items():
-                            if (
-                                field_data_obj.get("name", "").lower()
-                                == requested_key_or_name.lower()
-                            ):
-                                output_value_obj = {
-                                    "value": self._process_custom_field_value(
-                                        field_data_obj.get("value")
-                                    )
-                                }
-                                output_value_obj["name"] = field_data_obj["name"]
-                                result[internal_id] = output_value_obj
-                                found_by_id_or_name = True
-                                break
-                    if not found_by_id_or_name and requested_key_or_name.startswith(
-                        "cf_"
-                    ):
-                        full_id = "customfield_" + requested_key_or_name[3:]
-                        if full_id in self.custom_fields:
-                            field_data_obj = self.custom_fields[full_id]
-                            output_value_obj = {
-                                "value": self._process_custom_field_value(
-                                    field_data_obj.get("value")
-                                )
-                            }
-                            if "name" in field_data_obj:
-                                output_value_obj["name"] = field_data_obj["name"]
-                            result[full_id] = output_value_obj
+            self._add_projected_custom_fields(result, projection)
 
         return {k: v for k, v in result.items() if v is not None}
 
+    def _add_projected_custom_fields(
+        self, result: dict[str, Any], projection: IssueFieldProjection
+    ) -> None:
+        """Add the custom fields selected by *projection* to *result*."""
+        custom_fields = self.custom_fields
+        if projection.all_custom_fields:
+            for internal_id, field_data_obj in custom_fields.items():
+                result[internal_id] = self._simplified_custom_field(field_data_obj)
+            return
+
+        ids_by_lower_name: dict[str, str] | None = None
+        for request in projection.custom_field_requests:
+            if request.is_field_id and request.key in custom_fields:
+                result[request.key] = self._simplified_custom_field(
+                    custom_fields[request.key]
+                )
+                continue
+            if ids_by_lower_name is None:
+                # First field wins when display names collide, as in a scan.
+                ids_by_lower_name = {}
+                for internal_id, field_data_obj in custom_fields.items():
+                    ids_by_lower_name.setdefault(
+                        field_data_obj.get("name", "").lower(), internal_id
+                    )
+            internal_id = ids_by_lower_name.get(request.lower_key)
+            if internal_id is not None:
+                result[internal_id] = self._simplified_custom_field(
+                    custom_fields[internal_id]
+                )
+            elif request.cf_field_id and request.cf_field_id in custom_fields:
+                result[request.cf_field_id] = self._simplified_custom_field(
+                    custom_fields[request.cf_field_id]
+                )
+
+    def _simplified_custom_field(self, field_data_obj: dict[str, Any]) -> dict:
+        output_value_obj = {
+            "value": self._process_custom_field_value(field_data_obj.get("value"))
+        }
+        if "name" in field_data_obj:
+            output_value_obj["name"] = field_data_obj["name"]
+        return output_value_obj
+
     def _process_custom_field_value(self, field_value: Any) -> Any:
         """
         Process a custom field value for simplified dict output.
@@ -892,7 +937,9 @@ class JiraIssue(ApiModel, TimestampMixin):
         return result
 
     def to_display_name_dict(
-        self, extra_reserved_keys: set[str] | None = None
+        self,
+        extra_reserved_keys: set[str] | None = None,
+        projection: IssueFieldProjection | None = None,
     ) -> dict[str, Any]:
         """Like ``to_simplified_dict`` but with custom fields keyed by display name.
 
@@ -905,12 +952,13 @@ class JiraIssue(ApiModel, TimestampMixin):
             extra_reserved_keys: Additional keys that must not be claimed by
                 custom fields (e.g. enrichment section output keys like
                 ``"comments"``, ``"watchers"``).
+            projection: Passed through to ``to_simplified_dict``.
 
         Returns:
             A simplified dict suitable for tool / API output where custom
             fields use human-friendly keys.
         """
-        base = self.to_simplified_dict()
+        base = self.to_simplified_dict(projection)
 
         custom_items = [
             (key, value)
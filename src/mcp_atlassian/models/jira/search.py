@@ -10,7 +10,7 @@ from typing import Any
 from pydantic import Field, model_validator
 
 from ..base import ApiModel
-from .issue import JiraIssue
+from .issue import IssueFieldProjection, JiraIssue
 
 logger = logging.getLogger(__name__)
 
@@ -111,13 +111,38 @@ class JiraSearchResult(ApiModel):
         """
         return self
 
+    def _issue_projections(self) -> list[IssueFieldProjection]:
+        """Compile each distinct ``requested_fields`` value once.
+
+        Issues parsed from one response all share the same value, so this is
+        normally a single projection reused for every issue.
+        """
+        projections: list[IssueFieldProjection] = []
+        projection: IssueFieldProjection | None = None
+        for issue in self.issues:
+            if projection is None or issue.requested_fields != (
+                projection.requested_fields
+            ):
+                projection = IssueFieldProjection(issue.requested_fields)
+            projections.append(projection)
+        return projections
+
+    def simplified_issues(self) -> list[dict[str, Any]]:
+        """Return ``to_simplified_dict()`` of every issue, in order."""
+        return [
+            issue.to_simplified_dict(projection)
+            for issue, projection in zip(
+                self.issues, self._issue_projections(), strict=True
+            )
+        ]
+
     def to_simplified_dict(self) -> dict[str, Any]:
         """Convert to simplified dictionary for API response."""
         result: dict[str, Any] = {
             "total": self.total,
             "start_at": self.start_at,
             "max_results": self.max_results,
-            "issues": [issue.to_simplified_dict() for issue in self.issues],
+            "issues": self.simplified_issues(),
         }
         if self.next_page_token is not None:
             result["next_page_token"] = self.next_page_token
@@ -129,7 +154,12 @@ class JiraSearchResult(ApiModel):
             "total": self.total,
             "start_at": self.start_at,
             "max_results": self.max_results,
-            "issues": [issue.to_display_name_dict() for issue in self.issues],
+            "issues": [
+                issue.to_display_name_dict(projection=projection)
+                for issue, projection in zip(
+                    self.issues, self._issue_projections(), strict=True
+                )
+            ],
         }
         if self.next_page_token is not None:
             result["next_page_token"] = self.next_page_token
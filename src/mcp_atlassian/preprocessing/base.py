@@ -1,21 +1,104 @@
 """Base preprocessing module."""
 
+import functools
 import logging
+import os
 import re
 import urllib.parse
 import warnings
 from collections.abc import Callable
 from typing import Any, Protocol
 
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, CData, FeatureNotFound, NavigableString, Tag
+from markdownify import MarkdownConverter
 from markdownify import markdownify as md
 
 logger = logging.getLogger("mcp-atlassian")
 
+HTML_PARSER_ENV = "MCP_ATLASSIAN_HTML_PARSER"
+DEFAULT_HTML_PARSER = "html.parser"
+SUPPORTED_HTML_PARSERS = ("html.parser", "lxml")
+
+# Confluence elements rewritten by process_html_content, found in one sweep.
+_REWRITTEN_TAGS = ("ac:link", "ac:structured-macro", "time", "ac:image")
+
+_CDATA_PATTERN = re.compile(r"<!\[CDATA\[([\s\S]*?)\]\]>")
+_CDATA_PLACEHOLDER = re.compile("\ue001CDATA(\\d+)\ue001")
+
+_markdown_converter = MarkdownConverter()
+
+
+def _html_parser_from_env() -> str:
+    parser = os.getenv(HTML_PARSER_ENV, DEFAULT_HTML_PARSER).strip().lower()
+    if parser not in SUPPORTED_HTML_PARSERS:
+        logger.warning(
+            "Unsupported %s=%r; using %s. Supported: %s",
+            HTML_PARSER_ENV,
+            parser,
+            DEFAULT_HTML_PARSER,
+            ", ".join(SUPPORTED_HTML_PARSERS),
+        )
+        return DEFAULT_HTML_PARSER
+    return parser
+
+
+def _parse_html_with_lxml(html_content: str) -> BeautifulSoup:
+    """Parse storage-format HTML with lxml into an html.parser-shaped tree.
+
+    libxml2 turns CDATA sections (code macro bodies) into comments and wraps
+    the fragment in ``<html><body>``. CDATA is swapped for placeholders before
+    parsing and restored as :class:`bs4.CData` nodes, and the wrapper is
+    unwrapped, so the rewrites and serialization see the same shapes as with
+    html.parser.
+    """
+    cdata_sections: list[str] = []
+
+    def _protect(match: re.Match[str]) -> str:
+        cdata_sections.append(match.group(1))
+        return f"\ue001CDATA{len(cdata_sections) - 1}\ue001"
+
+    if "<![CDATA[" in html_content:
+        html_content = _CDATA_PATTERN.sub(_protect, html_content)
+
+    soup = BeautifulSoup(html_content, "lxml")
+    document = soup.find("html", recursive=False)
+    if isinstance(document, Tag):
+        # Tag.unwrap() re-inserts children one by one and looks each one up by
+        # linear scan, which is quadratic on large pages. Appending always
+        # moves the first remaining child, so this stays linear.
+        document.extract()
+        for section in list(document.contents):
+            if isinstance(section, Tag) and section.name in ("head", "body"):
+                soup.extend(section)
+            else:
+                soup.append(section)
+
+    if cdata_sections:
+        for text in soup.find_all(string=_CDATA_PLACEHOLDER):
+            parts = _CDATA_PLACEHOLDER.split(str(text))
+            replacements: list[NavigableString] = []
+            for index, part in enumerate(parts):
+                if index % 2:
+                    replacements.append(CData(cdata_sections[int(part)]))
+                elif part:
+                    replacements.append(NavigableString(part))
+            text.replace_with(*replacements)
+    return soup
+
+
+def _is_detached(element: Tag, root: BeautifulSoup) -> bool:
+    """Whether ``element`` was removed from ``root`` by an earlier rewrite."""
+    parent = element.parent
+    while parent is not None:
+        if parent is root:
+            return False
+        parent = parent.parent
+    return True
+
 
 def _extract_blocks(
     text: str,
-    pattern: str,
+    pattern: str | re.Pattern[str],
     transform_fn: Callable[[re.Match[str]], str],
     storage: list[str],
     prefix: str,
@@ -25,11 +108,11 @@ def _extract_blocks(
 
     Args:
         text: Input text to process.
-        pattern: Regex pattern to match blocks.
+        pattern: Regex pattern (string or precompiled) to match blocks.
         transform_fn: Function to transform the match into the target format.
         storage: List to store transformed blocks.
         prefix: Placeholder prefix (e.g., "CODEBLOCK").
-        flags: Regex flags to pass to ``re.sub``.
+        flags: Regex flags to pass to ``re.sub`` (string patterns only).
 
     Returns:
         Text with blocks replaced by placeholders.
@@ -41,14 +124,23 @@ def _extract_blocks(
         storage.append(transformed)
         return placeholder
 
+    if isinstance(pattern, re.Pattern):
+        return pattern.sub(_replacer, text)
     return re.sub(pattern, _replacer, text, flags=flags)
 
 
+@functools.lru_cache(maxsize=16)
+def _placeholder_pattern(prefix: str) -> re.Pattern[str]:
+    return re.compile(f"\x00{re.escape(prefix)}(\\d+)\x00")
+
+
 def _restore_blocks(text: str, storage: list[str], prefix: str) -> str:
     """Restore blocks from placeholders.
 
-    Replaces in reverse order (highest index first) to avoid
-    index collisions when placeholder text contains digits.
+    Runs a single regex pass instead of one ``str.replace`` per block, so
+    documents with many blocks restore in linear time. A stored block may
+    itself contain placeholders of lower index (a block extracted after
+    another one can wrap it); those are restored recursively.
 
     Args:
         text: Text with placeholders.
@@ -58,9 +150,20 @@ def _restore_blocks(text: str, storage: list[str], prefix: str) -> str:
     Returns:
         Text with placeholders replaced by stored blocks.
     """
-    for i in range(len(storage) - 1, -1, -1):
-        text = text.replace(f"\x00{prefix}{i}\x00", storage[i])
-    return text
+    if not storage:
+        return text
+    pattern = _placeholder_pattern(prefix)
+
+    def _restore(fragment: str, limit: int) -> str:
+        def _replacer(match: re.Match[str]) -> str:
+            index = int(match.group(1))
+            if index >= limit:
+                return match.group(0)
+            return _restore(storage[index], index)
+
+        return pattern.sub(_replacer, fragment)
+
+    return _restore(text, len(storage))
 
 
 class ConfluenceClient(Protocol):
@@ -82,14 +185,28 @@ class ConfluenceClient(Protocol):
 class BasePreprocessor:
     """Base class for text preprocessing operations."""
 
-    def __init__(self, base_url: str = "") -> None:
+    def __init__(self, base_url: str = "", html_parser: str | None = None) -> None:
         """
         Initialize the base text preprocessor.
 
         Args:
             base_url: Base URL for API server
+            html_parser: BeautifulSoup backend for storage-format HTML,
+                ``"html.parser"`` or ``"lxml"``. Defaults to
+                ``MCP_ATLASSIAN_HTML_PARSER`` (``html.parser`` when unset).
         """
         self.base_url = base_url.rstrip("/") if base_url else ""
+        self.html_parser = html_parser or _html_parser_from_env()
+
+    def _parse_html(self, html_content: str) -> BeautifulSoup:
+        """Parse HTML with the configured backend."""
+        if self.html_parser == "lxml":
+            try:
+                return _parse_html_with_lxml(html_content)
+            except FeatureNotFound:
+                logger.warning("lxml is not installed; falling back to html.parser")
+                self.html_parser = DEFAULT_HTML_PARSER
+        return BeautifulSoup(html_content, "html.parser")
 
     def process_html_content(
         self,
@@ -116,22 +233,57 @@ class BasePreprocessor:
         """
         try:
             # Parse the HTML content
-            soup = BeautifulSoup(html_content, "html.parser")
+            soup = self._parse_html(html_content)
+
+            # Collect every element the rewrites below touch in one sweep
+            # instead of one full-tree search per rewrite.
+            elements: dict[str, list[Tag]] = {name: [] for name in _REWRITTEN_TAGS}
+            for element in soup.find_all(_REWRITTEN_TAGS):
+                elements[element.name].append(element)
 
             # Process user mentions
-            self._process_user_mentions_in_soup(soup, confluence_client)
-            self._process_user_profile_macros_in_soup(soup, confluence_client)
+            self._process_user_mentions_in_soup(
+                soup, confluence_client, candidates=elements["ac:link"]
+            )
+            self._process_user_profile_macros_in_soup(
+                soup,
+                confluence_client,
+                candidates=[
+                    macro
+                    for macro in elements["ac:structured-macro"]
+                    if macro.get("ac:name") == "profile"
+                    and not _is_detached(macro, soup)
+                ],
+            )
 
             # Preserve Confluence date lozenges, whose value is stored only in
             # the datetime attribute and would otherwise be dropped by markdownify.
-            self._process_date_elements_in_soup(soup)
+            self._process_date_elements_in_soup(
+                soup,
+                candidates=[
+                    date for date in elements["time"] if not _is_detached(date, soup)
+                ],
+            )
 
             # Process Confluence image tags
-            self._process_images_in_soup(soup, content_id, attachments)
-
-            # Convert to string and markdown
+            self._process_images_in_soup(
+                soup,
+                content_id,
+                attachments,
+                candidates=[
+                    image
+                    for image in elements["ac:image"]
+                    if not _is_detached(image, soup)
+                ],
+            )
+
+            # Convert to string and markdown. markdownify walks the rewritten
+            # tree directly rather than re-parsing the serialized HTML, so the
+            # adjacent strings the rewrites leave behind are merged first, as
+            # a re-parse would; markdownify normalizes whitespace per string.
             processed_html = str(soup)
-            processed_markdown = md(processed_html)
+            soup.smooth()
+            processed_markdown = _markdown_converter.convert_soup(soup)
 
             return processed_html, processed_markdown
 
@@ -140,9 +292,13 @@ class BasePreprocessor:
             raise
 
     @staticmethod
-    def _process_date_elements_in_soup(soup: BeautifulSoup) -> None:
+    def _process_date_elements_in_soup(
+        soup: BeautifulSoup, candidates: list[Tag] | None = None
+    ) -> None:
         """Expose Confluence date-lozenge values as element text."""
-        for date_element in soup.find_all("time"):
+        if candidates is None:
+            candidates = soup.find_all("time")
+        for date_element in candidates:
             datetime_value = date_element.get("datetime")
             if (
                 isinstance(datetime_value, str)
@@ -152,7 +308,10 @@ class BasePreprocessor:
                 date_element.string = datetime_value
 
     def _process_user_mentions_in_soup(
-        self, soup: BeautifulSoup, confluence_client: ConfluenceClient | None = None
+        self,
+        soup: BeautifulSoup,
+        confluence_client: ConfluenceClient | None = None,
+        candidates: list[Tag] | None = None,
     ) -> None:
         """
         Process user mentions in BeautifulSoup object.
@@ -163,9 +322,10 @@ class BasePreprocessor:
         Args:
             soup: BeautifulSoup object containing HTML
             confluence_client: Optional Confluence client for user lookups
+            candidates: Pre-collected ``ac:link`` elements (default: search soup)
         """
         # Find all ac:link elements that might contain user mentions
-        user_mentions = soup.find_all("ac:link")
+        user_mentions = soup.find_all("ac:link") if candidates is None else candidates
 
         for user_element in user_mentions:
             user_ref = user_element.find("ri:user")
@@ -191,7 +351,10 @@ class BasePreprocessor:
                 )
 
     def _process_user_profile_macros_in_soup(
-        self, soup: BeautifulSoup, confluence_client: ConfluenceClient | None = None
+        self,
+        soup: BeautifulSoup,
+        confluence_client: ConfluenceClient | None = None,
+        candidates: list[Tag] | None = None,
     ) -> None:
         """
         Process Confluence User Profile macros in BeautifulSoup object.
@@ -201,9 +364,12 @@ class BasePreprocessor:
         Args:
             soup: BeautifulSoup object containing HTML
             confluence_client: Optional Confluence client for user lookups
+            candidates: Pre-collected profile macros (default: search soup)
         """
-        profile_macros = soup.find_all(
-            "ac:structured-macro", attrs={"ac:name": "profile"}
+        profile_macros = (
+            soup.find_all("ac:structured-macro", attrs={"ac:name": "profile"})
+            if candidates is None
+            else candidates
         )
 
         for macro_element in profile_macros:
@@ -398,6 +564,7 @@ class BasePreprocessor:
         soup: BeautifulSoup,
         content_id: str = "",
         attachments: list[dict[str, Any]] | None = None,
+        candidates: list[Tag] | None = None,
     ) -> None:
         """Convert Confluence ac:image tags to standard HTML img tags.
 
@@ -405,8 +572,11 @@ class BasePreprocessor:
             soup: BeautifulSoup object containing HTML
             content_id: Optional page/content ID for fallback URL
             attachments: Optional attachment list for URL lookup
+            candidates: Pre-collected ``ac:image`` elements (default: search soup)
         """
-        for ac_image in soup.find_all("ac:image"):
+        if candidates is None:
+            candidates = soup.find_all("ac:image")
+        for ac_image in candidates:
             src = ""
             alt = ""
 
@@ -1,8 +1,13 @@
 """Confluence-specific text preprocessing module."""
 
+import atexit
+import functools
 import logging
 import re
+import shutil
 import tempfile
+import threading
+from collections.abc import Iterable
 from pathlib import Path
 from urllib.parse import urlparse
 
@@ -23,6 +28,47 @@ from .base import BasePreprocessor
 
 logger = logging.getLogger("mcp-atlassian")
 
+# md2conf's markdown_to_html reuses one module-level markdown.Markdown
+# instance, which is not safe to drive from several threads at once.
+_markdown_lock = threading.Lock()
+
+_scratch_lock = threading.Lock()
+_scratch_document_path: Path | None = None
+
+
+def _markdown_to_html(markdown_content: str) -> str:
+    with _markdown_lock:
+        return markdown_to_html(markdown_content)
+
+
+def _scratch_document() -> Path:
+    """Return an empty placeholder document inside a private, empty directory.
+
+    md2conf's converter requires an existing source file and root directory,
+    but never reads the file: the element tree is passed in directly. One
+    placeholder per process replaces a temporary directory per conversion.
+    It is recreated if a temp cleaner removed it and deleted at exit.
+    """
+    global _scratch_document_path
+    with _scratch_lock:
+        path = _scratch_document_path
+        if path is None or not path.is_file():
+            scratch_dir = Path(tempfile.mkdtemp(prefix="mcp-atlassian-md2conf-"))
+            atexit.register(shutil.rmtree, scratch_dir, ignore_errors=True)
+            path = scratch_dir / "page.md"
+            path.touch()
+            _scratch_document_path = path
+        return path
+
+
+@functools.lru_cache(maxsize=2)
+def _converter_options(heading_anchors: bool) -> ConverterOptions:
+    return ConverterOptions(
+        force_valid_url=False,
+        heading_anchors=heading_anchors,
+        render_mermaid=False,
+    )
+
 
 class ConfluencePreprocessor(BasePreprocessor):
     """Handles text preprocessing for Confluence content."""
@@ -31,15 +77,31 @@ class ConfluencePreprocessor(BasePreprocessor):
     # restoring an opt-out task list cannot remove user-supplied characters.
     _TASK_MARKER_PREFIX = "\ue000"
     _TASK_MARKER_PATTERN = re.compile(r"(<li\b[^>]*>)(\[[ xX]\])")
-
-    def __init__(self, base_url: str) -> None:
+    # Cheap pre-check for _apply_task_lists: a list item whose text starts with
+    # a checkbox marker (literal or entity-encoded "[").
+    _TASK_ITEM_PATTERN = re.compile(
+        r"<li\b[^>]*>\s*(?:\[|&#0*91;|&#x0*5b;|&lsqb;|&lbrack;)[ xX]\]",
+        re.IGNORECASE,
+    )
+
+    def __init__(self, base_url: str, html_parser: str | None = None) -> None:
         """
         Initialize the Confluence text preprocessor.
 
         Args:
             base_url: Base URL for Confluence API
+            html_parser: Optional HTML parser backend; see BasePreprocessor
         """
-        super().__init__(base_url=base_url)
+        super().__init__(base_url=base_url, html_parser=html_parser)
+        parsed_url = urlparse(self.base_url)
+        base_path = parsed_url.path or "/wiki/"
+        if not base_path.endswith("/"):
+            base_path += "/"
+        self._site_metadata = ConfluenceSiteMetadata(
+            domain=parsed_url.netloc,
+            base_path=base_path,
+            space_key=None,
+        )
 
     # Table width and layout keyed by the caller-supplied table_layout value.
     _TABLE_WIDTHS: dict[str, str] = {
@@ -82,7 +144,7 @@ class ConfluencePreprocessor(BasePreprocessor):
         try:
             # First convert markdown to HTML
             html_content = self._fix_attachment_images(
-                markdown_to_html(markdown_content)
+                _markdown_to_html(markdown_content)
             )
             task_marker_prefix: str | None = None
             if not apply_task_lists:
@@ -91,68 +153,46 @@ class ConfluencePreprocessor(BasePreprocessor):
                     html_content, task_marker_prefix
                 )
 
-            with tempfile.TemporaryDirectory() as temp_dir:
-                root_dir = Path(temp_dir)
-                path = root_dir / "temp.md"
-                path.write_text(markdown_content, encoding="utf-8")
-
-                # Parse the HTML into an element tree
-                root = elements_from_strings([html_content])
-
-                parsed_url = urlparse(self.base_url)
-                base_path = parsed_url.path or "/wiki/"
-                if not base_path.endswith("/"):
-                    base_path += "/"
+            # Parse the HTML into an element tree
+            root = elements_from_strings([html_content])
+
+            # The converter collects per-document state (links, attachments,
+            # table of contents), so it is built per call; its options, the
+            # site metadata and the placeholder source path are reused.
+            scratch_path = _scratch_document()
+            converter = ConfluenceStorageFormatConverter(
+                options=_converter_options(enable_heading_anchors),
+                path=scratch_path,
+                root_dir=scratch_path.parent,
+                site_metadata=self._site_metadata,
+                page_metadata=ConfluencePageCollection(),
+                user_metadata=ConfluenceUserCollection(),
+            )
 
-                # Create converter options
-                options = ConverterOptions(
-                    force_valid_url=False,
-                    heading_anchors=enable_heading_anchors,
-                    render_mermaid=False,
-                )
+            # Transform the HTML to Confluence storage format
+            converter.visit(root)
 
-                # Create a converter
-                converter = ConfluenceStorageFormatConverter(
-                    options=options,
-                    path=path,
-                    root_dir=root_dir,
-                    site_metadata=ConfluenceSiteMetadata(
-                        domain=parsed_url.netloc,
-                        base_path=base_path,
-                        space_key=None,
-                    ),
-                    page_metadata=ConfluencePageCollection(),
-                    user_metadata=ConfluenceUserCollection(),
+            # Convert the element tree back to a string
+            storage_format = self._fix_attachment_images(str(elements_to_string(root)))
+            if task_marker_prefix is not None:
+                storage_format = self._restore_task_list_markers(
+                    storage_format, task_marker_prefix
                 )
+            if apply_task_lists:
+                storage_format = self._normalize_task_list_bodies(storage_format)
 
-                # Transform the HTML to Confluence storage format
-                converter.visit(root)
-
-                # Convert the element tree back to a string
-                storage_format = self._fix_attachment_images(
-                    str(elements_to_string(root))
-                )
-                if task_marker_prefix is not None:
-                    storage_format = self._restore_task_list_markers(
-                        storage_format, task_marker_prefix
-                    )
-                if apply_task_lists:
-                    storage_format = self._normalize_task_list_bodies(storage_format)
-
-                if apply_task_lists:
-                    storage_format = self._apply_task_lists(storage_format)
-                if table_layout is not None and table_layout in self._TABLE_WIDTHS:
-                    storage_format = self._apply_table_layout(
-                        storage_format, table_layout
-                    )
-                return storage_format
+            if apply_task_lists:
+                storage_format = self._apply_task_lists(storage_format)
+            if table_layout is not None and table_layout in self._TABLE_WIDTHS:
+                storage_format = self._apply_table_layout(storage_format, table_layout)
+            return storage_format
 
         except Exception as e:
             logger.error(f"Error converting markdown to Confluence storage format: {e}")
             logger.exception(e)
 
             # Fall back to a simpler method if the conversion fails
-            html_content = markdown_to_html(markdown_content)
+            html_content = _markdown_to_html(markdown_content)
 
             # This creates a proper Confluence storage format document
             storage_format = self._fix_attachment_images(f"""<p>{html_content}</p>""")
@@ -163,6 +203,43 @@ class ConfluencePreprocessor(BasePreprocessor):
 
             return storage_format
 
+    def markdown_to_confluence_storage_batch(
+        self,
+        markdown_documents: Iterable[str],
+        *,
+        enable_heading_anchors: bool = False,
+        apply_task_lists: bool = True,
+        table_layout: str | None = None,
+    ) -> list[str]:
+        """
+        Convert several Markdown documents to Confluence storage format.
+
+        Equivalent to calling :meth:`markdown_to_confluence_storage` for each
+        document with the same options, sharing the converter setup across
+        the batch. Intended for bulk page imports.
+
+        Args:
+            markdown_documents: Markdown texts to convert
+            enable_heading_anchors: Whether to enable automatic heading anchor
+                generation (default: False)
+            apply_task_lists: Whether to convert GFM task-list items to
+                Confluence ``ac:task-list`` macros (default: True)
+            table_layout: Optional table width preset applied to all tables;
+                see :meth:`markdown_to_confluence_storage`
+
+        Returns:
+            Storage format strings, in input order
+        """
+        return [
+            self.markdown_to_confluence_storage(
+                markdown_content,
+                enable_heading_anchors=enable_heading_anchors,
+                apply_task_lists=apply_task_lists,
+                table_layout=table_layout,
+            )
+            for markdown_content in markdown_documents
+        ]
+
     @classmethod
     def _get_task_list_marker_prefix(cls, html_content: str) -> str:
         """Return a private-use marker sequence absent from the HTML."""
@@ -204,7 +281,7 @@ class ConfluencePreprocessor(BasePreprocessor):
         Returns:
             Updated storage-format string with task lists converted.
         """
-        if "<ul" not in storage_html.lower() or "[" not in storage_html:
+        if not cls._TASK_ITEM_PATTERN.search(storage_html):
             return storage_html
 
         marker_pattern = re.compile(
@@ -11,11 +11,127 @@ logger = logging.getLogger("mcp-atlassian")
 _ISSUE_KEY_PATTERN = r"[A-Z][A-Z0-9_]+-\d+(?:-\d+)*"
 
 
+# Precompiled patterns for JiraPreprocessor.jira_to_markdown, in pass order.
+_J2M_CODE = re.compile(r"\{code(?::([a-z]+))?\}([\s\S]*?)\{code\}", re.MULTILINE)
+_J2M_NOFORMAT = re.compile(r"\{noformat\}([\s\S]*?)\{noformat\}")
+_J2M_INLINE_CODE = re.compile(r"\{\{([^}]+)\}\}")
+_J2M_BQ = re.compile(r"^bq\.(.*?)$", re.MULTILINE)
+_J2M_EMPHASIS = re.compile(r"([*_])(.*?)\1")
+_J2M_LIST_OR_HEADER = re.compile(
+    r"^(?:((?:#|-|\+|\*)+) (.*)|h([0-6])\.(.*))$", re.MULTILINE
+)
+_J2M_CITE = re.compile(r"\?\?([^?]+(?:\?[^?]+)*)\?\?")
+_J2M_INS = re.compile(r"\+([^+]*)\+")
+_J2M_SUP = re.compile(r"\^([^^]*)\^")
+_J2M_SUB = re.compile(r"~([^~]*)~")
+_J2M_QUOTE = re.compile(r"\{quote\}([\s\S]*)\{quote\}", re.MULTILINE)
+_J2M_PANEL = re.compile(r"\{panel(?::([^}]*))?\}([\s\S]*?)\{panel\}", re.MULTILINE)
+_J2M_PANEL_TITLE = re.compile(r"title=([^|}]+)")
+_J2M_IMAGE_ALT = re.compile(r"!([^|\n\s]+)\|([^\n!]*)alt=([^\n!\,]+?)(,([^\n!]*))?!")
+_J2M_IMAGE_PARAMS = re.compile(r"!([^|\n\s]+)\|([^\n!]*)!")
+_J2M_IMAGE = re.compile(r"!([^\n\s!]+)!")
+_J2M_LINK = re.compile(r"\[([^|]+)\|(.+?)\]")
+_J2M_BRACKETS = re.compile(r"\[(.+?)\]([^\(])")
+_J2M_COLOR = re.compile(r"\{color:([^}]+)\}([\s\S]*?)\{color\}", re.MULTILINE)
+
+
+def _jira_code_to_md(match: re.Match[str]) -> str:
+    lang = match.group(1) or ""
+    content = match.group(2)
+    return f"```{lang}\n{content}\n```"
+
+
+def _jira_emphasis_to_md(match: re.Match[str]) -> str:
+    marker = "**" if match.group(1) == "*" else "*"
+    return marker + match.group(2) + marker
+
+
+# Precompiled patterns for JiraPreprocessor.markdown_to_jira, in pass order.
+_M2J_CODE = re.compile(r"```(\w*)\n([\s\S]+?)```")
+_M2J_INLINE_CODE = re.compile(r"`([^`]+)`")
+_M2J_SETEXT_HEADER = re.compile(r"^(?=[^\n]*\S)(.*?)\n([=-])+$", re.MULTILINE)
+_M2J_ATX_HEADER = re.compile(r"^([#]+) (.*)$", re.MULTILINE)
+_M2J_LINK_TARGET = re.compile(r"(!?\[[^\]\n]*\]\()([^)]+)(\))")
+_M2J_AUTOLINK = re.compile(
+    r"<((?:[A-Za-z][A-Za-z0-9+.-]*:[^>\s]+|[^<>\s@]+@[^<>\s@]+))>"
+)
+# Equivalent to (?<=[^\W_])_+(?=[^\W_]) but starts with a literal "_", which
+# lets the regex engine skip ahead instead of testing the lookbehind everywhere.
+_M2J_INTRAWORD_UNDERSCORES = re.compile(r"_(?<=[^\W_]_)_*(?=[^\W_])")
+_M2J_LIST_MARKER = re.compile(r"^[*_]+\s")
+_M2J_EMPHASIS = re.compile(r"([*_]+)(.*?)\1")
+_M2J_BULLET_ITEM = re.compile(r"^(\s+)?[-+*] (.*)$", re.MULTILINE)
+_M2J_NUMBERED_ITEM = re.compile(r"^(\s+)?\d+\. (.*)$", re.MULTILINE)
+_M2J_HTML_TAGS = tuple(
+    (tag, re.compile(rf"<{tag}>(.*?)<\/{tag}>"), rf"{replacement}\1{replacement}")
+    for tag, replacement in (
+        ("cite", "??"),
+        ("del", "-"),
+        ("ins", "+"),
+        ("sup", "^"),
+        ("sub", "~"),
+    )
+)
+_M2J_COLOR = re.compile(
+    r"<span style=\"color:(#[^\"]+)\">([\s\S]*?)</span>", re.MULTILINE
+)
+_M2J_STRIKE = re.compile(r"~~(.*?)~~")
+_M2J_IMAGE = re.compile(r"!\[\]\(([^)\n\s]+)\)")
+_M2J_IMAGE_ALT = re.compile(r"!\[([^\]\n]+)\]\(([^)\n\s]+)\)")
+_M2J_LINK = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
+_M2J_ANGLE_LINK = re.compile(r"<([^>]+)>")
+_M2J_TABLE_ROW = re.compile(r"^\|.*\|$")
+_M2J_TABLE_SEPARATOR = re.compile(r"^\|[-\s|:]+\|$")
+_M2J_ANY_TABLE_SEPARATOR = re.compile(r"^\|[-\s|:]+\|$", re.MULTILINE)
+
+
+def _setext_header_to_jira(match: re.Match[str]) -> str:
+    return f"h{1 if match.group(2)[0] == '=' else 2}. {match.group(1)}"
+
+
+def _emphasis_to_jira(match: re.Match[str]) -> str:
+    marker = "_" if len(match.group(1)) == 1 else "*"
+    return marker + match.group(2) + marker
+
+
+def _markdown_list_item_to_jira(match: re.Match[str], marker: str) -> str:
+    ident = len(match.group(1)) if match.group(1) else 0
+    level = ident // 2 + 1
+    return marker * level + " " + match.group(2)
+
+
+def _markdown_tables_to_jira(text: str) -> str:
+    """Convert markdown table blocks (header, separator, rows) to Jira tables."""
+    lines = text.split("\n")
+    result: list[str] = []
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        # Look for a header row followed by a markdown separator line
+        if (
+            i + 1 < len(lines)
+            and _M2J_TABLE_SEPARATOR.match(lines[i + 1])
+            and _M2J_TABLE_ROW.match(line)
+        ):
+            header_cells = [cell.strip() for cell in line.split("|")[1:-1]]
+            result.append("||" + "||".join(header_cells) + "||")
+            i += 2  # drop separator
+            # Consume data rows while they look like table rows
+            while i < len(lines) and _M2J_TABLE_ROW.match(lines[i]):
+                data_cells = [cell.strip() for cell in lines[i].split("|")[1:-1]]
+                result.append("|" + "|".join(data_cells) + "|")
+                i += 1
+            continue
+        result.append(line)
+        i += 1
+    return "\n".join(result)
+
+
 def _convert_panel(params: str | None, content: str) -> str:
     """Convert a Jira {panel} block to markdown."""
     title = ""
     if params:
-        title_match = re.search(r"title=([^|}]+)", params)
+        title_match = _J2M_PANEL_TITLE.search(params)
         if title_match:
             title = title_match.group(1).strip()
     content = content.strip()
@@ -238,151 +354,112 @@ class JiraPreprocessor(BasePreprocessor):
         # continuity.  This is intentional: protecting code content
         # from markup corruption is more important than preserving
         # blockquote indentation around code fences.
+        #
+        # Every pass below uses a precompiled pattern and is skipped when
+        # its trigger text is absent, so plain prose costs a handful of
+        # substring checks instead of ~20 full regex scans.
         code_blocks: list[str] = []
         inline_codes: list[str] = []
 
-        def _jira_code_to_md(match: re.Match[str]) -> str:
-            lang = match.group(1) or ""
-            content = match.group(2)
-            return f"```{lang}\n{content}\n```"
-
-        output = _extract_blocks(
-            output,
-            r"\{code(?::([a-z]+))?\}([\s\S]*?)\{code\}",
-            _jira_code_to_md,
-            code_blocks,
-            "CODEBLOCK",
-            flags=re.MULTILINE,
-        )
-        output = _extract_blocks(
-            output,
-            r"\{noformat\}([\s\S]*?)\{noformat\}",
-            lambda m: f"```\n{m.group(1)}\n```",
-            code_blocks,
-            "CODEBLOCK",
-        )
-        output = _extract_blocks(
-            output,
-            r"\{\{([^}]+)\}\}",
-            lambda m: f"`{m.group(1)}`",
-            inline_codes,
-            "INLINECODE",
-        )
+        if "{code" in output:
+            output = _extract_blocks(
+                output, _J2M_CODE, _jira_code_to_md, code_blocks, "CODEBLOCK"
+            )
+        if "{noformat}" in output:
+            output = _extract_blocks(
+                output,
+                _J2M_NOFORMAT,
+                lambda m: f"```\n{m.group(1)}\n```",
+                code_blocks,
+                "CODEBLOCK",
+            )
+        if "{{" in output:
+            output = _extract_blocks(
+                output,
+                _J2M_INLINE_CODE,
+                lambda m: f"`{m.group(1)}`",
+                inline_codes,
+                "INLINECODE",
+            )
 
         # Block quotes
-        output = re.sub(r"^bq\.(.*?)$", r"> \1\n", output, flags=re.MULTILINE)
+        if "bq." in output:
+            output = _J2M_BQ.sub(r"> \1\n", output)
 
         # Text formatting (bold, italic)
-        output = re.sub(
-            r"([*_])(.*?)\1",
-            lambda match: (
-                ("**" if match.group(1) == "*" else "*")
-                + match.group(2)
-                + ("**" if match.group(1) == "*" else "*")
-            ),
-            output,
-        )
-
-        # Multi-level numbered list
-        output = re.sub(
-            r"^((?:#|-|\+|\*)+) (.*)$",
-            lambda match: self._convert_jira_list_to_markdown(match),
-            output,
-            flags=re.MULTILINE,
-        )
+        if "*" in output or "_" in output:
+            output = _J2M_EMPHASIS.sub(_jira_emphasis_to_md, output)
 
-        # Headers
-        output = re.sub(
-            r"^h([0-6])\.(.*)$",
-            lambda match: "#" * int(match.group(1)) + match.group(2),
-            output,
-            flags=re.MULTILINE,
-        )
+        # Multi-level lists and headers share one line-anchored pass; the two
+        # alternatives start with disjoint characters so no line matches both.
+        output = _J2M_LIST_OR_HEADER.sub(self._convert_jira_line_to_markdown, output)
 
         # Citation (non-overlapping alternation to avoid catastrophic backtracking)
-        output = re.sub(
-            r"\?\?([^?]+(?:\?[^?]+)*)\?\?",
-            r"<cite>\1</cite>",
-            output,
-        )
+        if "??" in output:
+            output = _J2M_CITE.sub(r"<cite>\1</cite>", output)
 
         # Inserted text
-        output = re.sub(r"\+([^+]*)\+", r"<ins>\1</ins>", output)
+        if "+" in output:
+            output = _J2M_INS.sub(r"<ins>\1</ins>", output)
 
         # Superscript
-        output = re.sub(r"\^([^^]*)\^", r"<sup>\1</sup>", output)
+        if "^" in output:
+            output = _J2M_SUP.sub(r"<sup>\1</sup>", output)
 
         # Subscript
-        output = re.sub(r"~([^~]*)~", r"<sub>\1</sub>", output)
+        if "~" in output:
+            output = _J2M_SUB.sub(r"<sub>\1</sub>", output)
 
-        # Strikethrough
-        output = re.sub(r"-([^-]*)-", r"-\1-", output)
+        # Strikethrough (-text-) is kept as-is, so it needs no pass.
 
         # Quote blocks
-        output = re.sub(
-            r"\{quote\}([\s\S]*)\{quote\}",
-            lambda match: "\n".join(
-                [f"> {line}" for line in match.group(1).split("\n")]
-            ),
-            output,
-            flags=re.MULTILINE,
-        )
+        if "{quote}" in output:
+            output = _J2M_QUOTE.sub(
+                lambda match: "\n".join(
+                    [f"> {line}" for line in match.group(1).split("\n")]
+                ),
+                output,
+            )
 
         # Panel blocks - extract content, optionally show title as bold
-        output = re.sub(
-            r"\{panel(?::([^}]*))?\}([\s\S]*?)\{panel\}",
-            lambda match: _convert_panel(match.group(1), match.group(2)),
-            output,
-            flags=re.MULTILINE,
-        )
-
-        # Images with alt text
-        output = re.sub(
-            r"!([^|\n\s]+)\|([^\n!]*)alt=([^\n!\,]+?)"
-            r"(,([^\n!]*))?!",
-            r"![\3](\1)",
-            output,
-        )
-
-        # Images with other parameters (ignore them)
-        output = re.sub(r"!([^|\n\s]+)\|([^\n!]*)!", r"![](\1)", output)
+        if "{panel" in output:
+            output = _J2M_PANEL.sub(
+                lambda match: _convert_panel(match.group(1), match.group(2)),
+                output,
+            )
 
-        # Images without parameters
-        output = re.sub(r"!([^\n\s!]+)!", r"![](\1)", output)
+        if "!" in output:
+            # Images with alt text
+            output = _J2M_IMAGE_ALT.sub(r"![\3](\1)", output)
+            # Images with other parameters (ignore them)
+            output = _J2M_IMAGE_PARAMS.sub(r"![](\1)", output)
+            # Images without parameters
+            output = _J2M_IMAGE.sub(r"![](\1)", output)
 
         # Links
-        output = re.sub(r"\[([^|]+)\|(.+?)\]", r"[\1](\2)", output)
-        output = re.sub(r"\[(.+?)\]([^\(])", r"\1\2", output)
+        if "[" in output:
+            output = _J2M_LINK.sub(r"[\1](\2)", output)
+            output = _J2M_BRACKETS.sub(r"\1\2", output)
 
         # Colored text
-        output = re.sub(
-            r"\{color:([^}]+)\}([\s\S]*?)\{color\}",
-            r"<span style=\"color:\1\">\2</span>",
-            output,
-            flags=re.MULTILINE,
-        )
+        if "{color:" in output:
+            output = _J2M_COLOR.sub(r"<span style=\"color:\1\">\2</span>", output)
 
         # Convert Jira table headers (||) to markdown table format
-        lines = output.split("\n")
-        i = 0
-        while i < len(lines):
-            line = lines[i]
-
-            if "||" in line:
+        if "||" in output:
+            lines: list[str] = []
+            for line in output.split("\n"):
+                if "||" not in line:
+                    lines.append(line)
+                    continue
                 # Replace Jira table headers
-                lines[i] = lines[i].replace("||", "|")
-
+                line = line.replace("||", "|")
+                lines.append(line)
                 # Add a separator line for markdown tables
-                header_cells = lines[i].count("|") - 1
+                header_cells = line.count("|") - 1
                 if header_cells > 0:
-                    separator_line = "|" + "---|" * header_cells
-                    lines.insert(i + 1, separator_line)
-                    i += 1
-
-            i += 1
-
-        # Rejoin the lines
-        output = "\n".join(lines)
+                    lines.append("|" + "---|" * header_cells)
+            output = "\n".join(lines)
 
         # Restore code/noformat blocks and inline code
         output = _restore_blocks(output, code_blocks, "CODEBLOCK")
@@ -437,58 +514,44 @@ class JiraPreprocessor(BasePreprocessor):
         code_blocks: list[str] = []
         inline_codes: list[str] = []
 
-        def _md_code_to_jira(match: re.Match[str]) -> str:
-            syntax = match.group(1) or ""
-            content = match.group(2)
-            jira_lang = self._normalize_code_language(syntax)
-            code = "{code"
-            if jira_lang:
-                code += ":" + jira_lang
-            code += "}" + content + "{code}"
-            return code
-
-        def _md_inline_to_jira(
-            match: re.Match[str],
-        ) -> str:
-            return "{{" + match.group(1) + "}}"
-
         # Extract code blocks and inline code before
         # any other transformations.
-        output = _extract_blocks(
-            input_text,
-            r"```(\w*)\n([\s\S]+?)```",
-            _md_code_to_jira,
-            code_blocks,
-            "CODEBLOCK",
-        )
-        output = _extract_blocks(
-            output,
-            r"`([^`]+)`",
-            _md_inline_to_jira,
-            inline_codes,
-            "INLINECODE",
-        )
+        output = input_text
+        if "```" in output:
+            output = _extract_blocks(
+                output,
+                _M2J_CODE,
+                self._markdown_code_to_jira,
+                code_blocks,
+                "CODEBLOCK",
+            )
+        if "`" in output:
+            output = _extract_blocks(
+                output,
+                _M2J_INLINE_CODE,
+                lambda m: "{{" + m.group(1) + "}}",
+                inline_codes,
+                "INLINECODE",
+            )
+
+        # As in jira_to_markdown, each pass below is precompiled and skipped
+        # when its trigger text is absent.
 
         # Headers with = or - underlines. A setext heading needs actual text on
         # the line above the underline, so the lookahead keeps a blank line from
         # matching: `\n\n----\n` is a horizontal rule, which is already valid
         # Jira markup, not an empty `h2.` (issue #1587).
-        output = re.sub(
-            r"^(?=[^\n]*\S)(.*?)\n([=-])+$",
-            lambda match: f"h{1 if match.group(2)[0] == '=' else 2}. {match.group(1)}",
-            output,
-            flags=re.MULTILINE,
-        )
+        if "\n=" in output or "\n-" in output:
+            output = _M2J_SETEXT_HEADER.sub(_setext_header_to_jira, output)
 
         # Headers with # prefix - require space after #
         # to distinguish from Jira lists (issue #786)
-        output = re.sub(
-            r"^([#]+) (.*)$",
-            lambda match: f"h{len(match.group(1))}. " + match.group(2),
-            output,
-            flags=re.MULTILINE,
-        )
+        if "#" in output:
+            output = _M2J_ATX_HEADER.sub(
+                lambda m: f"h{len(m.group(1))}. " + m.group(2), output
+            )
 
+        # Keep URL targets away from the emphasis pass (underscores in URLs).
         markdown_url_targets: list[str] = []
 
         def store_markdown_url_target(target: str) -> str:
@@ -496,163 +559,87 @@ class JiraPreprocessor(BasePreprocessor):
             markdown_url_targets.append(target)
             return placeholder
 
-        def protect_markdown_link_target(match: re.Match[str]) -> str:
-            return (
-                match.group(1)
-                + store_markdown_url_target(match.group(2))
-                + match.group(3)
+        if "](" in output:
+            output = _M2J_LINK_TARGET.sub(
+                lambda m: (
+                    m.group(1) + store_markdown_url_target(m.group(2)) + m.group(3)
+                ),
+                output,
+            )
+        if "<" in output:
+            output = _M2J_AUTOLINK.sub(
+                lambda m: "<" + store_markdown_url_target(m.group(1)) + ">",
+                output,
             )
-
-        def protect_markdown_autolink_target(match: re.Match[str]) -> str:
-            return "<" + store_markdown_url_target(match.group(1)) + ">"
-
-        output = re.sub(
-            r"(!?\[[^\]\n]*\]\()([^)]+)(\))",
-            protect_markdown_link_target,
-            output,
-        )
-        output = re.sub(
-            r"<((?:[A-Za-z][A-Za-z0-9+.-]*:[^>\s]+|[^<>\s@]+@[^<>\s@]+))>",
-            protect_markdown_autolink_target,
-            output,
-        )
 
         # Bold and italic - skip lines starting with
-        # asterisks+space (Jira list syntax, issue #786)
-        def escape_intraword_underscore_runs(match: re.Match[str]) -> str:
-            return r"\_" * len(match.group(0))
-
-        def convert_bold_italic_line(line: str) -> str:
-            # CommonMark treats underscores between two word characters as
-            # literal text, not emphasis. The Jira wiki renderer does not:
-            # it italicizes any ``_word_`` span, so identifiers such as
-            # snake_case, customfield_10101 or foo_bar_baz would render with
-            # spurious italics (and adjacent identifiers can pair into a
-            # cross-token italic span). Escape intraword underscore runs as
-            # ``\_`` so Jira renders them literally; genuine word-boundary
-            # ``_emphasis_``/``__strong__`` is left intact for conversion below.
-            line = re.sub(
-                r"(?<=[^\W_])_+(?=[^\W_])",
-                escape_intraword_underscore_runs,
-                line,
+        # asterisks+space (Jira list syntax, issue #786).
+        #
+        # CommonMark treats underscores between two word characters as
+        # literal text, not emphasis. The Jira wiki renderer does not:
+        # it italicizes any ``_word_`` span, so identifiers such as
+        # snake_case, customfield_10101 or foo_bar_baz would render with
+        # spurious italics (and adjacent identifiers can pair into a
+        # cross-token italic span). Escape intraword underscore runs as
+        # ``\_`` so Jira renders them literally; genuine word-boundary
+        # ``_emphasis_``/``__strong__`` is left intact for conversion below.
+        # Neither pattern crosses a newline, so the escape runs once over the
+        # whole text and emphasis only visits lines that contain a marker.
+        if "_" in output:
+            output = _M2J_INTRAWORD_UNDERSCORES.sub(
+                lambda m: r"\_" * len(m.group(0)), output
             )
-            if re.match(r"^[*_]+\s", line):
-                return line
-            return re.sub(
-                r"([*_]+)(.*?)\1",
-                lambda m: (
-                    ("_" if len(m.group(1)) == 1 else "*")
-                    + m.group(2)
-                    + ("_" if len(m.group(1)) == 1 else "*")
-                ),
-                line,
+        if "*" in output or "_" in output:
+            output = "\n".join(
+                _M2J_EMPHASIS.sub(_emphasis_to_jira, line)
+                if ("*" in line or "_" in line) and not _M2J_LIST_MARKER.match(line)
+                else line
+                for line in output.split("\n")
             )
-
-        lines = output.split("\n")
-        output = "\n".join(convert_bold_italic_line(line) for line in lines)
         output = _restore_blocks(output, markdown_url_targets, "MARKDOWNURL")
 
         # Multi-level bulleted list
-        def bulleted_list_fn(match: re.Match[str]) -> str:
-            ident = len(match.group(1)) if match.group(1) else 0
-            level = ident // 2 + 1
-            return str("*" * level + " " + match.group(2))
-
-        output = re.sub(
-            r"^(\s+)?[-+*] (.*)$",
-            bulleted_list_fn,
-            output,
-            flags=re.MULTILINE,
+        output = _M2J_BULLET_ITEM.sub(
+            lambda m: _markdown_list_item_to_jira(m, "*"), output
         )
 
         # Multi-level numbered list
-        def numbered_list_fn(
-            match: re.Match[str],
-        ) -> str:
-            ident = len(match.group(1)) if match.group(1) else 0
-            level = ident // 2 + 1
-            return str("#" * level + " " + match.group(2))
-
-        output = re.sub(
-            r"^(\s+)?\d+\. (.*)$",
-            numbered_list_fn,
-            output,
-            flags=re.MULTILINE,
+        output = _M2J_NUMBERED_ITEM.sub(
+            lambda m: _markdown_list_item_to_jira(m, "#"), output
         )
 
         # HTML formatting tags to Jira markup
-        tag_map = {
-            "cite": "??",
-            "del": "-",
-            "ins": "+",
-            "sup": "^",
-            "sub": "~",
-        }
-
-        for tag, replacement in tag_map.items():
-            output = re.sub(
-                rf"<{tag}>(.*?)<\/{tag}>",
-                rf"{replacement}\1{replacement}",
-                output,
-            )
+        if "<" in output:
+            for tag, pattern, replacement in _M2J_HTML_TAGS:
+                if f"<{tag}>" in output:
+                    output = pattern.sub(replacement, output)
 
-        # Colored text
-        output = re.sub(
-            r"<span style=\"color:(#[^\"]+)\">"
-            r"([\s\S]*?)</span>",
-            r"{color:\1}\2{color}",
-            output,
-            flags=re.MULTILINE,
-        )
+            # Colored text
+            if "<span" in output:
+                output = _M2J_COLOR.sub(r"{color:\1}\2{color}", output)
 
         # Strikethrough
-        output = re.sub(r"~~(.*?)~~", r"-\1-", output)
-
-        # Images without alt text
-        output = re.sub(r"!\[\]\(([^)\n\s]+)\)", r"!\1!", output)
+        if "~~" in output:
+            output = _M2J_STRIKE.sub(r"-\1-", output)
 
-        # Images with alt text
-        output = re.sub(
-            r"!\[([^\]\n]+)\]\(([^)\n\s]+)\)",
-            r"!\2|alt=\1!",
-            output,
-        )
+        if "![" in output:
+            # Images without alt text
+            output = _M2J_IMAGE.sub(r"!\1!", output)
+            # Images with alt text
+            output = _M2J_IMAGE_ALT.sub(r"!\2|alt=\1!", output)
 
         # Links
-        output = re.sub(r"\[([^\]]+)\]\(([^)]+)\)", r"[\1|\2]", output)
-        output = re.sub(r"<([^>]+)>", r"[\1]", output)
+        if "](" in output:
+            output = _M2J_LINK.sub(r"[\1|\2]", output)
+        if "<" in output:
+            output = _M2J_ANGLE_LINK.sub(r"[\1]", output)
 
         # Convert markdown tables to Jira table format
         # Issue #1343: parse full table blocks (header + separator + data rows),
         # strip whitespace from each cell, convert header to ||cell|| and data
         # rows to |cell|.
-        lines = output.split("\n")
-        i = 0
-        while i < len(lines):
-            # Look for a header row followed by a markdown separator line
-            if (
-                i < len(lines) - 1
-                and re.match(r"^\|[-\s|:]+\|$", lines[i + 1])
-                and re.match(r"^\|.*\|$", lines[i])
-            ):
-                # Header row
-                header_cells = [cell.strip() for cell in lines[i].split("|")[1:-1]]
-                lines[i] = "||" + "||".join(header_cells) + "||"
-                lines.pop(i + 1)  # drop separator
-
-                # Consume data rows while they look like table rows
-                while i < len(lines) and re.match(
-                    r"^\|.*\|$", lines[i + 1] if i + 1 < len(lines) else ""
-                ):
-                    data_cells = [
-                        cell.strip() for cell in lines[i + 1].split("|")[1:-1]
-                    ]
-                    lines[i + 1] = "|" + "|".join(data_cells) + "|"
-                    i += 1
-            i += 1
-
-        # Rejoin the lines
-        output = "\n".join(lines)
+        if _M2J_ANY_TABLE_SEPARATOR.search(output):
+            output = _markdown_tables_to_jira(output)
 
         # Restore code blocks and inline code
         output = _restore_blocks(output, code_blocks, "CODEBLOCK")
@@ -660,6 +647,20 @@ class JiraPreprocessor(BasePreprocessor):
 
         return output
 
+    def _markdown_code_to_jira(self, match: re.Match[str]) -> str:
+        """Convert a fenced markdown code block match to a Jira {code} block."""
+        jira_lang = self._normalize_code_language(match.group(1) or "")
+        code = "{code"
+        if jira_lang:
+            code += ":" + jira_lang
+        return code + "}" + match.group(2) + "{code}"
+
+    def _convert_jira_line_to_markdown(self, match: re.Match[str]) -> str:
+        """Convert a Jira list item or ``hN.`` header line to Markdown."""
+        if match.group(3) is not None:
+            return "#" * int(match.group(3)) + match.group(4)
+        return self._convert_jira_list_to_markdown(match)
+
     def _convert_jira_list_to_markdown(self, match: re.Match) -> str:
         """
         Helper method to convert Jira lists to Markdown format.
@@ -5,11 +5,16 @@ from __future__ import annotations
 import os
 from collections.abc import Callable
 from functools import partial
-from typing import ParamSpec, TypeVar
+from typing import TYPE_CHECKING, ParamSpec, TypeVar
 
 import anyio
 from anyio.lowlevel import RunVar
 
+from mcp_atlassian.utils.progress import PageProgress, get_tool_deadline_seconds
+
+if TYPE_CHECKING:
+    from fastmcp import Context
+
 P = ParamSpec("P")
 T = TypeVar("T")
 
@@ -60,3 +65,34 @@ async def run_jira_fetcher_call(
         call,
         limiter=_get_jira_fetcher_limiter(),
     )
+
+
+async def run_fetcher_call(
+    func: Callable[P, T],
+    /,
+    *args: P.args,
+    **kwargs: P.kwargs,
+) -> T:
+    """Run a blocking fetcher call in a worker thread.
+
+    Unlike ``run_jira_fetcher_call`` this uses anyio's default thread
+    limiter; it lets a long scan report progress (see ``tool_progress``)
+    without blocking the event loop.
+    """
+    return await anyio.to_thread.run_sync(partial(func, *args, **kwargs))
+
+
+def tool_progress(ctx: Context) -> PageProgress:
+    """Return a ``PageProgress`` that forwards pages as MCP progress.
+
+    The fetcher must run in an anyio worker thread (``run_fetcher_call`` or
+    ``run_jira_fetcher_call``) so each report can be sent through the event
+    loop. Notifications are only delivered when the client asked for them
+    with a progress token. The deadline comes from
+    ``MCP_ATLASSIAN_TOOL_DEADLINE_SECONDS``.
+    """
+
+    def report(done: float, total: float | None, message: str | None) -> None:
+        anyio.from_thread.run(ctx.report_progress, done, total, message)
+
+    return PageProgress(report, get_tool_deadline_seconds())
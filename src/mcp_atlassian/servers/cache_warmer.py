@@ -0,0 +1,203 @@
+"""Optional background warm-up of the shared response caches at startup.
+
+Enabled with MCP_ATLASSIAN_CACHE_WARMUP=true. After a restart the first tool
+calls would otherwise pay for field lists, link types, status categories,
+project metadata and Confluence space IDs. The warmer fetches them once with
+the server's global credentials for the projects in JIRA_PROJECTS_FILTER and
+the spaces in CONFLUENCE_SPACES_FILTER.
+
+Warm-up runs as a background task and never blocks readiness: ``/healthz``
+keeps reporting ``ok`` and additionally exposes the warm-up state and timings.
+It only has an effect when response caching is enabled
+(MCP_ATLASSIAN_RESPONSE_CACHE_TTL > 0), because fetchers themselves are rebuilt
+per request.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from mcp_atlassian.utils.cache import RESPONSE_CACHE_TTL_ENV, response_cache_ttl
+from mcp_atlassian.utils.env import is_env_truthy
+
+if TYPE_CHECKING:
+    from mcp_atlassian.confluence.config import ConfluenceConfig
+    from mcp_atlassian.jira.config import JiraConfig
+
+logger = logging.getLogger("mcp-atlassian.server.cache_warmer")
+
+CACHE_WARMUP_ENV = "MCP_ATLASSIAN_CACHE_WARMUP"
+
+
+def _filter_keys(raw: str | None) -> list[str]:
+    if not raw:
+        return []
+    return [key.strip() for key in raw.split(",") if key.strip()]
+
+
+class CacheWarmer:
+    """Pre-fetch cacheable metadata and record per-step timings."""
+
+    def __init__(
+        self,
+        jira_config: JiraConfig | None,
+        confluence_config: ConfluenceConfig | None,
+    ) -> None:
+        self.jira_config = jira_config
+        self.confluence_config = confluence_config
+        self._lock = threading.Lock()
+        self._state = "pending"
+        self._started_at: float | None = None
+        self._duration_ms: float | None = None
+        self._steps: dict[str, dict[str, Any]] = {}
+
+    def status(self) -> dict[str, Any]:
+        """Return a JSON-serializable snapshot for the health endpoint."""
+        with self._lock:
+            snapshot: dict[str, Any] = {"state": self._state}
+            if self._duration_ms is not None:
+                snapshot["duration_ms"] = self._duration_ms
+            elif self._started_at is not None:
+                snapshot["elapsed_ms"] = round(
+                    (time.monotonic() - self._started_at) * 1000, 1
+                )
+            if self._steps:
+                snapshot["steps"] = {
+                    name: dict(step) for name, step in self._steps.items()
+                }
+            return snapshot
+
+    def _run_step(self, name: str, step: Callable[[], Any]) -> None:
+        started = time.monotonic()
+        try:
+            step()
+        except Exception as exc:  # noqa: BLE001 - warm-up is best effort
+            # The status is served by the unauthenticated /healthz endpoint, so
+            # it carries only the exception type; upstream messages can include
+            # URLs, usernames and response bodies.
+            logger.warning("Cache warm-up step %s failed: %s", name, exc)
+            result: dict[str, Any] = {"ok": False, "error": type(exc).__name__}
+        else:
+            result = {"ok": True}
+        result["ms"] = round((time.monotonic() - started) * 1000, 1)
+        with self._lock:
+            self._steps[name] = result
+
+    def _jira_steps(self) -> list[tuple[str, Callable[[], Any]]]:
+        from mcp_atlassian.jira import JiraFetcher
+
+        config = self.jira_config
+        if config is None:
+            return []
+        fetcher = JiraFetcher(config=config)
+        steps: list[tuple[str, Callable[[], Any]]] = [
+            ("jira.fields", fetcher.get_fields),
+            ("jira.link_types", fetcher.get_issue_link_types),
+            ("jira.statuses", fetcher._get_all_statuses),
+        ]
+        for project_key in _filter_keys(config.projects_filter):
+            steps.append(
+                (
+                    f"jira.project.{project_key}",
+                    lambda key=project_key: (
+                        fetcher.get_project_components(key),
+                        fetcher.get_project_versions(key),
+                    ),
+                )
+            )
+        return steps
+
+    def _confluence_steps(self) -> list[tuple[str, Callable[[], Any]]]:
+        from mcp_atlassian.confluence import ConfluenceFetcher
+
+        config = self.confluence_config
+        if config is None or not config.is_cloud:
+            # Space IDs only exist in the Cloud v2 API.
+            return []
+        fetcher = ConfluenceFetcher(config=config)
+        return [
+            (
+                f"confluence.space.{space_key}",
+                lambda key=space_key: fetcher.get_space_id(key),
+            )
+            for space_key in _filter_keys(config.spaces_filter)
+        ]
+
+    def run_sync(self) -> None:
+        """Run every warm-up step, blocking the calling thread."""
+        with self._lock:
+            self._state = "running"
+            self._started_at = time.monotonic()
+        for service, build_steps in (
+            ("jira", self._jira_steps),
+            ("confluence", self._confluence_steps),
+        ):
+            try:
+                steps = build_steps()
+            except Exception as exc:  # noqa: BLE001 - warm-up is best effort
+                logger.warning("Cache warm-up for %s skipped: %s", service, exc)
+                with self._lock:
+                    self._steps[service] = {
+                        "ok": False,
+                        "error": type(exc).__name__,
+                    }
+                continue
+            for name, step in steps:
+                self._run_step(name, step)
+        with self._lock:
+            assert self._started_at is not None  # noqa: S101 - set above
+            self._duration_ms = round((time.monotonic() - self._started_at) * 1000, 1)
+            self._state = "done"
+        logger.info("Cache warm-up finished in %.1f ms", self._duration_ms)
+
+    async def run(self) -> None:
+        """Run the warm-up in a worker thread without blocking the event loop."""
+        try:
+            await asyncio.to_thread(self.run_sync)
+        except asyncio.CancelledError:
+            with self._lock:
+                self._state = "cancelled"
+            raise
+
+
+_cache_warmer: CacheWarmer | None = None
+
+
+def get_cache_warmup_status() -> dict[str, Any] | None:
+    """Return the current warm-up status, or None when warm-up is not enabled."""
+    warmer = _cache_warmer
+    return warmer.status() if warmer is not None else None
+
+
+def start_cache_warmup(
+    jira_config: JiraConfig | None,
+    confluence_config: ConfluenceConfig | None,
+) -> asyncio.Task[None] | None:
+    """Start the background warm-up if enabled and useful.
+
+    Returns:
+        The running task (cancel it on shutdown), or None if nothing started.
+    """
+    global _cache_warmer
+    _cache_warmer = None
+    if not is_env_truthy(CACHE_WARMUP_ENV):
+        return None
+    if response_cache_ttl() <= 0:
+        logger.warning(
+            "%s is set but response caching is disabled; set %s to enable warm-up.",
+            CACHE_WARMUP_ENV,
+            RESPONSE_CACHE_TTL_ENV,
+        )
+        return None
+    if jira_config is None and confluence_config is None:
+        logger.info("Cache warm-up skipped: no globally configured credentials.")
+        return None
+
+    _cache_warmer = CacheWarmer(jira_config, confluence_config)
+    logger.info("Starting background cache warm-up.")
+    return asyncio.create_task(_cache_warmer.run(), name="mcp-atlassian-cache-warmup")
@@ -2,7 +2,6 @@
 
 import base64
 import binascii
-import json
 import logging
 import mimetypes
 import re
@@ -16,8 +15,10 @@ from pydantic import BeforeValidator, Field
 
 from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
 from mcp_atlassian.models.confluence import ConfluenceAttachment
+from mcp_atlassian.servers.async_utils import run_fetcher_call, tool_progress
 from mcp_atlassian.servers.dependencies import get_confluence_fetcher
 from mcp_atlassian.servers.error_handling import ErrorPreservingFastMCP
+from mcp_atlassian.servers.response import dump_response
 from mcp_atlassian.utils.decorators import (
     check_write_access,
 )
@@ -274,7 +275,81 @@ async def search(
             query, limit=limit, spaces_filter=spaces_filter
         )
     search_results = [page.to_simplified_dict() for page in pages]
-    return json.dumps(search_results, indent=2, ensure_ascii=False)
+    return dump_response(search_results)
+
+
+@confluence_mcp.tool(
+    tags={"confluence", "read", "local_index", "toolset:confluence_pages"},
+    annotations={"title": "Local Search", "readOnlyHint": True},
+)
+async def local_search(
+    ctx: Context,
+    query: Annotated[
+        str,
+        Field(
+            description=(
+                "Words to find in page titles and bodies (all must match; end "
+                "a word with * for a prefix match). CQL is not supported."
+            )
+        ),
+    ],
+    spaces: Annotated[
+        str | None,
+        Field(
+            description=(
+                "(Optional) Comma-separated indexed space keys to search. "
+                "Defaults to every space in CONFLUENCE_LOCAL_INDEX_SPACES."
+            ),
+            default=None,
+        ),
+    ] = None,
+    limit: Annotated[
+        int,
+        Field(
+            description="Maximum number of results (1-50)",
+            default=10,
+            ge=1,
+            le=50,
+        ),
+    ] = 10,
+    refresh: Annotated[
+        bool,
+        Field(
+            description=(
+                "Sync spaces older than CONFLUENCE_LOCAL_INDEX_SYNC_INTERVAL "
+                "before searching. Set false to answer from the index only."
+            ),
+            default=True,
+        ),
+    ] = True,
+) -> str:
+    """Full-text search over the local index of selected Confluence spaces.
+
+    Answers from a local SQLite index instead of the CQL search endpoint, so
+    it stays fast on large or busy instances. Only spaces listed in
+    CONFLUENCE_LOCAL_INDEX_SPACES are indexed. Each result reports when its
+    space was last synced; use confluence_search for CQL filters or content
+    outside the indexed spaces.
+
+    Args:
+        ctx: The FastMCP context.
+        query: Words to search for.
+        spaces: Comma-separated indexed space keys.
+        limit: Maximum number of results (1-50).
+        refresh: Whether to sync stale spaces first.
+
+    Returns:
+        JSON string with matching pages, each with a snippet and freshness.
+    """
+    confluence_fetcher = await get_confluence_fetcher(ctx)
+    result = await run_fetcher_call(
+        confluence_fetcher.local_search,
+        query=query,
+        spaces=spaces.split(",") if spaces else None,
+        limit=limit,
+        refresh=refresh,
+    )
+    return dump_response(result)
 
 
 @confluence_mcp.tool(
@@ -371,22 +446,18 @@ async def get_page(
             )
         except Exception as e:
             logger.error(f"Error fetching page by ID '{page_id}': {e}")
-            return json.dumps(
-                {"error": f"Failed to retrieve page by ID '{page_id}': {e}"},
-                indent=2,
-                ensure_ascii=False,
+            return dump_response(
+                {"error": f"Failed to retrieve page by ID '{page_id}': {e}"}
             )
     elif title and space_key:
         page_object = confluence_fetcher.get_page_by_title(
             space_key, title, convert_to_markdown=convert_to_markdown
         )
         if not page_object:
-            return json.dumps(
+            return dump_response(
                 {
                     "error": f"Page with title '{title}' not found in space '{space_key}'."
-                },
-                indent=2,
-                ensure_ascii=False,
+                }
             )
     else:
         raise ValueError(
@@ -394,18 +465,14 @@ async def get_page(
         )
 
     if not page_object:
-        return json.dumps(
-            {"error": "Page not found with the provided identifiers."},
-            indent=2,
-            ensure_ascii=False,
-        )
+        return dump_response({"error": "Page not found with the provided identifiers."})
 
     if include_metadata:
         result = {"metadata": page_object.to_simplified_dict()}
     else:
         result = {"content": {"value": page_object.content}}
 
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return dump_response(result)
 
 
 @confluence_mcp.tool(
@@ -508,7 +575,7 @@ async def get_page_children(
         )
         result = {"error": f"Failed to get child pages: {e}"}
 
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return dump_response(result)
 
 
 @confluence_mcp.tool(
@@ -530,6 +597,14 @@ async def get_space_page_tree(
             le=1000,
         ),
     ] = 100,
+    start: Annotated[
+        int,
+        Field(
+            description="Offset of the first page; pass next_start to continue",
+            default=0,
+            ge=0,
+        ),
+    ] = 0,
 ) -> str:
     """Get page hierarchy for a Confluence space as a flat list.
 
@@ -543,6 +618,7 @@ async def get_space_page_tree(
         ctx: The FastMCP context.
         space_key: Space key identifier.
         limit: Maximum pages to fetch (start with 100 for faster results).
+        start: Offset of the first page, for continuing a truncated tree.
 
     Returns:
         JSON with space_key, total_pages, and pages array containing
@@ -550,17 +626,31 @@ async def get_space_page_tree(
         Root pages have parent_id: null and depth: 0.
     """
     confluence_fetcher = await get_confluence_fetcher(ctx)
-    tree_data = confluence_fetcher.get_space_page_tree(space_key=space_key, limit=limit)
+    progress = tool_progress(ctx)
+    tree_data = await run_fetcher_call(
+        confluence_fetcher.get_space_page_tree,
+        space_key=space_key,
+        limit=limit,
+        start=start,
+        progress=progress,
+    )
 
     result: dict[str, object] = dict(tree_data)
 
     # has_more is computed by the fetcher from the API's _links.next signal
-    if tree_data.get("has_more"):
+    if progress.deadline_reached:
+        result["partial"] = True
         result["hint"] = (
-            f"Results truncated at {limit} pages. Increase limit to see more."
+            "Stopped early at the tool deadline. Call again with "
+            f"start={tree_data.get('next_start')} to fetch the remaining pages."
+        )
+    elif tree_data.get("has_more"):
+        result["hint"] = (
+            f"Results truncated at {limit} pages. Call again with "
+            f"start={tree_data.get('next_start')} or increase limit to see more."
         )
 
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return dump_response(result)
 
 
 @confluence_mcp.tool(
@@ -592,7 +682,7 @@ async def get_comments(
     confluence_fetcher = await get_confluence_fetcher(ctx)
     comments = confluence_fetcher.get_page_comments(page_id)
     formatted_comments = [comment.to_simplified_dict() for comment in comments]
-    return json.dumps(formatted_comments, indent=2, ensure_ascii=False)
+    return dump_response(formatted_comments)
 
 
 @confluence_mcp.tool(
@@ -625,7 +715,7 @@ async def get_labels(
     confluence_fetcher = await get_confluence_fetcher(ctx)
     labels = confluence_fetcher.get_page_labels(page_id)
     formatted_labels = [label.to_simplified_dict() for label in labels]
-    return json.dumps(formatted_labels, indent=2, ensure_ascii=False)
+    return dump_response(formatted_labels)
 
 
 @confluence_mcp.tool(
@@ -678,7 +768,7 @@ async def add_label(
     confluence_fetcher = await get_confluence_fetcher(ctx)
     labels = confluence_fetcher.add_page_label(page_id, name)
     formatted_labels = [label.to_simplified_dict() for label in labels]
-    return json.dumps(formatted_labels, indent=2, ensure_ascii=False)
+    return dump_response(formatted_labels)
 
 
 @confluence_mcp.tool(
@@ -861,11 +951,7 @@ async def create_page(
     result = page.to_simplified_dict()
     if not include_content:
         result.pop("content", None)
-    return json.dumps(
-        {"message": "Page created successfully", "page": result},
-        indent=2,
-        ensure_ascii=False,
-    )
+    return dump_response({"message": "Page created successfully", "page": result})
 
 
 @confluence_mcp.tool(
@@ -1039,11 +1125,7 @@ async def update_page(
     page_data = updated_page.to_simplified_dict()
     if not include_content:
         page_data.pop("content", None)
-    return json.dumps(
-        {"message": "Page updated successfully", "page": page_data},
-        indent=2,
-        ensure_ascii=False,
-    )
+    return dump_response({"message": "Page updated successfully", "page": page_data})
 
 
 @confluence_mcp.tool(
@@ -1138,13 +1220,11 @@ async def update_page_section(
 
     page_data = updated_page.to_simplified_dict()
     page_data.pop("content", None)
-    return json.dumps(
+    return dump_response(
         {
             "message": f"Section '{heading_text}' updated successfully",
             "page": page_data,
-        },
-        indent=2,
-        ensure_ascii=False,
+        }
     )
 
 
@@ -1190,7 +1270,7 @@ async def delete_page(
             "error": str(e),
         }
 
-    return json.dumps(response, indent=2, ensure_ascii=False)
+    return dump_response(response)
 
 
 @confluence_mcp.tool(
@@ -1255,11 +1335,7 @@ async def move_page(
             position=position,
         )
         page_data = moved_page.to_simplified_dict()
-        return json.dumps(
-            {"message": "Page moved successfully", "page": page_data},
-            indent=2,
-            ensure_ascii=False,
-        )
+        return dump_response({"message": "Page moved successfully", "page": page_data})
     except ValueError:
         raise
     except Exception as e:
@@ -1269,7 +1345,7 @@ async def move_page(
             "message": f"Error moving page {page_id}",
             "error": str(e),
         }
-        return json.dumps(response, indent=2, ensure_ascii=False)
+        return dump_response(response)
 
 
 @confluence_mcp.tool(
@@ -1320,7 +1396,7 @@ async def add_comment(
             "error": str(e),
         }
 
-    return json.dumps(response, indent=2, ensure_ascii=False)
+    return dump_response(response)
 
 
 @confluence_mcp.tool(
@@ -1373,7 +1449,7 @@ async def reply_to_comment(
             "error": str(e),
         }
 
-    return json.dumps(response, indent=2, ensure_ascii=False)
+    return dump_response(response)
 
 
 @confluence_mcp.tool(
@@ -1417,7 +1493,7 @@ async def get_inline_comments(
             "error": str(e),
         }
 
-    return json.dumps(response, indent=2, ensure_ascii=False)
+    return dump_response(response)
 
 
 @confluence_mcp.tool(
@@ -1512,7 +1588,7 @@ async def add_inline_comment(
             "error": str(e),
         }
 
-    return json.dumps(response, indent=2, ensure_ascii=False)
+    return dump_response(response)
 
 
 @confluence_mcp.tool(
@@ -1580,25 +1656,21 @@ async def search_user(
             query, limit=limit, group_name=group_name
         )
         search_results = [user.to_simplified_dict() for user in user_results]
-        return json.dumps(search_results, indent=2, ensure_ascii=False)
+        return dump_response(search_results)
     except MCPAtlassianAuthenticationError as e:
         logger.error(f"Authentication error during user search: {e}", exc_info=False)
-        return json.dumps(
+        return dump_response(
             {
                 "error": "Authentication failed. Please check your credentials.",
                 "details": str(e),
-            },
-            indent=2,
-            ensure_ascii=False,
+            }
         )
     except Exception as e:
         logger.error(f"Error searching users: {str(e)}")
-        return json.dumps(
+        return dump_response(
             {
                 "error": f"An unexpected error occurred while searching for users: {str(e)}"
-            },
-            indent=2,
-            ensure_ascii=False,
+            }
         )
 
 
@@ -1656,29 +1728,25 @@ async def get_page_history(
             convert_to_markdown=convert_to_markdown,
         )
         result = page.to_simplified_dict()
-        return json.dumps(result, indent=2, ensure_ascii=False)
+        return dump_response(result)
     except MCPAtlassianAuthenticationError as e:
         logger.error(f"Authentication error getting page history: {e}")
-        return json.dumps(
+        return dump_response(
             {
                 "error": "Authentication failed. Please check your credentials.",
                 "details": str(e),
-            },
-            indent=2,
-            ensure_ascii=False,
+            }
         )
     except Exception as e:
         logger.error(
             f"Error getting page history for page {page_id} version {version}: {e}"
         )
-        return json.dumps(
+        return dump_response(
             {
                 "error": f"Failed to get page history: {e}",
                 "page_id": page_id,
                 "version": version,
-            },
-            indent=2,
-            ensure_ascii=False,
+            }
         )
 
 
@@ -1731,31 +1799,27 @@ async def get_page_diff(
             from_version=from_version,
             to_version=to_version,
         )
-        return json.dumps(result, indent=2, ensure_ascii=False)
+        return dump_response(result)
     except MCPAtlassianAuthenticationError as e:
         logger.error(f"Authentication error getting page diff: {e}")
-        return json.dumps(
+        return dump_response(
             {
                 "error": "Authentication failed. Please check your credentials.",
                 "details": str(e),
-            },
-            indent=2,
-            ensure_ascii=False,
+            }
         )
     except Exception as e:
         logger.error(
             f"Error getting diff for page {page_id} "
             f"(v{from_version} -> v{to_version}): {e}"
         )
-        return json.dumps(
+        return dump_response(
             {
                 "error": f"Failed to get page diff: {e}",
                 "page_id": page_id,
                 "from_version": from_version,
                 "to_version": to_version,
-            },
-            indent=2,
-            ensure_ascii=False,
+            }
         )
 
 
@@ -1799,30 +1863,22 @@ async def get_page_views(
             page_id=page_id,
             include_title=include_title,
         )
-        return json.dumps(result.to_simplified_dict(), indent=2, ensure_ascii=False)
+        return dump_response(result.to_simplified_dict())
     except MCPAtlassianAuthenticationError as e:
         logger.error(f"Authentication error getting page views: {e}")
-        return json.dumps(
+        return dump_response(
             {
                 "error": "Authentication failed. Please check your credentials.",
                 "details": str(e),
-            },
-            indent=2,
-            ensure_ascii=False,
+            }
         )
     except ValueError as e:
         logger.error(f"Error getting page views for {page_id}: {e}")
-        return json.dumps(
-            {"error": str(e), "page_id": page_id},
-            indent=2,
-            ensure_ascii=False,
-        )
+        return dump_response({"error": str(e), "page_id": page_id})
     except Exception as e:
         logger.error(f"Unexpected error getting page views for {page_id}: {e}")
-        return json.dumps(
-            {"error": f"Failed to get page views: {e}", "page_id": page_id},
-            indent=2,
-            ensure_ascii=False,
+        return dump_response(
+            {"error": f"Failed to get page views: {e}", "page_id": page_id}
         )
 
 
@@ -1964,10 +2020,8 @@ async def upload_attachment(
             minor_edit=minor_edit,
         )
 
-    return json.dumps(
-        {"message": "Attachment uploaded successfully", "attachment": result},
-        indent=2,
-        ensure_ascii=False,
+    return dump_response(
+        {"message": "Attachment uploaded successfully", "attachment": result}
     )
 
 
@@ -2050,13 +2104,11 @@ async def upload_attachments(
         minor_edit=minor_edit,
     )
 
-    return json.dumps(
+    return dump_response(
         {
             "message": f"Uploaded {len(results)} attachment(s) successfully",
             "attachments": results,
-        },
-        indent=2,
-        ensure_ascii=False,
+        }
     )
 
 
@@ -2162,7 +2214,7 @@ async def get_attachments(
         media_type=media_type,
     )
 
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return dump_response(result)
 
 
 @confluence_mcp.tool(
@@ -2216,15 +2268,13 @@ async def download_attachment(
         if not download_url:
             return TextContent(
                 type="text",
-                text=json.dumps(
+                text=dump_response(
                     {
                         "success": False,
                         "error": (
                             f"Could not find download URL for attachment {attachment_id}"
                         ),
-                    },
-                    indent=2,
-                    ensure_ascii=False,
+                    }
                 ),
             )
 
@@ -2243,7 +2293,7 @@ async def download_attachment(
         if file_size is not None and file_size > ATTACHMENT_MAX_BYTES:
             return TextContent(
                 type="text",
-                text=json.dumps(
+                text=dump_response(
                     {
                         "success": False,
                         "attachment_id": attachment_id,
@@ -2253,9 +2303,7 @@ async def download_attachment(
                             f"Attachment '{filename}' is {file_size} bytes which exceeds "
                             "the 50 MB inline limit. Retrieve it directly from Confluence."
                         ),
-                    },
-                    indent=2,
-                    ensure_ascii=False,
+                    }
                 ),
             )
 
@@ -2263,20 +2311,18 @@ async def download_attachment(
         if data_bytes is None:
             return TextContent(
                 type="text",
-                text=json.dumps(
+                text=dump_response(
                     {
                         "success": False,
                         "error": (f"Failed to download attachment {attachment_id}"),
-                    },
-                    indent=2,
-                    ensure_ascii=False,
+                    }
                 ),
             )
 
         if len(data_bytes) > ATTACHMENT_MAX_BYTES:
             return TextContent(
                 type="text",
-                text=json.dumps(
+                text=dump_response(
                     {
                         "success": False,
                         "attachment_id": attachment_id,
@@ -2287,9 +2333,7 @@ async def download_attachment(
                             "exceeds the 50 MB inline limit. Retrieve it directly from "
                             "Confluence."
                         ),
-                    },
-                    indent=2,
-                    ensure_ascii=False,
+                    }
                 ),
             )
 
@@ -2306,13 +2350,11 @@ async def download_attachment(
     except Exception as e:
         return TextContent(
             type="text",
-            text=json.dumps(
+            text=dump_response(
                 {
                     "success": False,
                     "error": f"Error downloading attachment: {str(e)}",
-                },
-                indent=2,
-                ensure_ascii=False,
+                }
             ),
         )
 
@@ -2358,7 +2400,7 @@ async def download_content_attachments(
         contents.append(
             TextContent(
                 type="text",
-                text=json.dumps(attachments_result, indent=2, ensure_ascii=False),
+                text=dump_response(attachments_result),
             )
         )
         return contents
@@ -2369,16 +2411,14 @@ async def download_content_attachments(
         contents.append(
             TextContent(
                 type="text",
-                text=json.dumps(
+                text=dump_response(
                     {
                         "success": True,
                         "content_id": content_id,
                         "message": f"No attachments found for content {content_id}",
                         "downloaded": 0,
                         "failed": [],
-                    },
-                    indent=2,
-                    ensure_ascii=False,
+                    }
                 ),
             )
         )
@@ -2464,7 +2504,7 @@ async def download_content_attachments(
         0,
         TextContent(
             type="text",
-            text=json.dumps(summary, indent=2, ensure_ascii=False),
+            text=dump_response(summary),
         ),
     )
     return contents
@@ -2514,13 +2554,11 @@ async def delete_attachment(
 
     confluence_fetcher.delete_attachment(attachment_id=attachment_id)
 
-    return json.dumps(
+    return dump_response(
         {
             "message": "Attachment deleted successfully",
             "attachment_id": attachment_id,
-        },
-        indent=2,
-        ensure_ascii=False,
+        }
     )
 
 
@@ -2567,7 +2605,7 @@ async def get_page_images(
         contents.append(
             TextContent(
                 type="text",
-                text=json.dumps(attachments_result, indent=2, ensure_ascii=False),
+                text=dump_response(attachments_result),
             )
         )
         return contents
@@ -2591,7 +2629,7 @@ async def get_page_images(
         contents.append(
             TextContent(
                 type="text",
-                text=json.dumps(
+                text=dump_response(
                     {
                         "success": True,
                         "content_id": content_id,
@@ -2599,9 +2637,7 @@ async def get_page_images(
                         "downloaded": 0,
                         "failed": [],
                         "message": "No image attachments found",
-                    },
-                    indent=2,
-                    ensure_ascii=False,
+                    }
                 ),
             )
         )
@@ -2677,7 +2713,7 @@ async def get_page_images(
         0,
         TextContent(
             type="text",
-            text=json.dumps(summary, indent=2, ensure_ascii=False),
+            text=dump_response(summary),
         ),
     )
     return contents
@@ -2736,11 +2772,7 @@ async def list_page_templates(
             }
             for t in results
         ]
-        return json.dumps(
-            {"templates": simplified, "total": len(simplified)},
-            indent=2,
-            ensure_ascii=False,
-        )
+        return dump_response({"templates": simplified, "total": len(simplified)})
     except MCPAtlassianAuthenticationError as e:
         logger.error(f"Authentication error listing templates: {e}")
         raise
@@ -2765,16 +2797,14 @@ async def get_page_template(
 
     try:
         template = confluence_fetcher.get_page_template(template_id)
-        return json.dumps(
+        return dump_response(
             {
                 "templateId": template.get("templateId", ""),
                 "name": template.get("name", ""),
                 "templateType": template.get("templateType", ""),
                 "description": _template_description(template),
                 "body": _template_storage_body(template),
-            },
-            indent=2,
-            ensure_ascii=False,
+            }
         )
     except MCPAtlassianAuthenticationError as e:
         logger.error(f"Authentication error fetching template {template_id}: {e}")
@@ -2827,7 +2857,7 @@ async def create_page_from_template(
             template_id=template_id,
             parent_id=parent_id,
         )
-        return json.dumps(result, indent=2, ensure_ascii=False)
+        return dump_response(result)
     except MCPAtlassianAuthenticationError as e:
         logger.error(f"Authentication error creating page from template: {e}")
         raise
@@ -2862,7 +2892,7 @@ async def get_page_restrictions(
     """
     confluence_fetcher = await get_confluence_fetcher(ctx)
     restrictions = confluence_fetcher.get_page_restrictions(page_id=page_id)
-    return json.dumps(restrictions, indent=2, ensure_ascii=False)
+    return dump_response(restrictions)
 
 
 @confluence_mcp.tool(
@@ -2939,10 +2969,8 @@ async def set_page_restrictions(
         edit_users=edit_users,
         edit_groups=edit_groups,
     )
-    return json.dumps(
-        {"message": "Page restrictions updated successfully", "restrictions": result},
-        indent=2,
-        ensure_ascii=False,
+    return dump_response(
+        {"message": "Page restrictions updated successfully", "restrictions": result}
     )
 
 
@@ -3009,10 +3037,8 @@ async def copy_page(
         destination_parent_id=destination_parent_id,
         copy_attachments=copy_attachments,
     )
-    return json.dumps(
-        {"message": "Page copied successfully", "page": page.to_simplified_dict()},
-        indent=2,
-        ensure_ascii=False,
+    return dump_response(
+        {"message": "Page copied successfully", "page": page.to_simplified_dict()}
     )
 
 
@@ -3077,7 +3103,7 @@ async def check_content_permissions(
         operation=operation,
         subject_type=subject_type,
     )
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return dump_response(result)
 
 
 @confluence_mcp.tool(
@@ -3132,4 +3158,4 @@ async def get_space_permissions(
         limit=limit,
         cursor=cursor,
     )
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return dump_response(result)
@@ -9,7 +9,9 @@ import dataclasses
 import hashlib
 import logging
 import os
+import sqlite3
 import threading
+import time
 from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
@@ -20,7 +22,9 @@ from starlette.requests import Request
 
 from mcp_atlassian.confluence import ConfluenceConfig, ConfluenceFetcher
 from mcp_atlassian.jira import JiraConfig, JiraFetcher
+from mcp_atlassian.servers.async_utils import run_fetcher_call
 from mcp_atlassian.servers.context import MainAppContext
+from mcp_atlassian.utils.cache_backends import get_cache_backend
 from mcp_atlassian.utils.env import (
     get_header_names,
     is_env_ssl_verify,
@@ -35,6 +39,7 @@ if TYPE_CHECKING:
         ConfluenceConfig as UserConfluenceConfigType,
     )
     from mcp_atlassian.jira.config import JiraConfig as UserJiraConfigType
+    from mcp_atlassian.utils.cache_backends import CacheBackend
 
 logger = logging.getLogger("mcp-atlassian.servers.dependencies")
 
@@ -115,6 +120,35 @@ class _ValidationInFlight:
 
 _validation_inflight: dict[tuple[str, str], _ValidationInFlight] = {}
 
+# When MCP_ATLASSIAN_CACHE_BACKEND selects a shared store (sqlite/factory), the
+# validation results are also written there so other workers and replicas skip
+# the /myself call, and a short lease in the same store coalesces concurrent
+# validations of one credential across processes. Keys are the same SHA-256
+# digests as above.
+_SHARED_VALIDATION_COLLECTION = "credential-validation"
+_SHARED_VALIDATION_LEASE_COLLECTION = "credential-validation-lease"
+_SHARED_VALIDATION_LEASE_SECONDS = 15.0
+_SHARED_VALIDATION_POLL_INTERVAL = 0.1
+_shared_validation_unavailable = False
+
+
+def _shared_validation_backend() -> CacheBackend | None:
+    """Return the cross-process validation store, or None if not configured."""
+    global _shared_validation_unavailable
+    if _shared_validation_unavailable:
+        return None
+    try:
+        backend = get_cache_backend()
+    except (ValueError, OSError, sqlite3.Error):
+        _shared_validation_unavailable = True
+        logger.warning(
+            "Shared cache backend is misconfigured or unavailable; credential "
+            "validation is cached per process only.",
+            exc_info=True,
+        )
+        return None
+    return backend if backend.shared else None
+
 
 def _credential_for_cache(config: JiraConfig | ConfluenceConfig) -> str | None:
     """Extract the secret that authenticates ``config``, for cache-key hashing.
@@ -223,7 +257,9 @@ def _validate_with_cache(
         return in_flight.validation_data
 
     try:
-        validation_data = validate_fn()
+        validation_data = _validate_across_workers(
+            cache_key, validate_fn, fn_name, service_name
+        )
     except BaseException as error:
         with _validation_cache_lock:
             in_flight.error = error
@@ -239,6 +275,66 @@ def _validate_with_cache(
     return validation_data
 
 
+def _validate_across_workers(
+    cache_key: tuple[str, str],
+    validate_fn: Callable[[], Any],
+    fn_name: str,
+    service_name: str,
+) -> Any:
+    """Validate once across processes when a shared cache backend is set.
+
+    Another worker's result is reused if present. Otherwise the caller takes a
+    short lease; callers that lose the race poll for the winner's result and
+    validate themselves only if it does not appear before the lease expires.
+    If the store fails to take the lease, the caller validates right away.
+    Failed validations are never shared.
+
+    Blocks while polling, so it must run in a worker thread (``_get_fetcher``
+    runs ``_create_and_validate`` through ``run_fetcher_call``).
+    """
+    backend = _shared_validation_backend()
+    if backend is None or _CACHE_TTL <= 0:
+        return validate_fn()
+
+    shared_key = ":".join(cache_key)
+    deadline = time.monotonic() + _SHARED_VALIDATION_LEASE_SECONDS
+    owns_lease: bool | None = False
+    while True:
+        shared = backend.get_many(_SHARED_VALIDATION_COLLECTION, [shared_key])[0]
+        if isinstance(shared, list) and len(shared) == 1:
+            logger.debug(
+                f"{fn_name}: Reusing {service_name} credential validation "
+                "from shared cache (skipped network call)."
+            )
+            return shared[0]
+        owns_lease = backend.add(
+            _SHARED_VALIDATION_LEASE_COLLECTION,
+            shared_key,
+            os.getpid(),
+            _SHARED_VALIDATION_LEASE_SECONDS,
+        )
+        if owns_lease is None:
+            logger.debug(
+                f"{fn_name}: Shared {service_name} validation lease unavailable; "
+                "validating without it."
+            )
+            break
+        if owns_lease or time.monotonic() >= deadline:
+            break
+        time.sleep(_SHARED_VALIDATION_POLL_INTERVAL)
+
+    try:
+        validation_data = validate_fn()
+    finally:
+        if owns_lease:
+            backend.delete(_SHARED_VALIDATION_LEASE_COLLECTION, shared_key)
+    # Wrapped in a list so a legitimately empty result is still a hit.
+    backend.put(
+        _SHARED_VALIDATION_COLLECTION, shared_key, [validation_data], _CACHE_TTL
+    )
+    return validation_data
+
+
 def _jira_on_validated(
     fn_name: str,
     request: Request,
@@ -873,7 +969,8 @@ async def _get_fetcher(ctx: Context, spec: _ServiceSpec) -> Any:
                 passthrough_headers=get_header_names(spec.passthrough_env_var),
                 **spec.filter_kwargs,
             )
-            return _create_and_validate(
+            return await run_fetcher_call(
+                _create_and_validate,
                 request,
                 spec,
                 header_config,
@@ -904,7 +1001,8 @@ async def _get_fetcher(ctx: Context, spec: _ServiceSpec) -> Any:
                 auth_type="basic",
                 credentials=credentials,
             )
-            return _create_and_validate(
+            return await run_fetcher_call(
+                _create_and_validate,
                 request,
                 spec,
                 user_config,
@@ -954,7 +1052,8 @@ async def _get_fetcher(ctx: Context, spec: _ServiceSpec) -> Any:
                 credentials=credentials,
                 cloud_id=user_cloud_id,
             )
-            return _create_and_validate(
+            return await run_fetcher_call(
+                _create_and_validate,
                 request,
                 spec,
                 user_config,
@@ -14,12 +14,14 @@ from requests.exceptions import HTTPError
 from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
 from mcp_atlassian.jira.constants import DEFAULT_READ_JIRA_FIELDS
 from mcp_atlassian.jira.forms_common import convert_datetime_to_timestamp
+from mcp_atlassian.jira.search import MAX_BATCH_GET_ISSUES, MAX_MULTI_SEARCH_QUERIES
 from mcp_atlassian.models.jira import JiraAttachment
 from mcp_atlassian.models.jira.common import JiraUser
-from mcp_atlassian.servers.async_utils import run_jira_fetcher_call
+from mcp_atlassian.servers.async_utils import run_jira_fetcher_call, tool_progress
 from mcp_atlassian.servers.dependencies import get_jira_fetcher
 from mcp_atlassian.servers.error_handling import ErrorPreservingFastMCP
 from mcp_atlassian.servers.helpers import resolve_transition
+from mcp_atlassian.servers.response import dump_response
 from mcp_atlassian.utils.decorators import check_write_access
 from mcp_atlassian.utils.env import get_regex_env
 from mcp_atlassian.utils.media import (
@@ -227,6 +229,31 @@ def _parse_request_participants(
     )
 
 
+def _parse_queries(queries: str | list[str]) -> list[str]:
+    """Parse JQL queries from a list or a JSON array string.
+
+    JQL may itself contain commas, so a comma-separated string is not
+    accepted.
+    """
+    if isinstance(queries, str):
+        try:
+            parsed = json.loads(queries)
+        except json.JSONDecodeError as e:
+            msg = f"queries must be a JSON array of JQL strings: {e}"
+            raise ValueError(msg) from e
+    else:
+        parsed = queries
+    if not isinstance(parsed, list) or not all(isinstance(q, str) for q in parsed):
+        raise ValueError("queries must be a JSON array of JQL strings.")
+    parsed = [query.strip() for query in parsed if query.strip()]
+    if not parsed:
+        raise ValueError("queries must contain at least one JQL query.")
+    if len(parsed) > MAX_MULTI_SEARCH_QUERIES:
+        msg = f"At most {MAX_MULTI_SEARCH_QUERIES} queries are allowed per call."
+        raise ValueError(msg)
+    return parsed
+
+
 def _parse_attachments(
     attachments: str | list[dict[str, Any]] | None,
 ) -> list[dict[str, Any]] | None:
@@ -314,7 +341,7 @@ async def get_user_profile(
             f"get_user_profile failed for '{user_identifier}': {error_message}",
         )
         response_data = error_result
-    return json.dumps(response_data, indent=2, ensure_ascii=False)
+    return dump_response(response_data)
 
 
 @jira_mcp.tool(
@@ -392,14 +419,12 @@ async def search_assignable_users(
     """
     jira = await get_jira_fetcher(ctx)
     if bool(project_key) == bool(issue_key):
-        return json.dumps(
+        return dump_response(
             {
                 "success": False,
                 "error": "Exactly one of project_key or issue_key must be provided.",
                 "query": query,
-            },
-            indent=2,
-            ensure_ascii=False,
+            }
         )
     try:
         users = jira.search_assignable_users(
@@ -434,7 +459,7 @@ async def search_assignable_users(
             "error": str(e),
             "query": query,
         }
-    return json.dumps(response_data, indent=2, ensure_ascii=False)
+    return dump_response(response_data)
 
 
 @jira_mcp.tool(
@@ -465,7 +490,7 @@ async def get_issue_watchers(
     """
     jira = await get_jira_fetcher(ctx)
     result = jira.get_issue_watchers(issue_key)
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return dump_response(result)
 
 
 @jira_mcp.tool(
@@ -510,7 +535,7 @@ async def add_watcher(
     """
     jira = await get_jira_fetcher(ctx)
     result = jira.add_watcher(issue_key, user_identifier)
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return dump_response(result)
 
 
 @jira_mcp.tool(
@@ -561,7 +586,7 @@ async def remove_watcher(
     """
     jira = await get_jira_fetcher(ctx)
     result = jira.remove_watcher(issue_key, username=username, account_id=account_id)
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return dump_response(result)
 
 
 @jira_mcp.tool(
@@ -741,7 +766,7 @@ async def get_issue(
         except Exception:  # noqa: BLE001
             result["worklogs"] = []
 
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return dump_response(result)
 
 
 @jira_mcp.tool(
@@ -849,6 +874,7 @@ async def search(
     if use_display_names:
         expand = _merge_expand(expand, ["names"])
 
+    progress = tool_progress(ctx)
     search_result = await run_jira_fetcher_call(
         jira.search_issues,
         jql=jql,
@@ -858,12 +884,325 @@ async def search(
         expand=expand,
         projects_filter=projects_filter,
         page_token=page_token,
+        progress=progress,
     )
     if use_display_names:
         result = search_result.to_display_name_dict()
     else:
         result = search_result.to_simplified_dict()
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    if progress.deadline_reached:
+        result["partial"] = True
+        result["hint"] = (
+            "Stopped early at the tool deadline. Call again with "
+            "page_token=next_page_token to fetch the remaining issues."
+        )
+    return dump_response(result)
+
+
+@jira_mcp.tool(
+    tags={"jira", "read", "toolset:jira_issues"},
+    annotations={"title": "Count Issues", "readOnlyHint": True},
+)
+async def count_issues(
+    ctx: Context,
+    jql: Annotated[
+        str,
+        Field(
+            description=(
+                "JQL query string to count matches for, e.g. "
+                '"project = PROJ AND status != Done". ORDER BY is ignored.'
+            )
+        ),
+    ],
+    projects_filter: Annotated[
+        str | None,
+        Field(
+            description=(
+                "(Optional) Comma-separated list of project keys to filter results by. "
+                "Overrides the environment variable JIRA_PROJECTS_FILTER if provided."
+            ),
+            default=None,
+        ),
+    ] = None,
+) -> str:
+    """Count the Jira issues matching a JQL query without fetching them.
+
+    Much cheaper than jira_search when only the number is needed. On Cloud
+    the count is approximate and may trail very recent changes.
+
+    Args:
+        ctx: The FastMCP context.
+        jql: JQL query string.
+        projects_filter: Comma-separated list of project keys to filter by.
+
+    Returns:
+        JSON string with the query, the count and whether it is approximate.
+    """
+    jira = await get_jira_fetcher(ctx)
+    count = await run_jira_fetcher_call(
+        jira.count_issues, jql=jql, projects_filter=projects_filter
+    )
+    result = {
+        "jql": jql,
+        "count": count,
+        "approximate": bool(jira.config.is_cloud),
+    }
+    return dump_response(result)
+
+
+@jira_mcp.tool(
+    tags={"jira", "read", "toolset:jira_issues"},
+    annotations={"title": "Multi Search", "readOnlyHint": True},
+)
+async def multi_search(
+    ctx: Context,
+    queries: Annotated[
+        str,
+        Field(
+            description=(
+                "JSON array of JQL query strings to run together, e.g. "
+                '["assignee = currentUser() AND type = Bug AND status != Done", '
+                '"sprint in openSprints() AND status = Blocked", '
+                '"project = PROJ AND updated >= -1d"]. '
+                f"At most {MAX_MULTI_SEARCH_QUERIES} queries."
+            )
+        ),
+    ],
+    fields: Annotated[
+        str,
+        Field(
+            description=(
+                "(Optional) Comma-separated fields to return for every issue. "
+                "Use '*all' for all fields, or specify individual fields like 'summary,status,assignee,priority'"
+            ),
+            default=",".join(DEFAULT_READ_JIRA_FIELDS),
+        ),
+    ] = ",".join(DEFAULT_READ_JIRA_FIELDS),
+    limit: Annotated[
+        int,
+        Field(
+            description="Maximum number of results per query (1-50)",
+            default=10,
+            ge=1,
+            le=50,
+        ),
+    ] = 10,
+    projects_filter: Annotated[
+        str | None,
+        Field(
+            description=(
+                "(Optional) Comma-separated list of project keys to filter results by. "
+                "Overrides the environment variable JIRA_PROJECTS_FILTER if provided."
+            ),
+            default=None,
+        ),
+    ] = None,
+) -> str:
+    """Run several JQL searches in one call, returning each issue once.
+
+    Prefer this over back-to-back jira_search calls for related questions
+    (e.g. my open bugs, blocked sprint work, recently updated). Queries run
+    concurrently; an issue matched by several queries is fetched and
+    returned once.
+
+    Args:
+        ctx: The FastMCP context.
+        queries: JSON array of JQL query strings.
+        fields: Comma-separated fields to return.
+        limit: Maximum number of results per query.
+        projects_filter: Comma-separated list of project keys to filter by.
+
+    Returns:
+        JSON string with per-query key lists, one shared issue table, and
+        errors for issues whose fields could not be fetched.
+    """
+    jira = await get_jira_fetcher(ctx)
+    fields_list: str | list[str] | None = fields
+    if fields and fields != "*all":
+        fields_list = [f.strip() for f in fields.split(",")]
+    result = await run_jira_fetcher_call(
+        jira.multi_search,
+        queries=_parse_queries(queries),
+        fields=fields_list,
+        limit=limit,
+        projects_filter=projects_filter,
+    )
+    return dump_response(result)
+
+
+@jira_mcp.tool(
+    tags={"jira", "read", "toolset:jira_issues"},
+    annotations={"title": "Batch Get Issues", "readOnlyHint": True},
+)
+async def batch_get_issues(
+    ctx: Context,
+    issue_keys: Annotated[
+        str,
+        Field(
+            description=(
+                "Comma-separated list of Jira issue keys (e.g. 'PROJ-123,PROJ-124'). "
+                f"At most {MAX_BATCH_GET_ISSUES} keys."
+            )
+        ),
+    ],
+    fields: Annotated[
+        str,
+        Field(
+            description=(
+                "(Optional) Comma-separated fields to return for every issue. "
+                "Use '*all' for all fields, or specify individual fields like 'summary,status,assignee,priority'"
+            ),
+            default=",".join(DEFAULT_READ_JIRA_FIELDS),
+        ),
+    ] = ",".join(DEFAULT_READ_JIRA_FIELDS),
+    comment_limit: Annotated[
+        int,
+        Field(
+            description="Maximum number of newest comments to include per issue (0 for no comments)",
+            default=0,
+            ge=0,
+            le=100,
+        ),
+    ] = 0,
+    projects_filter: Annotated[
+        str | None,
+        Field(
+            description=(
+                "(Optional) Comma-separated list of project keys to filter results by. "
+                "Overrides the environment variable JIRA_PROJECTS_FILTER if provided."
+            ),
+            default=None,
+        ),
+    ] = None,
+) -> str:
+    """Get many Jira issues by key in one call.
+
+    Prefer this over repeated jira_get_issue calls when the keys are already
+    known. Keys are fetched in concurrent chunks; keys that cannot be
+    returned are listed with their error instead of failing the call.
+
+    Args:
+        ctx: The FastMCP context.
+        issue_keys: Comma-separated list of issue keys.
+        fields: Comma-separated fields to return.
+        comment_limit: Newest comments to include per issue.
+        projects_filter: Comma-separated list of project keys to filter by.
+
+    Returns:
+        JSON string with the issues in request order, moved issues and
+        per-key errors.
+    """
+    jira = await get_jira_fetcher(ctx)
+    keys_list = [k.strip() for k in issue_keys.split(",") if k.strip()]
+    if not keys_list:
+        raise ValueError("issue_keys must contain at least one issue key.")
+    fields_list: str | list[str] | None = fields
+    if fields and fields != "*all":
+        fields_list = [f.strip() for f in fields.split(",")]
+    result = await run_jira_fetcher_call(
+        jira.batch_get_issues,
+        issue_keys=keys_list,
+        fields=fields_list,
+        comment_limit=comment_limit,
+        projects_filter=projects_filter,
+    )
+    return dump_response(result)
+
+
+@jira_mcp.tool(
+    tags={"jira", "read", "local_index", "toolset:jira_issues"},
+    annotations={"title": "Local Search", "readOnlyHint": True},
+)
+async def local_search(
+    ctx: Context,
+    query: Annotated[
+        str,
+        Field(
+            description=(
+                "Words to find in issue summaries, descriptions and comments "
+                "(all must match; end a word with * for a prefix match). "
+                "Leave empty to list issues by the filters alone."
+            ),
+            default="",
+        ),
+    ] = "",
+    projects: Annotated[
+        str | None,
+        Field(
+            description=(
+                "(Optional) Comma-separated mirrored project keys to search. "
+                "Defaults to every project in JIRA_LOCAL_MIRROR_PROJECTS."
+            ),
+            default=None,
+        ),
+    ] = None,
+    status: Annotated[
+        str | None,
+        Field(
+            description="(Optional) Exact status name, e.g. 'In Progress'.",
+            default=None,
+        ),
+    ] = None,
+    assignee: Annotated[
+        str | None,
+        Field(description="(Optional) Exact assignee display name.", default=None),
+    ] = None,
+    issue_type: Annotated[
+        str | None,
+        Field(
+            description="(Optional) Exact issue type name, e.g. 'Bug'.", default=None
+        ),
+    ] = None,
+    limit: Annotated[
+        int,
+        Field(
+            description="Maximum number of results (1-100)", default=20, ge=1, le=100
+        ),
+    ] = 20,
+    refresh: Annotated[
+        bool,
+        Field(
+            description=(
+                "Sync projects older than JIRA_LOCAL_MIRROR_SYNC_INTERVAL "
+                "before searching. Set false to answer from the mirror only."
+            ),
+            default=True,
+        ),
+    ] = True,
+) -> str:
+    """Full-text search over the local mirror of selected Jira projects.
+
+    Answers from a local SQLite index instead of calling Jira, so it is much
+    faster than jira_search for text lookups. Only projects listed in
+    JIRA_LOCAL_MIRROR_PROJECTS are mirrored. Each result reports when its
+    project was last synced; use jira_search when up-to-the-second data
+    matters.
+
+    Args:
+        ctx: The FastMCP context.
+        query: Words to search for.
+        projects: Comma-separated mirrored project keys.
+        status: Status name filter.
+        assignee: Assignee display name filter.
+        issue_type: Issue type name filter.
+        limit: Maximum number of results.
+        refresh: Whether to sync stale projects first.
+
+    Returns:
+        JSON string with matching issues, each with snippet and freshness.
+    """
+    jira = await get_jira_fetcher(ctx)
+    result = await run_jira_fetcher_call(
+        jira.local_search,
+        query=query,
+        projects=projects.split(",") if projects else None,
+        status=status,
+        assignee=assignee,
+        issue_type=issue_type,
+        limit=limit,
+        refresh=refresh,
+    )
+    return dump_response(result)
 
 
 @jira_mcp.tool(
@@ -900,7 +1239,7 @@ async def search_fields(
     """
     jira = await get_jira_fetcher(ctx)
     result = jira.search_fields(keyword, limit=limit, refresh=refresh)
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return dump_response(result)
 
 
 def _matches_contains(option: dict[str, Any], needle: str) -> bool:
@@ -1076,12 +1415,8 @@ async def get_field_options(
     result = [opt.to_simplified_dict() for opt in options]
     result = _apply_option_filters(result, contains, return_limit)
     if values_only:
-        return json.dumps(
-            _to_values_only_payload(result),
-            indent=2,
-            ensure_ascii=False,
-        )
-    return json.dumps(result, indent=2, ensure_ascii=False)
+        return dump_response(_to_values_only_payload(result))
+    return dump_response(result)
 
 
 @jira_mcp.tool(
@@ -1122,7 +1457,7 @@ async def get_project_issues(
         project_key=project_key, start=start_at, limit=limit
     )
     result = search_result.to_simplified_dict()
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return dump_response(result)
 
 
 @jira_mcp.tool(
@@ -1151,7 +1486,7 @@ async def get_transitions(
     jira = await get_jira_fetcher(ctx)
     # Underlying method returns list[dict] in the desired format
     transitions = jira.get_available_transitions(issue_key)
-    return json.dumps(transitions, indent=2, ensure_ascii=False)
+    return dump_response(transitions)
 
 
 @jira_mcp.tool(
@@ -1180,7 +1515,7 @@ async def get_worklog(
     jira = await get_jira_fetcher(ctx)
     worklogs = jira.get_worklogs(issue_key)
     result = {"worklogs": worklogs}
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return dump_response(result)
 
 
 @jira_mcp.tool(
@@ -1225,7 +1560,7 @@ async def download_attachments(
         contents.append(
             TextContent(
                 type="text",
-                text=json.dumps(result, indent=2, ensure_ascii=False),
+                text=dump_response(result),
             )
         )
         return contents
@@ -1277,7 +1612,7 @@ async def download_attachments(
             contents.append(
                 TextContent(
                     type="text",
-                    text=json.dumps(
+                    text=dump_response(
                         {
                             "success": True,
                             "issue_key": issue_key,
@@ -1285,9 +1620,7 @@ async def download_attachments(
                             "mime_type": mime_type,
                             "encoding": "base64",
                             "content": encoded,
-                        },
-                        indent=2,
-                        ensure_ascii=False,
+                        }
                     ),
                 )
             )
@@ -1310,7 +1643,7 @@ async def download_attachments(
         0,
         TextContent(
             type="text",
-            text=json.dumps(summary, indent=2, ensure_ascii=False),
+            text=dump_response(summary),
         ),
     )
 
@@ -1368,7 +1701,7 @@ async def get_issue_images(
         contents.append(
             TextContent(
                 type="text",
-                text=json.dumps(
+                text=dump_response(
                     {
                         "success": True,
                         "issue_key": issue_key,
@@ -1376,9 +1709,7 @@ async def get_issue_images(
                         "downloaded": 0,
                         "failed": [],
                         "message": "No image attachments found",
-                    },
-                    indent=2,
-                    ensure_ascii=False,
+                    }
                 ),
             )
         )
@@ -1443,7 +1774,7 @@ async def get_issue_images(
         0,
         TextContent(
             type="text",
-            text=json.dumps(summary, indent=2, ensure_ascii=False),
+            text=dump_response(summary),
         ),
     )
     return contents
@@ -1503,7 +1834,7 @@ async def get_agile_boards(
         limit=limit,
     )
     result = [board.to_simplified_dict() for board in boards]
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return dump_response(result)
 
 
 @jira_mcp.tool(
@@ -1583,7 +1914,7 @@ async def get_board_issues(
         expand=expand,
     )
     result = search_result.to_simplified_dict()
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return dump_response(result)
 
 
 @jira_mcp.tool(
@@ -1623,7 +1954,7 @@ async def get_sprints_from_board(
         board_id=board_id, state=state, start=start_at, limit=limit
     )
     result = [sprint.to_simplified_dict() for sprint in sprints]
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return dump_response(result)
 
 
 @jira_mcp.tool(
@@ -1674,7 +2005,7 @@ async def get_sprint_issues(
         sprint_id=sprint_id, fields=fields_list, start=start_at, limit=limit
     )
     result = search_result.to_simplified_dict()
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return dump_response(result)
 
 
 @jira_mcp.tool(
@@ -1709,7 +2040,7 @@ async def get_link_types(
             for lt in formatted_link_types
             if name_lower in lt.get("name", "").lower()
         ]
-    return json.dumps(formatted_link_types, indent=2, ensure_ascii=False)
+    return dump_response(formatted_link_types)
 
 
 @jira_mcp.tool(
@@ -1819,11 +2150,7 @@ async def create_issue(
         **extra_fields,
     )
     result = issue.to_simplified_dict()
-    return json.dumps(
-        {"message": "Issue created successfully", "issue": result},
-        indent=2,
-        ensure_ascii=False,
-    )
+    return dump_response({"message": "Issue created successfully", "issue": result})
 
 
 @jira_mcp.tool(
@@ -1895,7 +2222,7 @@ async def batch_create_issues(
         "message": message,
         "issues": [issue.to_simplified_dict() for issue in created_issues],
     }
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return dump_response(result)
 
 
 @jira_mcp.tool(
@@ -1929,6 +2256,16 @@ async def batch_get_changelogs(
             default=-1,
         ),
     ] = -1,
+    page_token: Annotated[
+        str | None,
+        Field(
+            description=(
+                "(Optional) next_page_token from a partial result, to continue "
+                "a fetch that stopped at the tool deadline."
+            ),
+            default=None,
+        ),
+    ] = None,
 ) -> str:
     """Get changelogs for multiple Jira issues (Cloud only).
 
@@ -1937,9 +2274,12 @@ async def batch_get_changelogs(
         issue_ids_or_keys: List of issue IDs or keys.
         fields: List of fields to filter changelogs by. None for all fields.
         limit: Maximum changelogs per issue (-1 for all).
+        page_token: Token to continue a fetch cut short by the deadline.
 
     Returns:
-        JSON string representing a list of issues with their changelogs.
+        JSON string representing a list of issues with their changelogs. If
+        the tool deadline stopped the fetch, an object with the issues
+        fetched so far under ``issues`` and a ``next_page_token``.
 
     Raises:
         NotImplementedError: If run on Jira Server/Data Center.
@@ -1959,8 +2299,13 @@ async def batch_get_changelogs(
         fields_list = [f.strip() for f in fields.split(",") if f.strip()]
 
     # Call the underlying method
-    issues_with_changelogs = jira.batch_get_changelogs(
-        issue_ids_or_keys=keys_list, fields=fields_list
+    progress = tool_progress(ctx)
+    issues_with_changelogs = await run_jira_fetcher_call(
+        jira.batch_get_changelogs,
+        issue_ids_or_keys=keys_list,
+        fields=fields_list,
+        page_token=page_token,
+        progress=progress,
     )
 
     # Format the response
@@ -1976,7 +2321,19 @@ async def batch_get_changelogs(
                 ],
             }
         )
-    return json.dumps(results, indent=2, ensure_ascii=False)
+    if progress.deadline_reached:
+        return dump_response(
+            {
+                "issues": results,
+                "partial": True,
+                "next_page_token": progress.cursor,
+                "hint": (
+                    "Stopped early at the tool deadline. Call again with "
+                    "page_token=next_page_token to fetch the remaining changelogs."
+                ),
+            }
+        )
+    return dump_response(results)
 
 
 @jira_mcp.tool(
@@ -2266,15 +2623,13 @@ async def update_issue(
     else:
         message = "No issue updates were requested"
 
-    return json.dumps(
+    return dump_response(
         {
             "message": message,
             "issue": result,
             "operations_performed": operations_performed,
             "operations_failed": operations_failed,
-        },
-        indent=2,
-        ensure_ascii=False,
+        }
     )
 
 
@@ -2340,10 +2695,8 @@ async def assign_issue(
 
         issue = jira.assign_issue(issue_key=issue_key, assignee=parsed_assignee)
         result = issue.to_simplified_dict()
-        return json.dumps(
-            {"message": f"Issue {issue_key} assigned successfully", "issue": result},
-            indent=2,
-            ensure_ascii=False,
+        return dump_response(
+            {"message": f"Issue {issue_key} assigned successfully", "issue": result}
         )
     except Exception as e:
         logger.error(f"Error assigning issue {issue_key}: {str(e)}", exc_info=True)
@@ -2381,7 +2734,7 @@ async def delete_issue(
     deleted = jira.delete_issue(issue_key)
     result = {"message": f"Issue {issue_key} has been deleted successfully."}
     # The underlying method raises on failure, so if we reach here, it's success.
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return dump_response(result)
 
 
 @jira_mcp.tool(
@@ -2435,16 +2788,14 @@ async def move_issue(
 
     try:
         result = await asyncio.to_thread(jira.move_issue, issue_key, target_project_key)
-        return json.dumps(
+        return dump_response(
             {
                 "message": (
                     f"Issue moved successfully from {issue_key} "
                     f"to project {target_project_key}"
                 ),
                 "issue": result.to_simplified_dict(),
-            },
-            indent=2,
-            ensure_ascii=False,
+            }
         )
     except (NotImplementedError, ValueError):
         raise
@@ -2543,7 +2894,7 @@ async def add_comment(
     if public is False and not jira._is_internal_only_project(issue_key):
         public_value = None
     result = jira.add_comment(issue_key, body, visibility_dict, public=public_value)
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return dump_response(result)
 
 
 @jira_mcp.tool(
@@ -2590,7 +2941,7 @@ async def edit_comment(
     jira = await get_jira_fetcher(ctx)
     visibility_dict = _parse_visibility(visibility)
     result = jira.edit_comment(issue_key, comment_id, body, visibility_dict)
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return dump_response(result)
 
 
 @jira_mcp.tool(
@@ -2666,7 +3017,7 @@ async def add_worklog(
         remaining_estimate=remaining_estimate,
     )
     result = {"message": "Worklog added successfully", "worklog": worklog_result}
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return dump_response(result)
 
 
 @jira_mcp.tool(
@@ -2710,7 +3061,7 @@ async def link_to_epic(
         "message": f"Issue {issue_key} has been linked to epic {epic_key}.",
         "issue": issue.to_simplified_dict(),
     }
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return dump_response(result)
 
 
 @jira_mcp.tool(
@@ -2806,7 +3157,7 @@ async def create_issue_link(
         link_data["comment"] = comment_obj
 
     result = jira.create_issue_link(link_data)
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return dump_response(result)
 
 
 @jira_mcp.tool(
@@ -2894,7 +3245,7 @@ async def create_remote_issue_link(
         link_data["relationship"] = relationship
 
     result = jira.create_remote_issue_link(issue_key, link_data)
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return dump_response(result)
 
 
 @jira_mcp.tool(
@@ -2923,7 +3274,7 @@ async def remove_issue_link(
         raise ValueError("link_id is required")
 
     result = jira.remove_issue_link(link_id)  # Returns dict on success
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return dump_response(result)
 
 
 @jira_mcp.tool(
@@ -3014,7 +3365,7 @@ async def transition_issue(
         "message": f"Issue {issue_key} transitioned successfully",
         "issue": issue.to_simplified_dict() if issue else None,
     }
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return dump_response(result)
 
 
 @jira_mcp.tool(
@@ -3060,7 +3411,7 @@ async def create_sprint(
         end_date=end_date,
         goal=goal,
     )
-    return json.dumps(sprint.to_simplified_dict(), indent=2, ensure_ascii=False)
+    return dump_response(sprint.to_simplified_dict())
 
 
 @jira_mcp.tool(
@@ -3119,9 +3470,9 @@ async def update_sprint(
         error_payload = {
             "error": f"Failed to update sprint {sprint_id}. Check logs for details."
         }
-        return json.dumps(error_payload, indent=2, ensure_ascii=False)
+        return dump_response(error_payload)
     else:
-        return json.dumps(sprint.to_simplified_dict(), indent=2, ensure_ascii=False)
+        return dump_response(sprint.to_simplified_dict())
 
 
 @jira_mcp.tool(
@@ -3158,7 +3509,7 @@ async def add_issues_to_sprint(
         "sprint_id": sprint_id,
         "issue_keys": keys_list,
     }
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return dump_response(result)
 
 
 @jira_mcp.tool(
@@ -3192,7 +3543,7 @@ async def move_issues_to_backlog(
         "message": f"Successfully moved {len(keys_list)} issue(s) to backlog",
         "issue_keys": keys_list,
     }
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return dump_response(result)
 
 
 @jira_mcp.tool(
@@ -3236,7 +3587,7 @@ async def get_project_issue_types(
         if untranslated_name:
             compact_type["untranslated_name"] = untranslated_name
         issue_types.append(compact_type)
-    return json.dumps(issue_types, indent=2, ensure_ascii=False)
+    return dump_response(issue_types)
 
 
 @jira_mcp.tool(
@@ -3289,7 +3640,7 @@ async def get_create_fields(
                 "schema": field.get("schema") or {},
             }
         )
-    return json.dumps(fields, indent=2, ensure_ascii=False)
+    return dump_response(fields)
 
 
 @jira_mcp.tool(
@@ -3309,7 +3660,7 @@ async def get_project_versions(
     """Get all fix versions for a specific Jira project."""
     jira = await get_jira_fetcher(ctx)
     versions = jira.get_project_versions(project_key)
-    return json.dumps(versions, indent=2, ensure_ascii=False)
+    return dump_response(versions)
 
 
 @jira_mcp.tool(
@@ -3329,7 +3680,7 @@ async def get_project_components(
     """Get all components for a specific Jira project."""
     jira = await get_jira_fetcher(ctx)
     components = jira.get_project_components(project_key)
-    return json.dumps(components, indent=2, ensure_ascii=False)
+    return dump_response(components)
 
 
 @jira_mcp.tool(
@@ -3378,7 +3729,7 @@ async def get_all_projects(
             "error": error_message,
         }
         logger.log(log_level, f"get_all_projects failed: {error_message}")
-        return json.dumps(error_result, indent=2, ensure_ascii=False)
+        return dump_response(error_result)
 
     # Ensure all project keys are uppercase
     for project in projects:
@@ -3397,7 +3748,7 @@ async def get_all_projects(
             if project.get("key") in allowed_project_keys
         ]
 
-    return json.dumps(projects, indent=2, ensure_ascii=False)
+    return dump_response(projects)
 
 
 @jira_mcp.tool(
@@ -3475,14 +3826,14 @@ async def search_projects(
             "error": error_message,
         }
         logger.log(log_level, f"search_projects failed: {error_message}")
-        return json.dumps(error_result, indent=2, ensure_ascii=False)
+        return dump_response(error_result)
 
     # Ensure all project keys are uppercase
     for project in projects:
         if "key" in project:
             project["key"] = project["key"].upper()
 
-    return json.dumps(projects, indent=2, ensure_ascii=False)
+    return dump_response(projects)
 
 
 @jira_mcp.tool(
@@ -3526,12 +3877,10 @@ async def get_project_fields(
         logger.log(
             log_level, f"get_project_fields failed for '{project_key}': {error_message}"
         )
-        return json.dumps(
-            {"success": False, "error": error_message, "project_key": project_key},
-            indent=2,
-            ensure_ascii=False,
+        return dump_response(
+            {"success": False, "error": error_message, "project_key": project_key}
         )
-    return json.dumps(fields, indent=2, ensure_ascii=False)
+    return dump_response(fields)
 
 
 @jira_mcp.tool(
@@ -3572,7 +3921,7 @@ async def get_service_desk_for_project(
         "project_key": project_key.upper(),
         "service_desk": service_desk.to_simplified_dict() if service_desk else None,
     }
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return dump_response(result)
 
 
 @jira_mcp.tool(
@@ -3618,7 +3967,7 @@ async def get_service_desk_queues(
         limit=limit,
         include_count=True,
     )
-    return json.dumps(result.to_simplified_dict(), indent=2, ensure_ascii=False)
+    return dump_response(result.to_simplified_dict())
 
 
 @jira_mcp.tool(
@@ -3669,7 +4018,7 @@ async def get_queue_issues(
         start_at=start_at,
         limit=limit,
     )
-    return json.dumps(result.to_simplified_dict(), indent=2, ensure_ascii=False)
+    return dump_response(result.to_simplified_dict())
 
 
 @jira_mcp.tool(
@@ -3708,7 +4057,7 @@ async def get_request_types(
         start_at=start_at,
         limit=limit,
     )
-    return json.dumps(result.to_simplified_dict(), indent=2, ensure_ascii=False)
+    return dump_response(result.to_simplified_dict())
 
 
 @jira_mcp.tool(
@@ -3741,7 +4090,7 @@ async def get_request_type_fields(
         service_desk_id=service_desk_id,
         request_type_id=request_type_id,
     )
-    return json.dumps(result.to_simplified_dict(), indent=2, ensure_ascii=False)
+    return dump_response(result.to_simplified_dict())
 
 
 @jira_mcp.tool(
@@ -3840,7 +4189,7 @@ async def create_customer_request(
         attachments=parsed_attachments,
         strict_on_behalf=strict_on_behalf,
     )
-    return json.dumps(result.to_simplified_dict(), indent=2, ensure_ascii=False)
+    return dump_response(result.to_simplified_dict())
 
 
 @jira_mcp.tool(
@@ -3890,14 +4239,12 @@ async def create_version(
             release_date=release_date,
             description=description,
         )
-        return json.dumps(version, indent=2, ensure_ascii=False)
+        return dump_response(version)
     except Exception as e:
         logger.error(
             f"Error creating version in project {project_key}: {str(e)}", exc_info=True
         )
-        return json.dumps(
-            {"success": False, "error": str(e)}, indent=2, ensure_ascii=False
-        )
+        return dump_response({"success": False, "error": str(e)})
 
 
 @jira_mcp.tool(
@@ -3954,7 +4301,7 @@ async def batch_create_versions(
 
     results = []
     if not version_list:
-        return json.dumps(results, indent=2, ensure_ascii=False)
+        return dump_response(results)
 
     for idx, v in enumerate(version_list):
         # Defensive: ensure v is a dict and has a name
@@ -3981,7 +4328,7 @@ async def batch_create_versions(
                 exc_info=True,
             )
             results.append({"success": False, "error": str(e), "input": v})
-    return json.dumps(results, indent=2, ensure_ascii=False)
+    return dump_response(results)
 
 
 @jira_mcp.tool(
@@ -4049,12 +4396,10 @@ async def update_version(
             archived=archived,
             released=released,
         )
-        return json.dumps(version, indent=2, ensure_ascii=False)
+        return dump_response(version)
     except Exception as e:
         logger.error(f"Error updating version {version_id}: {str(e)}", exc_info=True)
-        return json.dumps(
-            {"success": False, "error": str(e)}, indent=2, ensure_ascii=False
-        )
+        return dump_response({"success": False, "error": str(e)})
 
 
 @jira_mcp.tool(
@@ -4109,7 +4454,7 @@ async def get_issue_proforma_forms(
             f"get_issue_proforma_forms failed for '{issue_key}': {error_message}",
         )
         response_data = error_result
-    return json.dumps(response_data, indent=2, ensure_ascii=False)
+    return dump_response(response_data)
 
 
 @jira_mcp.tool(
@@ -4179,7 +4524,7 @@ async def get_proforma_form_details(
             f"get_proforma_form_details failed for '{issue_key}/{form_id}': {error_message}",
         )
         response_data = error_result
-    return json.dumps(response_data, indent=2, ensure_ascii=False)
+    return dump_response(response_data)
 
 
 @jira_mcp.tool(
@@ -4309,7 +4654,7 @@ async def update_proforma_form_answers(
             f"update_proforma_form_answers failed for '{issue_key}/{form_id}': {error_message}",
         )
         response_data = error_result
-    return json.dumps(response_data, indent=2, ensure_ascii=False)
+    return dump_response(response_data)
 
 
 @jira_mcp.tool(
@@ -4362,11 +4707,11 @@ async def get_issue_dates(
             include_status_changes=include_status_changes,
             include_status_summary=include_status_summary,
         )
-        return json.dumps(result.to_simplified_dict(), indent=2, ensure_ascii=False)
+        return dump_response(result.to_simplified_dict())
     except Exception as e:
         logger.error(f"Error getting issue dates for {issue_key}: {str(e)}")
         error_result = {"success": False, "error": str(e), "issue_key": issue_key}
-        return json.dumps(error_result, indent=2, ensure_ascii=False)
+        return dump_response(error_result)
 
 
 @jira_mcp.tool(
@@ -4443,11 +4788,11 @@ async def get_issue_sla(
             working_hours_only=working_hours_only,
             include_raw_dates=include_raw_dates,
         )
-        return json.dumps(result.to_simplified_dict(), indent=2, ensure_ascii=False)
+        return dump_response(result.to_simplified_dict())
     except Exception as e:
         logger.error(f"Error calculating SLA for {issue_key}: {str(e)}")
         error_result = {"success": False, "error": str(e), "issue_key": issue_key}
-        return json.dumps(error_result, indent=2, ensure_ascii=False)
+        return dump_response(error_result)
 
 
 @jira_mcp.tool(
@@ -4505,11 +4850,11 @@ async def get_issue_development_info(
             application_type=application_type,
             data_type=data_type,
         )
-        return json.dumps(result, indent=2, ensure_ascii=False)
+        return dump_response(result)
     except Exception as e:
         logger.error(f"Error getting development info for {issue_key}: {str(e)}")
         error_result = {"success": False, "error": str(e), "issue_key": issue_key}
-        return json.dumps(error_result, indent=2, ensure_ascii=False)
+        return dump_response(error_result)
 
 
 @jira_mcp.tool(
@@ -4569,11 +4914,11 @@ async def get_issues_development_info(
             application_type=application_type,
             data_type=data_type,
         )
-        return json.dumps(results, indent=2, ensure_ascii=False)
+        return dump_response(results)
     except Exception as e:
         logger.error(f"Error getting development info for issues: {str(e)}")
         error_result = {"success": False, "error": str(e)}
-        return json.dumps(error_result, indent=2, ensure_ascii=False)
+        return dump_response(error_result)
 
 
 @jira_mcp.tool(
@@ -4622,7 +4967,7 @@ async def get_project_epic_hierarchy(
         project_key=project_key,
         max_epics=max_epics,
     )
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    return dump_response(result)
 
 
 @jira_mcp.tool(
@@ -4649,6 +4994,16 @@ async def get_cross_project_dependencies(
             le=500,
         ),
     ] = 200,
+    cursor: Annotated[
+        str | None,
+        Field(
+            description=(
+                "(Optional) next_cursor from a partial result, to continue "
+                "a scan that stopped at the tool deadline."
+            ),
+            default=None,
+        ),
+    ] = None,
 ) -> str:
     """Find all cross-project issue links for a project.
 
@@ -4661,13 +5016,24 @@ async def get_cross_project_dependencies(
         ctx: The FastMCP context.
         project_key: The project key.
         max_issues: Max issues to scan.
+        cursor: Resume point from a partial result.
 
     Returns:
         JSON string with cross-project dependency map.
     """
     jira = await get_jira_fetcher(ctx)
-    result = jira.get_cross_project_dependencies(
+    progress = tool_progress(ctx)
+    result = await run_jira_fetcher_call(
+        jira.get_cross_project_dependencies,
         project_key=project_key,
         max_issues=max_issues,
+        cursor=cursor,
+        progress=progress,
     )
-    return json.dumps(result, indent=2, ensure_ascii=False)
+    if progress.deadline_reached:
+        result["partial"] = True
+        result["hint"] = (
+            "Stopped early at the tool deadline. Call again with "
+            "cursor=next_cursor to scan the remaining issues."
+        )
+    return dump_response(result)
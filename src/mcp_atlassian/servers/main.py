@@ -22,7 +22,9 @@ from starlette.responses import JSONResponse
 from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from mcp_atlassian.confluence.config import ConfluenceConfig
+from mcp_atlassian.confluence.local_index import get_local_index_spaces
 from mcp_atlassian.jira.config import JiraConfig
+from mcp_atlassian.jira.local_mirror import get_local_mirror_projects
 from mcp_atlassian.utils.env import is_env_truthy
 from mcp_atlassian.utils.environment import get_available_services
 from mcp_atlassian.utils.io import is_read_only_mode
@@ -41,6 +43,7 @@ from mcp_atlassian.utils.toolsets import (
 )
 from mcp_atlassian.utils.urls import is_atlassian_cloud_url, validate_url_for_ssrf
 
+from .cache_warmer import get_cache_warmup_status, start_cache_warmup
 from .client_storage import build_oauth_client_storage_from_env
 from .confluence import confluence_mcp
 from .context import MainAppContext
@@ -132,7 +135,12 @@ def _sanitize_schema_for_compatibility(tool: MCPTool) -> MCPTool:
 
 
 async def health_check(request: Request) -> JSONResponse:
-    return JSONResponse({"status": "ok"})
+    payload: dict[str, Any] = {"status": "ok"}
+    # Warm-up is informational only; readiness never waits for it.
+    warmup_status = get_cache_warmup_status()
+    if warmup_status is not None:
+        payload["cache_warmup"] = warmup_status
+    return JSONResponse(payload)
 
 
 @asynccontextmanager
@@ -186,6 +194,7 @@ async def main_lifespan(app: FastMCP[MainAppContext]) -> AsyncIterator[dict[str,
     logger.info(f"Read-only mode: {'ENABLED' if read_only else 'DISABLED'}")
     logger.info(f"Enabled tools filter: {enabled_tools or 'All tools enabled'}")
     logger.info(f"Enabled toolsets filter: {sorted(enabled_toolsets)}")
+    warmup_task = start_cache_warmup(loaded_jira_config, loaded_confluence_config)
 
     try:
         yield {"app_lifespan_context": app_context}
@@ -194,6 +203,8 @@ async def main_lifespan(app: FastMCP[MainAppContext]) -> AsyncIterator[dict[str,
         raise
     finally:
         logger.info("Main Atlassian MCP server lifespan shutting down...")
+        if warmup_task is not None and not warmup_task.done():
+            warmup_task.cancel()
         # Perform any necessary cleanup here
         try:
             # Close any open connections if needed
@@ -317,6 +328,11 @@ class AtlassianMCP(ErrorPreservingFastMCP[MainAppContext]):
         tool_tags = tool_obj.tags
         if "cloud_only" in tool_tags and "jira" in tool_tags:
             return ctx["jira_is_cloud"] is not False
+        # Local search tools only work once a mirror is configured.
+        if "local_index" in tool_tags and "jira" in tool_tags:
+            return bool(get_local_mirror_projects())
+        if "local_index" in tool_tags and "confluence" in tool_tags:
+            return bool(get_local_index_spaces())
         return True
 
     def _is_tool_enabled(
@@ -0,0 +1,349 @@
+"""JSON encoding for tool responses.
+
+Every tool returns its result as a JSON string. ``dump_response`` is the single
+place that encoding happens, so the output format can be chosen once:
+
+- ``pretty`` (default): two-space indentation, matching
+  ``json.dumps(data, indent=2, ensure_ascii=False)``.
+- ``compact``: no insignificant whitespace, which cuts the payload (and the
+  client's token usage) for large search results and page trees.
+
+Set ``MCP_ATLASSIAN_RESPONSE_FORMAT`` to pick one. When ``orjson`` is
+installed it encodes the response; anything it rejects (integers beyond 64
+bits, lone surrogates, non-JSON types) is encoded by the standard library
+instead, so results never depend on which backend ran.
+
+An optional size budget (``MCP_ATLASSIAN_RESPONSE_MAX_BYTES`` or
+``MCP_ATLASSIAN_RESPONSE_MAX_TOKENS``) caps the encoded response. Oversized
+results are shortened structurally: the longest text fields are cut first,
+then trailing items are dropped from the largest lists. A ``_truncation``
+entry records every cut and, for a list paginated by offset, the offset to
+continue from.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from collections import deque
+from typing import Any
+
+from mcp_atlassian.utils.env import get_int_env
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None  # type: ignore[assignment]
+
+logger = logging.getLogger("mcp-atlassian.servers.response")
+
+RESPONSE_FORMAT_ENV = "MCP_ATLASSIAN_RESPONSE_FORMAT"
+DEFAULT_RESPONSE_FORMAT = "pretty"
+SUPPORTED_RESPONSE_FORMATS = ("pretty", "compact")
+
+if orjson is not None:
+    # Leave datetimes and dataclasses to the stdlib fallback: json.dumps
+    # rejects them, and orjson should not silently accept what it would not.
+    _ORJSON_BASE_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+    _ORJSON_OPTIONS = {
+        "pretty": _ORJSON_BASE_OPTIONS | orjson.OPT_INDENT_2,
+        "compact": _ORJSON_BASE_OPTIONS,
+    }
+
+RESPONSE_MAX_BYTES_ENV = "MCP_ATLASSIAN_RESPONSE_MAX_BYTES"
+RESPONSE_MAX_TOKENS_ENV = "MCP_ATLASSIAN_RESPONSE_MAX_TOKENS"
+# Rough UTF-8 bytes per LLM token for JSON-heavy text.
+BYTES_PER_TOKEN = 4
+# Text fields are never cut below this many characters; past that point the
+# budget is met by dropping list items instead.
+MIN_TEXT_CHARS = 1000
+# Underscored so it cannot collide with a result's own "truncated" field.
+TRUNCATION_KEY = "_truncation"
+# Offsets a result's list may be paginated by; see ``_next_start``.
+_OFFSET_KEYS = ("start_at", "startAt", "start")
+_PAGE_TOKEN_KEYS = ("next_page_token", "nextPageToken")
+_TRUNCATION_HINT = (
+    "The response exceeded the size budget and was shortened. Each entry gives "
+    "the path that was cut and how many characters or items were returned out "
+    "of the total. Where an entry has 'next_start', pass it as the tool's start "
+    "offset to fetch the rest; otherwise request a smaller limit or fewer fields."
+)
+_MAX_TRUNCATION_PASSES = 8
+
+_JSON_KWARGS: dict[str, dict[str, Any]] = {
+    "pretty": {"indent": 2, "ensure_ascii": False},
+    "compact": {"separators": (",", ":"), "ensure_ascii": False},
+}
+
+
+def get_response_format() -> str:
+    """Return the configured response format, defaulting to ``pretty``."""
+    response_format = os.getenv(RESPONSE_FORMAT_ENV, "").strip().lower()
+    if not response_format:
+        return DEFAULT_RESPONSE_FORMAT
+    if response_format not in SUPPORTED_RESPONSE_FORMATS:
+        logger.warning(
+            "Unsupported %s=%r; using %s. Supported: %s",
+            RESPONSE_FORMAT_ENV,
+            response_format,
+            DEFAULT_RESPONSE_FORMAT,
+            ", ".join(SUPPORTED_RESPONSE_FORMATS),
+        )
+        return DEFAULT_RESPONSE_FORMAT
+    return response_format
+
+
+def get_response_budget() -> int:
+    """Return the response size budget in bytes, or 0 when unlimited.
+
+    When both the byte and the token budget are set, the smaller one wins.
+    """
+    budgets = [
+        get_int_env(RESPONSE_MAX_BYTES_ENV, 0),
+        get_int_env(RESPONSE_MAX_TOKENS_ENV, 0) * BYTES_PER_TOKEN,
+    ]
+    positive = [budget for budget in budgets if budget > 0]
+    return min(positive) if positive else 0
+
+
+def dump_response(
+    data: Any, response_format: str | None = None, max_bytes: int | None = None
+) -> str:
+    """Encode a tool result as JSON text.
+
+    Args:
+        data: The JSON-compatible result.
+        response_format: ``pretty`` or ``compact``; defaults to the configured
+            format.
+        max_bytes: Size budget for the encoded result; defaults to the
+            configured budget. 0 disables it.
+
+    Returns:
+        The encoded JSON string.
+    """
+    if response_format is None:
+        response_format = get_response_format()
+    text = _encode(data, response_format)
+    if max_bytes is None:
+        max_bytes = get_response_budget()
+    if max_bytes > 0 and _byte_length(text) > max_bytes:
+        return _ResponseTruncator(text, response_format, max_bytes).encode()
+    return text
+
+
+def _encode(data: Any, response_format: str) -> str:
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=_ORJSON_OPTIONS[response_format]).decode()
+        except TypeError:
+            # orjson.JSONEncodeError is a TypeError subclass.
+            pass
+    return json.dumps(data, **_JSON_KWARGS[response_format])
+
+
+def _byte_length(text: str) -> int:
+    return len(text) if text.isascii() else len(text.encode("utf-8", "surrogatepass"))
+
+
+def _child_path(path: str, key: Any) -> str:
+    if isinstance(key, int):
+        return f"{path}[{key}]"
+    return f"{path}.{key}" if path else str(key)
+
+
+def _next_start(parent: Any, kept: int) -> int | None:
+    """Return the offset continuing a list cut to *kept* items, if it has one.
+
+    Only a list whose enclosing object reports its own start offset (as
+    search results do) can be resumed by offset. Lists paginated by token,
+    nested lists such as comments, and text have no such offset.
+    """
+    if not isinstance(parent, dict):
+        return None
+    if any(parent.get(key) for key in _PAGE_TOKEN_KEYS):
+        return None
+    for key in _OFFSET_KEYS:
+        start = parent.get(key)
+        if isinstance(start, int) and not isinstance(start, bool) and start >= 0:
+            return start + kept
+    return None
+
+
+class _ResponseTruncator:
+    """Shorten a result until its encoding fits a byte budget.
+
+    Text is cut before list items are dropped because a shortened description
+    or page body keeps the result's shape, while a dropped item is gone. The
+    budget is best effort: a result made only of short fields and one-item
+    lists can still exceed it.
+    """
+
+    def __init__(self, text: str, response_format: str, max_bytes: int) -> None:
+        self.response_format = response_format
+        self.max_bytes = max_bytes
+        # Work on a decoded copy of the encoded result so the caller's data
+        # (possibly shared with cached models) is never mutated; json rather
+        # than orjson, which decodes integers beyond 64 bits as floats. A
+        # holder gives the top-level value a parent, so a bare oversized
+        # string is handled like any other field.
+        self.root: dict[str, Any] = {"": json.loads(text)}
+        self.cuts: dict[str, dict[str, Any]] = {}
+        self.dropped: list[tuple[str, int]] = []
+        self._collect()
+
+    def encode(self) -> str:
+        text = self._render()
+        size = _byte_length(text)
+        if size > self.max_bytes:
+            size = self._truncate_text(size)
+        if size > self.max_bytes:
+            size = self._drop_list_items(size)
+        if size > self.max_bytes:
+            logger.info(
+                "Response still %d bytes after truncation (budget %d)",
+                size,
+                self.max_bytes,
+            )
+        return self._render()
+
+    def _render(self) -> str:
+        data = self.root[""]
+        cuts = [cut for path, cut in self.cuts.items() if not self._is_dropped(path)]
+        if cuts:
+            note = {
+                "max_bytes": self.max_bytes,
+                "fields": cuts,
+                "hint": _TRUNCATION_HINT,
+            }
+            if isinstance(data, dict) and TRUNCATION_KEY not in data:
+                data = {**data, TRUNCATION_KEY: note}
+            else:
+                data = {"results": data, TRUNCATION_KEY: note}
+        return _encode(data, self.response_format)
+
+    def _is_dropped(self, path: str) -> bool:
+        for list_path, kept in self.dropped:
+            prefix = f"{list_path}["
+            if path.startswith(prefix):
+                index = int(path[len(prefix) : path.index("]", len(prefix))])
+                if index >= kept:
+                    return True
+        return False
+
+    def _collect(self) -> None:
+        """Find the long text fields and multi-item lists, outermost first."""
+        self.texts: list[tuple[str, Any, Any, str]] = []
+        self.lists: list[tuple[str, list[Any], Any]] = []
+        queue: deque[tuple[str, Any]] = deque([("", self.root)])
+        while queue:
+            path, container = queue.popleft()
+            items = (
+                container.items()
+                if isinstance(container, dict)
+                else enumerate(container)
+            )
+            for key, value in items:
+                if isinstance(value, str):
+                    if len(value) > MIN_TEXT_CHARS:
+                        self.texts.append(
+                            (_child_path(path, key), container, key, value)
+                        )
+                elif isinstance(value, dict | list):
+                    child_path = _child_path(path, key)
+                    if isinstance(value, list) and len(value) > 1:
+                        self.lists.append((child_path, value, container))
+                    queue.append((child_path, value))
+
+    def _truncate_text(self, size: int) -> int:
+        fields = self.texts
+        if not fields:
+            return size
+        returned = {path: len(value) for path, _, _, value in fields}
+        for _ in range(_MAX_TRUNCATION_PASSES):
+            needed = size - self.max_bytes
+            cap = self._water_level(sorted(returned.values(), reverse=True), needed)
+            for path, parent, key, original in fields:
+                if returned[path] <= cap:
+                    continue
+                returned[path] = cap
+                omitted = len(original) - cap
+                parent[key] = (
+                    f"{original[:cap]}\n[... {omitted} more characters truncated]"
+                )
+                self.cuts[path] = {
+                    "path": path or "$",
+                    "kind": "text",
+                    "returned": cap,
+                    "total": len(original),
+                }
+            size = _byte_length(self._render())
+            if size <= self.max_bytes or cap <= MIN_TEXT_CHARS:
+                break
+        return size
+
+    @staticmethod
+    def _water_level(lengths: list[int], needed: int) -> int:
+        """Return the largest cap whose cuts to *lengths* remove *needed* chars."""
+        removed = 0
+        for count, length in enumerate(lengths, start=1):
+            following = lengths[count] if count < len(lengths) else MIN_TEXT_CHARS
+            following = max(following, MIN_TEXT_CHARS)
+            step = (length - following) * count
+            if removed + step >= needed:
+                return max(MIN_TEXT_CHARS, length - -(-(needed - removed) // count))
+            removed += step
+        return MIN_TEXT_CHARS
+
+    def _drop_list_items(self, size: int) -> int:
+        lists = sorted(
+            self.lists,
+            key=lambda entry: len(_encode(entry[1], "compact")),
+            reverse=True,
+        )
+        for path, items, parent in lists:
+            if size <= self.max_bytes:
+                break
+            if self._is_dropped(path):
+                continue
+            # Dropping items also drops their text cuts from the truncation
+            # note, so the size is measured rather than estimated: binary
+            # search for the most items that fit.
+            full = items[:]
+            low, high = 1, len(full) - 1
+            while low < high:
+                middle = (low + high + 1) // 2
+                if (
+                    self._size_keeping(path, items, full, middle, parent)
+                    <= self.max_bytes
+                ):
+                    low = middle
+                else:
+                    high = middle - 1
+            size = self._size_keeping(path, items, full, low, parent)
+            self.dropped.append((path, low))
+        return size
+
+    def _size_keeping(
+        self, path: str, items: list[Any], full: list[Any], kept: int, parent: Any
+    ) -> int:
+        items[:] = full[:kept]
+        cut: dict[str, Any] = {
+            "path": path or "$",
+            "kind": "items",
+            "returned": kept,
+            "total": len(full),
+        }
+        next_start = _next_start(parent, kept)
+        if next_start is not None:
+            cut["next_start"] = next_start
+        self.cuts[path] = cut
+        self.dropped.append((path, kept))
+        try:
+            return _byte_length(self._render())
+        finally:
+            self.dropped.pop()
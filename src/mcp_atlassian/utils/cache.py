@@ -0,0 +1,378 @@
+"""Process-wide response caching and the write invalidation bus.
+
+Fetchers are rebuilt for every tool call (per request in HTTP transports), so
+any response cache that should outlive a single call lives at module level and
+is shared by every fetcher in the process. Such caches are only safe when our
+own writes invalidate them: write paths publish the entities they touched on
+``invalidation_bus`` and every ``ResponseCache`` subscribes to it, so a read
+that follows a write through this server never sees pre-write data.
+
+Entities are plain strings of the form ``"<kind>:<identifier>"`` (for example
+``"jira.issue:PROJ-1"``). Publishing ``"<kind>:*"`` invalidates every entity of
+that kind, which is what writes use when they cannot name the affected entity.
+
+Response caching is disabled by default. Set MCP_ATLASSIAN_RESPONSE_CACHE_TTL
+to a positive number of seconds to enable it; MCP_ATLASSIAN_CACHE_BACKEND picks
+where entries are stored (see ``cache_backends``).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import inspect
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterable, Sequence
+from functools import wraps
+from typing import Any, TypeVar
+
+from .cache_backends import (
+    INVALIDATION_COLLECTION_SUFFIX,
+    CacheBackend,
+    MemoryCacheBackend,
+    get_cache_backend,
+)
+from .env import get_int_env
+
+logger = logging.getLogger("mcp-atlassian.cache")
+
+T = TypeVar("T")
+F = TypeVar("F", bound=Callable[..., Any])
+
+RESPONSE_CACHE_TTL_ENV = "MCP_ATLASSIAN_RESPONSE_CACHE_TTL"
+DEFAULT_RESPONSE_CACHE_TTL = 0
+
+# Entity kinds published by write paths.
+JIRA_ISSUE = "jira.issue"
+JIRA_PROJECT = "jira.project"
+JIRA_SPRINT = "jira.sprint"
+CONFLUENCE_PAGE = "confluence.page"
+CONFLUENCE_SPACE = "confluence.space"
+
+WILDCARD = "*"
+
+
+def response_cache_ttl() -> int:
+    """Return the configured response cache TTL in seconds (0 = disabled)."""
+    return get_int_env(RESPONSE_CACHE_TTL_ENV, DEFAULT_RESPONSE_CACHE_TTL)
+
+
+def entity_key(kind: str, identifier: object) -> str:
+    """Build the entity key published for ``identifier`` of ``kind``."""
+    return f"{kind}:{identifier}"
+
+
+def _kind_of(entity: str) -> str:
+    return entity.partition(":")[0]
+
+
+class InvalidationBus:
+    """Fan out entity invalidations from write paths to subscribed caches."""
+
+    def __init__(self) -> None:
+        self._subscribers: list[Callable[[str], None]] = []
+        self._lock = threading.Lock()
+
+    def subscribe(self, callback: Callable[[str], None]) -> Callable[[], None]:
+        """Register ``callback`` for every published entity.
+
+        Returns:
+            A function that removes the subscription again.
+        """
+        with self._lock:
+            self._subscribers.append(callback)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                if callback in self._subscribers:
+                    self._subscribers.remove(callback)
+
+        return unsubscribe
+
+    def publish(self, *entities: str) -> None:
+        """Deliver each entity to every subscriber.
+
+        A failing subscriber is logged and skipped; it never fails the write
+        that published the invalidation.
+        """
+        if not entities:
+            return
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for entity in entities:
+            logger.debug("Invalidating cached responses for %s", entity)
+            for callback in subscribers:
+                try:
+                    callback(entity)
+                except Exception:  # noqa: BLE001
+                    logger.warning(
+                        "Cache invalidation subscriber failed for %s",
+                        entity,
+                        exc_info=True,
+                    )
+
+
+invalidation_bus = InvalidationBus()
+
+
+def _normalize_identifiers(values: Iterable[object]) -> list[str]:
+    identifiers: list[str] = []
+    for value in values:
+        if value is None or value == "":
+            continue
+        if isinstance(value, list | tuple | set | frozenset):
+            identifiers.extend(_normalize_identifiers(value))
+        else:
+            identifiers.append(str(value))
+    return identifiers
+
+
+def publish_invalidation(kind: str, *identifiers: object) -> None:
+    """Publish invalidations for ``identifiers`` of ``kind``.
+
+    ``None``/empty identifiers are ignored and list values are flattened, so
+    callers can pass optional arguments straight through.
+    """
+    invalidation_bus.publish(
+        *(entity_key(kind, ident) for ident in _normalize_identifiers(identifiers))
+    )
+
+
+def invalidates(kind: str, *params: str) -> Callable[[F], F]:
+    """Publish invalidations for the arguments named by ``params`` after a write.
+
+    The invalidation is published whether the wrapped call succeeds or fails:
+    a write that raised may still have changed upstream state (for example an
+    update that succeeded before the re-fetch of the issue failed).
+
+    Args:
+        kind: Entity kind of every named argument (e.g. ``JIRA_ISSUE``).
+        params: Names of the wrapped function's parameters that identify the
+            written entities. Values may be strings or lists of strings.
+    """
+
+    def decorator(func: F) -> F:
+        signature = inspect.signature(func)
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return func(*args, **kwargs)
+            finally:
+                try:
+                    bound = signature.bind_partial(*args, **kwargs)
+                except TypeError:
+                    bound = None
+                if bound is not None:
+                    publish_invalidation(
+                        kind, *(bound.arguments.get(name) for name in params)
+                    )
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def config_cache_scope(config: Any) -> str:
+    """Return a digest identifying whose view of the instance ``config`` sees.
+
+    Cached responses depend on the caller's permissions, so cache keys are
+    scoped to the target instance AND the credential. Only a SHA-256 digest is
+    ever used; raw tokens never reach the cache.
+    """
+    oauth_config = getattr(config, "oauth_config", None)
+    custom_headers = getattr(config, "custom_headers", None) or {}
+    material = "\x00".join(
+        str(part or "")
+        for part in (
+            getattr(config, "url", ""),
+            getattr(config, "auth_type", ""),
+            getattr(config, "username", ""),
+            getattr(config, "api_token", ""),
+            getattr(config, "personal_token", ""),
+            getattr(oauth_config, "access_token", "") if oauth_config else "",
+            getattr(oauth_config, "cloud_id", "") if oauth_config else "",
+            *sorted(f"{k.lower()}={v}" for k, v in custom_headers.items()),
+        )
+    )
+    return hashlib.sha256(material.encode()).hexdigest()
+
+
+class ResponseCache:
+    """TTL cache of upstream responses, invalidated by entity.
+
+    Each entry records the entities it was derived from. An entry is served
+    only if none of those entities (nor their kind, via a wildcard) has been
+    invalidated since the load that produced it *started*, which also covers
+    writes that land while a slow read is still in flight.
+
+    Entries and invalidation records live in the process-wide cache backend
+    (see ``cache_backends``), so with a shared backend one replica's writes
+    also invalidate the entries cached by the others. Invalidation records are
+    kept for twice the entry TTL, long enough to outlive any entry they could
+    make stale.
+
+    ``ttl`` and ``max_ttl`` may be callables; like the shared TTL they are
+    read on first use and again after :meth:`clear`.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        ttl: int | Callable[[], int] | None = None,
+        max_ttl: int | Callable[[], int] | None = None,
+        maxsize: int | None = None,
+        bus: InvalidationBus | None = None,
+        backend: CacheBackend | None = None,
+    ) -> None:
+        self.name = name
+        self._ttl_override = ttl
+        self._max_ttl = max_ttl
+        self._backend_override = backend
+        if backend is None and maxsize is not None:
+            self._backend_override = MemoryCacheBackend(maxsize)
+        self._ttl = 0
+        self._backend: CacheBackend | None = None
+        self._configured = False
+        self._lock = threading.RLock()
+        (bus or invalidation_bus).subscribe(self.invalidate)
+
+    @property
+    def _markers(self) -> str:
+        return f"{self.name}{INVALIDATION_COLLECTION_SUFFIX}"
+
+    def _configure(self) -> None:
+        # Settings given as callables are read here, not at import, so
+        # clear() picks up environment changes like the shared TTL.
+        ttl = self._ttl_override
+        if ttl is None:
+            ttl = response_cache_ttl
+        self._ttl = ttl() if callable(ttl) else ttl
+        max_ttl = self._max_ttl
+        if max_ttl is not None:
+            self._ttl = min(self._ttl, max_ttl() if callable(max_ttl) else max_ttl)
+        self._backend = None
+        if self._ttl > 0:
+            self._backend = self._backend_override or get_cache_backend()
+        self._configured = True
+
+    def _active_backend(self) -> CacheBackend | None:
+        with self._lock:
+            if not self._configured:
+                self._configure()
+            return self._backend
+
+    @property
+    def enabled(self) -> bool:
+        """Whether this cache stores anything (positive TTL)."""
+        return self._active_backend() is not None
+
+    @staticmethod
+    def _storage_key(key: Any) -> str:
+        parts = key if isinstance(key, tuple) else (key,)
+        return "\x1f".join(str(part) for part in parts)
+
+    def _is_fresh(
+        self, backend: CacheBackend, loaded_at: float, entities: Sequence[str]
+    ) -> bool:
+        if not entities:
+            return True
+        markers = list(
+            dict.fromkeys(
+                marker
+                for entity in entities
+                for marker in (entity, entity_key(_kind_of(entity), WILDCARD))
+            )
+        )
+        return all(
+            invalidated_at is None or invalidated_at < loaded_at
+            for invalidated_at in backend.get_many(self._markers, markers)
+        )
+
+    def get(self, key: Any) -> Any | None:
+        """Return the fresh cached value for ``key``, or None on a miss."""
+        backend = self._active_backend()
+        if backend is None:
+            return None
+        cached = backend.get_many(self.name, [self._storage_key(key)])[0]
+        if cached is None:
+            return None
+        value, loaded_at, cached_entities = cached
+        if not self._is_fresh(backend, loaded_at, cached_entities):
+            return None
+        logger.debug("%s cache hit", self.name)
+        return value
+
+    def put(
+        self,
+        key: Any,
+        value: Any,
+        *,
+        loaded_at: float,
+        entities: Iterable[str] = (),
+    ) -> None:
+        """Cache ``value`` unless one of its entities changed since ``loaded_at``.
+
+        Args:
+            key: Hashable cache key; include the credential scope.
+            value: The loaded value.
+            loaded_at: ``time.time()`` taken before the upstream read started.
+            entities: Entity keys the value was derived from.
+        """
+        backend = self._active_backend()
+        if backend is None:
+            return
+        entity_keys = tuple(entities)
+        if self._is_fresh(backend, loaded_at, entity_keys):
+            backend.put(
+                self.name,
+                self._storage_key(key),
+                (value, loaded_at, list(entity_keys)),
+                self._ttl,
+            )
+
+    def get_or_load(
+        self,
+        key: Any,
+        loader: Callable[[], T],
+        *,
+        entities: Iterable[str] = (),
+        refresh: bool = False,
+    ) -> T:
+        """Return the cached value for ``key`` or load and cache it.
+
+        Args:
+            key: Hashable cache key; include the credential scope.
+            loader: Fetches the value from upstream on a miss.
+            entities: Entity keys the value was derived from.
+            refresh: Skip the lookup and replace any cached value.
+        """
+        if not self.enabled:
+            return loader()
+
+        if not refresh:
+            cached = self.get(key)
+            if cached is not None:
+                return cached
+        loaded_at = time.time()
+        value = loader()
+        self.put(key, value, loaded_at=loaded_at, entities=entities)
+        return value
+
+    def invalidate(self, entity: str) -> None:
+        """Mark ``entity`` (or a ``"<kind>:*"`` wildcard) as changed now."""
+        backend = self._active_backend()
+        if backend is None:
+            return
+        backend.put(self._markers, entity, time.time(), 2 * self._ttl)
+
+    def clear(self) -> None:
+        """Drop every entry and invalidation record, re-reading settings."""
+        with self._lock:
+            if self._backend is not None:
+                self._backend.clear(self.name)
+                self._backend.clear(self._markers)
+            self._backend = None
+            self._configured = False
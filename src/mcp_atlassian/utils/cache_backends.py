@@ -0,0 +1,394 @@
+"""Storage backends for the process-wide response caches.
+
+The backend is selected once per process with MCP_ATLASSIAN_CACHE_BACKEND:
+
+- ``memory`` (default): in-process LRU with per-entry TTL.
+- ``sqlite``: a SQLite file (MCP_ATLASSIAN_CACHE_SQLITE_PATH) that several
+  worker processes on one host can share.
+- ``factory``: any ``AsyncKeyValue`` store (Redis, Valkey, DynamoDB, ...)
+  returned by MCP_ATLASSIAN_CACHE_FACTORY, optionally called with the JSON
+  object in MCP_ATLASSIAN_CACHE_CONFIG_JSON. This is the same plug-in contract
+  as ATLASSIAN_OAUTH_CLIENT_STORAGE_FACTORY, and lets replicas behind a load
+  balancer share warm caches.
+
+Backends never raise on cache I/O: a failing shared store is logged and treated
+as a miss so that tool calls keep working against the upstream API.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import math
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Protocol
+
+from cachetools import TLRUCache
+
+from .env import get_float_env, get_int_env
+from .storage_factory import build_storage_from_factory_env
+
+if TYPE_CHECKING:
+    from key_value.aio.protocols import AsyncKeyValue
+
+logger = logging.getLogger("mcp-atlassian.cache")
+
+CACHE_BACKEND_ENV = "MCP_ATLASSIAN_CACHE_BACKEND"
+CACHE_SQLITE_PATH_ENV = "MCP_ATLASSIAN_CACHE_SQLITE_PATH"
+CACHE_FACTORY_ENV = "MCP_ATLASSIAN_CACHE_FACTORY"
+CACHE_CONFIG_JSON_ENV = "MCP_ATLASSIAN_CACHE_CONFIG_JSON"
+CACHE_BACKEND_TIMEOUT_ENV = "MCP_ATLASSIAN_CACHE_BACKEND_TIMEOUT"
+# Shared with ResponseCache: the memory backend applies it per collection.
+RESPONSE_CACHE_MAXSIZE_ENV = "MCP_ATLASSIAN_RESPONSE_CACHE_MAXSIZE"
+DEFAULT_RESPONSE_CACHE_MAXSIZE = 1024
+DEFAULT_CACHE_BACKEND_TIMEOUT = 2.0
+# Collections holding invalidation markers. A marker must outlive every entry
+# it makes stale, so backends may only drop markers by TTL, never for space.
+INVALIDATION_COLLECTION_SUFFIX = ":invalidated"
+
+
+class CacheBackend(Protocol):
+    """Minimal synchronous key/value interface used by ``ResponseCache``.
+
+    ``collection`` namespaces keys per cache. Shared backends only accept
+    JSON-serializable values.
+    """
+
+    shared: bool
+
+    def get_many(self, collection: str, keys: Sequence[str]) -> list[Any | None]:
+        """Return the live value for each key, or ``None``."""
+        ...
+
+    def put(self, collection: str, key: str, value: Any, ttl: float) -> None:
+        """Store ``value`` under ``key`` for ``ttl`` seconds."""
+        ...
+
+    def add(self, collection: str, key: str, value: Any, ttl: float) -> bool | None:
+        """Store ``value`` only if ``key`` has no live value; True if stored.
+
+        Returns False if another live value holds ``key`` and None if the
+        store itself failed, so callers do not wait on a lease nobody holds.
+        Used as a short lease to coalesce work across processes. Backends
+        without an atomic primitive implement it best effort.
+        """
+        ...
+
+    def delete(self, collection: str, key: str) -> None:
+        """Remove ``key`` if present."""
+        ...
+
+    def clear(self, collection: str) -> None:
+        """Drop every entry of ``collection`` (best effort)."""
+        ...
+
+
+def _entry_expiry(_key: Any, entry: tuple[Any, float], now: float) -> float:
+    return now + entry[1]
+
+
+class MemoryCacheBackend:
+    """In-process LRU per collection with per-entry TTL.
+
+    Invalidation marker collections are bounded by TTL only: evicting a
+    marker before the entries it covers would serve those entries again.
+    """
+
+    shared = False
+
+    def __init__(self, maxsize: int = DEFAULT_RESPONSE_CACHE_MAXSIZE) -> None:
+        self._maxsize = max(1, maxsize)
+        self._collections: dict[str, TLRUCache[str, tuple[Any, float]]] = {}
+        self._lock = threading.Lock()
+
+    def _collection(self, collection: str) -> TLRUCache[str, tuple[Any, float]]:
+        entries = self._collections.get(collection)
+        if entries is None:
+            maxsize = (
+                math.inf
+                if collection.endswith(INVALIDATION_COLLECTION_SUFFIX)
+                else self._maxsize
+            )
+            entries = TLRUCache(
+                maxsize=maxsize, ttu=_entry_expiry, timer=time.monotonic
+            )
+            self._collections[collection] = entries
+        return entries
+
+    def get_many(self, collection: str, keys: Sequence[str]) -> list[Any | None]:
+        with self._lock:
+            entries = self._collection(collection)
+            results: list[Any | None] = []
+            for key in keys:
+                entry = entries.get(key)
+                results.append(entry[0] if entry is not None else None)
+            return results
+
+    def put(self, collection: str, key: str, value: Any, ttl: float) -> None:
+        with self._lock:
+            self._collection(collection)[key] = (value, ttl)
+
+    def add(self, collection: str, key: str, value: Any, ttl: float) -> bool:
+        with self._lock:
+            entries = self._collection(collection)
+            if entries.get(key) is not None:
+                return False
+            entries[key] = (value, ttl)
+            return True
+
+    def delete(self, collection: str, key: str) -> None:
+        with self._lock:
+            self._collection(collection).pop(key, None)
+
+    def clear(self, collection: str) -> None:
+        with self._lock:
+            self._collections.pop(collection, None)
+
+
+class SqliteCacheBackend:
+    """SQLite file shared by the worker processes of one host.
+
+    Values are stored as JSON. WAL mode lets readers in other processes proceed
+    while one process writes.
+    """
+
+    shared = True
+    _PRUNE_EVERY = 256
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._conn = sqlite3.connect(
+            str(self.path), check_same_thread=False, timeout=5.0
+        )
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS response_cache ("
+                "collection TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, "
+                "expires_at REAL NOT NULL, PRIMARY KEY (collection, key))"
+            )
+
+    def get_many(self, collection: str, keys: Sequence[str]) -> list[Any | None]:
+        if not keys:
+            return []
+        placeholders = ",".join("?" for _ in keys)
+        try:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT key, value FROM response_cache "  # noqa: S608
+                    f"WHERE collection = ? AND key IN ({placeholders}) "
+                    "AND expires_at > ?",
+                    (collection, *keys, time.time()),
+                ).fetchall()
+        except sqlite3.Error:
+            logger.warning("SQLite cache read failed", exc_info=True)
+            return [None] * len(keys)
+        found = {key: json.loads(value) for key, value in rows}
+        return [found.get(key) for key in keys]
+
+    def put(self, collection: str, key: str, value: Any, ttl: float) -> None:
+        try:
+            payload = json.dumps(value)
+        except (TypeError, ValueError):
+            logger.debug("Skipping non-JSON value for %s cache", collection)
+            return
+        now = time.time()
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO response_cache VALUES (?, ?, ?, ?)",
+                    (collection, key, payload, now + ttl),
+                )
+                self._writes += 1
+                if self._writes % self._PRUNE_EVERY == 0:
+                    self._conn.execute(
+                        "DELETE FROM response_cache WHERE expires_at <= ?", (now,)
+                    )
+        except sqlite3.Error:
+            logger.warning("SQLite cache write failed", exc_info=True)
+
+    def add(self, collection: str, key: str, value: Any, ttl: float) -> bool | None:
+        now = time.time()
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "DELETE FROM response_cache "
+                    "WHERE collection = ? AND key = ? AND expires_at <= ?",
+                    (collection, key, now),
+                )
+                cursor = self._conn.execute(
+                    "INSERT OR IGNORE INTO response_cache VALUES (?, ?, ?, ?)",
+                    (collection, key, json.dumps(value), now + ttl),
+                )
+                return cursor.rowcount == 1
+        except (sqlite3.Error, TypeError, ValueError):
+            logger.warning("SQLite cache write failed", exc_info=True)
+            return None
+
+    def delete(self, collection: str, key: str) -> None:
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "DELETE FROM response_cache WHERE collection = ? AND key = ?",
+                    (collection, key),
+                )
+        except sqlite3.Error:
+            logger.warning("SQLite cache delete failed", exc_info=True)
+
+    def clear(self, collection: str) -> None:
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "DELETE FROM response_cache WHERE collection = ?", (collection,)
+                )
+        except sqlite3.Error:
+            logger.warning("SQLite cache clear failed", exc_info=True)
+
+
+class KeyValueCacheBackend:
+    """Adapter running an ``AsyncKeyValue`` store from synchronous code.
+
+    Fetcher methods run in worker threads, so store calls are submitted to a
+    private event loop thread and waited on with a timeout.
+    """
+
+    shared = True
+
+    def __init__(self, store: AsyncKeyValue, timeout: float) -> None:
+        self._store = store
+        self._timeout = timeout
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="mcp-atlassian-cache", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self, coro: Any) -> Any:
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        try:
+            return future.result(timeout=self._timeout)
+        except Exception:
+            future.cancel()
+            raise
+
+    def get_many(self, collection: str, keys: Sequence[str]) -> list[Any | None]:
+        if not keys:
+            return []
+        try:
+            entries = self._run(self._store.get_many(list(keys), collection=collection))
+        except Exception:  # noqa: BLE001
+            logger.warning("Shared cache read failed", exc_info=True)
+            return [None] * len(keys)
+        return [entry.get("v") if entry else None for entry in entries]
+
+    def put(self, collection: str, key: str, value: Any, ttl: float) -> None:
+        try:
+            json.dumps(value)
+        except (TypeError, ValueError):
+            logger.debug("Skipping non-JSON value for %s cache", collection)
+            return
+        try:
+            self._run(
+                self._store.put(key, {"v": value}, collection=collection, ttl=ttl)
+            )
+        except Exception:  # noqa: BLE001
+            logger.warning("Shared cache write failed", exc_info=True)
+
+    def add(self, collection: str, key: str, value: Any, ttl: float) -> bool | None:
+        # AsyncKeyValue has no compare-and-set; two processes racing here may
+        # both win, which only costs a duplicate upstream call.
+        try:
+            if self._run(self._store.get(key, collection=collection)) is not None:
+                return False
+            self._run(
+                self._store.put(key, {"v": value}, collection=collection, ttl=ttl)
+            )
+        except Exception:  # noqa: BLE001
+            logger.warning("Shared cache write failed", exc_info=True)
+            return None
+        return True
+
+    def delete(self, collection: str, key: str) -> None:
+        try:
+            self._run(self._store.delete(key, collection=collection))
+        except Exception:  # noqa: BLE001
+            logger.warning("Shared cache delete failed", exc_info=True)
+
+    def clear(self, collection: str) -> None:
+        destroy_collection = getattr(self._store, "destroy_collection", None)
+        if not callable(destroy_collection):
+            return
+        try:
+            self._run(destroy_collection(collection))
+        except Exception:  # noqa: BLE001
+            logger.warning("Shared cache clear failed", exc_info=True)
+
+
+def _default_sqlite_path() -> Path:
+    return Path.home() / ".mcp-atlassian" / "response-cache.sqlite3"
+
+
+def build_cache_backend_from_env() -> CacheBackend:
+    """Build the response cache backend selected by env vars."""
+    mode = os.getenv(CACHE_BACKEND_ENV, "memory").strip().lower()
+    if mode in {"", "memory"}:
+        return MemoryCacheBackend(
+            get_int_env(RESPONSE_CACHE_MAXSIZE_ENV, DEFAULT_RESPONSE_CACHE_MAXSIZE)
+        )
+
+    if mode == "sqlite":
+        path = os.getenv(CACHE_SQLITE_PATH_ENV, "").strip() or _default_sqlite_path()
+        logger.info("Using SQLite response cache at %s.", path)
+        return SqliteCacheBackend(path)
+
+    if mode != "factory":
+        raise ValueError(
+            f"Unsupported {CACHE_BACKEND_ENV}='{mode}'. "
+            "Supported backends: memory, sqlite, factory."
+        )
+
+    import_path = os.getenv(CACHE_FACTORY_ENV, "").strip()
+    if not import_path:
+        raise ValueError(
+            f"{CACHE_FACTORY_ENV} is required when {CACHE_BACKEND_ENV}=factory."
+        )
+    store = build_storage_from_factory_env(
+        CACHE_FACTORY_ENV,
+        CACHE_CONFIG_JSON_ENV,
+        "Response cache storage",
+        import_path,
+        os.getenv(CACHE_CONFIG_JSON_ENV, ""),
+    )
+    logger.info("Using custom response cache storage from %s.", CACHE_FACTORY_ENV)
+    return KeyValueCacheBackend(
+        store,
+        get_float_env(CACHE_BACKEND_TIMEOUT_ENV, DEFAULT_CACHE_BACKEND_TIMEOUT),
+    )
+
+
+_cache_backend: CacheBackend | None = None
+_cache_backend_lock = threading.Lock()
+
+
+def get_cache_backend() -> CacheBackend:
+    """Return the process-wide cache backend, building it on first use."""
+    global _cache_backend
+    with _cache_backend_lock:
+        if _cache_backend is None:
+            _cache_backend = build_cache_backend_from_env()
+        return _cache_backend
+
+
+def _reset_cache_backend_for_tests() -> None:
+    global _cache_backend
+    with _cache_backend_lock:
+        _cache_backend = None
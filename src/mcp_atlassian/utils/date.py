@@ -1,12 +1,56 @@
 """Utility functions for date operations."""
 
 import logging
-from datetime import datetime, timezone
+import re
+from datetime import datetime, timedelta, timezone
 
 import dateutil.parser
 
 logger = logging.getLogger("mcp-atlassian")
 
+# The timestamp shape Jira and Confluence return, e.g. 2024-01-01T10:00:00.000+0000.
+_ATLASSIAN_TIMESTAMP = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,6}))?"
+    r"(?:(Z)|([+-])(\d{2}):?(\d{2}))"
+)
+
+
+def _parse_atlassian_timestamp(date_str: str) -> datetime | None:
+    """Parse the offset-qualified timestamp Atlassian APIs return without dateutil.
+
+    ``dateutil.parser.parse`` dominates model serialization time, and nearly
+    every timestamp has this one shape. Returns None for anything else, and
+    for year-9999 sentinels, so those keep dateutil's platform overflow
+    handling.
+    """
+    match = _ATLASSIAN_TIMESTAMP.fullmatch(date_str)
+    if match is None:
+        return None
+    year, month, day, hour, minute, second, fraction, zulu, sign, tz_h, tz_m = (
+        match.groups()
+    )
+    if year == "9999":
+        return None
+    if zulu:
+        tzinfo = timezone.utc
+    else:
+        offset = timedelta(hours=int(tz_h), minutes=int(tz_m))
+        tzinfo = timezone(-offset if sign == "-" else offset)
+    try:
+        return datetime(
+            int(year),
+            int(month),
+            int(day),
+            int(hour),
+            int(minute),
+            int(second),
+            int(fraction.ljust(6, "0")) if fraction else 0,
+            tzinfo=tzinfo,
+        )
+    except ValueError:
+        # Out-of-range parts (month 13, offset +25:00); let dateutil decide.
+        return None
+
 
 def parse_date(date_str: str | int | None) -> datetime | None:
     """
@@ -49,6 +93,9 @@ def parse_date(date_str: str | int | None) -> datetime | None:
                 f"Failed to parse timestamp {date_str}: {e}. Returning None."
             )
             return None
+    parsed = _parse_atlassian_timestamp(date_str)
+    if parsed is not None:
+        return parsed
     try:
         return dateutil.parser.parse(date_str)
     except (ValueError, TypeError) as e:
@@ -2,7 +2,7 @@ import logging
 from collections.abc import Awaitable, Callable
 from dataclasses import replace
 from functools import wraps
-from inspect import getdoc
+from inspect import getdoc, isgeneratorfunction
 from typing import Any, TypeVar
 
 import requests
@@ -159,25 +159,40 @@ def handle_auth_errors(
         service_name: Name of the service for error messages.
     """
 
+    def convert(http_err: HTTPError) -> None:
+        if http_err.response is not None and http_err.response.status_code in [
+            401,
+            403,
+        ]:
+            error_msg = (
+                f"Authentication failed for "
+                f"{service_name} "
+                f"({http_err.response.status_code}). "
+                "Token may be expired or invalid. "
+                "Please verify credentials."
+            )
+            logger.error(error_msg)
+            raise MCPAtlassianAuthenticationError(error_msg) from http_err
+
     def decorator(func: Callable) -> Callable:
+        if isgeneratorfunction(func):
+            # Generators raise while being iterated, not when called.
+            @wraps(func)
+            def generator_wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+                try:
+                    return (yield from func(self, *args, **kwargs))
+                except HTTPError as http_err:
+                    convert(http_err)
+                    raise  # re-raise non-auth HTTPError
+
+            return generator_wrapper
+
         @wraps(func)
         def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
             try:
                 return func(self, *args, **kwargs)
             except HTTPError as http_err:
-                if http_err.response is not None and http_err.response.status_code in [
-                    401,
-                    403,
-                ]:
-                    error_msg = (
-                        f"Authentication failed for "
-                        f"{service_name} "
-                        f"({http_err.response.status_code}). "
-                        "Token may be expired or invalid. "
-                        "Please verify credentials."
-                    )
-                    logger.error(error_msg)
-                    raise MCPAtlassianAuthenticationError(error_msg) from http_err
+                convert(http_err)
                 raise  # re-raise non-auth HTTPError
 
         return wrapper
@@ -0,0 +1,99 @@
+"""Helpers for the local SQLite full-text indexes.
+
+The opt-in local mirrors keep a copy of selected Jira projects and Confluence
+spaces in a SQLite file with an FTS5 index, so text queries are answered
+without a round trip to Atlassian. This module holds what they share: opening
+the database, claiming syncs, and turning free text into a safe FTS5
+``MATCH`` expression.
+"""
+
+from __future__ import annotations
+
+import re
+import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+_TERM = re.compile(r"\w+\*?")
+
+
+def connect_fts_database(path: str | Path) -> sqlite3.Connection:
+    """Open (creating if needed) a SQLite file for a local full-text index.
+
+    The connection is shared by worker threads, so callers serialize access
+    with their own lock. WAL mode lets other processes read while one syncs.
+
+    Raises:
+        ValueError: If this Python's SQLite was built without FTS5.
+    """
+    db_path = Path(path).expanduser()
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(db_path), check_same_thread=False, timeout=5.0)
+    try:
+        conn.execute("CREATE VIRTUAL TABLE IF NOT EXISTS temp.fts5_probe USING fts5(x)")
+        conn.execute("DROP TABLE temp.fts5_probe")
+    except sqlite3.OperationalError as e:
+        conn.close()
+        raise ValueError(
+            "The local search index needs SQLite with FTS5, which this Python "
+            f"build does not provide (SQLite {sqlite3.sqlite_version})."
+        ) from e
+    with conn:
+        conn.execute("PRAGMA journal_mode=WAL")
+    return conn
+
+
+class SyncClaims:
+    """Track which ``(scope, key)`` pairs are being synced in this process.
+
+    A claim is never waited on: a caller that finds a sync already running
+    skips it and reads what is stored. No lock is held across the network
+    scan, so a long first load for one credential or project does not block
+    searches for any other.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._active: set[tuple[str, str]] = set()
+
+    @contextmanager
+    def claim(self, scope: str, key: str) -> Iterator[bool]:
+        """Claim the sync of *key* for *scope*; yields False if already claimed."""
+        token = (scope, key)
+        with self._lock:
+            claimed = token not in self._active
+            self._active.add(token)
+        try:
+            yield claimed
+        finally:
+            if claimed:
+                with self._lock:
+                    self._active.discard(token)
+
+
+def fts_match_query(text: str) -> str:
+    """Turn free text into an FTS5 query matching documents with every word.
+
+    Each word is quoted, so FTS5 operators and punctuation in user input are
+    searched for literally instead of raising syntax errors. A trailing
+    ``*`` keeps its prefix-match meaning. Returns an empty string when the
+    text has no searchable words.
+    """
+    terms = []
+    for term in _TERM.findall(text):
+        word = term.rstrip("*")
+        quoted = '"' + word.replace('"', '""') + '"'
+        terms.append(quoted + "*" if term.endswith("*") else quoted)
+    return " ".join(terms)
+
+
+def iso_timestamp(epoch_seconds: float) -> str:
+    """Format a Unix timestamp as a UTC ISO 8601 string (second precision)."""
+    return (
+        datetime.fromtimestamp(epoch_seconds, tz=timezone.utc)
+        .replace(microsecond=0)
+        .isoformat()
+    )
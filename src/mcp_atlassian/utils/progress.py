@@ -0,0 +1,80 @@
+"""Progress reporting and deadlines for multi-page fetches.
+
+Long scans (space page trees, project-wide searches, bulk changelogs) fetch
+many upstream pages. A ``PageProgress`` passed to the fetcher is told after
+every page, so the server can forward MCP progress notifications, and it
+carries an optional deadline: once it passes, the fetcher stops at the next
+page boundary and records a cursor the caller can resume from.
+
+The deadline is opt-in via ``MCP_ATLASSIAN_TOOL_DEADLINE_SECONDS``.
+"""
+
+import logging
+import os
+import time
+from collections.abc import Callable
+
+logger = logging.getLogger("mcp-atlassian.progress")
+
+TOOL_DEADLINE_ENV = "MCP_ATLASSIAN_TOOL_DEADLINE_SECONDS"
+
+ProgressCallback = Callable[[float, float | None, str | None], None]
+
+
+def get_tool_deadline_seconds() -> float:
+    """Return the configured per-call deadline in seconds, or 0 when disabled."""
+    raw_value = os.getenv(TOOL_DEADLINE_ENV, "").strip()
+    if not raw_value:
+        return 0.0
+    try:
+        seconds = float(raw_value)
+    except ValueError:
+        logger.warning("Ignoring non-numeric %s=%r", TOOL_DEADLINE_ENV, raw_value)
+        return 0.0
+    return max(seconds, 0.0)
+
+
+class PageProgress:
+    """Per-call progress sink and deadline for a multi-page fetch.
+
+    Fetchers call ``page_done`` after each upstream page and stop when
+    ``should_stop`` returns True, setting ``cursor`` to where the scan can
+    resume. ``deadline_reached`` tells the caller the result is partial.
+    """
+
+    def __init__(
+        self,
+        report: ProgressCallback | None = None,
+        deadline_seconds: float = 0,
+    ) -> None:
+        self._report = report
+        self._deadline = (
+            time.monotonic() + deadline_seconds if deadline_seconds > 0 else None
+        )
+        self.deadline_reached = False
+        self.cursor: str | None = None
+
+    def page_done(
+        self, done: float, total: float | None = None, message: str | None = None
+    ) -> None:
+        """Report progress after an upstream page; never raises."""
+        if self._report is None:
+            return
+        try:
+            self._report(done, total, message)
+        except Exception:  # noqa: BLE001 - progress must not fail the fetch
+            logger.debug("Progress report failed", exc_info=True)
+
+    def should_stop(self, cursor: str | int | None) -> bool:
+        """Return True, recording *cursor*, once the deadline has passed.
+
+        Call before fetching the next page; *cursor* is where that page
+        starts. A scan with nothing left to fetch is never cut short.
+        """
+        if cursor is None or self._deadline is None:
+            return False
+        if time.monotonic() < self._deadline:
+            return False
+        self.deadline_reached = True
+        self.cursor = str(cursor)
+        return True
@@ -0,0 +1,165 @@
+"""Loading of user-supplied ``AsyncKeyValue`` storage factories.
+
+Several pluggable stores (OAuth client storage, the shared response cache) are
+configured the same way: an import path ``<module.path>:<callable>`` plus an
+optional JSON object passed to the callable. The env var names are passed in so
+that error messages point at the setting the operator actually used.
+"""
+
+from __future__ import annotations
+
+import inspect
+import json
+from collections.abc import Callable
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, cast
+
+if TYPE_CHECKING:
+    from key_value.aio.protocols import AsyncKeyValue
+else:
+    AsyncKeyValue = Any
+
+REQUIRED_STORAGE_METHODS = (
+    "get",
+    "put",
+    "delete",
+    "ttl",
+    "get_many",
+    "put_many",
+    "delete_many",
+    "ttl_many",
+)
+
+
+def load_storage_factory(
+    import_path: str, factory_env: str
+) -> Callable[..., AsyncKeyValue]:
+    """Resolve ``<module.path>:<callable>`` read from ``factory_env``."""
+    module_path, separator, attribute_name = import_path.partition(":")
+    if not separator or not module_path or not attribute_name:
+        raise ValueError(
+            f"Invalid {factory_env}='{import_path}'. "
+            "Expected '<module.path>:<callable>'."
+        )
+
+    try:
+        module = import_module(module_path)
+    except Exception as exc:
+        raise ValueError(
+            f"Unable to import module '{module_path}' from "
+            f"{factory_env}='{import_path}'."
+        ) from exc
+
+    factory = getattr(module, attribute_name, None)
+    if not callable(factory):
+        raise ValueError(
+            f"{factory_env}='{import_path}' does not resolve to a callable."
+        )
+    return cast(Callable[..., AsyncKeyValue], factory)
+
+
+def parse_factory_config(raw_json: str, config_env: str) -> dict[str, Any] | None:
+    """Parse the optional JSON object read from ``config_env``."""
+    stripped = raw_json.strip()
+    if not stripped:
+        return None
+
+    try:
+        parsed = json.loads(stripped)
+    except json.JSONDecodeError as exc:
+        raise ValueError(f"{config_env} must be valid JSON.") from exc
+
+    if not isinstance(parsed, dict):
+        raise ValueError(f"{config_env} must decode to a JSON object.")
+
+    return parsed
+
+
+def validate_storage_candidate(storage: object, description: str) -> None:
+    """Check that ``storage`` implements the ``AsyncKeyValue`` methods we use."""
+    # Keep validation lightweight and interface-oriented.
+    missing = [
+        method
+        for method in REQUIRED_STORAGE_METHODS
+        if not callable(getattr(storage, method, None))
+    ]
+    if missing:
+        raise ValueError(
+            f"{description} factory returned an incompatible object. "
+            f"Missing methods: {', '.join(missing)}"
+        )
+
+
+def invoke_storage_factory(
+    factory: Callable[..., AsyncKeyValue],
+    config: dict[str, Any] | None,
+    factory_env: str,
+) -> AsyncKeyValue:
+    """Call ``factory``, passing ``config`` the way its signature accepts it."""
+    if config is None:
+        return factory()
+
+    try:
+        signature = inspect.signature(factory)
+    except (TypeError, ValueError):
+        # Some callables may not expose an introspectable signature.
+        return factory(config)
+
+    params = signature.parameters
+    if any(param.kind == inspect.Parameter.VAR_KEYWORD for param in params.values()):
+        return factory(config=config)
+
+    config_param = params.get("config")
+    if config_param and config_param.kind in (
+        inspect.Parameter.POSITIONAL_OR_KEYWORD,
+        inspect.Parameter.KEYWORD_ONLY,
+    ):
+        return factory(config=config)
+
+    if any(
+        param.kind
+        in (
+            inspect.Parameter.POSITIONAL_ONLY,
+            inspect.Parameter.POSITIONAL_OR_KEYWORD,
+            inspect.Parameter.VAR_POSITIONAL,
+        )
+        for param in params.values()
+    ):
+        return factory(config)
+
+    factory_module = getattr(factory, "__module__", "<unknown-module>")
+    factory_name = getattr(factory, "__name__", factory.__class__.__name__)
+    raise ValueError(
+        f"{factory_env}='{factory_module}:{factory_name}' "
+        "does not accept a configuration argument."
+    )
+
+
+def build_storage_from_factory_env(
+    factory_env: str,
+    config_env: str,
+    description: str,
+    import_path: str,
+    raw_config: str,
+) -> AsyncKeyValue:
+    """Load, invoke and validate a storage factory.
+
+    Args:
+        factory_env: Env var the import path was read from (for messages).
+        config_env: Env var the JSON config was read from (for messages).
+        description: Human readable store name, e.g. ``"OAuth client storage"``.
+        import_path: ``<module.path>:<callable>``.
+        raw_config: Raw JSON config; empty means "call without arguments".
+    """
+    config = parse_factory_config(raw_config, config_env)
+    factory = load_storage_factory(import_path, factory_env)
+
+    try:
+        storage = invoke_storage_factory(factory, config, factory_env)
+    except Exception as exc:
+        raise ValueError(
+            f"Failed to create {description} from {factory_env}='{import_path}': {exc}"
+        ) from exc
+
+    validate_storage_candidate(storage, description)
+    return storage
@@ -0,0 +1,231 @@
+"""Tests for the local Confluence page index."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mcp_atlassian.confluence import local_index as index_module
+from mcp_atlassian.confluence.local_index import (
+    LOCAL_INDEX_PATH_ENV,
+    LOCAL_INDEX_SPACES_ENV,
+    LOCAL_INDEX_SYNC_INTERVAL_ENV,
+    LocalIndexMixin,
+)
+from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
+from mcp_atlassian.models.confluence import ConfluencePage
+
+
+def _page(page_id: str, title: str, body: str) -> ConfluencePage:
+    return ConfluencePage(
+        id=page_id,
+        title=title,
+        content=body,
+        url=f"https://wiki.example.com/pages/{page_id}",
+    )
+
+
+class TestLocalIndex:
+    """Tests for LocalIndexMixin and PageIndex."""
+
+    @pytest.fixture
+    def clock(self, monkeypatch: pytest.MonkeyPatch) -> list[float]:
+        clock = [1_700_000_000.0]
+        monkeypatch.setattr(index_module.time, "time", lambda: clock[0])
+        return clock
+
+    @pytest.fixture
+    def mixin(self, monkeypatch: pytest.MonkeyPatch, tmp_path, clock):
+        monkeypatch.setenv(LOCAL_INDEX_SPACES_ENV, "OPS,DEV")
+        monkeypatch.setenv(LOCAL_INDEX_PATH_ENV, str(tmp_path / "index.sqlite3"))
+        monkeypatch.delenv(LOCAL_INDEX_SYNC_INTERVAL_ENV, raising=False)
+        index_module._reset_page_index_for_tests()
+        with patch(
+            "mcp_atlassian.confluence.pages.ConfluenceClient.__init__"
+        ) as mock_init:
+            mock_init.return_value = None
+            mixin = LocalIndexMixin()
+        mixin.config = MagicMock(url="https://wiki.example.com", username="a")
+        # Server-side state: page id -> (version, page)
+        mixin.server = {
+            "1": (1, _page("1", "Deploy runbook", "Restart the payment service.")),
+            "2": (3, _page("2", "Team notes", "The runbook moved last week.")),
+        }
+        mixin.iter_space_pages = MagicMock(
+            side_effect=lambda space, expand: iter(
+                {"id": page_id, "version": {"number": version, "when": "2024-05-01"}}
+                for page_id, (version, _) in mixin.server.items()
+            )
+        )
+        mixin.get_page_content = MagicMock(
+            side_effect=lambda page_id: mixin.server[page_id][1]
+        )
+        mixin.confluence = MagicMock()
+        mixin.confluence.get_all_pages_from_space.side_effect = (
+            lambda space, start, limit, expand: [
+                {
+                    "id": page.id,
+                    "title": page.title,
+                    "body": {"storage": {"value": page.content}},
+                }
+                for _, page in list(mixin.server.values())[start : start + limit]
+            ]
+        )
+        mixin.preprocessor = MagicMock()
+        mixin.preprocessor.process_html_content.side_effect = lambda html, **kwargs: (
+            html,
+            html,
+        )
+        yield mixin
+        index_module._reset_page_index_for_tests()
+
+    def test_disabled_without_spaces(
+        self, mixin: LocalIndexMixin, monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.delenv(LOCAL_INDEX_SPACES_ENV)
+
+        with pytest.raises(ValueError, match=LOCAL_INDEX_SPACES_ENV):
+            mixin.local_search("runbook")
+
+    def test_rejects_spaces_not_indexed(self, mixin: LocalIndexMixin):
+        with pytest.raises(ValueError, match="Spaces not indexed: HR"):
+            mixin.local_search("runbook", spaces=["OPS", "HR"])
+
+    def test_search_ranks_title_matches_first(self, mixin: LocalIndexMixin):
+        result = mixin.local_search("runbook", spaces=["OPS"])
+
+        assert result["sync"] == {"OPS": {"skipped": False, "indexed": 2, "removed": 0}}
+        assert [page["id"] for page in result["results"]] == ["1", "2"]
+        assert result["results"][0]["snippet"] == "Deploy [runbook]"
+        assert result["results"][1] == {
+            "id": "2",
+            "space": "OPS",
+            "title": "Team notes",
+            "url": "https://wiki.example.com/pages/2",
+            "version": 3,
+            "last_modified": "2024-05-01",
+            "snippet": "The [runbook] moved last week.",
+            "freshness": {
+                "indexed_at": "2023-11-14T22:13:20+00:00",
+                "synced_at": "2023-11-14T22:13:20+00:00",
+                "age_seconds": 0,
+            },
+        }
+        mixin.iter_space_pages.assert_called_once_with("OPS", expand="version")
+
+    def test_sync_refetches_only_changed_pages(
+        self, mixin: LocalIndexMixin, clock: list[float]
+    ):
+        mixin.sync_local_index(["OPS"])
+        mixin.get_page_content.reset_mock()
+
+        clock[0] += 60
+        assert mixin.local_search("payment", spaces=["OPS"])["sync"]["OPS"] == {
+            "skipped": True,
+            "indexed": 0,
+            "removed": 0,
+        }
+
+        clock[0] += 600
+        mixin.server["2"] = (4, _page("2", "Team notes", "Payment outage recap."))
+        del mixin.server["1"]
+        mixin.server["3"] = (1, _page("3", "Payment FAQ", "Refund questions."))
+        result = mixin.local_search("payment", spaces=["OPS"])
+
+        assert result["sync"]["OPS"] == {"skipped": False, "indexed": 2, "removed": 1}
+        assert sorted(
+            call.args[0] for call in mixin.get_page_content.call_args_list
+        ) == ["2", "3"]
+        assert [page["id"] for page in result["results"]] == ["3", "2"]
+
+    def test_many_changes_are_fetched_in_bulk(self, mixin: LocalIndexMixin):
+        mixin.server = {
+            str(n): (1, _page(str(n), f"Page {n}", "Shared body"))
+            for n in range(index_module.BULK_REFRESH_THRESHOLD + 5)
+        }
+
+        report = mixin.sync_local_index(["OPS"])
+
+        assert report["OPS"]["indexed"] == index_module.BULK_REFRESH_THRESHOLD + 5
+        assert mixin.local_search("page 7", refresh=False)["results"][0]["id"] == "7"
+        mixin.get_page_content.assert_not_called()
+        assert [
+            call.kwargs["start"]
+            for call in mixin.confluence.get_all_pages_from_space.call_args_list
+        ] == [0, 25, 30]
+
+    def test_bulk_refresh_converts_only_changed_pages(self, mixin: LocalIndexMixin):
+        mixin.server = {
+            str(n): (1, _page(str(n), f"Page {n}", "Shared body")) for n in range(200)
+        }
+        mixin.sync_local_index(["OPS"])
+        mixin.preprocessor.process_html_content.reset_mock()
+        for n in range(30):
+            mixin.server[str(n)] = (2, _page(str(n), f"Page {n}", "Edited body"))
+
+        report = mixin.sync_local_index(["OPS"])
+
+        assert report["OPS"]["indexed"] == 30
+        assert mixin.preprocessor.process_html_content.call_count == 30
+        mixin.get_page_content.assert_not_called()
+
+    def test_few_changes_in_a_large_space_are_fetched_per_page(
+        self, mixin: LocalIndexMixin
+    ):
+        mixin.server = {
+            str(n): (1, _page(str(n), f"Page {n}", "Shared body")) for n in range(2000)
+        }
+        mixin.sync_local_index(["OPS"])
+        mixin.confluence.get_all_pages_from_space.reset_mock()
+        for n in range(30):
+            mixin.server[str(n)] = (2, _page(str(n), f"Page {n}", "Edited body"))
+
+        report = mixin.sync_local_index(["OPS"])
+
+        assert report["OPS"]["indexed"] == 30
+        assert mixin.get_page_content.call_count == 30
+        mixin.confluence.get_all_pages_from_space.assert_not_called()
+
+    def test_rows_are_scoped_to_the_credential(self, mixin: LocalIndexMixin):
+        mixin.sync_local_index(["OPS"])
+
+        mixin.config = MagicMock(url="https://wiki.example.com", username="b")
+
+        assert mixin.local_search("runbook", refresh=False)["results"] == []
+
+    def test_failed_sync_falls_back_to_index(
+        self, mixin: LocalIndexMixin, clock: list[float]
+    ):
+        mixin.sync_local_index(["OPS"])
+        clock[0] += 3600
+        mixin.iter_space_pages.side_effect = ConnectionError("Confluence timed out")
+
+        result = mixin.local_search("runbook", spaces=["OPS"])
+
+        assert result["sync_error"] == "Confluence timed out"
+        assert result["results"][0]["freshness"]["age_seconds"] == 3600
+
+    def test_auth_errors_are_raised(self, mixin: LocalIndexMixin):
+        mixin.get_page_content.side_effect = MCPAtlassianAuthenticationError("401")
+
+        with pytest.raises(MCPAtlassianAuthenticationError):
+            mixin.local_search("runbook")
+
+    def test_running_sync_does_not_block_other_searches(self, mixin: LocalIndexMixin):
+        listing = mixin.iter_space_pages.side_effect
+        nested: dict = {}
+
+        def scan(space, expand):
+            if space == "OPS" and not nested:
+                # While OPS is being listed, another call syncs OPS and DEV:
+                # OPS is reported as in progress, DEV still syncs.
+                nested.update(mixin.local_search("runbook"))
+            return listing(space, expand)
+
+        mixin.iter_space_pages.side_effect = scan
+
+        outer = mixin.sync_local_index()
+
+        assert outer["OPS"]["indexed"] == 2
+        assert nested["sync"]["OPS"]["in_progress"] is True
+        assert nested["sync"]["DEV"]["indexed"] == 2
+        assert len(nested["results"]) == 2
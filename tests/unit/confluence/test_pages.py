@@ -9,6 +9,9 @@ from requests.exceptions import ConnectionError, HTTPError
 from mcp_atlassian.confluence.pages import PagesMixin
 from mcp_atlassian.confluence.utils import extract_emoji_from_property
 from mcp_atlassian.models.confluence import ConfluencePage
+from mcp_atlassian.utils import progress as progress_module
+from mcp_atlassian.utils.cache import config_cache_scope
+from mcp_atlassian.utils.progress import PageProgress
 
 
 class TestPagesMixin:
@@ -961,6 +964,7 @@ class TestPagesMixin:
         adapter_cls.assert_called_once_with(
             session=pages_mixin.confluence._session,
             base_url="https://example.atlassian.net/wiki",
+            cache_scope=config_cache_scope(pages_mixin.config),
         )
         mock_v2_adapter.get_page_direct_children.assert_called_once_with(
             page_id=parent_id,
@@ -3649,6 +3653,79 @@ class TestPageHierarchy:
         assert result["total_pages"] == 1
         assert result["has_more"] is False
 
+    def test_get_space_page_tree_reports_and_stops_at_deadline(
+        self, pages_mixin, monkeypatch
+    ):
+        """Past the deadline the tree so far is returned with next_start."""
+        batches = [
+            self._raw_response(
+                [{"id": str(i), "title": f"Page {i}", "ancestors": []}],
+                next_link=f"/next?start={i + 1}",
+            )
+            for i in range(3)
+        ]
+        raw = MagicMock(side_effect=batches)
+        pages_mixin.confluence.get_all_pages_from_space_raw = raw
+        clock = [0.0]
+        monkeypatch.setattr(progress_module.time, "monotonic", lambda: clock[0])
+        reports = []
+
+        def report(done, total, message):
+            reports.append((done, total))
+            if done == 2:
+                clock[0] = 10.0
+
+        progress = PageProgress(report, deadline_seconds=5)
+
+        result = pages_mixin.get_space_page_tree(
+            "TEST", limit=10, start=20, progress=progress
+        )
+
+        assert [page["id"] for page in result["pages"]] == ["0", "1"]
+        assert result["has_more"] is True
+        assert result["next_start"] == 22
+        assert progress.deadline_reached is True
+        assert reports == [(1, 10), (2, 10)]
+        assert [call.kwargs["start"] for call in raw.call_args_list] == [20, 21]
+
+    def test_iter_space_pages_fetches_batches_lazily(self, pages_mixin):
+        """Each batch is requested only when the caller reaches it."""
+        batches = [
+            self._raw_response(
+                [{"id": str(i)} for i in range(2)], next_link="/next?start=2"
+            ),
+            self._raw_response(
+                [{"id": str(i)} for i in range(2, 4)], next_link="/next?start=4"
+            ),
+            self._raw_response([{"id": "4"}]),
+        ]
+        raw = MagicMock(side_effect=batches)
+        pages_mixin.confluence.get_all_pages_from_space_raw = raw
+
+        pages = pages_mixin.iter_space_pages("TEST", page_size=2)
+
+        assert next(pages)["id"] == "0"
+        assert raw.call_count == 1
+        assert [page["id"] for page in pages] == ["1", "2", "3", "4"]
+        assert [call.kwargs["start"] for call in raw.call_args_list] == [0, 2, 4]
+        assert raw.call_args.kwargs["expand"] == "ancestors"
+
+    def test_iter_space_pages_respects_limit_and_start(self, pages_mixin):
+        """limit bounds the request sizes; start offsets the first request."""
+        raw = MagicMock(
+            return_value=self._raw_response(
+                [{"id": str(i)} for i in range(3)], next_link="/next"
+            )
+        )
+        pages_mixin.confluence.get_all_pages_from_space_raw = raw
+
+        pages = list(
+            pages_mixin.iter_space_pages("TEST", limit=3, start=10, expand=None)
+        )
+
+        assert len(pages) == 3
+        raw.assert_called_once_with(space="TEST", start=10, limit=3, expand=None)
+
 
 class TestUpdatePageSection:
     """Tests for PagesMixin.update_page_section."""
@@ -3806,3 +3883,103 @@ class TestUpdatePageSection:
             )
 
         pages_mixin.preprocessor.markdown_to_confluence_storage.assert_not_called()
+
+
+class TestPageContentCache:
+    """Tests for the version-aware page content cache."""
+
+    PAGE_ID = "987654321"
+
+    @pytest.fixture
+    def pages_mixin(self, confluence_client, monkeypatch):
+        from mcp_atlassian.confluence import pages as pages_module
+        from mcp_atlassian.utils.cache import ResponseCache
+
+        monkeypatch.setattr(
+            pages_module,
+            "_page_content_cache",
+            ResponseCache("test.page_content", ttl=60, maxsize=16),
+        )
+        monkeypatch.setattr(
+            pages_module,
+            "_page_not_found_cache",
+            ResponseCache("test.page_not_found", ttl=60, maxsize=16),
+        )
+        with patch(
+            "mcp_atlassian.confluence.pages.ConfluenceClient.__init__"
+        ) as mock_init:
+            mock_init.return_value = None
+            mixin = PagesMixin()
+            mixin.confluence = confluence_client.confluence
+            mixin.config = confluence_client.config
+            mixin.preprocessor = confluence_client.preprocessor
+            return mixin
+
+    def _body_fetches(self, pages_mixin) -> int:
+        return sum(
+            1
+            for call in pages_mixin.confluence.get_page_by_id.call_args_list
+            if "body.storage" in call.kwargs.get("expand", "")
+        )
+
+    def test_unchanged_version_skips_body_fetch(self, pages_mixin):
+        first = pages_mixin.get_page_content(self.PAGE_ID)
+        second = pages_mixin.get_page_content(self.PAGE_ID)
+
+        assert self._body_fetches(pages_mixin) == 1
+        pages_mixin.confluence.get_page_by_id.assert_called_with(
+            page_id=self.PAGE_ID, expand="version"
+        )
+        assert second.content == first.content
+        assert second.title == first.title
+        assert second.version.number == first.version.number
+        assert pages_mixin.preprocessor.process_html_content.call_count == 1
+
+    def test_new_version_refetches(self, pages_mixin):
+        pages_mixin.get_page_content(self.PAGE_ID)
+        page = dict(pages_mixin.confluence.get_page_by_id.return_value)
+        page["version"] = {**page["version"], "number": 2}
+        pages_mixin.confluence.get_page_by_id.return_value = page
+
+        result = pages_mixin.get_page_content(self.PAGE_ID)
+
+        assert self._body_fetches(pages_mixin) == 2
+        assert result.version.number == 2
+
+    def test_formats_are_cached_separately(self, pages_mixin):
+        pages_mixin.get_page_content(self.PAGE_ID, convert_to_markdown=True)
+        pages_mixin.get_page_content(self.PAGE_ID, convert_to_markdown=False)
+
+        assert self._body_fetches(pages_mixin) == 2
+
+    def test_invalidation_drops_entry(self, pages_mixin):
+        from mcp_atlassian.utils.cache import CONFLUENCE_PAGE, publish_invalidation
+
+        pages_mixin.get_page_content(self.PAGE_ID)
+        publish_invalidation(CONFLUENCE_PAGE, self.PAGE_ID)
+        pages_mixin.get_page_content(self.PAGE_ID)
+
+        assert self._body_fetches(pages_mixin) == 2
+
+    def test_not_found_is_cached(self, pages_mixin):
+        response = MagicMock(status_code=404)
+        pages_mixin.confluence.get_page_by_id.side_effect = ApiError(
+            "Page not found", reason=HTTPError(response=response)
+        )
+
+        with pytest.raises(Exception, match="Page not found") as first:
+            pages_mixin.get_page_content(self.PAGE_ID)
+        with pytest.raises(Exception, match="Page not found") as second:
+            pages_mixin.get_page_content(self.PAGE_ID)
+
+        assert str(first.value) == str(second.value)
+        assert pages_mixin.confluence.get_page_by_id.call_count == 1
+
+    def test_other_errors_are_not_cached(self, pages_mixin):
+        pages_mixin.confluence.get_page_by_id.side_effect = ApiError("boom")
+
+        for _ in range(2):
+            with pytest.raises(Exception, match="boom"):
+                pages_mixin.get_page_content(self.PAGE_ID)
+
+        assert pages_mixin.confluence.get_page_by_id.call_count == 2
@@ -6,7 +6,9 @@ import pytest
 import requests
 from requests.exceptions import HTTPError
 
+from mcp_atlassian.confluence import v2_adapter as v2_adapter_module
 from mcp_atlassian.confluence.v2_adapter import ConfluenceV2Adapter
+from mcp_atlassian.utils.cache import ResponseCache
 
 
 class TestConfluenceV2Adapter:
@@ -93,6 +95,17 @@ class TestConfluenceV2Adapter:
         with pytest.raises(ValueError, match="Failed to get page '999999'"):
             v2_adapter.get_page("999999")
 
+    def test_get_page_version_omits_body(self, v2_adapter, mock_session):
+        """Version lookups request the page without a body format."""
+        mock_response = Mock()
+        mock_response.json.return_value = {"id": "123456", "version": {"number": 7}}
+        mock_session.get.return_value = mock_response
+
+        assert v2_adapter.get_page_version("123456") == 7
+        mock_session.get.assert_called_once_with(
+            "https://example.atlassian.net/wiki/api/v2/pages/123456"
+        )
+
     def test_get_page_with_minimal_response(self, v2_adapter, mock_session):
         """Test page retrieval with minimal v2 response."""
         # Mock the v2 API response without optional fields
@@ -352,6 +365,32 @@ class TestConfluenceV2Adapter:
         assert "/wiki/wiki/" not in url, f"Double /wiki in URL: {url}"
         assert url.endswith(expected_path), f"Expected {expected_path}, got {url}"
 
+    def test_space_id_cache_is_scoped_to_credential(self, mock_session, monkeypatch):
+        """Space IDs looked up by one credential are not served to another."""
+        monkeypatch.setattr(
+            v2_adapter_module,
+            "_space_id_cache",
+            ResponseCache("test.space_ids", ttl=60, maxsize=16),
+        )
+        response = Mock()
+        response.json.return_value = {"results": [{"id": "789"}]}
+        mock_session.get.return_value = response
+        base_url = "https://example.atlassian.net/wiki"
+
+        alice = ConfluenceV2Adapter(mock_session, base_url, cache_scope="alice")
+        assert alice._get_space_id("TEST") == "789"
+        assert alice._get_space_id("TEST") == "789"
+        assert mock_session.get.call_count == 1
+
+        bob = ConfluenceV2Adapter(mock_session, base_url, cache_scope="bob")
+        assert bob._get_space_id("TEST") == "789"
+        assert mock_session.get.call_count == 2
+
+        unscoped = ConfluenceV2Adapter(mock_session, base_url)
+        unscoped._get_space_id("TEST")
+        unscoped._get_space_id("TEST")
+        assert mock_session.get.call_count == 4
+
 
 class TestConfluenceV2AdapterComments:
     """Tests for v2 adapter comment operations."""
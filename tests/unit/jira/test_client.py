@@ -10,6 +10,8 @@ from requests.sessions import Session
 
 from mcp_atlassian.jira.client import JiraClient
 from mcp_atlassian.jira.config import JiraConfig
+from mcp_atlassian.utils import progress as progress_module
+from mcp_atlassian.utils.progress import PageProgress
 from mcp_atlassian.utils.ssl import NoProxyAdapter
 
 
@@ -346,6 +348,36 @@ def test_get_paged_post():
     _test_get_paged("post")
 
 
+def test_get_paged_stops_at_deadline(monkeypatch):
+    """Past the deadline, paging stops and the next token becomes the cursor."""
+    with (
+        patch("mcp_atlassian.jira.client.Jira.post") as mock_post,
+        patch("mcp_atlassian.jira.client.configure_ssl_verification"),
+    ):
+        config = JiraConfig(
+            url="https://test.atlassian.net",
+            auth_type="basic",
+            username="test_username",
+            api_token="test_token",
+        )
+        client = JiraClient(config=config)
+        mock_post.side_effect = [
+            {"data": "page1", "nextPageToken": "token1"},
+            {"data": "page2"},
+        ]
+        clock = [0.0]
+        monkeypatch.setattr(progress_module.time, "monotonic", lambda: clock[0])
+        reports = []
+        progress = PageProgress(lambda *args: reports.append(args), deadline_seconds=5)
+        clock[0] = 10.0
+
+        results = client.get_paged("post", "/test/url", {}, progress=progress)
+
+        assert results == [{"data": "page1", "nextPageToken": "token1"}]
+        assert progress.cursor == "token1"
+        assert reports == [(1, None, "Fetched 1 pages")]
+
+
 def test_get_paged_without_cloud():
     """Test the get_paged method without cloud."""
     with patch("mcp_atlassian.jira.client.configure_ssl_verification"):
@@ -1797,6 +1797,38 @@ class TestIssuesMixin:
         assert result == []
         assert not issues_mixin.jira.create_issues.called
 
+    def test_batch_create_issues_converts_repeated_description_once(
+        self, issues_mixin: IssuesMixin
+    ):
+        """Identical descriptions in one batch are converted only once."""
+        issues = [
+            {
+                "project_key": "TEST",
+                "summary": f"Issue {index}",
+                "issue_type": "Task",
+                "description": "Shared **template**" if index < 3 else "Other",
+            }
+            for index in range(4)
+        ]
+        issues_mixin.jira.create_issues.return_value = {"issues": [], "errors": []}
+
+        with patch.object(
+            issues_mixin, "_markdown_to_jira", side_effect=lambda text: f"wiki:{text}"
+        ) as convert:
+            issues_mixin.batch_create_issues(issues)
+
+        assert [call.args[0] for call in convert.call_args_list] == [
+            "Shared **template**",
+            "Other",
+        ]
+        payload = issues_mixin.jira.create_issues.call_args[0][0]
+        assert [item["fields"]["description"] for item in payload] == [
+            "wiki:Shared **template**",
+            "wiki:Shared **template**",
+            "wiki:Shared **template**",
+            "wiki:Other",
+        ]
+
     def test_batch_create_issues_with_components(self, issues_mixin: IssuesMixin):
         """Test batch_create_issues with component handling."""
         # Setup test data with various component formats
@@ -2105,6 +2137,7 @@ class TestIssuesMixin:
                 "fieldIds": ["Parent"],
                 "issueIdsOrKeys": ["TEST-1", "TEST-2"],
             },
+            progress=None,
         )
 
     def test_create_issue_with_labels(self, issues_mixin: IssuesMixin, make_issue_data):
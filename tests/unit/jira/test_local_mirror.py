@@ -0,0 +1,203 @@
+"""Tests for the local full-text issue mirror."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
+from mcp_atlassian.jira import JiraFetcher
+from mcp_atlassian.jira import local_mirror as mirror_module
+from mcp_atlassian.jira.local_mirror import (
+    LOCAL_MIRROR_PATH_ENV,
+    LOCAL_MIRROR_PROJECTS_ENV,
+    LOCAL_MIRROR_SYNC_INTERVAL_ENV,
+)
+from mcp_atlassian.models.jira import JiraIssue, JiraSearchResult
+from mcp_atlassian.models.jira.comment import JiraComment
+from mcp_atlassian.models.jira.common import JiraStatus, JiraUser
+
+
+def _issue(key: str, summary: str, **kwargs) -> JiraIssue:
+    return JiraIssue(key=key, summary=summary, updated="2024-05-01T10:00:00", **kwargs)
+
+
+class TestLocalMirror:
+    """Tests for LocalMirrorMixin and IssueMirror."""
+
+    @pytest.fixture
+    def clock(self, monkeypatch: pytest.MonkeyPatch) -> list[float]:
+        clock = [1_700_000_000.0]
+        monkeypatch.setattr(mirror_module.time, "time", lambda: clock[0])
+        return clock
+
+    @pytest.fixture
+    def fetcher(
+        self, jira_fetcher: JiraFetcher, monkeypatch: pytest.MonkeyPatch, tmp_path
+    ) -> JiraFetcher:
+        monkeypatch.setenv(LOCAL_MIRROR_PROJECTS_ENV, "test, other")
+        monkeypatch.setenv(LOCAL_MIRROR_PATH_ENV, str(tmp_path / "mirror.sqlite3"))
+        monkeypatch.delenv(LOCAL_MIRROR_SYNC_INTERVAL_ENV, raising=False)
+        mirror_module._reset_issue_mirror_for_tests()
+        jira_fetcher.config = MagicMock(url="https://jira.example.com", username="a")
+        jira_fetcher.pages = {"TEST": [], "OTHER": []}
+        jira_fetcher.iter_search_pages = MagicMock(
+            side_effect=lambda jql, fields: iter(
+                [JiraSearchResult(issues=jira_fetcher.pages[jql.split('"')[1]])]
+            )
+        )
+        yield jira_fetcher
+        mirror_module._reset_issue_mirror_for_tests()
+
+    def test_disabled_without_projects(
+        self, fetcher: JiraFetcher, monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.delenv(LOCAL_MIRROR_PROJECTS_ENV)
+
+        with pytest.raises(ValueError, match=LOCAL_MIRROR_PROJECTS_ENV):
+            fetcher.local_search("login")
+
+    def test_rejects_projects_not_mirrored(self, fetcher: JiraFetcher):
+        with pytest.raises(ValueError, match="Projects not mirrored: NOPE"):
+            fetcher.local_search("login", projects=["test", "nope"])
+
+    def test_first_search_loads_and_ranks_matches(
+        self, fetcher: JiraFetcher, clock: list[float]
+    ):
+        fetcher.pages["TEST"] = [
+            _issue(
+                "TEST-1",
+                "Dashboard is slow",
+                description="The login page loads fine.",
+                status=JiraStatus(name="Open"),
+            ),
+            _issue("TEST-2", "Login fails on Safari", status=JiraStatus(name="Done")),
+            _issue(
+                "TEST-3",
+                "Unrelated",
+                comments=[JiraComment(body="Could be the logging config")],
+            ),
+        ]
+
+        result = fetcher.local_search("login", projects=["test"])
+
+        assert result["sync"] == {"TEST": {"mode": "full", "written": 3, "removed": 0}}
+        assert [issue["key"] for issue in result["issues"]] == ["TEST-2", "TEST-1"]
+        assert result["issues"][0]["snippet"] == "[Login] fails on Safari"
+        assert result["issues"][1]["freshness"] == {
+            "mirrored_at": "2023-11-14T22:13:20+00:00",
+            "synced_at": "2023-11-14T22:13:20+00:00",
+            "age_seconds": 0,
+        }
+        fetcher.iter_search_pages.assert_called_once_with(
+            'project = "TEST" ORDER BY key ASC', fields=mirror_module._MIRROR_FIELDS
+        )
+
+    def test_prefix_and_filters(self, fetcher: JiraFetcher, clock: list[float]):
+        fetcher.pages["TEST"] = [
+            _issue(
+                "TEST-1",
+                "Logging noise",
+                status=JiraStatus(name="In Progress"),
+                assignee=JiraUser(display_name="Ada Lovelace"),
+            ),
+            _issue("TEST-2", "Login fails", status=JiraStatus(name="Done")),
+        ]
+
+        prefix = fetcher.local_search("log*")
+        filtered = fetcher.local_search(
+            "", status="in progress", assignee="ada lovelace"
+        )
+
+        assert {issue["key"] for issue in prefix["issues"]} == {"TEST-1", "TEST-2"}
+        assert [issue["key"] for issue in filtered["issues"]] == ["TEST-1"]
+        assert "snippet" not in filtered["issues"][0]
+
+    def test_later_syncs_fetch_only_updated_issues(
+        self, fetcher: JiraFetcher, clock: list[float]
+    ):
+        fetcher.pages["TEST"] = [_issue("TEST-1", "Login fails")]
+        fetcher.sync_local_mirror(["TEST"])
+
+        clock[0] += 60
+        assert fetcher.local_search("login", projects=["TEST"])["sync"] == {
+            "TEST": {"mode": "skipped", "written": 0, "removed": 0}
+        }
+
+        clock[0] += 600
+        fetcher.pages["TEST"] = [_issue("TEST-1", "Checkout fails")]
+        result = fetcher.local_search("checkout", projects=["TEST"])
+
+        assert result["sync"]["TEST"]["mode"] == "delta"
+        assert fetcher.iter_search_pages.call_args.args[0] == (
+            'project = "TEST" AND updated >= -12m ORDER BY key ASC'
+        )
+        assert [issue["key"] for issue in result["issues"]] == ["TEST-1"]
+        assert fetcher.local_search("login", refresh=False)["issues"] == []
+        assert result["issues"][0]["freshness"]["age_seconds"] == 0
+
+    def test_daily_full_sync_drops_deleted_issues(
+        self, fetcher: JiraFetcher, clock: list[float]
+    ):
+        fetcher.pages["TEST"] = [_issue("TEST-1", "Login"), _issue("TEST-2", "Login")]
+        fetcher.sync_local_mirror(["TEST"])
+
+        clock[0] += mirror_module.FULL_RESYNC_SECONDS
+        fetcher.pages["TEST"] = [_issue("TEST-2", "Login")]
+        report = fetcher.sync_local_mirror(["TEST"])
+
+        assert report["TEST"] == {"mode": "full", "written": 1, "removed": 1}
+        keys = [
+            i["key"] for i in fetcher.local_search("login", refresh=False)["issues"]
+        ]
+        assert keys == ["TEST-2"]
+
+    def test_rows_are_scoped_to_the_credential(
+        self, fetcher: JiraFetcher, clock: list[float]
+    ):
+        fetcher.pages["TEST"] = [_issue("TEST-1", "Secret login plan")]
+        fetcher.sync_local_mirror(["TEST"])
+
+        fetcher.config = MagicMock(url="https://jira.example.com", username="b")
+
+        assert fetcher.local_search("login", refresh=False)["issues"] == []
+
+    def test_failed_sync_falls_back_to_mirror(
+        self, fetcher: JiraFetcher, clock: list[float]
+    ):
+        fetcher.pages["TEST"] = [_issue("TEST-1", "Login fails")]
+        fetcher.sync_local_mirror(["TEST"])
+        clock[0] += 3600
+        fetcher.iter_search_pages.side_effect = ConnectionError("Jira unreachable")
+
+        result = fetcher.local_search("login", projects=["TEST"])
+
+        assert result["sync_error"] == "Jira unreachable"
+        assert result["issues"][0]["freshness"]["age_seconds"] == 3600
+
+    def test_auth_errors_are_raised(self, fetcher: JiraFetcher, clock: list[float]):
+        fetcher.iter_search_pages.side_effect = MCPAtlassianAuthenticationError("401")
+
+        with pytest.raises(MCPAtlassianAuthenticationError):
+            fetcher.local_search("login")
+
+    def test_running_sync_does_not_block_other_searches(
+        self, fetcher: JiraFetcher, clock: list[float]
+    ):
+        fetcher.pages["OTHER"] = [_issue("OTHER-1", "Login works")]
+        nested: dict = {}
+
+        def scan(jql, fields):
+            if jql.startswith('project = "TEST"') and not nested:
+                # While TEST is being scanned, another call syncs TEST and
+                # OTHER: TEST is reported as in progress, OTHER still syncs.
+                nested.update(fetcher.local_search("login"))
+            return iter([JiraSearchResult(issues=fetcher.pages[jql.split('"')[1]])])
+
+        fetcher.iter_search_pages.side_effect = scan
+
+        outer = fetcher.sync_local_mirror()
+
+        assert outer["TEST"]["mode"] == "full"
+        assert nested["sync"]["TEST"]["mode"] == "in_progress"
+        assert nested["sync"]["OTHER"]["mode"] == "full"
+        assert [issue["key"] for issue in nested["issues"]] == ["OTHER-1"]
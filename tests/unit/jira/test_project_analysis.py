@@ -15,6 +15,8 @@ from mcp_atlassian.models.jira.link import (
     JiraLinkedIssueFields,
 )
 from mcp_atlassian.models.jira.search import JiraSearchResult
+from mcp_atlassian.utils import progress as progress_module
+from mcp_atlassian.utils.progress import PageProgress
 
 
 def _make_link(
@@ -380,7 +382,7 @@ class TestProjectAnalysisMixin:
     # ---- pagination ----
 
     def test_fetch_with_pagination(self, mixin):
-        """_fetch_project_issues_with_links pages correctly on Server/DC."""
+        """_iter_project_issues_with_links pages correctly on Server/DC."""
         mixin.config = MagicMock(is_cloud=False)
 
         page1 = [_issue(f"P-{i}") for i in range(50)]
@@ -397,17 +399,66 @@ class TestProjectAnalysisMixin:
 
         mixin.search_issues = MagicMock(side_effect=fake_search)
 
-        result = mixin._fetch_project_issues_with_links("key in ()", 100)
+        result = list(mixin._iter_project_issues_with_links("key in ()", 100))
         assert len(result) == 60
         assert mixin.search_issues.call_count == 2
 
+    def test_cross_deps_stops_at_deadline_with_cursor(self, mixin, monkeypatch):
+        """A deadline-cut Server/DC scan reports the offset to resume from."""
+        mixin.config = MagicMock(is_cloud=False)
+        pages = {
+            0: JiraSearchResult(
+                total=120,
+                start_at=0,
+                max_results=50,
+                issues=[_issue(f"PROJ-{i}") for i in range(50)],
+            ),
+            50: JiraSearchResult(
+                total=120,
+                start_at=50,
+                max_results=50,
+                issues=[_issue(f"PROJ-{i}") for i in range(50, 100)],
+            ),
+        }
+        mixin.search_issues = MagicMock(
+            side_effect=lambda jql, start=0, **kw: pages[start]
+        )
+        monkeypatch.setenv("JIRA_SEARCH_MAX_WORKERS", "1")
+        clock = [0.0]
+        monkeypatch.setattr(progress_module.time, "monotonic", lambda: clock[0])
+        progress = PageProgress(deadline_seconds=5)
+        clock[0] = 10.0
+
+        result = mixin.get_cross_project_dependencies(
+            "PROJ", max_issues=500, progress=progress
+        )
+
+        assert result["total_issues_scanned"] == 50
+        assert result["next_cursor"] == "50"
+
+        progress = PageProgress()
+        mixin.search_issues.reset_mock()
+        resumed = mixin.get_cross_project_dependencies(
+            "PROJ", max_issues=50, cursor="50", progress=progress
+        )
+
+        assert resumed["total_issues_scanned"] == 50
+        assert "next_cursor" not in resumed
+        assert mixin.search_issues.call_args.kwargs["start"] == 50
+
+    def test_cross_deps_rejects_bad_server_cursor(self, mixin):
+        mixin.config = MagicMock(is_cloud=False)
+
+        with pytest.raises(ValueError, match="start offset"):
+            mixin.get_cross_project_dependencies("PROJ", cursor="abc")
+
     def test_fetch_cloud_no_repaging(self, mixin):
-        """On Cloud, _fetch_project_issues_with_links must not re-page."""
+        """On Cloud, _iter_project_issues_with_links must not re-page."""
         mixin.config = MagicMock(is_cloud=True)
 
         all_issues = [_issue(f"P-{i}") for i in range(80)]
         mixin.search_issues = MagicMock(return_value=_search_result(all_issues))
 
-        result = mixin._fetch_project_issues_with_links("key in ()", 200)
+        result = list(mixin._iter_project_issues_with_links("key in ()", 200))
         assert len(result) == 80
         assert mixin.search_issues.call_count == 1
@@ -799,7 +799,20 @@ def test_get_project_issues_count(projects_mixin: ProjectsMixin):
     result = projects_mixin.get_project_issues_count("PROJ1")
     assert result == 42
     projects_mixin.jira.jql.assert_called_once_with(
-        jql='project = "PROJ1"', fields="key", limit=1
+        'project = "PROJ1"', fields="key", limit=0
+    )
+
+
+def test_get_project_issues_count_ignores_projects_filter(
+    projects_mixin: ProjectsMixin,
+):
+    """The project count is not narrowed by JIRA_PROJECTS_FILTER."""
+    projects_mixin.config.projects_filter = "OTHER"
+    projects_mixin.jira.jql.return_value = {"total": 7}
+
+    assert projects_mixin.get_project_issues_count("PROJ1") == 7
+    projects_mixin.jira.jql.assert_called_once_with(
+        'project = "PROJ1"', fields="key", limit=0
     )
 
 
@@ -813,7 +826,7 @@ def test_get_project_issues_count__project_with_reserved_keyword(
     result = projects_mixin.get_project_issues_count("AND")
     assert result == 42
     projects_mixin.jira.jql.assert_called_once_with(
-        jql='project = "AND"', fields="key", limit=1
+        'project = "AND"', fields="key", limit=0
     )
 
 
@@ -1,14 +1,22 @@
 """Tests for the Jira Search mixin."""
 
+import re
+import threading
+import time
 from typing import Any
 from unittest.mock import ANY, MagicMock
 
 import pytest
 import requests
 
+from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
 from mcp_atlassian.jira import JiraFetcher
+from mcp_atlassian.jira import search as search_module
 from mcp_atlassian.jira.search import SearchMixin
 from mcp_atlassian.models.jira import JiraIssue, JiraSearchResult
+from mcp_atlassian.utils import progress as progress_module
+from mcp_atlassian.utils.cache import JIRA_ISSUE, ResponseCache, publish_invalidation
+from mcp_atlassian.utils.progress import PageProgress
 
 
 class TestSearchMixin:
@@ -1246,6 +1254,789 @@ class TestSearchMixin:
         # The result should not have a next_page_token from Server/DC
         assert result.next_page_token is None
 
+    @staticmethod
+    def _paged_jql(total: int, page_cap: int = 50, reported_total: int | None = None):
+        """Fake ``jira.jql`` serving *total* issues in pages of *page_cap*."""
+        in_flight = 0
+        stats = {"max_in_flight": 0, "starts": []}
+        lock = threading.Lock()
+
+        def fake_jql(jql, fields=None, start=0, limit=50, expand=None):
+            nonlocal in_flight
+            with lock:
+                in_flight += 1
+                stats["max_in_flight"] = max(stats["max_in_flight"], in_flight)
+                stats["starts"].append(start)
+            time.sleep(0.01)
+            with lock:
+                in_flight -= 1
+            end = min(start + min(limit, page_cap), total)
+            return {
+                "issues": [
+                    {"id": str(n), "key": f"TEST-{n}", "fields": {"summary": "s"}}
+                    for n in range(start, end)
+                ],
+                "total": total if reported_total is None else reported_total,
+                "startAt": start,
+                "maxResults": page_cap,
+            }
+
+        return fake_jql, stats
+
+    def test_search_all_issues_server_fetches_pages_concurrently(
+        self, search_mixin: SearchMixin, monkeypatch
+    ):
+        """Server/DC pages after the first are fetched in parallel, in order."""
+        monkeypatch.setenv("JIRA_SEARCH_MAX_WORKERS", "3")
+        fake_jql, stats = self._paged_jql(total=420)
+        search_mixin.jira.jql = MagicMock(side_effect=fake_jql)
+
+        result = search_mixin.search_all_issues("project = TEST", limit=1000)
+
+        assert [issue.key for issue in result.issues] == [
+            f"TEST-{n}" for n in range(420)
+        ]
+        assert result.total == 420
+        assert result.start_at == 0
+        assert stats["starts"][0] == 0
+        assert sorted(stats["starts"]) == list(range(0, 420, 50))
+        assert 1 < stats["max_in_flight"] <= 3
+
+    def test_search_all_issues_server_respects_limit(self, search_mixin: SearchMixin):
+        """Only the offsets needed for ``limit`` are requested."""
+        fake_jql, stats = self._paged_jql(total=2000)
+        search_mixin.jira.jql = MagicMock(side_effect=fake_jql)
+
+        result = search_mixin.search_all_issues("project = TEST", limit=120)
+
+        assert [issue.key for issue in result.issues] == [
+            f"TEST-{n}" for n in range(120)
+        ]
+        assert sorted(stats["starts"]) == [0, 50, 100]
+        last_call = max(
+            search_mixin.jira.jql.call_args_list, key=lambda c: c.kwargs["start"]
+        )
+        assert last_call.kwargs["limit"] == 20
+
+    def test_search_all_issues_server_follows_stale_total(
+        self, search_mixin: SearchMixin
+    ):
+        """Pages past a stale ``total`` are still fetched while pages are full."""
+        fake_jql, stats = self._paged_jql(total=130, reported_total=50)
+        search_mixin.jira.jql = MagicMock(side_effect=fake_jql)
+
+        result = search_mixin.search_all_issues("project = TEST", limit=1000)
+
+        assert len(result.issues) == 130
+        assert stats["starts"] == [0, 50, 100]
+
+    def test_search_all_issues_server_uses_smaller_server_pages(
+        self, search_mixin: SearchMixin
+    ):
+        """Offsets follow the page size the server actually returns."""
+        fake_jql, stats = self._paged_jql(total=95, page_cap=20)
+        search_mixin.jira.jql = MagicMock(side_effect=fake_jql)
+
+        result = search_mixin.search_all_issues("project = TEST", limit=1000)
+
+        assert [issue.key for issue in result.issues] == [
+            f"TEST-{n}" for n in range(95)
+        ]
+        assert sorted(stats["starts"]) == [0, 20, 40, 60, 80]
+
+    def test_search_all_issues_server_follows_stale_total_with_small_pages(
+        self, search_mixin: SearchMixin
+    ):
+        """A stale ``total`` is followed at the server's capped page size."""
+        fake_jql, stats = self._paged_jql(total=70, page_cap=20, reported_total=40)
+        search_mixin.jira.jql = MagicMock(side_effect=fake_jql)
+
+        result = search_mixin.search_all_issues("project = TEST", limit=1000)
+
+        assert [issue.key for issue in result.issues] == [
+            f"TEST-{n}" for n in range(70)
+        ]
+        assert stats["starts"] == [0, 20, 40, 60]
+
+    def test_search_all_issues_server_short_single_page_is_not_followed(
+        self, search_mixin: SearchMixin
+    ):
+        """A first page that ends the results needs no follow-up request."""
+        fake_jql, stats = self._paged_jql(total=7)
+        search_mixin.jira.jql = MagicMock(side_effect=fake_jql)
+
+        result = search_mixin.search_all_issues("project = TEST", limit=1000)
+
+        assert len(result.issues) == 7
+        assert stats["starts"] == [0]
+
+    def test_search_all_issues_drops_duplicates_across_pages(
+        self, search_mixin: SearchMixin
+    ):
+        """An issue shifted across a page boundary is returned once."""
+        pages = {
+            0: [_search_result_issue(n) for n in range(50)],
+            50: [_search_result_issue(n) for n in range(49, 60)],
+        }
+        search_mixin.jira.jql = MagicMock(
+            side_effect=lambda jql, start=0, **kwargs: {
+                "issues": pages.get(start, []),
+                "total": 60,
+            }
+        )
+
+        result = search_mixin.search_all_issues("project = TEST", limit=1000)
+
+        assert [issue.key for issue in result.issues] == [
+            f"TEST-{n}" for n in range(60)
+        ]
+
+    def test_search_all_issues_cloud_delegates(self, search_mixin: SearchMixin):
+        """Cloud pages inside search_issues, so a single call is made."""
+        search_mixin.config.is_cloud = True
+        expected = JiraSearchResult(total=-1, issues=[])
+        search_mixin.search_issues = MagicMock(return_value=expected)
+
+        result = search_mixin.search_all_issues("project = TEST", limit=300)
+
+        assert result is expected
+        search_mixin.search_issues.assert_called_once_with(
+            "project = TEST",
+            fields=None,
+            limit=300,
+            expand=None,
+            projects_filter=None,
+        )
+
+    def test_iter_search_pages_cloud_prefetches_next_page(
+        self, search_mixin: SearchMixin
+    ):
+        """The next Cloud page is requested before the current one is consumed."""
+        search_mixin.config.is_cloud = True
+        responses = [
+            {
+                "issues": [_search_result_issue(n) for n in range(100)],
+                "nextPageToken": "token_page2",
+            },
+            {"issues": [_search_result_issue(n) for n in range(100, 130)]},
+        ]
+        second_requested = threading.Event()
+        bodies: list[dict[str, Any]] = []
+
+        def fake_post(path, json):
+            bodies.append(json)
+            if len(bodies) == 2:
+                second_requested.set()
+            return responses[len(bodies) - 1]
+
+        search_mixin.jira.post = MagicMock(side_effect=fake_post)
+
+        pages = search_mixin.iter_search_pages("project = TEST")
+        first = next(pages)
+
+        assert [issue.key for issue in first.issues][-1] == "TEST-99"
+        assert first.next_page_token == "token_page2"
+        assert second_requested.wait(5)
+        second = next(pages)
+        assert [issue.key for issue in second.issues][0] == "TEST-100"
+        assert next(pages, None) is None
+        assert [body.get("nextPageToken") for body in bodies] == [
+            None,
+            "token_page2",
+        ]
+        assert [body["maxResults"] for body in bodies] == [100, 100]
+
+    def test_iter_search_pages_server_walks_offsets(self, search_mixin: SearchMixin):
+        """Server/DC pages follow start offsets until total is reached."""
+        fake_jql, stats = self._paged_jql(total=120)
+        search_mixin.jira.jql = MagicMock(side_effect=fake_jql)
+
+        pages = list(search_mixin.iter_search_pages("project = TEST"))
+
+        assert [len(page.issues) for page in pages] == [50, 50, 20]
+        assert [page.start_at for page in pages] == [0, 50, 100]
+        assert sorted(stats["starts"]) == [0, 50, 100]
+
+    def test_iter_search_pages_stops_at_limit(self, search_mixin: SearchMixin):
+        """No page beyond ``limit`` is requested, even in the background."""
+        fake_jql, stats = self._paged_jql(total=1000)
+        search_mixin.jira.jql = MagicMock(side_effect=fake_jql)
+
+        pages = list(
+            search_mixin.iter_search_pages("project = TEST", limit=70, start=100)
+        )
+
+        assert [issue.key for page in pages for issue in page.issues] == [
+            f"TEST-{n}" for n in range(100, 170)
+        ]
+        assert sorted(stats["starts"]) == [100, 150]
+
+    def test_iter_search_pages_stops_prefetching_when_closed(
+        self, search_mixin: SearchMixin
+    ):
+        """Abandoning the iterator stops the background fetches."""
+        search_mixin.config.is_cloud = True
+        search_mixin.jira.post = MagicMock(
+            side_effect=lambda path, json: {
+                "issues": [_search_result_issue(1)],
+                "nextPageToken": "more",
+            }
+        )
+
+        pages = search_mixin.iter_search_pages("project = TEST", page_size=1)
+        next(pages)
+        pages.close()
+
+        for thread in threading.enumerate():
+            if thread.name == "jira-search-prefetch":
+                thread.join(5)
+        assert search_mixin.jira.post.call_count <= 3
+
+    def test_iter_search_pages_converts_auth_errors(self, search_mixin: SearchMixin):
+        """A 401 from a prefetched page surfaces as an authentication error."""
+        search_mixin.config.is_cloud = True
+        response = MagicMock(status_code=401)
+        search_mixin.jira.post = MagicMock(
+            side_effect=[
+                {"issues": [_search_result_issue(1)], "nextPageToken": "t2"},
+                requests.HTTPError(response=response),
+            ]
+        )
+
+        pages = search_mixin.iter_search_pages("project = TEST", page_size=1)
+        next(pages)
+
+        with pytest.raises(MCPAtlassianAuthenticationError):
+            next(pages)
+
+    def test_iter_issues_fetches_pages_lazily(
+        self, search_mixin: SearchMixin, monkeypatch
+    ):
+        """Only a bounded window of pages is fetched ahead of the consumer."""
+        monkeypatch.setenv("JIRA_SEARCH_MAX_WORKERS", "2")
+        fake_jql, stats = self._paged_jql(total=2000)
+        search_mixin.jira.jql = MagicMock(side_effect=fake_jql)
+
+        issues = search_mixin.iter_issues("project = TEST")
+        first = [next(issues) for _ in range(60)]
+
+        assert [issue.key for issue in first] == [f"TEST-{n}" for n in range(60)]
+        assert len(stats["starts"]) <= 4
+
+        rest = list(issues)
+        assert len(first) + len(rest) == 2000
+        assert rest[-1].key == "TEST-1999"
+
+    def test_iter_issues_page_size_and_limit(self, search_mixin: SearchMixin):
+        """page_size sets the request size; limit bounds the issues yielded."""
+        fake_jql, stats = self._paged_jql(total=500)
+        search_mixin.jira.jql = MagicMock(side_effect=fake_jql)
+
+        keys = [
+            issue.key
+            for issue in search_mixin.iter_issues(
+                "project = TEST", page_size=20, limit=70
+            )
+        ]
+
+        assert keys == [f"TEST-{n}" for n in range(70)]
+        assert sorted(stats["starts"]) == [0, 20, 40, 60]
+
+    def test_iter_issues_skips_duplicates(self, search_mixin: SearchMixin):
+        """An issue repeated on the next Cloud page is yielded once."""
+        search_mixin.config.is_cloud = True
+        search_mixin.jira.post = MagicMock(
+            side_effect=[
+                {
+                    "issues": [_search_result_issue(n) for n in range(3)],
+                    "nextPageToken": "t2",
+                },
+                {"issues": [_search_result_issue(n) for n in range(2, 5)]},
+            ]
+        )
+
+        keys = [
+            issue.key
+            for issue in search_mixin.iter_issues("project = TEST", page_size=3)
+        ]
+
+        assert keys == [f"TEST-{n}" for n in range(5)]
+
+    def test_search_issues_cloud_stops_at_deadline(
+        self, search_mixin: SearchMixin, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Past the deadline, the pages so far are returned with their token."""
+        search_mixin.config.is_cloud = True
+        pages = [
+            {
+                "issues": [_search_result_issue(n) for n in range(start, start + 100)],
+                "nextPageToken": f"token-{start + 100}",
+            }
+            for start in (0, 100, 200)
+        ]
+        search_mixin.jira.post = MagicMock(side_effect=pages)
+        clock = [0.0]
+        monkeypatch.setattr(progress_module.time, "monotonic", lambda: clock[0])
+        reports: list[tuple] = []
+        progress = PageProgress(lambda *args: reports.append(args), 5)
+        clock[0] = 10.0
+
+        result = search_mixin.search_issues(
+            "project = TEST", limit=300, progress=progress
+        )
+
+        assert len(result.issues) == 100
+        assert result.next_page_token == "token-100"
+        assert progress.deadline_reached is True
+        assert progress.cursor == "token-100"
+        assert search_mixin.jira.post.call_count == 1
+        assert reports == [(100, 300, "Fetched 100 of up to 300 issues")]
+
+
+class TestCountIssues:
+    """Tests for SearchMixin.count_issues."""
+
+    @pytest.fixture
+    def search_mixin(
+        self, jira_fetcher: JiraFetcher, monkeypatch: pytest.MonkeyPatch
+    ) -> SearchMixin:
+        monkeypatch.setattr(
+            search_module,
+            "_issue_count_cache",
+            ResponseCache("test.issue_count", ttl=60, maxsize=16),
+        )
+        jira_fetcher.config = MagicMock(is_cloud=False, projects_filter=None)
+        return jira_fetcher
+
+    def test_cloud_uses_approximate_count(self, search_mixin: SearchMixin):
+        search_mixin.config.is_cloud = True
+        search_mixin.jira.post = MagicMock(return_value={"count": 1234})
+
+        count = search_mixin.count_issues("project = TEST ORDER BY created DESC")
+
+        assert count == 1234
+        search_mixin.jira.post.assert_called_once_with(
+            "rest/api/3/search/approximate-count", json={"jql": "project = TEST"}
+        )
+
+    def test_server_reads_total_without_issues(self, search_mixin: SearchMixin):
+        search_mixin.jira.jql = MagicMock(return_value={"total": 57, "issues": []})
+
+        assert search_mixin.count_issues("project = TEST", projects_filter="TEST") == 57
+        search_mixin.jira.jql.assert_called_once_with(
+            "(project = TEST) AND (project = TEST)", fields="key", limit=0
+        )
+
+    @pytest.mark.parametrize(
+        ("jql", "expected"),
+        [
+            (
+                'summary ~ "order by date" AND project = TEST',
+                'summary ~ "order by date" AND project = TEST',
+            ),
+            (
+                "summary ~ 'x order by y' ORDER BY created",
+                "summary ~ 'x order by y'",
+            ),
+            ("reorder = 1 order by rank", "reorder = 1"),
+        ],
+    )
+    def test_only_top_level_order_by_is_dropped(
+        self, search_mixin: SearchMixin, jql: str, expected: str
+    ):
+        search_mixin.jira.jql = MagicMock(return_value={"total": 3})
+
+        search_mixin.count_issues(jql)
+
+        assert search_mixin.jira.jql.call_args.args[0] == expected
+
+    def test_unexpected_response_raises(self, search_mixin: SearchMixin):
+        search_mixin.jira.jql = MagicMock(return_value={"issues": []})
+
+        with pytest.raises(TypeError, match="Unexpected issue count response"):
+            search_mixin.count_issues("project = TEST")
+
+    def test_counts_are_cached_until_an_issue_write(self, search_mixin: SearchMixin):
+        search_mixin.jira.jql = MagicMock(
+            side_effect=[{"total": 5}, {"total": 6}, {"total": 1}]
+        )
+
+        assert search_mixin.count_issues("project = TEST") == 5
+        assert search_mixin.count_issues("project = TEST ORDER BY key") == 5
+        assert search_mixin.jira.jql.call_count == 1
+
+        publish_invalidation(JIRA_ISSUE, "TEST-1")
+
+        assert search_mixin.count_issues("project = TEST") == 6
+        assert search_mixin.count_issues("project = OTHER") == 1
+        assert search_mixin.jira.jql.call_count == 3
+
+
+class TestJqlResultCache:
+    """Tests for the incremental JQL result cache in search_issues."""
+
+    @pytest.fixture
+    def search_mixin(
+        self, jira_fetcher: JiraFetcher, monkeypatch: pytest.MonkeyPatch
+    ) -> SearchMixin:
+        monkeypatch.setattr(
+            search_module,
+            "_jql_result_cache",
+            ResponseCache("test.jql_results", ttl=600, maxsize=16),
+        )
+        jira_fetcher.config = MagicMock(
+            is_cloud=False, projects_filter=None, url="https://jira.example.com"
+        )
+        return jira_fetcher
+
+    @staticmethod
+    def _server(issues: dict[str, str]) -> tuple[MagicMock, list[str]]:
+        """Fake jira.jql over {key: summary}; records non-key queries."""
+        body_queries: list[str] = []
+
+        def jql(jql, fields=None, start=0, limit=50, expand=None):
+            if fields == "key":
+                keys = sorted(issues)
+            else:
+                body_queries.append(jql)
+                requested = re.findall(r'"([A-Z]+-\d+)"', jql)
+                keys = [key for key in requested if key in issues]
+                if "updated >=" in jql:
+                    keys = [key for key in keys if issues[key].endswith("(edited)")]
+            return {
+                "total": len(issues),
+                "startAt": start,
+                "maxResults": limit,
+                "issues": [
+                    {"id": key, "key": key, "fields": {"summary": issues[key]}}
+                    for key in keys
+                ],
+            }
+
+        return MagicMock(side_effect=jql), body_queries
+
+    def test_refresh_fetches_only_new_and_updated_issues(
+        self, search_mixin: SearchMixin
+    ):
+        issues = {f"TEST-{n}": f"Issue {n}" for n in range(1, 5)}
+        search_mixin.jira.jql, body_queries = self._server(issues)
+
+        first = search_mixin.search_issues("project = TEST ORDER BY key")
+
+        assert [issue.key for issue in first.issues] == [
+            "TEST-1",
+            "TEST-2",
+            "TEST-3",
+            "TEST-4",
+        ]
+        assert len(body_queries) == 1
+        assert "updated >=" not in body_queries[0]
+
+        issues["TEST-2"] = "Issue 2 (edited)"
+        del issues["TEST-3"]
+        issues["TEST-5"] = "Issue 5"
+        body_queries.clear()
+
+        second = search_mixin.search_issues("project  =  TEST")
+
+        assert [(issue.key, issue.summary) for issue in second.issues] == [
+            ("TEST-1", "Issue 1"),
+            ("TEST-2", "Issue 2 (edited)"),
+            ("TEST-4", "Issue 4"),
+            ("TEST-5", "Issue 5"),
+        ]
+        assert second.total == 4
+        assert body_queries == [
+            'key in ("TEST-1", "TEST-2", "TEST-4") AND updated >= -2m',
+            'key in ("TEST-5")',
+        ]
+
+    def test_key_only_searches_bypass_cache(self, search_mixin: SearchMixin):
+        search_mixin.jira.jql, body_queries = self._server({"TEST-1": "Issue 1"})
+
+        result = search_mixin.search_issues("project = TEST", fields="key")
+
+        assert [issue.key for issue in result.issues] == ["TEST-1"]
+        assert search_mixin.jira.jql.call_count == 1
+        assert body_queries == []
+
+    def test_cloud_fills_bodies_with_key_queries(self, search_mixin: SearchMixin):
+        search_mixin.config.is_cloud = True
+
+        def post(path, json):
+            if json["fields"] == ["key"]:
+                return {"issues": [{"id": "1", "key": "TEST-1"}]}
+            return {
+                "issues": [{"id": "1", "key": "TEST-1", "fields": {"summary": "One"}}],
+                "names": {"summary": "Summary"},
+            }
+
+        search_mixin.jira.post = MagicMock(side_effect=post)
+
+        result = search_mixin.search_issues("project = TEST", fields="summary", limit=5)
+
+        assert [issue.summary for issue in result.issues] == ["One"]
+        assert search_mixin.jira.post.call_args_list[-1].kwargs["json"] == {
+            "jql": 'key in ("TEST-1")',
+            "fields": ["summary"],
+            "maxResults": 1,
+        }
+
+
+class TestMultiSearch:
+    """Tests for multi_search."""
+
+    @pytest.fixture
+    def search_mixin(self, jira_fetcher: JiraFetcher) -> SearchMixin:
+        jira_fetcher.config = MagicMock(
+            is_cloud=False, projects_filter=None, url="https://jira.example.com"
+        )
+        matches = {
+            "type = Bug": ["TEST-1", "TEST-2"],
+            "status = Blocked": ["TEST-2", "TEST-3"],
+        }
+
+        def jql(jql, fields=None, start=0, limit=50, expand=None):
+            if fields == "key":
+                if jql not in matches:
+                    raise requests.HTTPError("400 Bad JQL")
+                keys = matches[jql][:limit]
+            else:
+                keys = re.findall(r'"([A-Z]+-\d+)"', jql)
+                gone = [key for key in keys if key in jira_fetcher.deleted]
+                if gone:
+                    response = requests.Response()
+                    response.status_code = 400
+                    msg = f"An issue with key '{gone[0]}' does not exist"
+                    raise requests.HTTPError(msg, response=response)
+            return {
+                "total": len(matches.get(jql, keys)),
+                "startAt": start,
+                "maxResults": limit,
+                "issues": [
+                    {"id": key, "key": key, "fields": {"summary": f"Issue {key}"}}
+                    for key in keys
+                ],
+            }
+
+        jira_fetcher.deleted = set()
+        jira_fetcher.jira.jql = MagicMock(side_effect=jql)
+        return jira_fetcher
+
+    def test_overlapping_issues_are_fetched_once(self, search_mixin: SearchMixin):
+        result = search_mixin.multi_search(
+            ["type = Bug", "status = Blocked"], fields="summary"
+        )
+
+        assert result["queries"] == [
+            {"jql": "type = Bug", "total": 2, "keys": ["TEST-1", "TEST-2"]},
+            {"jql": "status = Blocked", "total": 2, "keys": ["TEST-2", "TEST-3"]},
+        ]
+        assert result["issues"] == {
+            key: {
+                "id": key,
+                "key": key,
+                "summary": f"Issue {key}",
+                "browse_url": f"https://jira.example.com/browse/{key}",
+            }
+            for key in ("TEST-1", "TEST-2", "TEST-3")
+        }
+        body_calls = [
+            call
+            for call in search_mixin.jira.jql.call_args_list
+            if call.kwargs["fields"] != "key"
+        ]
+        assert [call.args[0] for call in body_calls] == [
+            'key in ("TEST-1", "TEST-2", "TEST-3")'
+        ]
+
+    def test_failed_query_is_reported_and_others_kept(self, search_mixin: SearchMixin):
+        result = search_mixin.multi_search(["type = Bug", "bogus ~"], fields="key")
+
+        assert result["queries"][0]["keys"] == ["TEST-1", "TEST-2"]
+        assert result["queries"][1]["jql"] == "bogus ~"
+        assert "400 Bad JQL" in result["queries"][1]["error"]
+        assert list(result["issues"]) == ["TEST-1", "TEST-2"]
+        assert all(
+            call.kwargs["fields"] == "key"
+            for call in search_mixin.jira.jql.call_args_list
+        )
+
+    def test_issue_deleted_before_body_fetch_is_reported(
+        self, search_mixin: SearchMixin
+    ):
+        search_mixin.deleted.add("TEST-2")
+
+        result = search_mixin.multi_search(
+            ["type = Bug", "status = Blocked"], fields="summary"
+        )
+
+        assert result["queries"][1]["keys"] == ["TEST-2", "TEST-3"]
+        assert list(result["issues"]) == ["TEST-1", "TEST-3"]
+        assert result["errors"] == [
+            {"key": "TEST-2", "error": "An issue with key 'TEST-2' does not exist"}
+        ]
+
+    def test_rejects_too_many_queries(self, search_mixin: SearchMixin):
+        queries = ["type = Bug"] * (search_module.MAX_MULTI_SEARCH_QUERIES + 1)
+
+        with pytest.raises(ValueError, match="At most 10 queries"):
+            search_mixin.multi_search(queries)
+
+        search_mixin.jira.jql.assert_not_called()
+
+
+class TestBatchGetIssues:
+    """Tests for batch_get_issues."""
+
+    @pytest.fixture
+    def search_mixin(self, jira_fetcher: JiraFetcher) -> SearchMixin:
+        jira_fetcher.config = MagicMock(
+            is_cloud=False, projects_filter=None, url="https://jira.example.com"
+        )
+        existing = {f"TEST-{n}" for n in range(1, 61)}
+        previous_keys = {"OLD-7": "TEST-7"}
+
+        def jql(jql, fields=None, start=0, limit=50, expand=None):
+            if "project = NOPE" in jql:
+                response = requests.Response()
+                response.status_code = 400
+                msg = "The value 'NOPE' does not exist for the field 'project'."
+                raise requests.HTTPError(msg, response=response)
+            keys = [
+                previous_keys.get(key, key)
+                for key in re.findall(r'"([A-Z]+-\d+)"', jql)
+            ]
+            missing = [key for key in keys if key not in existing]
+            if missing:
+                response = requests.Response()
+                response.status_code = 400
+                msg = f"An issue with key '{missing[0]}' does not exist"
+                raise requests.HTTPError(msg, response=response)
+            return {
+                "issues": [
+                    {
+                        "id": key,
+                        "key": key,
+                        "fields": {
+                            "summary": f"Issue {key}",
+                            "comment": {
+                                "comments": [
+                                    {"id": str(n), "body": f"Comment {n}"}
+                                    for n in range(1, 4)
+                                ]
+                            },
+                        },
+                    }
+                    for key in keys
+                ],
+            }
+
+        jira_fetcher.jira.jql = MagicMock(side_effect=jql)
+        jira_fetcher.jira.get_issue = MagicMock(
+            side_effect=lambda key, **kwargs: {"key": previous_keys.get(key, key)}
+        )
+        return jira_fetcher
+
+    def test_keys_are_fetched_in_chunks_in_request_order(
+        self, search_mixin: SearchMixin
+    ):
+        keys = [f"TEST-{n}" for n in range(60, 0, -1)]
+
+        result = search_mixin.batch_get_issues(
+            ["test-60", *keys, "not a key"], fields="summary"
+        )
+
+        assert [issue["key"] for issue in result["issues"]] == keys
+        assert result["issues"][0] == {
+            "id": "TEST-60",
+            "key": "TEST-60",
+            "summary": "Issue TEST-60",
+            "browse_url": "https://jira.example.com/browse/TEST-60",
+        }
+        assert result["errors"] == [{"key": "NOT A KEY", "error": "Invalid issue key."}]
+        assert [
+            call.kwargs["limit"] for call in search_mixin.jira.jql.call_args_list
+        ] == [50, 10]
+
+    def test_missing_key_only_fails_itself(self, search_mixin: SearchMixin):
+        result = search_mixin.batch_get_issues(
+            ["TEST-1", "TEST-2", "TEST-999", "TEST-3"], fields="summary"
+        )
+
+        assert [issue["key"] for issue in result["issues"]] == [
+            "TEST-1",
+            "TEST-2",
+            "TEST-3",
+        ]
+        assert result["errors"] == [
+            {
+                "key": "TEST-999",
+                "error": "An issue with key 'TEST-999' does not exist",
+            }
+        ]
+        assert search_mixin.jira.jql.call_count == 2
+
+    def test_query_wide_error_fails_the_call_without_retries(
+        self, search_mixin: SearchMixin
+    ):
+        keys = [f"TEST-{n}" for n in range(1, 51)]
+
+        with pytest.raises(requests.HTTPError, match="NOPE"):
+            search_mixin.batch_get_issues(keys, projects_filter="NOPE")
+
+        search_mixin.jira.jql.assert_called_once()
+
+    def test_moved_issue_is_returned_for_its_old_key(self, search_mixin: SearchMixin):
+        result = search_mixin.batch_get_issues(
+            ["OLD-7", "TEST-1", "TEST-7"], fields="summary"
+        )
+
+        assert [issue["key"] for issue in result["issues"]] == ["TEST-7", "TEST-1"]
+        assert result["moved"] == [{"requested_key": "OLD-7", "key": "TEST-7"}]
+        assert result["errors"] == []
+
+    def test_comments_are_added_and_trimmed(self, search_mixin: SearchMixin):
+        result = search_mixin.batch_get_issues(
+            ["TEST-1"], fields="summary", comment_limit=2
+        )
+
+        assert search_mixin.jira.jql.call_args.kwargs["fields"] == "summary,comment"
+        assert [comment["body"] for comment in result["issues"][0]["comments"]] == [
+            "Comment 2",
+            "Comment 3",
+        ]
+
+    def test_projects_filter_narrows_every_chunk(self, search_mixin: SearchMixin):
+        result = search_mixin.batch_get_issues(
+            ["TEST-1"], fields="summary", projects_filter="TEST"
+        )
+
+        assert search_mixin.jira.jql.call_args.args[0] == (
+            'key in ("TEST-1") AND project = TEST'
+        )
+        assert result["errors"] == []
+
+    def test_auth_errors_are_raised(self, search_mixin: SearchMixin):
+        response = requests.Response()
+        response.status_code = 401
+        search_mixin.jira.jql.side_effect = requests.HTTPError(response=response)
+
+        with pytest.raises(MCPAtlassianAuthenticationError):
+            search_mixin.batch_get_issues(["TEST-1", "TEST-2"])
+
+    def test_rejects_too_many_keys(self, search_mixin: SearchMixin):
+        keys = [f"TEST-{n}" for n in range(search_module.MAX_BATCH_GET_ISSUES + 1)]
+
+        with pytest.raises(ValueError, match="At most 500 issue keys"):
+            search_mixin.batch_get_issues(keys)
+
+        search_mixin.jira.jql.assert_not_called()
+
+
+def _search_result_issue(n: int) -> dict[str, Any]:
+    return {"id": str(n), "key": f"TEST-{n}", "fields": {"summary": "s"}}
+
 
 class TestSearchFilterAndInjectionRegression:
     """Regression — project/space filter bypass (GHSA-w66g, GHSA-rqwg) and JQL
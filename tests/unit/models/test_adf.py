@@ -12,6 +12,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from src.mcp_atlassian.models.jira.adf import (
+    adf_to_markdown,
     adf_to_text,
     extract_top_level_media_nodes,
     markdown_to_adf,
@@ -310,6 +311,133 @@ class TestAdfToText:
         }
         assert adf_to_text(node) == "Item 1"
 
+    def test_nesting_beyond_recursion_limit(self):
+        """Documents deeper than the interpreter recursion limit still render."""
+        node: dict[str, Any] = {"type": "text", "text": "bottom"}
+        for _ in range(5000):
+            node = {"type": "blockquote", "content": [node]}
+        assert adf_to_text({"type": "doc", "content": [node, "tail"]}) == (
+            "bottom\ntail"
+        )
+
+    def test_empty_siblings_do_not_add_separators(self):
+        """Children that render nothing leave no blank lines behind."""
+        node = [
+            {"type": "paragraph", "content": [{"type": "text", "text": ""}]},
+            {"type": "text", "text": "a"},
+            {"type": "paragraph", "content": [{"type": "date", "attrs": {}}]},
+            {"type": "codeBlock"},
+            {"type": "unknown"},
+            {"type": "text", "text": "b"},
+        ]
+        assert adf_to_text(node) == "a\n```\n\n```\nb"
+
+
+class TestAdfToMarkdown:
+    """Tests for the adf_to_markdown function."""
+
+    def test_none_and_string_input(self):
+        assert adf_to_markdown(None) is None
+        assert adf_to_markdown("plain") == "plain"
+        assert adf_to_markdown({"type": "doc", "content": []}) is None
+
+    def test_round_trips_markdown_to_adf(self):
+        markdown = (
+            "# Title\n\n"
+            "Some **bold**, *italic*, `code`, ~~old~~ and [a link](https://x.y).\n\n"
+            "- one\n"
+            "- two\n\n"
+            "1. first\n"
+            "2. second\n\n"
+            "> quoted\n\n"
+            "```python\nprint(1)\n```\n\n"
+            "| A | B |\n"
+            "| --- | --- |\n"
+            "| 1 | 2 |\n\n"
+            "---\n\n"
+            "- [ ] todo\n"
+            "- [x] done"
+        )
+        assert adf_to_markdown(markdown_to_adf(markdown)) == markdown
+
+    def test_nested_list_items_are_indented(self):
+        node = {
+            "type": "orderedList",
+            "attrs": {"order": 3},
+            "content": [
+                {
+                    "type": "listItem",
+                    "content": [
+                        {
+                            "type": "paragraph",
+                            "content": [{"type": "text", "text": "parent"}],
+                        },
+                        {
+                            "type": "bulletList",
+                            "content": [
+                                {
+                                    "type": "listItem",
+                                    "content": [
+                                        {
+                                            "type": "paragraph",
+                                            "content": [
+                                                {"type": "text", "text": "child"}
+                                            ],
+                                        }
+                                    ],
+                                }
+                            ],
+                        },
+                    ],
+                }
+            ],
+        }
+        assert adf_to_markdown(node) == "3. parent\n   - child"
+
+    def test_panel_and_inline_nodes(self):
+        node = {
+            "type": "panel",
+            "attrs": {"panelType": "warning"},
+            "content": [
+                {
+                    "type": "paragraph",
+                    "content": [
+                        {"type": "mention", "attrs": {"id": "abc", "text": "@Ann"}},
+                        {"type": "text", "text": " is "},
+                        {"type": "status", "attrs": {"text": "BLOCKED"}},
+                        {"type": "hardBreak"},
+                        {"type": "emoji", "attrs": {"shortName": ":warning:"}},
+                    ],
+                }
+            ],
+        }
+        assert adf_to_markdown(node) == (
+            "> [!WARNING]\n> @Ann is [BLOCKED]\n> :warning:"
+        )
+
+    def test_table_cells_escape_pipes_and_newlines(self):
+        cell = {
+            "type": "tableCell",
+            "content": [
+                {"type": "paragraph", "content": [{"type": "text", "text": "a|b"}]},
+                {"type": "paragraph", "content": [{"type": "text", "text": "c"}]},
+            ],
+        }
+        node = {
+            "type": "table",
+            "content": [{"type": "tableRow", "content": [cell, cell]}],
+        }
+        assert adf_to_markdown(node) == ("| a\\|b<br>c | a\\|b<br>c |\n| --- | --- |")
+
+    def test_nesting_beyond_recursion_limit(self):
+        node: dict[str, Any] = {
+            "type": "paragraph",
+            "content": [{"type": "text", "text": "deep"}],
+        }
+        for _ in range(3000):
+            node = {"type": "blockquote", "content": [node]}
+        assert adf_to_markdown(node).endswith("> deep")
+
 
 class TestMarkdownToAdf:
     """Tests for the markdown_to_adf function."""
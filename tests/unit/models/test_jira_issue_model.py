@@ -649,6 +649,15 @@ class TestJiraIssue:
             "name": "Epic Link",
         }
 
+    def test_custom_field_attribute_access(self, jira_issue_data):
+        """Test custom fields are reachable as attributes and unknown names raise."""
+        issue = JiraIssue.from_api_response(jira_issue_data, requested_fields="*all")
+
+        assert issue.customfield_10001 == issue.custom_fields["customfield_10001"]
+        assert issue.summary == "Test Issue Summary"
+        with pytest.raises(AttributeError):
+            _ = issue.customfield_99999
+
     def test_jira_issue_with_default_fields(self, jira_issue_data):
         """Test that JiraIssue returns only essential fields by default."""
         issue = JiraIssue.from_api_response(jira_issue_data)
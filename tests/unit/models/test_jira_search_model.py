@@ -149,6 +149,52 @@ class TestJiraSearchResult:
         assert simplified["issues"][1]["key"] == "PROJ-124"
         assert simplified["issues"][1]["summary"] == "Second Issue"
 
+    def test_to_simplified_dict_compiles_projection_once(self, monkeypatch):
+        """Test issues sharing requested_fields reuse one compiled projection."""
+        from mcp_atlassian.models.jira import search
+
+        mock_data = {
+            "issues": [
+                {
+                    "id": str(n),
+                    "key": f"PROJ-{n}",
+                    "fields": {
+                        "summary": f"Issue {n}",
+                        "status": {"name": "Done"},
+                        "customfield_10010": {"value": f"Option {n}"},
+                        "customfield_10020": n,
+                    },
+                }
+                for n in range(3)
+            ],
+            "names": {"customfield_10010": "Team", "customfield_10020": "Points"},
+        }
+        requested = ["summary", "team", "cf_10020"]
+        search_result = JiraSearchResult.from_api_response(
+            mock_data, requested_fields=requested
+        )
+        compiled: list[object] = []
+        original = search.IssueFieldProjection
+
+        def counting_projection(requested_fields):
+            compiled.append(requested_fields)
+            return original(requested_fields)
+
+        monkeypatch.setattr(search, "IssueFieldProjection", counting_projection)
+        simplified = search_result.to_simplified_dict()
+
+        assert len(compiled) == 1
+        assert simplified["issues"] == [
+            issue.to_simplified_dict() for issue in search_result.issues
+        ]
+        assert simplified["issues"][2] == {
+            "id": "2",
+            "key": "PROJ-2",
+            "summary": "Issue 2",
+            "customfield_10010": {"value": "Option 2", "name": "Team"},
+            "customfield_10020": {"value": 2, "name": "Points"},
+        }
+
     def test_from_api_response_with_next_page_token(self):
         """Test from_api_response extracts nextPageToken from API data."""
         mock_data = {
@@ -1,6 +1,8 @@
 import re
+from unittest.mock import MagicMock
 
 import pytest
+from markdownify import markdownify as md
 
 from mcp_atlassian.preprocessing.confluence import ConfluencePreprocessor
 from mcp_atlassian.preprocessing.jira import JiraPreprocessor
@@ -330,6 +332,38 @@ def test_jira_to_markdown_citation_no_redos(preprocessor_with_jira):
     assert "retry-handler" in result
 
 
+@pytest.mark.parametrize(
+    ("jira", "expected"),
+    [
+        (
+            "* one\n** two\n#* mixed\n# num\n-- dash\n+ plus",
+            "- one\n      - two\n  - mixed\n1. num\n  - dash\n- plus",
+        ),
+        ("h7. not header\nh0. zero\nh3.nospace", "h7. not header\n zero\n###nospace"),
+        (
+            "x^2^ H~2~O +ins+ ??cite?? -strike- a-b-c",
+            (
+                "x<sup>2</sup> H<sub>2</sub>O <ins>ins</ins> <cite>cite</cite> "
+                "-strike- a-b-c"
+            ),
+        ),
+        (
+            "+a^b+c^ ~x+y~z+",
+            "<ins>a<sup>b</ins>c</sup> <sub>x<ins>y</sub>z</ins>",
+        ),
+        (
+            "||h1||h2||\n|a|b|\n||x||\n|c|d|",
+            "|h1|h2|\n|---|---|\n|a|b|\n|x|\n|---|\n|c|d|",
+        ),
+        ("{noformat}{code}x{code}{noformat}", "```\n```\nx\n```\n```"),
+        ("no markup at all.\nsecond line", "no markup at all.\nsecond line"),
+    ],
+)
+def test_jira_to_markdown_pass_order_preserved(preprocessor_with_jira, jira, expected):
+    """Precompiled, merged and skipped passes keep the sequential-pass output."""
+    assert preprocessor_with_jira.jira_to_markdown(jira) == expected
+
+
 def test_markdown_to_jira(preprocessor_with_jira):
     """Test conversion of Markdown to Jira markup."""
     # Test headers
@@ -387,6 +421,36 @@ For more information, see [our website](https://example.com).
     assert "[our website|https://example.com]" in converted
 
 
+@pytest.mark.parametrize(
+    ("markdown", "expected"),
+    [
+        (
+            "**bold** *it* __strong__ _em_ ***both*** snake_case foo__bar _x_y_",
+            "*bold* _it_ *strong* _em_ *both* snake\\_case foo\\_\\_bar _x\\_y_",
+        ),
+        ("a\n-\nb\n=", "h2. a\nh1. b"),
+        (
+            "* star item\n- dash\n  - nested\n    + deep\n1. one\n  2. two",
+            "* star item\n* dash\n** nested\n*** deep\n# one\n## two",
+        ),
+        (
+            "| a | b |\n|---|:--:|\n| 1 | 2 |\n|3|4|\nafter\n| x |\n|---|",
+            "||a||b||\n|1|2|\n|3|4|\nafter\n||x||",
+        ),
+        (
+            "[a](http://x/y_z) ![](i.png) ![alt](p.png) <https://a.b/c_d> <b>",
+            "[a|http://x/y_z] !i.png! !p.png|alt=alt! [https://a.b/c_d] [b]",
+        ),
+        ("plain text only\nsecond", "plain text only\nsecond"),
+    ],
+)
+def test_markdown_to_jira_pass_order_preserved(
+    preprocessor_with_jira, markdown, expected
+):
+    """Precompiled and skipped passes keep the sequential-pass output."""
+    assert preprocessor_with_jira.markdown_to_jira(markdown) == expected
+
+
 def test_markdown_nested_bullet_list_2space(preprocessor_with_jira):
     """Test that 2-space indented bullet lists convert correctly to Jira format."""
     markdown = "* Item A\n  * Sub-item A.1\n    * Sub-sub A.1.1\n* Item B"
@@ -458,6 +522,63 @@ This is some **bold** and *italic* text.
     assert "example.com" in storage_format
 
 
+def test_markdown_to_confluence_storage_without_temp_dir(
+    preprocessor_with_confluence, monkeypatch
+):
+    """Conversions reuse one placeholder document instead of a temp dir each."""
+    import tempfile
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("TemporaryDirectory should not be used")
+
+    preprocessor_with_confluence.markdown_to_confluence_storage("warm up")
+    monkeypatch.setattr(tempfile, "TemporaryDirectory", _fail)
+
+    storage_format = preprocessor_with_confluence.markdown_to_confluence_storage(
+        "# Heading\n\n| a | b |\n|---|---|\n| 1 | 2 |\n"
+    )
+
+    assert "<h1>Heading</h1>" in storage_format
+    assert "<table" in storage_format
+
+
+def test_markdown_to_confluence_storage_recreates_scratch_document(
+    preprocessor_with_confluence,
+):
+    """A placeholder removed by a temp cleaner is recreated on demand."""
+    import shutil
+
+    from mcp_atlassian.preprocessing import confluence
+
+    preprocessor_with_confluence.markdown_to_confluence_storage("first")
+    scratch = confluence._scratch_document()
+    shutil.rmtree(scratch.parent)
+
+    storage_format = preprocessor_with_confluence.markdown_to_confluence_storage(
+        "**second**"
+    )
+
+    assert "<strong>second</strong>" in storage_format
+    assert confluence._scratch_document().is_file()
+
+
+def test_markdown_to_confluence_storage_batch(preprocessor_with_confluence):
+    """Batch conversion matches converting each document on its own."""
+    documents = ["# One", "Some *text*", "| a |\n|---|\n| 1 |", ""]
+
+    batch = preprocessor_with_confluence.markdown_to_confluence_storage_batch(
+        documents, table_layout="wide"
+    )
+
+    assert batch == [
+        preprocessor_with_confluence.markdown_to_confluence_storage(
+            document, table_layout="wide"
+        )
+        for document in documents
+    ]
+    assert 'data-layout="wide"' in batch[2]
+
+
 def test_process_confluence_profile_macro(preprocessor_with_confluence):
     """Test processing Confluence User Profile Macro in page content."""
     html_content = MOCK_PAGE_RESPONSE["body"]["storage"]["value"]
@@ -1698,3 +1819,110 @@ class TestHtmlConversionCodeProtection:
         """Direct test of _convert_html_to_markdown with markdown code spans."""
         result = preprocessor._convert_html_to_markdown(md_input)
         assert expected_substr in result, f"Expected '{expected_substr}' in: {result!r}"
+
+
+class TestHtmlParserBackend:
+    """Tests for the selectable process_html_content parser backend."""
+
+    STORAGE = (
+        '<h2><ac:emoticon ac:name="smile" />&nbsp;Title</h2>'
+        "<p>Hello <strong>world</strong> &amp; friends, due "
+        '<time datetime="2024-05-01" />.</p>'
+        '<ac:structured-macro ac:name="code"><ac:plain-text-body>'
+        "<![CDATA[if a < b && c > d:\n    pass\n]]></ac:plain-text-body>"
+        "</ac:structured-macro>"
+        "<ul><li><p>one</p></li><li><p>two <code>x_y</code></p></li></ul>"
+        '<ac:image><ri:attachment ri:filename="diagram.png" /></ac:image>'
+    )
+
+    def test_default_parser_is_html_parser(self, monkeypatch):
+        monkeypatch.delenv("MCP_ATLASSIAN_HTML_PARSER", raising=False)
+        assert ConfluencePreprocessor("https://x").html_parser == "html.parser"
+
+    def test_parser_from_env(self, monkeypatch):
+        monkeypatch.setenv("MCP_ATLASSIAN_HTML_PARSER", " LXML ")
+        assert ConfluencePreprocessor("https://x").html_parser == "lxml"
+
+    def test_invalid_parser_from_env_falls_back(self, monkeypatch, caplog):
+        monkeypatch.setenv("MCP_ATLASSIAN_HTML_PARSER", "html5lib")
+        assert ConfluencePreprocessor("https://x").html_parser == "html.parser"
+        assert "Unsupported MCP_ATLASSIAN_HTML_PARSER" in caplog.text
+
+    def test_lxml_matches_html_parser(self):
+        pytest.importorskip("lxml")
+        default = ConfluencePreprocessor("https://x/wiki", html_parser="html.parser")
+        fast = ConfluencePreprocessor("https://x/wiki", html_parser="lxml")
+
+        expected = default.process_html_content(self.STORAGE, content_id="7")
+        actual = fast.process_html_content(self.STORAGE, content_id="7")
+
+        assert actual == expected
+        assert "<![CDATA[if a < b && c > d:" in actual[0]
+        assert "<html>" not in actual[0]
+
+    def test_missing_lxml_falls_back(self, monkeypatch):
+        from bs4 import FeatureNotFound
+
+        from mcp_atlassian.preprocessing import base
+
+        def _unavailable(html_content):
+            raise FeatureNotFound("lxml")
+
+        monkeypatch.setattr(base, "_parse_html_with_lxml", _unavailable)
+        processor = ConfluencePreprocessor("https://x", html_parser="lxml")
+
+        _, markdown = processor.process_html_content("<p>Hi <em>there</em></p>")
+
+        assert markdown.strip() == "Hi *there*"
+        assert processor.html_parser == "html.parser"
+
+    def test_profile_macro_inside_replaced_mention_is_skipped(self):
+        client = MockConfluenceClient()
+        processor = ConfluencePreprocessor("https://x")
+        html = (
+            '<ac:link><ri:user ri:account-id="123456" />'
+            '<ac:structured-macro ac:name="profile">'
+            '<ac:parameter ac:name="user"><ri:user ri:account-id="999" />'
+            "</ac:parameter></ac:structured-macro></ac:link>"
+        )
+
+        processed_html, _ = processor.process_html_content(
+            html, confluence_client=client
+        )
+
+        assert "profile" not in processed_html
+        assert processed_html.startswith("@")
+
+    @pytest.mark.parametrize(
+        "storage",
+        [
+            'due <time datetime="2024-05-01" /> \n<p>next</p>',
+            '<p>by <ac:link><ri:user ri:account-id="abc" /></ac:link>  \n</p>',
+        ],
+    )
+    def test_markdown_matches_reparsed_html(self, storage):
+        """Converting the rewritten tree matches converting its serialization."""
+        client = MagicMock()
+        client.get_user_details_by_accountid.return_value = {"displayName": "user_abc"}
+        processor = ConfluencePreprocessor("https://x/wiki", html_parser="html.parser")
+
+        html, markdown = processor.process_html_content(
+            storage, confluence_client=client
+        )
+
+        assert markdown == md(html)
+
+    def test_mention_before_macro_keeps_blank_line_count(self):
+        client = MagicMock()
+        client.get_user_details_by_accountid.return_value = {"displayName": "user_abc"}
+        storage = (
+            '<ac:link><ri:user ri:account-id="abc" /></ac:link>\n'
+            '<ac:structured-macro ac:name="info"><ac:rich-text-body>'
+            "<p>note</p></ac:rich-text-body></ac:structured-macro>"
+        )
+
+        _, markdown = ConfluencePreprocessor("https://x/wiki").process_html_content(
+            storage, confluence_client=client
+        )
+
+        assert markdown == "@user\\_abc\n\nnote"
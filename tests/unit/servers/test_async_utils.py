@@ -6,6 +6,7 @@ import time
 from collections.abc import Iterator
 from concurrent.futures import Future, ThreadPoolExecutor
 from threading import Lock
+from unittest.mock import AsyncMock, MagicMock, call
 
 import anyio
 import pytest
@@ -14,8 +15,11 @@ from src.mcp_atlassian.servers.async_utils import (
     DEFAULT_JIRA_FETCHER_MAX_WORKERS,
     JIRA_FETCHER_MAX_WORKERS_ENV,
     get_jira_fetcher_max_workers,
+    run_fetcher_call,
     run_jira_fetcher_call,
+    tool_progress,
 )
+from src.mcp_atlassian.utils.progress import TOOL_DEADLINE_ENV
 
 
 @pytest.fixture(autouse=True)
@@ -139,3 +143,26 @@ def test_run_jira_fetcher_call_works_across_anyio_backends(
 
     assert anyio.run(call, "asyncio") == "asyncio"
     assert anyio.run(call, "trio", backend="trio") == "trio"
+
+
+@pytest.mark.anyio
+async def test_tool_progress_reports_from_worker_thread(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Pages reported by a threaded fetcher reach ctx.report_progress."""
+    monkeypatch.setenv(TOOL_DEADLINE_ENV, "30")
+    ctx = MagicMock()
+    ctx.report_progress = AsyncMock()
+    progress = tool_progress(ctx)
+
+    def fetch_pages() -> str:
+        progress.page_done(50, 100, "Fetched 50 of up to 100")
+        progress.page_done(100, 100, "Fetched 100 of up to 100")
+        return "done"
+
+    assert await run_fetcher_call(fetch_pages) == "done"
+    assert ctx.report_progress.await_args_list == [
+        call(50, 100, "Fetched 50 of up to 100"),
+        call(100, 100, "Fetched 100 of up to 100"),
+    ]
+    assert progress.should_stop("next") is False
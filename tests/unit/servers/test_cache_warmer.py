@@ -0,0 +1,132 @@
+"""Tests for the optional startup cache warmer."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from mcp_atlassian.jira import JiraConfig
+from mcp_atlassian.servers import cache_warmer
+from mcp_atlassian.servers.cache_warmer import (
+    CACHE_WARMUP_ENV,
+    CacheWarmer,
+    get_cache_warmup_status,
+    start_cache_warmup,
+)
+from mcp_atlassian.servers.main import main_mcp
+
+
+@pytest.fixture(autouse=True)
+def _reset_warmer(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(cache_warmer, "_cache_warmer", None)
+    monkeypatch.delenv(CACHE_WARMUP_ENV, raising=False)
+    monkeypatch.delenv("MCP_ATLASSIAN_RESPONSE_CACHE_TTL", raising=False)
+
+
+@pytest.fixture
+def jira_config() -> JiraConfig:
+    return JiraConfig(
+        url="https://example.atlassian.net",
+        auth_type="basic",
+        username="user@example.com",
+        api_token="token",
+        projects_filter="PROJ, OPS",
+    )
+
+
+def test_warmup_is_opt_in(jira_config):
+    assert start_cache_warmup(jira_config, None) is None
+    assert get_cache_warmup_status() is None
+
+
+def test_warmup_requires_response_cache(monkeypatch, jira_config):
+    monkeypatch.setenv(CACHE_WARMUP_ENV, "true")
+
+    assert start_cache_warmup(jira_config, None) is None
+    assert get_cache_warmup_status() is None
+
+
+def test_run_sync_records_each_step(jira_config):
+    fetcher = MagicMock()
+    fetcher.get_project_versions.side_effect = [
+        [],
+        RuntimeError("403 Forbidden for https://example.atlassian.net as admin"),
+    ]
+    warmer = CacheWarmer(jira_config, None)
+
+    with patch("mcp_atlassian.jira.JiraFetcher", return_value=fetcher):
+        warmer.run_sync()
+
+    status = warmer.status()
+    assert status["state"] == "done"
+    assert "duration_ms" in status
+    assert set(status["steps"]) == {
+        "jira.fields",
+        "jira.link_types",
+        "jira.statuses",
+        "jira.project.PROJ",
+        "jira.project.OPS",
+    }
+    assert status["steps"]["jira.project.PROJ"]["ok"] is True
+    assert status["steps"]["jira.project.OPS"] == {
+        "ok": False,
+        "error": "RuntimeError",
+        "ms": status["steps"]["jira.project.OPS"]["ms"],
+    }
+    fetcher.get_fields.assert_called_once()
+    fetcher.get_project_components.assert_any_call("OPS")
+
+
+def test_status_step_fails_when_jira_is_unreachable(jira_config):
+    from mcp_atlassian.jira import JiraFetcher
+
+    fetcher = JiraFetcher(config=jira_config)
+    fetcher.jira = MagicMock()
+    fetcher.jira.get_all_statuses.side_effect = ConnectionError("down")
+    warmer = CacheWarmer(jira_config, None)
+
+    with patch("mcp_atlassian.jira.JiraFetcher", return_value=fetcher):
+        warmer.run_sync()
+
+    step = warmer.status()["steps"]["jira.statuses"]
+    assert step["ok"] is False
+    assert step["error"] == "ConnectionError"
+
+
+def test_fetcher_construction_failure_is_reported(jira_config):
+    warmer = CacheWarmer(jira_config, None)
+
+    with patch("mcp_atlassian.jira.JiraFetcher", side_effect=ValueError("bad url")):
+        warmer.run_sync()
+
+    status = warmer.status()
+    assert status["state"] == "done"
+    assert status["steps"]["jira"] == {"ok": False, "error": "ValueError"}
+
+
+@pytest.mark.anyio
+async def test_start_runs_in_background(monkeypatch, jira_config):
+    monkeypatch.setenv(CACHE_WARMUP_ENV, "true")
+    monkeypatch.setenv("MCP_ATLASSIAN_RESPONSE_CACHE_TTL", "60")
+
+    with patch("mcp_atlassian.jira.JiraFetcher", return_value=MagicMock()):
+        task = start_cache_warmup(jira_config, None)
+        assert task is not None
+        await task
+
+    assert get_cache_warmup_status()["state"] == "done"
+
+
+@pytest.mark.anyio
+async def test_health_check_reports_warmup_without_blocking(jira_config):
+    cache_warmer._cache_warmer = CacheWarmer(jira_config, None)
+
+    app = main_mcp.http_app(transport="sse")
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get("/healthz")
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok", "cache_warmup": {"state": "pending"}}
@@ -250,6 +250,7 @@ def test_confluence_mcp(mock_confluence_fetcher, mock_base_confluence_config):
         get_space_page_tree,
         get_space_permissions,
         list_page_templates,
+        local_search,
         search,
         search_user,
         update_page,
@@ -276,6 +277,7 @@ def test_confluence_mcp(mock_confluence_fetcher, mock_base_confluence_config):
     # Create and configure the sub-MCP for Confluence tools
     confluence_sub_mcp = FastMCP(name="TestConfluenceSubMCP")
     confluence_sub_mcp.add_tool(search)
+    confluence_sub_mcp.add_tool(local_search)
     confluence_sub_mcp.add_tool(get_page)
     confluence_sub_mcp.add_tool(get_page_children)
     confluence_sub_mcp.add_tool(get_space_page_tree)
@@ -506,6 +508,27 @@ async def test_search(client, mock_confluence_fetcher):
     assert result_data[0]["title"] == "Test Page Mock Title"
 
 
+@pytest.mark.anyio
+async def test_local_search(client, mock_confluence_fetcher, monkeypatch):
+    """Test the local_search tool answers from the local page index."""
+    monkeypatch.setenv("CONFLUENCE_LOCAL_INDEX_SPACES", "DOCS")
+    mock_confluence_fetcher.local_search.return_value = {
+        "query": "runbook",
+        "spaces": ["OPS"],
+        "results": [{"id": "123", "title": "Runbook", "snippet": "[Runbook]"}],
+    }
+
+    response = await client.call_tool(
+        "confluence_local_search", {"query": "runbook", "spaces": "OPS"}
+    )
+
+    assert json.loads(response.content[0].text)["results"][0]["id"] == "123"
+    mock_confluence_fetcher.local_search.assert_called_once_with(
+        query="runbook", spaces=["OPS"], limit=10, refresh=True
+    )
+    mock_confluence_fetcher.search.assert_not_called()
+
+
 @pytest.mark.anyio
 async def test_search_returns_error_details(client, mock_confluence_fetcher):
     """Test that search tool failures preserve the original error message."""
@@ -643,6 +666,42 @@ async def test_get_page_children(client, mock_confluence_fetcher):
     )
 
 
+@pytest.mark.anyio
+async def test_get_space_page_tree_reports_progress_and_partial_result(
+    client, mock_confluence_fetcher
+):
+    """Per-batch progress reaches the client; a deadline cut adds a hint."""
+
+    def partial_tree(space_key, limit, start, progress):
+        progress.page_done(200, limit, "Fetched 200 of up to 500 pages")
+        progress.deadline_reached = True
+        return {
+            "space_key": space_key,
+            "total_pages": 200,
+            "has_more": True,
+            "pages": [],
+            "next_start": start + 200,
+        }
+
+    mock_confluence_fetcher.get_space_page_tree.side_effect = partial_tree
+    updates = []
+
+    async def on_progress(progress, total, message):
+        updates.append((progress, total, message))
+
+    response = await client.call_tool(
+        "confluence_get_space_page_tree",
+        {"space_key": "TEST", "limit": 500, "start": 100},
+        progress_handler=on_progress,
+    )
+
+    assert updates == [(200, 500, "Fetched 200 of up to 500 pages")]
+    result_data = json.loads(response.content[0].text)
+    assert result_data["partial"] is True
+    assert result_data["next_start"] == 300
+    assert "start=300" in result_data["hint"]
+
+
 @pytest.mark.anyio
 async def test_get_space_page_tree(client, mock_confluence_fetcher):
     """Test the get_space_page_tree tool."""
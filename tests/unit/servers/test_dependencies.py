@@ -18,11 +18,14 @@ from mcp_atlassian.servers.dependencies import (
     _create_and_validate,
     _create_user_config_for_fetcher,
     _resolve_bearer_auth_type,
+    _shared_validation_backend,
+    _validate_across_workers,
     _validation_cache,
     _validation_cache_scope,
     get_confluence_fetcher,
     get_jira_fetcher,
 )
+from mcp_atlassian.utils.cache_backends import SqliteCacheBackend
 from mcp_atlassian.utils.oauth import BYOAccessTokenOAuthConfig, OAuthConfig
 from tests.utils.assertions import assert_mock_called_with_partial
 from tests.utils.factories import AuthConfigFactory
@@ -2170,6 +2173,160 @@ class TestValidationCache:
         succeeding_fetcher.get_current_user_info.assert_called_once()
 
 
+class TestSharedValidationCache:
+    """Validation results shared across workers through the cache backend."""
+
+    @pytest.fixture
+    def shared_backend(self, tmp_path, monkeypatch):
+        backend = SqliteCacheBackend(tmp_path / "cache.sqlite3")
+        monkeypatch.setattr(
+            "mcp_atlassian.servers.dependencies._shared_validation_backend",
+            lambda: backend,
+        )
+        return backend
+
+    def _headers(self) -> dict[str, str]:
+        return {
+            "X-Atlassian-Confluence-Url": "https://test.atlassian.net",
+            "X-Atlassian-Confluence-Personal-Token": "shared-pat-token",
+        }
+
+    @patch("mcp_atlassian.servers.dependencies.get_http_request")
+    @patch("mcp_atlassian.servers.dependencies.ConfluenceFetcher")
+    async def test_other_worker_reuses_shared_validation(
+        self,
+        mock_confluence_fetcher_class,
+        mock_get_http_request,
+        mock_context,
+        shared_backend,
+    ):
+        """A worker with a cold local cache reuses another worker's result."""
+        fetcher1 = _create_mock_fetcher(
+            ConfluenceFetcher,
+            validation_return={"email": "user@example.com", "displayName": "User"},
+        )
+        fetcher2 = _create_mock_fetcher(ConfluenceFetcher)
+        mock_confluence_fetcher_class.side_effect = [fetcher1, fetcher2]
+
+        mock_get_http_request.return_value = TestValidationCache()._header_pat_request(
+            self._headers()
+        )
+        await get_confluence_fetcher(mock_context)
+        # Simulate a different worker process: empty per-process cache.
+        _validation_cache.clear()
+        request2 = TestValidationCache()._header_pat_request(self._headers())
+        mock_get_http_request.return_value = request2
+        await get_confluence_fetcher(mock_context)
+
+        fetcher1.get_current_user_info.assert_called_once()
+        fetcher2.get_current_user_info.assert_not_called()
+        assert request2.state.user_atlassian_email == "user@example.com"
+
+    def test_shared_keys_are_digests_only(self, shared_backend):
+        _validate_across_workers(("Jira", "a" * 64), lambda: "account-id", "fn", "Jira")
+
+        rows = shared_backend._conn.execute("SELECT key FROM response_cache").fetchall()
+        assert rows == [(f"Jira:{'a' * 64}",)]
+
+    def test_failed_validation_is_not_shared_and_releases_lease(self, shared_backend):
+        cache_key = ("Jira", "b" * 64)
+
+        with pytest.raises(RuntimeError):
+            _validate_across_workers(
+                cache_key,
+                MagicMock(side_effect=RuntimeError("401")),
+                "fn",
+                "Jira",
+            )
+
+        retry = MagicMock(return_value="account-id")
+        assert _validate_across_workers(cache_key, retry, "fn", "Jira") == (
+            "account-id"
+        )
+        retry.assert_called_once()
+
+    def test_waits_for_worker_holding_the_lease(self, shared_backend, monkeypatch):
+        """A worker that loses the lease polls for the winner's result."""
+        monkeypatch.setattr(
+            "mcp_atlassian.servers.dependencies._SHARED_VALIDATION_POLL_INTERVAL",
+            0.01,
+        )
+        shared_key = f"Jira:{'c' * 64}"
+        assert shared_backend.add("credential-validation-lease", shared_key, 1, 15.0)
+
+        def winner() -> None:
+            shared_backend.put(
+                "credential-validation", shared_key, ["winner-account"], 60
+            )
+
+        timer = threading.Timer(0.05, winner)
+        timer.start()
+        validate_fn = MagicMock(return_value="loser-account")
+        try:
+            result = _validate_across_workers(
+                ("Jira", "c" * 64), validate_fn, "fn", "Jira"
+            )
+        finally:
+            timer.join()
+
+        assert result == "winner-account"
+        validate_fn.assert_not_called()
+
+    def test_lease_store_error_validates_without_waiting(
+        self, shared_backend, monkeypatch
+    ):
+        """A store that fails to take the lease must not stall the caller."""
+        monkeypatch.setattr(shared_backend, "add", MagicMock(return_value=None))
+        monkeypatch.setattr(
+            "mcp_atlassian.servers.dependencies.time.sleep",
+            MagicMock(side_effect=AssertionError("polled a lease nobody holds")),
+        )
+        validate_fn = MagicMock(return_value="account-id")
+
+        result = _validate_across_workers(("Jira", "d" * 64), validate_fn, "fn", "Jira")
+
+        assert result == "account-id"
+        validate_fn.assert_called_once()
+
+    @patch("mcp_atlassian.servers.dependencies.get_http_request")
+    @patch("mcp_atlassian.servers.dependencies.ConfluenceFetcher")
+    async def test_validation_runs_off_the_event_loop(
+        self,
+        mock_confluence_fetcher_class,
+        mock_get_http_request,
+        mock_context,
+        shared_backend,
+    ):
+        """Fetcher creation and validation run in a worker thread."""
+        validating_threads: list[threading.Thread] = []
+        fetcher = _create_mock_fetcher(ConfluenceFetcher)
+        fetcher.get_current_user_info.side_effect = lambda: (
+            validating_threads.append(threading.current_thread())
+            or {"email": "user@example.com", "displayName": "User"}
+        )
+        mock_confluence_fetcher_class.return_value = fetcher
+        mock_get_http_request.return_value = TestValidationCache()._header_pat_request(
+            self._headers()
+        )
+
+        await get_confluence_fetcher(mock_context)
+
+        assert validating_threads
+        assert validating_threads[0] is not threading.current_thread()
+
+    def test_unavailable_backend_falls_back_to_per_process(self, monkeypatch):
+        monkeypatch.setattr(
+            "mcp_atlassian.servers.dependencies._shared_validation_unavailable",
+            False,
+        )
+        monkeypatch.setattr(
+            "mcp_atlassian.servers.dependencies.get_cache_backend",
+            MagicMock(side_effect=PermissionError("read-only home")),
+        )
+
+        assert _shared_validation_backend() is None
+
+
 class TestBasicAuthMultiUser:
     """Tests for Basic Auth multi-user support (#739)."""
 
@@ -6,7 +6,7 @@ import os
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 from typing import Any
-from unittest.mock import AsyncMock, MagicMock, call, patch
+from unittest.mock import ANY, AsyncMock, MagicMock, call, patch
 
 import pytest
 from fastmcp import Client, FastMCP
@@ -18,6 +18,7 @@ from src.mcp_atlassian.jira import JiraFetcher
 from src.mcp_atlassian.jira.config import JiraConfig
 from src.mcp_atlassian.models.jira import (
     JiraCustomerRequest,
+    JiraIssue,
     JiraRequestType,
     JiraRequestTypeField,
     JiraRequestTypeFieldsResult,
@@ -460,6 +461,8 @@ def test_jira_mcp(mock_jira_fetcher, mock_base_jira_config):
         batch_create_issues,
         batch_create_versions,
         batch_get_changelogs,
+        batch_get_issues,
+        count_issues,
         create_customer_request,
         create_issue,
         create_issue_link,
@@ -500,8 +503,10 @@ def test_jira_mcp(mock_jira_fetcher, mock_base_jira_config):
         get_user_profile,
         get_worklog,
         link_to_epic,
+        local_search,
         move_issue,
         move_issues_to_backlog,
+        multi_search,
         remove_issue_link,
         search,
         search_assignable_users,
@@ -522,6 +527,10 @@ def test_jira_mcp(mock_jira_fetcher, mock_base_jira_config):
     jira_sub_mcp.add_tool(get_issue_sla)
     jira_sub_mcp.add_tool(get_issues_development_info)
     jira_sub_mcp.add_tool(search)
+    jira_sub_mcp.add_tool(count_issues)
+    jira_sub_mcp.add_tool(local_search)
+    jira_sub_mcp.add_tool(multi_search)
+    jira_sub_mcp.add_tool(batch_get_issues)
     jira_sub_mcp.add_tool(search_fields)
     jira_sub_mcp.add_tool(get_project_issues)
     jira_sub_mcp.add_tool(get_project_versions)
@@ -702,6 +711,128 @@ async def test_search(jira_client, mock_jira_fetcher):
         expand=None,
         projects_filter=None,
         page_token=None,
+        progress=ANY,
+    )
+
+
+@pytest.mark.anyio
+async def test_count_issues(jira_client, mock_jira_fetcher):
+    """Test the count_issues tool returns the count without issue bodies."""
+    mock_jira_fetcher.count_issues.return_value = 321
+
+    response = await jira_client.call_tool(
+        "jira_count_issues", {"jql": "project = TEST", "projects_filter": "TEST"}
+    )
+
+    assert json.loads(response.content[0].text) == {
+        "jql": "project = TEST",
+        "count": 321,
+        "approximate": True,
+    }
+    mock_jira_fetcher.count_issues.assert_called_once_with(
+        jql="project = TEST", projects_filter="TEST"
+    )
+    mock_jira_fetcher.search_issues.assert_not_called()
+
+
+@pytest.mark.anyio
+async def test_local_search(jira_client, mock_jira_fetcher, monkeypatch):
+    """Test the local_search tool passes filters to the mirror search."""
+    monkeypatch.setenv("JIRA_LOCAL_MIRROR_PROJECTS", "TEST")
+    mock_jira_fetcher.local_search.return_value = {
+        "query": "login",
+        "projects": ["TEST"],
+        "issues": [{"key": "TEST-1", "summary": "Login fails"}],
+    }
+
+    response = await jira_client.call_tool(
+        "jira_local_search",
+        {"query": "login", "projects": "TEST", "status": "Open", "refresh": False},
+    )
+
+    assert json.loads(response.content[0].text)["issues"][0]["key"] == "TEST-1"
+    mock_jira_fetcher.local_search.assert_called_once_with(
+        query="login",
+        projects=["TEST"],
+        status="Open",
+        assignee=None,
+        issue_type=None,
+        limit=20,
+        refresh=False,
+    )
+    mock_jira_fetcher.search_issues.assert_not_called()
+
+
+@pytest.mark.anyio
+async def test_multi_search(jira_client, mock_jira_fetcher):
+    """Test the multi_search tool parses queries and shares one issue table."""
+    mock_jira_fetcher.multi_search.return_value = {
+        "queries": [
+            {"jql": "type = Bug", "total": 1, "keys": ["TEST-1"]},
+            {"jql": "status = Blocked", "total": 1, "keys": ["TEST-1"]},
+        ],
+        "issues": {"TEST-1": {"key": "TEST-1", "summary": "Broken"}},
+    }
+
+    response = await jira_client.call_tool(
+        "jira_multi_search",
+        {
+            "queries": '["type = Bug", "status = Blocked"]',
+            "fields": "summary, status",
+        },
+    )
+
+    assert json.loads(response.content[0].text)["issues"] == {
+        "TEST-1": {"key": "TEST-1", "summary": "Broken"}
+    }
+    mock_jira_fetcher.multi_search.assert_called_once_with(
+        queries=["type = Bug", "status = Blocked"],
+        fields=["summary", "status"],
+        limit=10,
+        projects_filter=None,
+    )
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    ("queries", "message"),
+    [
+        ("type = Bug, status = Open", "JSON array of JQL strings"),
+        ("[]", "at least one JQL query"),
+        (json.dumps([f"key = TEST-{n}" for n in range(11)]), "At most 10 queries"),
+    ],
+)
+async def test_multi_search_rejects_bad_queries(
+    jira_client, mock_jira_fetcher, queries, message
+):
+    """Test the multi_search tool validates its queries argument."""
+    with pytest.raises(ToolError, match=message):
+        await jira_client.call_tool("jira_multi_search", {"queries": queries})
+
+    mock_jira_fetcher.multi_search.assert_not_called()
+
+
+@pytest.mark.anyio
+async def test_batch_get_issues(jira_client, mock_jira_fetcher):
+    """Test the batch_get_issues tool splits keys and returns per-key errors."""
+    mock_jira_fetcher.batch_get_issues.return_value = {
+        "issues": [{"key": "TEST-1", "summary": "Broken"}],
+        "errors": [{"key": "TEST-9", "error": "Issue TEST-9 not found."}],
+    }
+
+    response = await jira_client.call_tool(
+        "jira_batch_get_issues",
+        {"issue_keys": "TEST-1, TEST-9", "fields": "summary", "comment_limit": 3},
+    )
+
+    assert json.loads(response.content[0].text)["errors"] == [
+        {"key": "TEST-9", "error": "Issue TEST-9 not found."}
+    ]
+    mock_jira_fetcher.batch_get_issues.assert_called_once_with(
+        issue_keys=["TEST-1", "TEST-9"],
+        fields=["summary"],
+        comment_limit=3,
+        projects_filter=None,
     )
 
 
@@ -4744,7 +4875,7 @@ async def test_get_issues_development_info_parses_keys(jira_client, mock_jira_fe
             "jira_get_cross_project_dependencies",
             {"project_key": "TEST", "max_issues": 50},
             "get_cross_project_dependencies",
-            {"project_key": "TEST", "max_issues": 50},
+            {"project_key": "TEST", "max_issues": 50, "cursor": None, "progress": ANY},
         ),
     ],
 )
@@ -4843,3 +4974,29 @@ async def test_jira_analysis_tools_return_structured_errors(
 
     assert content["success"] is False
     assert content["error"] == "service unavailable"
+
+
+@pytest.mark.anyio
+async def test_batch_get_changelogs_partial_at_deadline(jira_client, mock_jira_fetcher):
+    """A deadline-cut bulk fetch returns what it has and a token to resume."""
+
+    def partial_fetch(issue_ids_or_keys, fields, page_token, progress):
+        progress.deadline_reached = True
+        progress.cursor = "next-token"
+        return [JiraIssue(id="10001", changelogs=[])]
+
+    mock_jira_fetcher.batch_get_changelogs.side_effect = partial_fetch
+
+    response = await jira_client.call_tool(
+        "jira_batch_get_changelogs",
+        {"issue_ids_or_keys": "TEST-1,TEST-2", "page_token": "prev-token"},
+    )
+
+    result = json.loads(response.content[0].text)
+    assert result["partial"] is True
+    assert result["next_page_token"] == "next-token"
+    assert result["issues"] == [{"issue_id": "10001", "changelogs": []}]
+    assert (
+        mock_jira_fetcher.batch_get_changelogs.call_args.kwargs["page_token"]
+        == "prev-token"
+    )
@@ -215,6 +215,42 @@ class TestMCPProtocolIntegration:
             expected_cloud_only_tools if is_cloud else set()
         )
 
+    @pytest.mark.parametrize("projects", ["PROJ", ""], ids=["mirror", "no_mirror"])
+    async def test_local_search_listed_only_with_mirror(self, monkeypatch, projects):
+        """jira_local_search is advertised only when the mirror is configured."""
+        monkeypatch.setenv("JIRA_LOCAL_MIRROR_PROJECTS", projects)
+        app_context = MainAppContext(full_jira_config=MagicMock(spec=JiraConfig))
+        request_context = MagicMock()
+        request_context.request = None
+        request_context.lifespan_context = {"app_lifespan_context": app_context}
+
+        with patch.object(main_mcp, "_mcp_server") as mcp_server:
+            mcp_server.request_context = request_context
+            listed_tool_names = {tool.name for tool in await main_mcp._list_tools_mcp()}
+
+        assert "jira_get_issue" in listed_tool_names
+        assert ("jira_local_search" in listed_tool_names) is bool(projects)
+
+    @pytest.mark.parametrize("spaces", ["DOCS", ""], ids=["index", "no_index"])
+    async def test_confluence_local_search_listed_only_with_index(
+        self, monkeypatch, spaces
+    ):
+        """confluence_local_search is advertised only when the index is set."""
+        monkeypatch.setenv("CONFLUENCE_LOCAL_INDEX_SPACES", spaces)
+        app_context = MainAppContext(
+            full_confluence_config=MagicMock(spec=ConfluenceConfig)
+        )
+        request_context = MagicMock()
+        request_context.request = None
+        request_context.lifespan_context = {"app_lifespan_context": app_context}
+
+        with patch.object(main_mcp, "_mcp_server") as mcp_server:
+            mcp_server.request_context = request_context
+            listed_tool_names = {tool.name for tool in await main_mcp._list_tools_mcp()}
+
+        assert "confluence_get_page" in listed_tool_names
+        assert ("confluence_local_search" in listed_tool_names) is bool(spaces)
+
     async def test_tool_filtering_uses_header_based_jira_deployment(
         self, atlassian_mcp_server
     ):
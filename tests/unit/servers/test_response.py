@@ -0,0 +1,235 @@
+"""Tests for the tool response JSON encoder."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from mcp_atlassian.servers import response
+from mcp_atlassian.servers.response import (
+    MIN_TEXT_CHARS,
+    RESPONSE_FORMAT_ENV,
+    RESPONSE_MAX_BYTES_ENV,
+    RESPONSE_MAX_TOKENS_ENV,
+    TRUNCATION_KEY,
+    dump_response,
+    get_response_budget,
+    get_response_format,
+)
+
+SAMPLE = {
+    "issues": [
+        {
+            "key": "PROJ-1",
+            "summary": 'Ünïcode "quoted" \\ summary\twith\x01control',
+            "labels": [],
+            "fields": {},
+            "points": 2.5,
+            "count": 2**40,
+            "done": False,
+            "assignee": None,
+        }
+    ],
+    "total": 1,
+}
+
+
+@pytest.fixture(autouse=True)
+def _clear_format(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv(RESPONSE_FORMAT_ENV, raising=False)
+    monkeypatch.delenv(RESPONSE_MAX_BYTES_ENV, raising=False)
+    monkeypatch.delenv(RESPONSE_MAX_TOKENS_ENV, raising=False)
+
+
+@pytest.mark.parametrize(
+    ("raw_value", "expected"),
+    [
+        (None, "pretty"),
+        ("", "pretty"),
+        ("compact", "compact"),
+        (" Compact ", "compact"),
+        ("pretty", "pretty"),
+        ("minified", "pretty"),
+    ],
+)
+def test_get_response_format(monkeypatch, raw_value, expected):
+    if raw_value is not None:
+        monkeypatch.setenv(RESPONSE_FORMAT_ENV, raw_value)
+
+    assert get_response_format() == expected
+
+
+def test_pretty_matches_stdlib_output():
+    assert dump_response(SAMPLE) == json.dumps(SAMPLE, indent=2, ensure_ascii=False)
+
+
+def test_compact_matches_stdlib_output(monkeypatch):
+    monkeypatch.setenv(RESPONSE_FORMAT_ENV, "compact")
+
+    result = dump_response(SAMPLE)
+
+    assert result == json.dumps(SAMPLE, separators=(",", ":"), ensure_ascii=False)
+    assert len(result) < len(dump_response(SAMPLE, "pretty"))
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"big": 2**70},
+        {1: "int key", "2": "str key"},
+        {"surrogate": "\ud800"},
+    ],
+)
+def test_edge_values_match_stdlib(data):
+    assert dump_response(data) == json.dumps(data, indent=2, ensure_ascii=False)
+
+
+def test_non_json_types_still_raise():
+    with pytest.raises(TypeError):
+        dump_response({"when": datetime(2024, 1, 1, tzinfo=timezone.utc)})
+
+
+def test_works_without_orjson(monkeypatch):
+    monkeypatch.setattr(response, "orjson", None)
+
+    assert dump_response(SAMPLE, "compact") == json.dumps(
+        SAMPLE, separators=(",", ":"), ensure_ascii=False
+    )
+
+
+@pytest.mark.parametrize(
+    ("max_bytes", "max_tokens", "expected"),
+    [
+        (None, None, 0),
+        ("5000", None, 5000),
+        (None, "1000", 4000),
+        ("5000", "1000", 4000),
+        ("0", "abc", 0),
+    ],
+)
+def test_get_response_budget(monkeypatch, max_bytes, max_tokens, expected):
+    if max_bytes is not None:
+        monkeypatch.setenv(RESPONSE_MAX_BYTES_ENV, max_bytes)
+    if max_tokens is not None:
+        monkeypatch.setenv(RESPONSE_MAX_TOKENS_ENV, max_tokens)
+
+    assert get_response_budget() == expected
+
+
+def test_budget_leaves_small_results_untouched(monkeypatch):
+    monkeypatch.setenv(RESPONSE_MAX_BYTES_ENV, "100000")
+
+    assert dump_response(SAMPLE) == json.dumps(SAMPLE, indent=2, ensure_ascii=False)
+
+
+def test_budget_cuts_longest_text_first():
+    page = {
+        "metadata": {"id": "1", "title": "Big page"},
+        "content": {"value": "x" * 200_000},
+        "excerpt": "y" * 5_000,
+    }
+
+    result = dump_response(page, max_bytes=20_000)
+    data = json.loads(result)
+
+    assert len(result.encode()) <= 20_000
+    assert data["metadata"] == page["metadata"]
+    assert data["excerpt"] == page["excerpt"]
+    returned = data[TRUNCATION_KEY]["fields"][0]["returned"]
+    assert data[TRUNCATION_KEY]["fields"] == [
+        {
+            "path": "content.value",
+            "kind": "text",
+            "returned": returned,
+            "total": 200_000,
+        }
+    ]
+    assert data["content"]["value"].startswith("x" * returned + "\n[... ")
+    assert page["content"]["value"] == "x" * 200_000
+
+
+def test_budget_drops_trailing_list_items():
+    search = {
+        "total": 400,
+        "start_at": 0,
+        "issues": [{"key": f"PROJ-{n}", "summary": "s" * 200} for n in range(400)],
+    }
+
+    result = dump_response(search, "compact", max_bytes=10_000)
+    data = json.loads(result)
+
+    assert len(result.encode()) <= 10_000
+    kept = len(data["issues"])
+    assert 0 < kept < 400
+    assert data["issues"] == search["issues"][:kept]
+    assert data[TRUNCATION_KEY]["fields"] == [
+        {
+            "path": "issues",
+            "kind": "items",
+            "returned": kept,
+            "total": 400,
+            "next_start": kept,
+        }
+    ]
+    assert len(search["issues"]) == 400
+
+
+def test_next_start_continues_from_the_page_offset():
+    search = {
+        "start_at": 100,
+        "issues": [{"key": f"PROJ-{n}", "summary": "s" * 200} for n in range(100)],
+    }
+
+    data = json.loads(dump_response(search, "compact", max_bytes=5_000))
+
+    cut = data[TRUNCATION_KEY]["fields"][0]
+    assert cut["next_start"] == 100 + len(data["issues"]) == 100 + cut["returned"]
+
+
+@pytest.mark.parametrize(
+    "result",
+    [
+        {"start_at": 0, "next_page_token": "abc", "issues": []},
+        {"issues": [{"key": "PROJ-1", "comments": []}]},
+    ],
+    ids=["token-paginated", "nested"],
+)
+def test_no_next_start_without_an_offset(result):
+    items = [{"body": "c" * 200} for _ in range(100)]
+    if "next_page_token" in result:
+        result["issues"] = items
+    else:
+        result["issues"][0]["comments"] = items
+
+    data = json.loads(dump_response(result, "compact", max_bytes=5_000))
+
+    assert data[TRUNCATION_KEY]["fields"]
+    assert all("next_start" not in cut for cut in data[TRUNCATION_KEY]["fields"])
+
+
+def test_existing_truncation_key_is_not_overwritten():
+    result = {TRUNCATION_KEY: "upstream", "items": ["i" * 200 for _ in range(100)]}
+
+    data = json.loads(dump_response(result, "compact", max_bytes=5_000))
+
+    assert data["results"][TRUNCATION_KEY] == "upstream"
+    assert data[TRUNCATION_KEY]["fields"][0]["path"] == "items"
+
+
+def test_budget_wraps_top_level_lists():
+    pages = [{"id": str(n), "body": "b" * (MIN_TEXT_CHARS * 3)} for n in range(30)]
+
+    data = json.loads(dump_response(pages, max_bytes=15_000))
+
+    assert TRUNCATION_KEY in data
+    assert [page["id"] for page in data["results"]] == [
+        str(n) for n in range(len(data["results"]))
+    ]
+    paths = {cut["path"] for cut in data[TRUNCATION_KEY]["fields"]}
+    assert "$" in paths
+    # Cuts inside dropped items are not reported.
+    assert all(
+        int(path[1 : path.index("]")]) < len(data["results"]) for path in paths - {"$"}
+    )
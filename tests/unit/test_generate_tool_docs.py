@@ -371,6 +371,12 @@ def _write_count_documents(root: Path, counts: ToolCounts) -> None:
         f"In v0.22.0, the default will change from all toolsets to "
         f"{counts.core_toolsets} core toolsets only.\n"
     )
+    toolsets_module = root / "src" / "mcp_atlassian" / "utils" / "toolsets.py"
+    toolsets_module.parent.mkdir(parents=True)
+    toolsets_module.write_text(
+        f'"""Groups {counts.total_tools} tools into {counts.total_toolsets} '
+        'named toolsets."""\n'
+    )
 
 
 @pytest.mark.parametrize(
@@ -401,6 +407,12 @@ def _write_count_documents(root: Path, counts: ToolCounts) -> None:
             "to 30 core toolsets only",
             "core_toolsets",
         ),
+        (
+            "src/mcp_atlassian/utils/toolsets.py",
+            "Groups 100 tools",
+            "Groups 98 tools",
+            "total_tools",
+        ),
     ],
 )
 def test_check_counts_rejects_valid_number_in_wrong_context(
@@ -0,0 +1,246 @@
+"""Tests for the response cache and the write invalidation bus."""
+
+import os
+from unittest.mock import MagicMock
+
+import pytest
+
+from mcp_atlassian.jira.config import JiraConfig
+from mcp_atlassian.jira.watchers import WatchersMixin
+from mcp_atlassian.utils import cache as cache_module
+from mcp_atlassian.utils.cache import (
+    JIRA_ISSUE,
+    InvalidationBus,
+    ResponseCache,
+    config_cache_scope,
+    entity_key,
+    invalidates,
+    invalidation_bus,
+    publish_invalidation,
+)
+
+
+@pytest.fixture
+def published(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Capture everything published on a private bus."""
+    bus = InvalidationBus()
+    events: list[str] = []
+    bus.subscribe(events.append)
+    monkeypatch.setattr(cache_module, "invalidation_bus", bus)
+    return events
+
+
+class TestInvalidationBus:
+    def test_publish_reaches_every_subscriber(self):
+        bus = InvalidationBus()
+        first: list[str] = []
+        second: list[str] = []
+        bus.subscribe(first.append)
+        bus.subscribe(second.append)
+
+        bus.publish("jira.issue:A-1", "jira.issue:A-2")
+
+        assert first == ["jira.issue:A-1", "jira.issue:A-2"]
+        assert second == first
+
+    def test_unsubscribe_stops_delivery(self):
+        bus = InvalidationBus()
+        events: list[str] = []
+        unsubscribe = bus.subscribe(events.append)
+        unsubscribe()
+
+        bus.publish("jira.issue:A-1")
+
+        assert events == []
+
+    def test_failing_subscriber_does_not_block_others(self):
+        bus = InvalidationBus()
+        events: list[str] = []
+        bus.subscribe(MagicMock(side_effect=RuntimeError("boom")))
+        bus.subscribe(events.append)
+
+        bus.publish("confluence.page:1")
+
+        assert events == ["confluence.page:1"]
+
+
+class TestInvalidatesDecorator:
+    def test_publishes_named_arguments(self, published):
+        @invalidates(JIRA_ISSUE, "issue_key", "other_key")
+        def write(issue_key: str, other_key: str | None = None) -> str:
+            return "ok"
+
+        assert write("A-1", other_key="A-2") == "ok"
+        assert published == ["jira.issue:A-1", "jira.issue:A-2"]
+
+    def test_flattens_lists_and_skips_missing_values(self, published):
+        @invalidates(JIRA_ISSUE, "issue_keys", "epic_key")
+        def write(issue_keys: list[str], epic_key: str | None = None) -> None:
+            return None
+
+        write(["A-1", "A-2"])
+        assert published == ["jira.issue:A-1", "jira.issue:A-2"]
+
+    def test_publishes_even_when_write_fails(self, published):
+        @invalidates(JIRA_ISSUE, "issue_key")
+        def write(issue_key: str) -> None:
+            raise ValueError("upstream error")
+
+        with pytest.raises(ValueError, match="upstream error"):
+            write("A-1")
+        assert published == ["jira.issue:A-1"]
+
+    def test_publish_invalidation_helper(self, published):
+        publish_invalidation(JIRA_ISSUE, "A-1", None, "", ("A-2",))
+        assert published == ["jira.issue:A-1", "jira.issue:A-2"]
+
+
+class TestResponseCache:
+    def test_disabled_by_default(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.delenv("MCP_ATLASSIAN_RESPONSE_CACHE_TTL", raising=False)
+        cache = ResponseCache("test", bus=InvalidationBus())
+        loader = MagicMock(return_value={"value": 1})
+
+        cache.get_or_load("k", loader)
+        cache.get_or_load("k", loader)
+
+        assert cache.enabled is False
+        assert loader.call_count == 2
+
+    def test_env_enables_cache(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setenv("MCP_ATLASSIAN_RESPONSE_CACHE_TTL", "60")
+        cache = ResponseCache("test", bus=InvalidationBus())
+
+        assert cache.enabled is True
+
+    def test_max_ttl_setting_is_read_lazily(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setenv("MCP_ATLASSIAN_RESPONSE_CACHE_TTL", "60")
+        monkeypatch.setenv("TEST_MAX_TTL", "0")
+        cache = ResponseCache(
+            "test",
+            max_ttl=lambda: int(os.environ["TEST_MAX_TTL"]),
+            bus=InvalidationBus(),
+        )
+        assert cache.enabled is False
+
+        monkeypatch.setenv("TEST_MAX_TTL", "5")
+        assert cache.enabled is False
+        cache.clear()
+        assert cache.enabled is True
+
+    def test_hit_skips_loader(self):
+        cache = ResponseCache("test", ttl=60, maxsize=10, bus=InvalidationBus())
+        loader = MagicMock(return_value={"value": 1})
+
+        assert cache.get_or_load("k", loader) == {"value": 1}
+        assert cache.get_or_load("k", loader) == {"value": 1}
+        loader.assert_called_once()
+
+    def test_invalidation_forces_reload(self):
+        bus = InvalidationBus()
+        cache = ResponseCache("test", ttl=60, maxsize=10, bus=bus)
+        loader = MagicMock(side_effect=[1, 2])
+        entities = (entity_key(JIRA_ISSUE, "A-1"),)
+
+        cache.get_or_load("k", loader, entities=entities)
+        bus.publish("jira.issue:A-1")
+
+        assert cache.get_or_load("k", loader, entities=entities) == 2
+
+    def test_unrelated_invalidation_keeps_entry(self):
+        bus = InvalidationBus()
+        cache = ResponseCache("test", ttl=60, maxsize=10, bus=bus)
+        loader = MagicMock(side_effect=[1, 2])
+        entities = (entity_key(JIRA_ISSUE, "A-1"),)
+
+        cache.get_or_load("k", loader, entities=entities)
+        bus.publish("jira.issue:A-2")
+
+        assert cache.get_or_load("k", loader, entities=entities) == 1
+
+    def test_wildcard_invalidates_whole_kind(self):
+        bus = InvalidationBus()
+        cache = ResponseCache("test", ttl=60, maxsize=10, bus=bus)
+        loader = MagicMock(side_effect=[1, 2])
+        entities = (entity_key(JIRA_ISSUE, "A-1"),)
+
+        cache.get_or_load("k", loader, entities=entities)
+        bus.publish("jira.issue:*")
+
+        assert cache.get_or_load("k", loader, entities=entities) == 2
+
+    def test_invalidation_survives_more_markers_than_maxsize(self):
+        bus = InvalidationBus()
+        cache = ResponseCache("test", ttl=60, maxsize=4, bus=bus)
+        entities = (entity_key(JIRA_ISSUE, "P-1"),)
+
+        cache.put("issue-1", "old", loaded_at=0.0, entities=entities)
+        bus.publish("jira.issue:P-1")
+        for n in range(2, 12):
+            bus.publish(f"jira.issue:P-{n}")
+
+        assert cache.get("issue-1") is None
+
+    def test_write_during_load_is_not_cached(self):
+        bus = InvalidationBus()
+        cache = ResponseCache("test", ttl=60, maxsize=10, bus=bus)
+        entities = (entity_key(JIRA_ISSUE, "A-1"),)
+
+        def racing_loader() -> str:
+            bus.publish("jira.issue:A-1")
+            return "stale"
+
+        assert cache.get_or_load("k", racing_loader, entities=entities) == "stale"
+        assert cache.get_or_load("k", lambda: "fresh", entities=entities) == "fresh"
+
+
+class TestConfigCacheScope:
+    def test_scope_differs_per_credential(self):
+        first = JiraConfig(
+            url="https://example.atlassian.net",
+            auth_type="basic",
+            username="a@example.com",
+            api_token="token-a",
+        )
+        second = JiraConfig(
+            url="https://example.atlassian.net",
+            auth_type="basic",
+            username="a@example.com",
+            api_token="token-b",
+        )
+
+        assert config_cache_scope(first) != config_cache_scope(second)
+        assert "token-a" not in config_cache_scope(first)
+
+
+class TestWriteInvalidatesReadCache:
+    def test_add_watcher_refreshes_cached_watchers(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        from mcp_atlassian.jira import watchers as watchers_module
+
+        monkeypatch.setattr(
+            watchers_module,
+            "_watchers_cache",
+            ResponseCache("jira.watchers", ttl=60, maxsize=10, bus=invalidation_bus),
+        )
+        mixin = WatchersMixin(
+            config=JiraConfig(
+                url="https://example.atlassian.net",
+                auth_type="basic",
+                username="a@example.com",
+                api_token="token",
+            )
+        )
+        mixin.jira = MagicMock()
+        mixin.jira.issue_get_watchers.side_effect = [
+            {"watchCount": 0, "isWatching": False, "watchers": []},
+            {"watchCount": 1, "isWatching": True, "watchers": []},
+        ]
+
+        assert mixin.get_issue_watchers("TEST-1")["watcher_count"] == 0
+        assert mixin.get_issue_watchers("TEST-1")["watcher_count"] == 0
+        mixin.add_watcher("TEST-1", "abc123")
+
+        assert mixin.get_issue_watchers("TEST-1")["watcher_count"] == 1
+        assert mixin.jira.issue_get_watchers.call_count == 2
@@ -0,0 +1,199 @@
+"""Tests for the response cache storage backends."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from key_value.aio.stores.memory import MemoryStore
+
+from mcp_atlassian.utils import cache_backends
+from mcp_atlassian.utils.cache import InvalidationBus, ResponseCache
+from mcp_atlassian.utils.cache_backends import (
+    CACHE_BACKEND_ENV,
+    CACHE_CONFIG_JSON_ENV,
+    CACHE_FACTORY_ENV,
+    CACHE_SQLITE_PATH_ENV,
+    KeyValueCacheBackend,
+    MemoryCacheBackend,
+    SqliteCacheBackend,
+    build_cache_backend_from_env,
+    get_cache_backend,
+)
+
+
+def make_memory_store(config: dict | None = None) -> MemoryStore:
+    return MemoryStore()
+
+
+@pytest.fixture(autouse=True)
+def _reset_backend(monkeypatch: pytest.MonkeyPatch):
+    for name in (
+        CACHE_BACKEND_ENV,
+        CACHE_SQLITE_PATH_ENV,
+        CACHE_FACTORY_ENV,
+        CACHE_CONFIG_JSON_ENV,
+    ):
+        monkeypatch.delenv(name, raising=False)
+    cache_backends._reset_cache_backend_for_tests()
+    yield
+    cache_backends._reset_cache_backend_for_tests()
+
+
+class TestMemoryCacheBackend:
+    def test_round_trip_and_missing_keys(self):
+        backend = MemoryCacheBackend(maxsize=10)
+        backend.put("c", "a", {"x": 1}, ttl=60)
+
+        assert backend.get_many("c", ["a", "b"]) == [{"x": 1}, None]
+        assert backend.get_many("other", ["a"]) == [None]
+
+    def test_evicts_least_recently_used(self):
+        backend = MemoryCacheBackend(maxsize=2)
+        backend.put("c", "a", 1, ttl=60)
+        backend.put("c", "b", 2, ttl=60)
+        backend.get_many("c", ["a"])
+        backend.put("c", "d", 3, ttl=60)
+
+        assert backend.get_many("c", ["a", "b", "d"]) == [1, None, 3]
+
+    def test_expired_entries_are_not_returned(self, monkeypatch: pytest.MonkeyPatch):
+        clock = MagicMock(return_value=100.0)
+        monkeypatch.setattr(cache_backends.time, "monotonic", clock)
+        backend = MemoryCacheBackend(maxsize=10)
+        backend.put("c", "a", 1, ttl=5)
+
+        clock.return_value = 106.0
+
+        assert backend.get_many("c", ["a"]) == [None]
+
+    def test_clear_drops_collection(self):
+        backend = MemoryCacheBackend(maxsize=10)
+        backend.put("c", "a", 1, ttl=60)
+        backend.clear("c")
+
+        assert backend.get_many("c", ["a"]) == [None]
+
+
+class TestSqliteCacheBackend:
+    def test_round_trip_is_shared_between_connections(self, tmp_path: Path):
+        path = tmp_path / "cache.sqlite3"
+        writer = SqliteCacheBackend(path)
+        reader = SqliteCacheBackend(path)
+
+        writer.put("c", "a", {"fields": ["x"]}, ttl=60)
+
+        assert reader.get_many("c", ["a", "b"]) == [{"fields": ["x"]}, None]
+
+    def test_expired_entries_are_not_returned(self, tmp_path: Path):
+        backend = SqliteCacheBackend(tmp_path / "cache.sqlite3")
+        backend.put("c", "a", 1, ttl=-1)
+
+        assert backend.get_many("c", ["a"]) == [None]
+
+    def test_non_json_values_are_skipped(self, tmp_path: Path):
+        backend = SqliteCacheBackend(tmp_path / "cache.sqlite3")
+        backend.put("c", "a", object(), ttl=60)
+
+        assert backend.get_many("c", ["a"]) == [None]
+
+    def test_add_reports_store_errors_apart_from_held_keys(self, tmp_path: Path):
+        backend = SqliteCacheBackend(tmp_path / "cache.sqlite3")
+
+        assert backend.add("lease", "a", 1, ttl=60) is True
+        assert backend.add("lease", "a", 2, ttl=60) is False
+        backend._conn.close()
+        assert backend.add("lease", "b", 1, ttl=60) is None
+
+
+class TestKeyValueCacheBackend:
+    def test_round_trip_through_async_store(self):
+        backend = KeyValueCacheBackend(MemoryStore(), timeout=5.0)
+        backend.put("c", "a", [1, 2], ttl=60)
+
+        assert backend.get_many("c", ["a", "b"]) == [[1, 2], None]
+
+    def test_store_errors_are_treated_as_misses(self):
+        store = MagicMock()
+        store.get_many.side_effect = RuntimeError("store down")
+        backend = KeyValueCacheBackend(store, timeout=1.0)
+
+        assert backend.get_many("c", ["a"]) == [None]
+
+    def test_add_reports_store_errors(self):
+        store = MagicMock()
+        store.get.side_effect = RuntimeError("store down")
+        backend = KeyValueCacheBackend(store, timeout=1.0)
+
+        assert backend.add("lease", "a", 1, ttl=60) is None
+
+
+class TestBuildCacheBackendFromEnv:
+    def test_defaults_to_memory(self):
+        assert isinstance(build_cache_backend_from_env(), MemoryCacheBackend)
+
+    def test_sqlite_mode_uses_configured_path(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ):
+        path = tmp_path / "nested" / "cache.sqlite3"
+        monkeypatch.setenv(CACHE_BACKEND_ENV, "sqlite")
+        monkeypatch.setenv(CACHE_SQLITE_PATH_ENV, str(path))
+
+        backend = build_cache_backend_from_env()
+
+        assert isinstance(backend, SqliteCacheBackend)
+        assert path.exists()
+
+    def test_factory_mode_loads_async_key_value_store(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.setenv(CACHE_BACKEND_ENV, "factory")
+        monkeypatch.setenv(CACHE_FACTORY_ENV, f"{__name__}:make_memory_store")
+        monkeypatch.setenv(CACHE_CONFIG_JSON_ENV, '{"namespace": "mcp"}')
+
+        assert isinstance(build_cache_backend_from_env(), KeyValueCacheBackend)
+
+    def test_factory_mode_requires_import_path(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setenv(CACHE_BACKEND_ENV, "factory")
+
+        with pytest.raises(ValueError, match=CACHE_FACTORY_ENV):
+            build_cache_backend_from_env()
+
+    def test_factory_mode_rejects_incompatible_object(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.setenv(CACHE_BACKEND_ENV, "factory")
+        monkeypatch.setenv(CACHE_FACTORY_ENV, "builtins:dict")
+
+        with pytest.raises(ValueError, match="Response cache storage factory"):
+            build_cache_backend_from_env()
+
+    def test_rejects_unknown_backend(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setenv(CACHE_BACKEND_ENV, "redis")
+
+        with pytest.raises(ValueError, match="Supported backends"):
+            build_cache_backend_from_env()
+
+    def test_process_backend_is_built_once(self):
+        assert get_cache_backend() is get_cache_backend()
+
+
+class TestSharedResponseCache:
+    def test_replicas_share_entries_and_invalidations(self, tmp_path: Path):
+        path = tmp_path / "cache.sqlite3"
+        replica_a = ResponseCache(
+            "test", ttl=60, bus=InvalidationBus(), backend=SqliteCacheBackend(path)
+        )
+        replica_b_bus = InvalidationBus()
+        replica_b = ResponseCache(
+            "test", ttl=60, bus=replica_b_bus, backend=SqliteCacheBackend(path)
+        )
+        entities = ("jira.issue:A-1",)
+
+        assert replica_a.get_or_load("k", lambda: 1, entities=entities) == 1
+        assert replica_b.get_or_load("k", lambda: 2, entities=entities) == 1
+
+        replica_b_bus.publish("jira.issue:A-1")
+
+        assert replica_a.get_or_load("k", lambda: 3, entities=entities) == 3
@@ -110,3 +110,24 @@ def test_parse_date_iso_oserror_returns_none() -> None:
     ):
         result = parse_date("9999-12-31T23:59:59.000+0000")
         assert result is None
+
+
+@pytest.mark.parametrize(
+    "input_val",
+    [
+        "2024-01-01T12:34:56.789+0000",
+        "2024-01-01T12:34:56+05:30",
+        "2024-03-10T02:30:00.1-0530",
+        "2024-11-03T06:30:00.123456Z",
+    ],
+)
+def test_parse_date_atlassian_timestamps_match_dateutil(input_val: str) -> None:
+    """Test the Atlassian timestamp fast path agrees with dateutil."""
+    import dateutil.parser
+
+    result = parse_date(input_val)
+    expected = dateutil.parser.parse(input_val)
+
+    assert result == expected
+    assert result.utcoffset() == expected.utcoffset()
+    assert str(result) == str(expected)
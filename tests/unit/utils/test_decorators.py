@@ -1,5 +1,6 @@
 import inspect
 import logging
+from collections.abc import Iterator
 from unittest.mock import MagicMock
 
 import pytest
@@ -169,6 +170,11 @@ class _FakeService:
     def raise_value_error(self) -> None:
         raise ValueError("bad input")
 
+    @handle_auth_errors("Test API")
+    def iter_then_fail(self, status_code: int) -> Iterator[int]:
+        yield 1
+        raise _make_http_error(status_code)
+
 
 def test_handle_auth_errors_returns_value():
     svc = _FakeService()
@@ -186,6 +192,20 @@ def test_handle_auth_errors_catches_auth_errors(
     assert str(status_code) in str(exc.value)
 
 
+@pytest.mark.parametrize(
+    ("status_code", "expected"),
+    [(401, MCPAtlassianAuthenticationError), (404, HTTPError)],
+)
+def test_handle_auth_errors_wraps_generators(status_code, expected):
+    """Errors raised while iterating a decorated generator are converted too."""
+    svc = _FakeService()
+    pages = svc.iter_then_fail(status_code)
+
+    assert next(pages) == 1
+    with pytest.raises(expected):
+        next(pages)
+
+
 def test_handle_auth_errors_passes_through_404():
     svc = _FakeService()
     with pytest.raises(HTTPError) as exc:
@@ -0,0 +1,55 @@
+"""Tests for the local full-text index helpers."""
+
+import pytest
+
+from mcp_atlassian.utils.fts import (
+    SyncClaims,
+    connect_fts_database,
+    fts_match_query,
+    iso_timestamp,
+)
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("login fails", '"login" "fails"'),
+        ("log*", '"log"*'),
+        ('NOT (a OR "b")', '"NOT" "a" "OR" "b"'),
+        ("PROJ-123", '"PROJ" "123"'),
+        ("  -- ", ""),
+    ],
+)
+def test_fts_match_query(text, expected):
+    assert fts_match_query(text) == expected
+
+
+def test_match_query_is_valid_fts5(tmp_path):
+    conn = connect_fts_database(tmp_path / "index.sqlite3")
+    conn.execute("CREATE VIRTUAL TABLE docs USING fts5(body)")
+    conn.execute("INSERT INTO docs VALUES ('Login fails with NOT found')")
+
+    rows = conn.execute(
+        "SELECT body FROM docs WHERE docs MATCH ?", (fts_match_query('not "login'),)
+    ).fetchall()
+
+    assert rows == [("Login fails with NOT found",)]
+
+
+def test_iso_timestamp():
+    assert iso_timestamp(0.7) == "1970-01-01T00:00:00+00:00"
+
+
+def test_sync_claims_are_per_scope_and_key():
+    claims = SyncClaims()
+
+    with claims.claim("alice", "PROJ") as first:
+        with claims.claim("alice", "PROJ") as second:
+            assert (first, second) == (True, False)
+        with claims.claim("bob", "PROJ") as other_scope:
+            assert other_scope is True
+        with claims.claim("alice", "OPS") as other_key:
+            assert other_key is True
+
+    with claims.claim("alice", "PROJ") as again:
+        assert again is True
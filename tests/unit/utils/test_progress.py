@@ -0,0 +1,72 @@
+"""Tests for per-page progress reporting and tool deadlines."""
+
+from __future__ import annotations
+
+import pytest
+
+from mcp_atlassian.utils import progress as progress_module
+from mcp_atlassian.utils.progress import (
+    TOOL_DEADLINE_ENV,
+    PageProgress,
+    get_tool_deadline_seconds,
+)
+
+
+@pytest.mark.parametrize(
+    ("raw_value", "expected"),
+    [
+        (None, 0.0),
+        ("", 0.0),
+        ("30", 30.0),
+        ("2.5", 2.5),
+        ("-1", 0.0),
+        ("soon", 0.0),
+    ],
+)
+def test_get_tool_deadline_seconds(monkeypatch, raw_value, expected):
+    if raw_value is None:
+        monkeypatch.delenv(TOOL_DEADLINE_ENV, raising=False)
+    else:
+        monkeypatch.setenv(TOOL_DEADLINE_ENV, raw_value)
+
+    assert get_tool_deadline_seconds() == expected
+
+
+def test_page_done_forwards_reports():
+    reports = []
+    progress = PageProgress(lambda *args: reports.append(args))
+
+    progress.page_done(50, 200, "Fetched 50")
+    progress.page_done(100)
+
+    assert reports == [(50, 200, "Fetched 50"), (100, None, None)]
+
+
+def test_page_done_swallows_report_errors():
+    def report(done, total, message):
+        raise RuntimeError("client went away")
+
+    PageProgress(report).page_done(1, 2)
+
+
+def test_should_stop_without_deadline():
+    progress = PageProgress()
+
+    assert progress.should_stop("token") is False
+    assert progress.deadline_reached is False
+    assert progress.cursor is None
+
+
+def test_should_stop_after_deadline(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(progress_module.time, "monotonic", lambda: clock[0])
+    progress = PageProgress(deadline_seconds=10)
+
+    assert progress.should_stop(50) is False
+    clock[0] = 110.0
+    # Nothing left to fetch: the scan is complete, not cut short.
+    assert progress.should_stop(None) is False
+    assert progress.deadline_reached is False
+    assert progress.should_stop(50) is True
+    assert progress.deadline_reached is True
+    assert progress.cursor == "50"